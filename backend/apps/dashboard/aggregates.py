@@ -0,0 +1,92 @@
+"""
+여러 GROUP BY 패널을 한 번의 조회로 집계
+
+같은 필터의 queryset 을 여러 차원 조합(grouping set)으로 나눠 합계를 내야 하는 패널
+(예: 학과별·과정별·학적상태별 학생 수)을 차원 조합마다 따로 GROUP BY 하지 않고 한 번에 계산한다.
+
+- PostgreSQL: GROUP BY GROUPING SETS ((a, b), (c), (d)) 한 문장, GROUPING() 비트마스크로 행이 속한 조합 구분
+- 그 외(SQLite 등): 모든 차원을 합친 가장 세밀한 GROUP BY 한 번을 읽어 파이썬에서 조합별로 다시 합산
+
+어느 쪽이든 테이블은 한 번만 읽는다.
+"""
+from collections import Counter
+from typing import Dict, Sequence, Tuple
+
+from django.db import connections
+from django.db.models import Expression, QuerySet, Sum
+
+GroupingSet = Tuple[str, ...]
+Totals = Dict[GroupingSet, Counter]
+
+MEASURE = 'grouping_measure'
+
+
+def _columns(grouping_sets: Sequence[GroupingSet]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(column for grouping_set in grouping_sets for column in grouping_set))
+
+
+def grouping_sets_sql(queryset: QuerySet, grouping_sets: Sequence[GroupingSet], measure: Expression):
+    """
+    GROUPING SETS 집계 SQL
+
+    필터·주석이 적용된 queryset 을 부분 질의로 감싸고 바깥에서 GROUPING SETS 로 묶는다.
+
+    Returns:
+        (sql, params) - 결과 열: 모든 차원..., GROUPING(모든 차원) 비트마스크, 합계
+    """
+    columns = _columns(grouping_sets)
+    inner = queryset.annotate(**{MEASURE: measure}).values(*columns, MEASURE).order_by()
+    inner_sql, params = inner.query.sql_with_params()
+    qn = connections[queryset.db].ops.quote_name
+    column_list = ', '.join(qn(column) for column in columns)
+    sets = ', '.join(f"({', '.join(qn(column) for column in grouping_set)})" for grouping_set in grouping_sets)
+    sql = (
+        f"SELECT {column_list}, GROUPING({column_list}), SUM({qn(MEASURE)}) "
+        f"FROM ({inner_sql}) AS grouped GROUP BY GROUPING SETS ({sets})"
+    )
+    return sql, params
+
+
+def _mask(columns: Sequence[str], grouping_set: GroupingSet) -> int:
+    """GROUPING(columns) 값: 조합에 없는(합쳐진) 차원의 비트가 1 (첫 차원이 최상위 비트)"""
+    mask = 0
+    for column in columns:
+        mask = (mask << 1) | (column not in grouping_set)
+    return mask
+
+
+def grouped_totals(
+    queryset: QuerySet,
+    grouping_sets: Sequence[GroupingSet],
+    measure: Expression,
+) -> Totals:
+    """
+    queryset 을 차원 조합별로 합산
+
+    Args:
+        queryset: 필터를 적용한 queryset (차원 이름의 필드 또는 주석 포함)
+        grouping_sets: 차원 조합 목록 (예: [('department', 'college'), ('program_type',)])
+        measure: 행마다 더할 값 (건수는 Value(1), 롤업은 F('row_count'))
+
+    Returns:
+        {차원 조합: Counter({차원 값 튜플: 합계})}
+    """
+    columns = _columns(grouping_sets)
+    totals = {grouping_set: Counter() for grouping_set in grouping_sets}
+
+    if connections[queryset.db].vendor == 'postgresql':
+        by_mask = {_mask(columns, grouping_set): grouping_set for grouping_set in grouping_sets}
+        sql, params = grouping_sets_sql(queryset, grouping_sets, measure)
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(sql, params)
+            for *values, mask, total in cursor.fetchall():
+                row = dict(zip(columns, values))
+                grouping_set = by_mask[mask]
+                totals[grouping_set][tuple(row[column] for column in grouping_set)] += total or 0
+        return totals
+
+    finest = queryset.values(*columns).annotate(grouping_total=Sum(measure)).order_by()
+    for row in finest:
+        for grouping_set in grouping_sets:
+            totals[grouping_set][tuple(row[column] for column in grouping_set)] += row['grouping_total'] or 0
+    return totals
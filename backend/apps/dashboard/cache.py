@@ -0,0 +1,102 @@
+"""
+대시보드 응답 캐시
+
+대시보드 데이터는 업로드가 있을 때만 바뀌므로 응답 본문을 Django 캐시에 저장하고 재사용한다.
+
+캐시 키 = 엔드포인트 + 패널이 쓰는 data_type 들의 버전 + 정규화한 쿼리 파라미터.
+업로드가 data_type 버전을 올리면(apps.data_upload.versions) 그 데이터를 쓰는 패널의 키만 바뀌고,
+예전 키의 항목은 DASHBOARD_CACHE_TIMEOUT 뒤 만료된다.
+
+응답에는 같은 키에서 만든 강한 ETag 를 붙인다. 클라이언트가 If-None-Match 로 현재 ETag 를 보내면
+캐시·집계 조회 없이 304 를 반환한다 (캐시를 꺼도 동작).
+"""
+import hashlib
+from functools import wraps
+from typing import Dict, Iterable, Sequence, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.data_upload.versions import data_versions
+from config.responses import not_modified_response
+
+CACHE_KEY = 'dashboard:{endpoint}:{versions}:{params}'
+
+
+def normalized_params(query_params, names: Iterable[str]) -> Tuple[Tuple[str, str], ...]:
+    """
+    캐시 키용 쿼리 파라미터 (뷰가 읽는 이름만, 앞뒤 공백 제거, 빈 값 제외, 이름순)
+
+    ?college=공과대학&_=123 과 ?_=456&college=공과대학 은 같은 키가 된다.
+    """
+    normalized = []
+    for name in sorted(names):
+        value = (query_params.get(name) or '').strip()
+        if value:
+            normalized.append((name, value))
+    return tuple(normalized)
+
+
+def cache_key(endpoint: str, versions: Dict[str, int], params: Tuple[Tuple[str, str], ...]) -> str:
+    version_part = '.'.join(f"{data_type}{versions[data_type]}" for data_type in sorted(versions))
+    params_part = hashlib.md5(urlencode(params).encode('utf-8')).hexdigest()
+    return CACHE_KEY.format(endpoint=endpoint, versions=version_part, params=params_part)
+
+
+def etag_for(key: str) -> str:
+    """
+    캐시 키(엔드포인트·DB 에 저장된 데이터 버전·필터)에서 만든 강한 ETag
+
+    버전은 모든 프로세스가 같은 값을 보므로, 다른 프로세스의 업로드 뒤에도 예전 ETag 는 304 를 받지 않는다.
+    업로드 외에 모델 save/delete 로 바뀐 데이터도 커밋 시 버전을 올리므로 ETag 가 바로 바뀐다.
+    """
+    return quote_etag(hashlib.sha256(key.encode('utf-8')).hexdigest()[:32])
+
+
+def etag_matches(request, etag: str) -> bool:
+    """If-None-Match 에 etag 가 있는지 (If-None-Match 는 약한 비교: W/ 접두사 무시)"""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return '*' in tags or any(tag.removeprefix('W/') == etag for tag in tags)
+
+
+def cached_dashboard(endpoint: str, data_types: Sequence[str], params: Sequence[str] = ()):
+    """
+    대시보드 GET 응답 캐시·ETag 데코레이터
+
+    Args:
+        endpoint: 캐시 키 이름 (예: 'papers')
+        data_types: 응답이 의존하는 데이터 유형 (이 유형의 업로드만 캐시를 무효화)
+        params: 응답에 영향을 주는 쿼리 파라미터 이름
+    """
+    def decorator(get):
+        @wraps(get)
+        def wrapper(view, request, *args, **kwargs):
+            key = cache_key(
+                endpoint, data_versions(data_types), normalized_params(request.query_params, params),
+            )
+            etag = etag_for(key)
+            if etag_matches(request, etag):
+                return not_modified_response(etag)
+
+            body = cache.get(key) if settings.DASHBOARD_CACHE_ENABLED else None
+            if body is not None:
+                response = Response(body, status=status.HTTP_200_OK)
+            else:
+                response = get(view, request, *args, **kwargs)
+                if settings.DASHBOARD_CACHE_ENABLED and response.status_code == status.HTTP_200_OK:
+                    cache.set(key, response.data, settings.DASHBOARD_CACHE_TIMEOUT)
+
+            if response.status_code == status.HTTP_200_OK:
+                response['ETag'] = etag
+                # 인증된 사용자 전용, 브라우저는 저장하되 매번 ETag 로 재검증
+                response['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,75 @@
+"""
+GROUPING SETS 집계 테스트
+"""
+import pytest
+from django.db.models import Count, F, Sum, Value
+from apps.dashboard.aggregates import _mask, grouped_totals, grouping_sets_sql
+from apps.data_upload.models import PublicationList, StudentRollup, StudentRoster
+from apps.data_upload.services import process_csv_upload
+from benchmarks.synthetic import synthetic_csv_bytes
+
+pytestmark = pytest.mark.django_db
+
+SETS = (('department', 'college'), ('program_type',), ('academic_status',))
+
+
+@pytest.fixture
+def students(user):
+    content, _ = synthetic_csv_bytes('student', 300, seed=21)
+    process_csv_upload(content, 'student', user, 'students.csv')
+
+
+def test_mask():
+    columns = ('department', 'college', 'program_type', 'academic_status')
+
+    assert _mask(columns, ('department', 'college')) == 0b0011
+    assert _mask(columns, ('program_type',)) == 0b1101
+    assert _mask(columns, ('academic_status',)) == 0b1110
+
+
+def test_grouping_sets_sql():
+    sql, params = grouping_sets_sql(StudentRollup.objects.filter(college='공과대학'), SETS, F('row_count'))
+
+    assert 'GROUP BY GROUPING SETS (("department", "college"), ("program_type"), ("academic_status"))' in sql
+    assert 'GROUPING("department", "college", "program_type", "academic_status")' in sql
+    assert '공과대학' in params
+
+
+def test_grouped_totals_match_separate_group_by(students, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        totals = grouped_totals(StudentRollup.objects.all(), SETS, F('row_count'))
+
+    for grouping_set in SETS:
+        expected = {
+            tuple(row[column] for column in grouping_set): row['total']
+            for row in StudentRoster.objects.values(*grouping_set).annotate(total=Count('id')).order_by()
+        }
+        assert dict(totals[grouping_set]) == expected
+
+
+def test_grouped_totals_count_rows(user):
+    content, _ = synthetic_csv_bytes('publication', 200, seed=22)
+    process_csv_upload(content, 'publication', user, 'papers.csv')
+
+    totals = grouped_totals(PublicationList.objects.all(), (('journal_grade',), ('department',)), Value(1))
+
+    expected = {
+        (row['journal_grade'],): row['total']
+        for row in PublicationList.objects.values('journal_grade').annotate(total=Sum(Value(1))).order_by()
+    }
+    assert dict(totals[('journal_grade',)]) == expected
+    assert sum(totals[('department',)].values()) == PublicationList.objects.count()
+
+
+def test_students_view_single_query(authenticated_client, students, settings, django_assert_num_queries):
+    settings.DASHBOARD_CACHE_ENABLED = False
+
+    # 데이터 버전 조회 + 집계 1회
+    with django_assert_num_queries(2):
+        response = authenticated_client.get('/api/dashboard/students/')
+
+    data = response.json()['data']
+    assert sum(item['student_count'] for item in data['students_by_department']) == StudentRoster.objects.count()
+    assert [item['program_type'] for item in data['students_by_program']] == sorted(
+        item['program_type'] for item in data['students_by_program']
+    )
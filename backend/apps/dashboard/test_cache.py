@@ -0,0 +1,164 @@
+"""
+대시보드 응답 캐시 테스트
+"""
+from datetime import date
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from apps.dashboard.cache import normalized_params
+from apps.data_upload.models import DataVersion, StudentRoster
+from apps.data_upload.services import process_csv_upload
+from apps.data_upload.versions import bump_data_version, data_version
+from benchmarks.synthetic import synthetic_csv_bytes
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def students(db):
+    StudentRoster.objects.create(
+        student_id='20240001', name='홍길동', college='공과대학', department='컴퓨터공학과',
+        grade=3, program_type='학사', academic_status='재학', gender='남', admission_year=2021,
+    )
+
+
+def get(client, endpoint, **params):
+    response = client.get(f'/api/dashboard/{endpoint}/', params)
+    assert response.status_code == 200
+    return response.json()['data']
+
+
+class TestDashboardCache:
+
+    def test_repeated_request_served_from_cache(self, authenticated_client, students, django_assert_num_queries):
+        first = get(authenticated_client, 'students')
+
+        # 데이터 버전 조회만 (집계 없음)
+        with django_assert_num_queries(1):
+            assert get(authenticated_client, 'students') == first
+
+    def test_equivalent_query_strings_share_entry(self, authenticated_client, students, django_assert_num_queries):
+        get(authenticated_client, 'students', college='공과대학', program_type='학사')
+
+        with django_assert_num_queries(1):
+            get(authenticated_client, 'students', program_type='학사', college=' 공과대학 ', department='', _='123')
+
+        # 다른 필터는 따로 계산
+        assert get(authenticated_client, 'students', college='인문대학')['students_by_department'] == []
+
+    def test_upload_invalidates_only_affected_panels(self, authenticated_client, user, students, django_assert_num_queries):
+        papers_before = get(authenticated_client, 'papers')
+        get(authenticated_client, 'students')
+        get(authenticated_client, 'overview')
+
+        content, _ = synthetic_csv_bytes('publication', 20, seed=3)
+        process_csv_upload(content, 'publication', user, 'papers.csv')
+
+        papers_after = get(authenticated_client, 'papers')
+        assert sum(item['count'] for item in papers_after['journal_grade_distribution']) == 20
+        assert papers_after != papers_before
+        with django_assert_num_queries(1):
+            get(authenticated_client, 'students')
+        with django_assert_num_queries(1):
+            get(authenticated_client, 'papers')
+        # 개요는 업로드가 다시 계산한 스냅샷을 기본키로 읽음 (버전 조회 + 스냅샷)
+        with django_assert_num_queries(2):
+            get(authenticated_client, 'overview')
+
+    def test_unchanged_reupload_keeps_cache(self, user):
+        content, _ = synthetic_csv_bytes('student', 10, seed=4)
+        process_csv_upload(content, 'student', user, 'students.csv')
+        version = data_version('student')
+
+        process_csv_upload(content, 'student', user, 'students.csv')
+
+        assert data_version('student') == version
+
+    def test_disabled(self, authenticated_client, students, settings, django_assert_num_queries):
+        settings.DASHBOARD_CACHE_ENABLED = False
+        get(authenticated_client, 'students')
+
+        with django_assert_num_queries(2):
+            get(authenticated_client, 'students')
+
+    def test_file_based_cache(self, authenticated_client, students, settings, tmp_path, django_assert_num_queries):
+        settings.CACHES = {'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(tmp_path / 'cache'),
+        }}
+        get(authenticated_client, 'students')
+        with django_assert_num_queries(1):
+            get(authenticated_client, 'students')
+
+        bump_data_version('student')
+        with django_assert_num_queries(2):
+            get(authenticated_client, 'students')
+
+
+class TestDataVersion:
+
+    def test_bump_changes_version(self):
+        version = data_version('kpi')
+
+        assert bump_data_version('kpi') != version
+        assert data_version('kpi') != version
+        assert data_version('student') == data_version('student')
+
+    def test_survives_cache_clear(self):
+        version = bump_data_version('kpi')
+        cache.clear()
+
+        assert data_version('kpi') == version
+
+    def test_bump_from_other_process_is_visible(self, authenticated_client, students, django_assert_num_queries):
+        bump_data_version('student')
+        get(authenticated_client, 'students')
+        # 업로드 워커 등 다른 프로세스가 올린 버전 (이 프로세스의 캐시를 거치지 않음)
+        DataVersion.objects.filter(data_type='student').update(version=F('version') + 1)
+
+        with django_assert_num_queries(2):
+            get(authenticated_client, 'students')
+
+    @pytest.mark.parametrize('change', ['save', 'delete', 'queryset_delete'])
+    def test_model_change_outside_upload_bumps_version(
+        self, authenticated_client, students, django_capture_on_commit_callbacks, change,
+    ):
+        """관리자 화면 수정·삭제도 커밋 후 버전을 올려 캐시된 패널을 무효화"""
+        before = get(authenticated_client, 'students')
+        version, other = data_version('student'), data_version('publication')
+        student = StudentRoster.objects.get()
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            if change == 'save':
+                student.academic_status = '휴학'
+                student.save()
+            elif change == 'delete':
+                student.delete()
+            else:
+                StudentRoster.objects.filter(pk=student.pk).delete()
+
+        assert len(callbacks) == 1
+        assert data_version('student') != version
+        assert data_version('publication') == other
+        assert get(authenticated_client, 'students') != before
+
+    def test_rolled_back_change_keeps_version(self, students, django_capture_on_commit_callbacks):
+        version = data_version('student')
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    StudentRoster.objects.get().delete()
+                    raise RuntimeError
+
+        assert callbacks == []
+        assert data_version('student') == version
+
+
+def test_normalized_params():
+    query = {'end_date': str(date(2024, 1, 1)), 'college': ' 공과대학 ', 'department': '', 'page': '2'}
+
+    assert normalized_params(query, ('college', 'department', 'end_date')) == (
+        ('college', '공과대학'), ('end_date', '2024-01-01'),
+    )
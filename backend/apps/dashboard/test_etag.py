@@ -0,0 +1,134 @@
+"""
+대시보드 ETag / 조건부 GET 테스트
+"""
+import pytest
+from django.db.models import F
+from rest_framework import status
+from apps.data_upload.models import DataVersion, StudentRoster
+from apps.data_upload.overview import refresh_overview_snapshot
+from apps.data_upload.services import process_csv_upload
+from apps.data_upload.versions import bump_data_version
+from benchmarks.synthetic import synthetic_csv_bytes
+
+pytestmark = pytest.mark.django_db
+
+ENDPOINTS = ['overview', 'performance', 'papers', 'students', 'budget']
+
+
+@pytest.fixture(autouse=True)
+def overview_snapshot(db):
+    """마이그레이션(0009)이 만들어 두는 개요 스냅샷"""
+    refresh_overview_snapshot()
+
+
+@pytest.fixture
+def students(db):
+    StudentRoster.objects.create(
+        student_id='20240001', name='홍길동', college='공과대학', department='컴퓨터공학과',
+        grade=3, program_type='학사', academic_status='재학', gender='남', admission_year=2021,
+    )
+
+
+def get(client, endpoint, etag=None, **params):
+    headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+    return client.get(f'/api/dashboard/{endpoint}/', params, **headers)
+
+
+class TestDashboardETag:
+
+    @pytest.mark.parametrize('endpoint', ENDPOINTS)
+    def test_not_modified_without_aggregation(self, authenticated_client, endpoint, settings, django_assert_num_queries):
+        settings.DASHBOARD_CACHE_ENABLED = False
+        response = get(authenticated_client, endpoint)
+        etag = response['ETag']
+        assert response.status_code == status.HTTP_200_OK
+        assert etag.startswith('"') and not etag.startswith('W/')
+        assert response['Cache-Control'] == 'private, no-cache'
+
+        # 데이터 버전 조회만 (집계 없음)
+        with django_assert_num_queries(1):
+            response = get(authenticated_client, endpoint, etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert response.content == b''
+
+    def test_cached_body_has_same_etag(self, authenticated_client, students):
+        first = get(authenticated_client, 'students')
+        second = get(authenticated_client, 'students')
+
+        assert second['ETag'] == first['ETag']
+        assert second.json() == first.json()
+
+    def test_etag_list_and_weak_form_match(self, authenticated_client, students):
+        etag = get(authenticated_client, 'students')['ETag']
+
+        assert get(authenticated_client, 'students', f'"other", W/{etag}').status_code == status.HTTP_304_NOT_MODIFIED
+        assert get(authenticated_client, 'students', '"other"').status_code == status.HTTP_200_OK
+
+    def test_etag_follows_normalized_filters(self, authenticated_client, students):
+        etag = get(authenticated_client, 'students', college='공과대학')['ETag']
+
+        # 같은 필터(공백·빈 값·알 수 없는 파라미터 무시)는 같은 ETag
+        response = get(authenticated_client, 'students', etag, college=' 공과대학 ', department='', _='1')
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        response = get(authenticated_client, 'students', etag, college='인문대학')
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_upload_changes_only_affected_etags(self, authenticated_client, user, students):
+        students_etag = get(authenticated_client, 'students')['ETag']
+        papers_etag = get(authenticated_client, 'papers')['ETag']
+
+        content, _ = synthetic_csv_bytes('publication', 20, seed=3)
+        process_csv_upload(content, 'publication', user, 'papers.csv')
+
+        assert get(authenticated_client, 'students', students_etag).status_code == status.HTTP_304_NOT_MODIFIED
+        response = get(authenticated_client, 'papers', papers_etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != papers_etag
+
+    def test_version_bump_changes_etag(self, authenticated_client, students):
+        etag = get(authenticated_client, 'students')['ETag']
+
+        bump_data_version('student')
+
+        assert get(authenticated_client, 'students', etag).status_code == status.HTTP_200_OK
+
+    def test_bump_from_other_process_changes_etag(self, authenticated_client, students):
+        bump_data_version('student')
+        etag = get(authenticated_client, 'students')['ETag']
+        assert get(authenticated_client, 'students', etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        # 업로드 워커 등 다른 프로세스가 DB 에서 올린 버전 (이 프로세스의 캐시는 그대로)
+        DataVersion.objects.filter(data_type='student').update(version=F('version') + 1)
+
+        response = get(authenticated_client, 'students', etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_etag_stable_until_model_change(
+        self, authenticated_client, students, monkeypatch, django_capture_on_commit_callbacks,
+    ):
+        monkeypatch.setattr('time.time', lambda: 1000.0)
+        etag = get(authenticated_client, 'students')['ETag']
+        monkeypatch.setattr('time.time', lambda: 100000.0)
+
+        assert get(authenticated_client, 'students', etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        # 관리자 화면 등 업로드 외 경로의 수정
+        student = StudentRoster.objects.get(student_id='20240001')
+        student.academic_status = '휴학'
+        with django_capture_on_commit_callbacks(execute=True):
+            student.save()
+
+        response = get(authenticated_client, 'students', etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_unauthenticated_not_modified_is_rejected(self, api_client, authenticated_client, students):
+        etag = get(authenticated_client, 'students')['ETag']
+        api_client.force_authenticate(user=None)
+
+        assert get(api_client, 'students', etag).status_code == status.HTTP_401_UNAUTHORIZED
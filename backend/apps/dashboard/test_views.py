@@ -391,6 +391,24 @@ class TestPapersView:
         for item in papers['publication_by_department']:
             assert item['department'] == '컴퓨터공학과'
 
+    @pytest.mark.parametrize('start_date, end_date, expected', [
+        ('2023-12-01', '2024-01-31', 2),  # 온전한 달만 (롤업)
+        ('2023-12-11', '2024-02-20', 2),  # 양쪽 경계가 달 중간 (원본 + 롤업)
+        ('2024-01-15', '2024-01-15', 1),  # 같은 달 안
+        ('2024-01-16', None, 1),
+        (None, '2023-12-10', 1),
+        ('2024-03-01', '2024-01-01', 0),
+    ])
+    def test_papers_partial_month_ranges(self, authenticated_client, sample_publication_data,
+                                         start_date, end_date, expected):
+        """월별 롤업과 경계 달 원본 집계를 합친 결과가 일 단위 필터와 같은지"""
+        params = {key: value for key, value in (('start_date', start_date), ('end_date', end_date)) if value}
+        response = authenticated_client.get('/api/dashboard/papers/', params)
+
+        papers = response.json()['data']
+        assert sum(item['count'] for item in papers['journal_grade_distribution']) == expected
+        assert sum(item['count'] for item in papers['publication_trend']) == expected
+
 
 class TestStudentsView:
     """학생 대시보드 API 테스트"""
@@ -524,6 +542,23 @@ class TestBudgetView:
             if item['funding_agency'] == '과학기술정보통신부':
                 assert item['total_budget'] > 0
 
+    @pytest.mark.parametrize('start_date, end_date, expected', [
+        ('2024-01-01', '2024-02-29', {'PRJ-2024-001': 50.0, 'PRJ-2024-002': 75.0}),  # 온전한 달만 (롤업)
+        ('2024-01-16', '2024-02-20', {'PRJ-2024-002': 75.0}),  # 경계가 달 중간 (원본 + 롤업)
+        ('2024-01-10', '2024-02-19', {'PRJ-2024-001': 50.0}),
+        ('2024-02-21', None, {}),
+    ])
+    def test_budget_partial_month_ranges(self, authenticated_client, sample_project_data,
+                                         start_date, end_date, expected):
+        """과제별 집행률이 월별 롤업과 경계 달 원본 집계를 합쳐 일 단위 필터와 같은지"""
+        params = {key: value for key, value in (('start_date', start_date), ('end_date', end_date)) if value}
+        response = authenticated_client.get('/api/dashboard/budget/', params)
+
+        budget = response.json()['data']
+        rates = {item['project_number']: item['execution_rate'] for item in budget['project_execution_rates']}
+        assert rates == expected
+        assert len(budget['research_budget_execution']) == len(expected)
+
     def test_budget_with_date_range_filter(self, authenticated_client, sample_project_data):
         """날짜 범위 필터로 예산 조회 테스트"""
         response = authenticated_client.get('/api/dashboard/budget/', {
@@ -1,17 +1,97 @@
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Avg, Count, Sum, Q
-from django.db import models
-from django.utils import timezone
+from collections import Counter
+from django.db.models import Count, F, Sum, Q, Value
 from datetime import datetime, timedelta
 from config.responses import success_response
 from apps.data_upload.models import (
     DepartmentKPI,
+    OverviewSnapshot,
+    ProjectExpenseRollup,
+    ProjectMonthlyRollup,
     PublicationList,
+    PublicationMonthlyRollup,
     ResearchProjectData,
-    StudentRoster,
+    StudentRollup,
 )
+from apps.data_upload.overview import OVERVIEW_VERSION, SNAPSHOT_ID, refresh_overview_snapshot
 from django.db.models.functions import ExtractYear, ExtractMonth
+from apps.dashboard.aggregates import grouped_totals
+from apps.dashboard.cache import cached_dashboard
+
+
+PAPER_GROUPING_SETS = (('journal_grade',), ('department',), ('year', 'month'))
+STUDENT_GROUPING_SETS = (('department', 'college'), ('program_type',), ('academic_status',))
+
+
+def _parse_date(value):
+    """YYYY-MM-DD 문자열 → date (형식이 틀리면 필터 무시)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _month_index(day):
+    return day.year * 12 + day.month - 1
+
+
+def _last_day(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+
+def _month_span(start, end):
+    """
+    기간을 월별 롤업으로 읽을 온전한 달과 원본 테이블에서 읽을 경계 구간으로 나눔
+
+    Returns:
+        (첫 달 번호, 마지막 달 번호, [(시작일, 종료일)]) - 달 번호는 연 * 12 + 월 - 1, 경계가 없으면 None
+        첫 달 번호 > 마지막 달 번호이면 롤업에서 읽을 달이 없다.
+    """
+    first = last = None
+    partial = []
+    if start:
+        first = _month_index(start)
+        if start.day != 1:
+            partial.append((start, min(_last_day(start), end) if end else _last_day(start)))
+            first += 1
+    if end:
+        last = _month_index(end)
+        if end != _last_day(end):
+            last -= 1
+            if first is None or _month_index(end) >= first:  # 시작일과 같은 달이면 이미 포함
+                month_start = end.replace(day=1)
+                partial.append((max(month_start, start) if start else month_start, end))
+    return first, last, partial
+
+
+def _monthly_sources(rollup_model, source_model, date_field, filters, start, end):
+    """
+    기간 필터를 월별 롤업(온전한 달)과 원본 테이블(기간 경계의 일부 달) queryset 으로 나눔
+
+    Returns:
+        (롤업 queryset, 읽을 달이 없으면 None), [원본 queryset (year·month 주석 포함)]
+    """
+    first_month, last_month, partial_ranges = _month_span(start, end)
+    rollup = None
+    if first_month is None or last_month is None or first_month <= last_month:
+        rollup = rollup_model.objects.filter(filters).annotate(
+            month_index=F('year') * 12 + F('month') - 1
+        )
+        if first_month is not None:
+            rollup = rollup.filter(month_index__gte=first_month)
+        if last_month is not None:
+            rollup = rollup.filter(month_index__lte=last_month)
+    partial = [
+        source_model.objects.filter(filters, **{f"{date_field}__range": (range_start, range_end)}).annotate(
+            year=ExtractYear(date_field),
+            month=ExtractMonth(date_field)
+        )
+        for range_start, range_end in partial_ranges
+    ]
+    return rollup, partial
 
 
 class OverviewView(APIView):
@@ -22,69 +102,40 @@ class OverviewView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    @cached_dashboard('overview', (OVERVIEW_VERSION,))
     def get(self, request):
         """
-        데이터베이스에서 실제 데이터를 집계하여 반환합니다.
-        최적화: 여러 쿼리를 배치로 실행하여 DB 왕복 횟수 감소
+        미리 계산한 개요 스냅샷(apps/data_upload/overview.py)을 기본키로 한 번 읽어 반환합니다.
+        스냅샷이 아직 없으면 이 요청에서 계산해 저장합니다.
         """
-        current_year = timezone.now().year
-        one_year_ago = timezone.now() - timedelta(days=365)
-        
-        # 실적: 최신 연도 평균 취업률 (최적화: 한 번의 쿼리로 처리)
-        latest_year = DepartmentKPI.objects.aggregate(
-            latest_year=models.Max('evaluation_year')
-        )['latest_year']
-        
-        performance_value = 0.0
-        if latest_year:
-            performance_avg = DepartmentKPI.objects.filter(
-                evaluation_year=latest_year
-            ).aggregate(avg=Avg('employment_rate'))
-            performance_value = float(performance_avg['avg'] or 0)
-        
-        # 논문: 최근 1년 논문 수 (인덱스 활용)
-        papers_count = PublicationList.objects.filter(
-            publication_date__gte=one_year_ago
-        ).count()
-        
-        # 학생: 현재 재학생 수 (인덱스 활용)
-        students_count = StudentRoster.objects.filter(
-            academic_status='재학'
-        ).count()
-        
-        # 예산: 집행률 계산 (최적화: 한 번의 쿼리로 두 집계 수행)
-        budget_aggregates = ResearchProjectData.objects.aggregate(
-            total_budget=Sum('total_budget'),
-            total_expense=Sum('expense_amount')
-        )
-        total_budget = budget_aggregates['total_budget'] or 0
-        total_expense = budget_aggregates['total_expense'] or 0
-        budget_value = (total_expense / total_budget * 100) if total_budget > 0 else 0.0
-        
+        snapshot = OverviewSnapshot.objects.filter(pk=SNAPSHOT_ID).first()
+        if snapshot is None:
+            snapshot = refresh_overview_snapshot()
+
         response_data = {
             "performance": {
                 "label": "실적",
-                "value": round(performance_value, 1),
+                "value": round(snapshot.performance_value, 1),
                 "unit": "%",
-                "trend": "up",
+                "trend": snapshot.performance_trend,
             },
             "papers": {
                 "label": "논문",
-                "value": papers_count,
+                "value": snapshot.papers_count,
                 "unit": "건",
-                "trend": "up",
+                "trend": snapshot.papers_trend,
             },
             "students": {
                 "label": "학생",
-                "value": students_count,
+                "value": snapshot.students_count,
                 "unit": "명",
-                "trend": "stable",
+                "trend": snapshot.students_trend,
             },
             "budget": {
                 "label": "예산",
-                "value": round(budget_value, 1),
+                "value": round(snapshot.budget_value, 1),
                 "unit": "%",
-                "trend": "up",
+                "trend": snapshot.budget_trend,
             },
         }
 
@@ -99,6 +150,7 @@ class PerformanceView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    @cached_dashboard('performance', ('kpi',), ('evaluation_year', 'college', 'department'))
     def get(self, request):
         """
         데이터베이스에서 실적 데이터를 집계하여 반환합니다.
@@ -207,9 +259,12 @@ class PapersView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    @cached_dashboard(
+        'papers', ('publication',), ('start_date', 'end_date', 'college', 'department', 'journal_grade'),
+    )
     def get(self, request):
         """
-        데이터베이스에서 논문 데이터를 집계하여 반환합니다.
+        논문 수 롤업(월별)과 기간 경계 달의 원본 데이터를 집계하여 반환합니다.
 
         Query Parameters:
         - start_date (optional): 조회 시작일 (YYYY-MM-DD)
@@ -224,18 +279,11 @@ class PapersView(APIView):
         department = request.query_params.get("department")
         journal_grade = request.query_params.get("journal_grade")
 
-        # 필터 적용
+        start = _parse_date(start_date)
+        end = _parse_date(end_date)
+
+        # 기간 외 필터 (롤업과 원본 테이블에 같은 필드명)
         filters = Q()
-        if start_date:
-            try:
-                filters &= Q(publication_date__gte=datetime.strptime(start_date, "%Y-%m-%d").date())
-            except ValueError:
-                pass
-        if end_date:
-            try:
-                filters &= Q(publication_date__lte=datetime.strptime(end_date, "%Y-%m-%d").date())
-            except ValueError:
-                pass
         if college:
             filters &= Q(college=college)
         if department:
@@ -243,41 +291,41 @@ class PapersView(APIView):
         if journal_grade:
             filters &= Q(journal_grade=journal_grade)
 
-        queryset = PublicationList.objects.filter(filters)
+        # 저널등급별·학과별·월별 논문 수를 한 번의 조회(GROUPING SETS)로 집계:
+        # 온전한 달은 월별 롤업, 기간 경계의 일부 달만 원본 테이블에서 집계해 합산
+        rollup, partial = _monthly_sources(
+            PublicationMonthlyRollup, PublicationList, 'publication_date', filters, start, end,
+        )
+        sources = [(queryset, Value(1)) for queryset in partial]
+        if rollup is not None:
+            sources.insert(0, (rollup, F('row_count')))
+
+        grades = Counter()
+        departments = Counter()
+        months = Counter()
+        for queryset, measure in sources:
+            totals = grouped_totals(queryset, PAPER_GROUPING_SETS, measure)
+            grades.update({grade: count for (grade,), count in totals[('journal_grade',)].items()})
+            departments.update({dept: count for (dept,), count in totals[('department',)].items()})
+            months.update(totals[('year', 'month')])
 
         # 저널 등급별 분포
-        journal_grade_distribution = []
-        for grade_data in queryset.values('journal_grade').annotate(
-            count=Count('id')
-        ):
-            journal_grade_distribution.append({
-                "journal_grade": grade_data['journal_grade'],
-                "count": grade_data['count'],
-            })
+        journal_grade_distribution = [
+            {"journal_grade": grade, "count": count}
+            for grade, count in sorted(grades.items())
+        ]
 
         # 학과별 논문 게재 수
-        publication_by_department = []
-        for dept_data in queryset.values('department').annotate(
-            paper_count=Count('id')
-        ):
-            publication_by_department.append({
-                "department": dept_data['department'],
-                "paper_count": dept_data['paper_count'],
-            })
+        publication_by_department = [
+            {"department": dept, "paper_count": count}
+            for dept, count in sorted(departments.items())
+        ]
 
-        # 논문 게재 추이 (월별) - 최적화: Django ORM 함수 사용
-        publication_trend = []
-        for trend_data in queryset.annotate(
-            year=ExtractYear('publication_date'),
-            month=ExtractMonth('publication_date')
-        ).values('year', 'month').annotate(
-            count=Count('id')
-        ).order_by('year', 'month'):
-            publication_trend.append({
-                "year": trend_data['year'],
-                "month": trend_data['month'],
-                "count": trend_data['count'],
-            })
+        # 논문 게재 추이 (월별)
+        publication_trend = [
+            {"year": year, "month": month, "count": count}
+            for (year, month), count in sorted(months.items())
+        ]
 
         response_data = {
             "journal_grade_distribution": journal_grade_distribution,
@@ -296,9 +344,10 @@ class StudentsView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    @cached_dashboard('students', ('student',), ('college', 'department', 'program_type', 'academic_status'))
     def get(self, request):
         """
-        데이터베이스에서 학생 데이터를 집계하여 반환합니다.
+        학생 수 롤업 테이블에서 집계하여 반환합니다.
 
         Query Parameters:
         - college (optional): 단과대학 필터
@@ -322,38 +371,31 @@ class StudentsView(APIView):
         if academic_status:
             filters &= Q(academic_status=academic_status)
 
-        queryset = StudentRoster.objects.filter(filters)
+        # 학생 수 롤업 (단과대학·학과·과정·학적상태 조합별 행만 읽음)
+        queryset = StudentRollup.objects.filter(filters)
+
+        # 학과별·과정별·학적상태별 학생 수를 한 번의 조회(GROUPING SETS)로 집계
+        totals = grouped_totals(queryset, STUDENT_GROUPING_SETS, F('row_count'))
 
         # 학과별 학생 수
-        students_by_department = []
-        for dept_data in queryset.values('department', 'college').annotate(
-            student_count=Count('id')
-        ):
-            students_by_department.append({
-                "department": dept_data['department'],
-                "college": dept_data['college'],
-                "student_count": dept_data['student_count'],
-            })
+        students_by_department = [
+            {"department": dept, "college": college_name, "student_count": count}
+            for (dept, college_name), count in sorted(
+                totals[('department', 'college')].items(), key=lambda item: (item[0][1], item[0][0])
+            )
+        ]
 
         # 과정별 학생 분포
-        students_by_program = []
-        for program_data in queryset.values('program_type').annotate(
-            student_count=Count('id')
-        ):
-            students_by_program.append({
-                "program_type": program_data['program_type'],
-                "student_count": program_data['student_count'],
-            })
+        students_by_program = [
+            {"program_type": program, "student_count": count}
+            for (program,), count in sorted(totals[('program_type',)].items())
+        ]
 
         # 학적상태별 통계
-        academic_status_statistics = []
-        for status_data in queryset.values('academic_status').annotate(
-            student_count=Count('id')
-        ):
-            academic_status_statistics.append({
-                "academic_status": status_data['academic_status'],
-                "student_count": status_data['student_count'],
-            })
+        academic_status_statistics = [
+            {"academic_status": status_name, "student_count": count}
+            for (status_name,), count in sorted(totals[('academic_status',)].items())
+        ]
 
         response_data = {
             "students_by_department": students_by_department,
@@ -372,9 +414,12 @@ class BudgetView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    @cached_dashboard(
+        'budget', ('project',), ('start_date', 'end_date', 'department', 'funding_agency', 'status'),
+    )
     def get(self, request):
         """
-        데이터베이스에서 예산 데이터를 집계하여 반환합니다.
+        연구비 집행 롤업(일별), 과제별 월 롤업과 기간 경계 달의 원본 데이터를 집계하여 반환합니다.
 
         Query Parameters:
         - start_date (optional): 조회 시작일 (YYYY-MM-DD)
@@ -389,18 +434,11 @@ class BudgetView(APIView):
         funding_agency = request.query_params.get("funding_agency")
         status_filter = request.query_params.get("status")
 
-        # 필터 적용
+        start = _parse_date(start_date)
+        end = _parse_date(end_date)
+
+        # 기간 외 필터 (롤업과 원본 테이블에 같은 필드명)
         filters = Q()
-        if start_date:
-            try:
-                filters &= Q(execution_date__gte=datetime.strptime(start_date, "%Y-%m-%d").date())
-            except ValueError:
-                pass
-        if end_date:
-            try:
-                filters &= Q(execution_date__lte=datetime.strptime(end_date, "%Y-%m-%d").date())
-            except ValueError:
-                pass
         if department:
             filters &= Q(department=department)
         if funding_agency:
@@ -408,7 +446,12 @@ class BudgetView(APIView):
         if status_filter:
             filters &= Q(status=status_filter)
 
-        queryset = ResearchProjectData.objects.filter(filters)
+        # 집행 롤업 (일자·학과·지원기관·상태 조합별 합계)
+        queryset = ProjectExpenseRollup.objects.filter(filters)
+        if start:
+            queryset = queryset.filter(execution_date__gte=start)
+        if end:
+            queryset = queryset.filter(execution_date__lte=end)
 
         # 연구비 집행 현황 (일별 집행 금액)
         research_budget_execution = []
@@ -425,7 +468,7 @@ class BudgetView(APIView):
         for agency_data in queryset.values('funding_agency').annotate(
             total_budget=Sum('total_budget'),
             executed_amount=Sum('expense_amount')
-        ):
+        ).order_by('funding_agency'):
             total_budget = agency_data['total_budget'] or 0
             executed_amount = agency_data['executed_amount'] or 0
             execution_rate = (executed_amount / total_budget * 100) if total_budget > 0 else 0.0
@@ -437,19 +480,28 @@ class BudgetView(APIView):
                 "execution_rate": round(execution_rate, 2),
             })
 
-        # 과제별 집행률
+        # 과제별 집행률: 온전한 달은 과제별 월 롤업, 기간 경계의 일부 달만 원본 테이블에서 합산
+        rollup, partial = _monthly_sources(
+            ProjectMonthlyRollup, ResearchProjectData, 'execution_date', filters, start, end,
+        )
+        projects = {}
+        for source in ([rollup] if rollup is not None else []) + partial:
+            for project_data in source.values('project_number', 'project_name').annotate(
+                total_budget=Sum('total_budget'),
+                executed_amount=Sum('expense_amount')
+            ).order_by():
+                key = (project_data['project_number'], project_data['project_name'])
+                sums = projects.setdefault(key, [0, 0])
+                sums[0] += project_data['total_budget'] or 0
+                sums[1] += project_data['executed_amount'] or 0
+
         project_execution_rates = []
-        for project_data in queryset.values('project_number', 'project_name').annotate(
-            total_budget=Sum('total_budget'),
-            executed_amount=Sum('expense_amount')
-        ).distinct():
-            total_budget = project_data['total_budget'] or 0
-            executed_amount = project_data['executed_amount'] or 0
+        for (project_number, project_name), (total_budget, executed_amount) in sorted(projects.items()):
             execution_rate = (executed_amount / total_budget * 100) if total_budget > 0 else 0.0
             
             project_execution_rates.append({
-                "project_number": project_data['project_number'],
-                "project_name": project_data['project_name'],
+                "project_number": project_number,
+                "project_name": project_name,
                 "total_budget": total_budget,
                 "executed_amount": executed_amount,
                 "execution_rate": round(execution_rate, 2),
@@ -5,6 +5,9 @@ from .models import (
     ResearchProjectData,
     StudentRoster,
     UploadLog,
+    UploadBatch,
+    UploadJob,
+    UploadSession,
 )
 
 
@@ -42,8 +45,38 @@ class StudentRosterAdmin(admin.ModelAdmin):
 
 @admin.register(UploadLog)
 class UploadLogAdmin(admin.ModelAdmin):
-    list_display = ['file_name', 'data_type', 'total_rows', 'success_rows', 'failed_rows', 'uploaded_by', 'created_at']
+    list_display = [
+        'file_name', 'data_type', 'total_rows', 'success_rows', 'failed_rows',
+        'inserted_rows', 'updated_rows', 'unchanged_rows', 'uploaded_by', 'created_at',
+    ]
     list_filter = ['data_type', 'created_at']
     search_fields = ['file_name', 'uploaded_by__username']
     ordering = ['-created_at']
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(UploadJob)
+class UploadJobAdmin(admin.ModelAdmin):
+    list_display = [
+        'file_name', 'data_type', 'status', 'rows_processed', 'batch', 'uploaded_by', 'created_at', 'finished_at',
+    ]
+    list_filter = ['status', 'data_type', 'created_at']
+    search_fields = ['file_name', 'uploaded_by__username']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'updated_at', 'started_at', 'finished_at']
+
+
+@admin.register(UploadBatch)
+class UploadBatchAdmin(admin.ModelAdmin):
+    list_display = ['id', 'file_count', 'uploaded_by', 'created_at']
+    search_fields = ['uploaded_by__username']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = ['file_name', 'data_type', 'status', 'received_bytes', 'total_size', 'uploaded_by', 'created_at']
+    list_filter = ['status', 'data_type']
+    search_fields = ['file_name']
+    ordering = ['-created_at']
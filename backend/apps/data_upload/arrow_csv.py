@@ -0,0 +1,208 @@
+"""
+PyArrow 기반 CSV 파싱 엔진 (settings.CSV_PARSER_ENGINE = 'pyarrow')
+
+pandas C 파서는 단일 스레드로 디코딩한 문자열을 읽고 모든 셀을 파이썬 객체로 만든다.
+PyArrow CSV 리더는 원본 바이트를 여러 스레드로 바로 파싱하고(UTF-8 BOM 은 리더가 건너뜀),
+단과대학·학과·저널등급·상태처럼 값 종류가 적은 컬럼은 사전(dictionary) 배열로 읽어
+pandas 에서도 Categorical 로 유지하므로 같은 문자열 객체를 행마다 만들지 않는다.
+
+결과 DataFrame 은 pandas 엔진(dtype=str, keep_default_na=False)과 같은 값을 갖는다:
+모든 컬럼이 문자열이고 빈 셀은 빈 문자열이다. 컬럼 수가 모자란 행은 Arrow 가 파일 전체를 거부하는 대신
+pandas 처럼 빈 문자열로 채워 원래 위치에 넣으므로, 빠진 필수값은 행 단위 검증 오류로 보고된다.
+pandas 는 중복된 헤더를 a, a.1 로 바꾸고 Arrow 는 컬럼 하나를 버리므로, 중복 헤더는 파싱 오류로 거부한다.
+
+pyarrow 는 선택 의존성이므로 이 모듈은 엔진을 고를 때만 import 한다.
+"""
+import csv
+import heapq
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+BLOCK_SIZE = 1 << 22  # 스트리밍 리더 블록 크기 (4MB)
+UTF8_ENCODINGS = ('utf-8', 'utf8', 'utf-8-sig', 'utf_8', 'utf_8_sig')
+
+
+def _header(line: bytes, encoding: str) -> List[str]:
+    """
+    헤더 행의 컬럼명
+
+    Raises:
+        ValueError: 같은 컬럼명이 두 번 이상 나옴
+    """
+    text = line.decode(encoding).lstrip('\ufeff')
+    columns = next(csv.reader([text]), [])
+    duplicates = sorted({column for column in columns if columns.count(column) > 1})
+    if duplicates:
+        raise ValueError(f"중복된 컬럼명: {', '.join(duplicates)}")
+    return columns
+
+
+class ShortRows:
+    """
+    컬럼 수가 모자란 행을 빈 문자열로 채워 원래 위치에 다시 넣기 (ParseOptions.invalid_row_handler)
+
+    Arrow 는 핸들러가 건너뛴 행을 결과에서 빼므로, 채운 행을 행 번호와 함께 모아 두었다가
+    레코드 배치 사이에 끼워 넣는다. 컬럼이 더 많은 행은 pandas 처럼 그대로 파싱 오류로 둔다.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+        self.rows: List[Tuple[int, int, Dict[str, str]]] = []  # (데이터 행 위치, 도착 순서, 값) 힙
+        self.numbered = True  # 다중 스레드 read_csv 는 행 번호를 알려 주지 않음
+
+    def __bool__(self) -> bool:
+        return bool(self.rows)
+
+    def __call__(self, row) -> str:
+        if row.actual_columns > row.expected_columns:
+            return 'error'
+        if row.number is None:
+            self.numbered = False
+        values = next(csv.reader([row.text]), [])
+        values += [''] * (len(self.columns) - len(values))
+        position = (row.number or 0) - 2  # row.number 는 헤더를 1 로 센 행 번호 (빈 줄 제외)
+        heapq.heappush(self.rows, (position, len(self.rows), dict(zip(self.columns, values))))
+        return 'skip'
+
+    def insert(self, batches: Iterable[pa.RecordBatch], schema: pa.Schema) -> Iterator[pa.RecordBatch]:
+        """건너뛴 행을 채운 값으로 원래 위치에 끼워 넣은 레코드 배치"""
+        position = 0
+        for batch in batches:
+            offset = 0
+            while self.rows and self.rows[0][0] <= position + batch.num_rows - offset:
+                size = self.rows[0][0] - position
+                if size:
+                    yield batch.slice(offset, size)
+                    offset += size
+                    position += size
+                yield self._batch(schema)
+                position += 1
+            if offset < batch.num_rows:
+                yield batch.slice(offset)
+                position += batch.num_rows - offset
+        while self.rows:  # 마지막 블록 끝의 행
+            yield self._batch(schema)
+
+    def _batch(self, schema: pa.Schema) -> pa.RecordBatch:
+        _, _, values = heapq.heappop(self.rows)
+        return pa.RecordBatch.from_pylist([values], schema=schema)
+
+
+def _options(
+    columns: List[str],
+    encoding: str,
+    usecols: Optional[Iterable[str]],
+    dictionary_columns: Iterable[str],
+    short_rows: ShortRows,
+    block_size: Optional[int] = None,
+    use_threads: bool = True,
+):
+    """모든 컬럼을 문자열(저카디널리티 컬럼은 사전 배열)로, 빈 셀은 빈 문자열로 읽는 옵션"""
+    dictionary_columns = set(dictionary_columns)
+    include_columns = None
+    if usecols is not None:
+        usecols = set(usecols)
+        include_columns = [column for column in columns if column in usecols]  # 파일에 없는 컬럼명은 무시
+    read_options = pa_csv.ReadOptions(use_threads=use_threads)
+    if encoding.lower() not in UTF8_ENCODINGS:
+        read_options.encoding = encoding
+    if block_size:
+        read_options.block_size = block_size
+    convert_options = pa_csv.ConvertOptions(
+        column_types={
+            column: pa.dictionary(pa.int32(), pa.string()) if column in dictionary_columns else pa.string()
+            for column in columns
+        },
+        strings_can_be_null=False,
+        quoted_strings_can_be_null=False,
+        null_values=[],
+        include_columns=include_columns,
+    )
+    parse_options = pa_csv.ParseOptions(invalid_row_handler=short_rows)
+    return read_options, parse_options, convert_options
+
+
+def to_frame(table: pa.Table) -> pd.DataFrame:
+    """Arrow 테이블 → DataFrame (문자열은 object, 사전 배열은 Categorical)"""
+    return table.to_pandas()
+
+
+def read_csv(
+    file_content: bytes,
+    encoding: str = 'utf-8-sig',
+    usecols: Optional[Iterable[str]] = None,
+    dictionary_columns: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    바이트 전체를 다중 스레드로 파싱
+
+    다중 스레드 파싱은 건너뛴 행의 번호를 알려 주지 않으므로, 컬럼 수가 모자란 행이 있으면 한 스레드로 다시 파싱한다.
+    """
+    columns = _header(file_content.split(b'\n', 1)[0].rstrip(b'\r'), encoding)
+    for use_threads in (True, False):
+        short_rows = ShortRows(columns)
+        read_options, parse_options, convert_options = _options(
+            columns, encoding, usecols, dictionary_columns, short_rows, use_threads=use_threads,
+        )
+        table = pa_csv.read_csv(
+            pa.BufferReader(file_content),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        if short_rows.numbered:
+            break
+    if short_rows:
+        table = pa.Table.from_batches(list(short_rows.insert(table.to_batches(), table.schema)), schema=table.schema)
+    return to_frame(table)
+
+
+def iter_csv_chunks(
+    source: BinaryIO,
+    chunk_size: int,
+    encoding: str = 'utf-8-sig',
+    usecols: Optional[Iterable[str]] = None,
+    dictionary_columns: Iterable[str] = (),
+) -> Iterator[pd.DataFrame]:
+    """
+    파일 객체를 블록 단위로 스트리밍 파싱해 chunk_size 행씩 DataFrame 으로 반환
+
+    행 번호 계산이 pandas 엔진과 같도록 Arrow 블록 경계와 관계없이 청크 크기를 맞춘다.
+    """
+    start = source.tell()
+    columns = _header(source.readline().rstrip(b'\r\n'), encoding)
+    source.seek(start)
+    short_rows = ShortRows(columns)
+    read_options, parse_options, convert_options = _options(
+        columns, encoding, usecols, dictionary_columns, short_rows, BLOCK_SIZE,
+    )
+    reader = pa_csv.open_csv(
+        source, read_options=read_options, parse_options=parse_options, convert_options=convert_options,
+    )
+
+    for table in rebatch(short_rows.insert(reader, reader.schema), reader.schema, chunk_size):
+        yield to_frame(table)
+
+
+def rebatch(batches: Iterable[pa.RecordBatch], schema: pa.Schema, chunk_size: int) -> Iterator[pa.Table]:
+    """레코드 배치를 chunk_size 행씩 테이블로 다시 묶기 (마지막 테이블만 더 작을 수 있음)"""
+    pending: List[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows < chunk_size:
+            continue
+        table = pa.Table.from_batches(pending, schema=schema)
+        offset = 0
+        while pending_rows - offset >= chunk_size:
+            yield table.slice(offset, chunk_size)
+            offset += chunk_size
+        rest = table.slice(offset)
+        pending = rest.to_batches()
+        pending_rows = rest.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending, schema=schema)
@@ -0,0 +1,191 @@
+"""
+일괄 업로드 (CSV 여러 개 또는 ZIP)
+
+파일마다 헤더로 데이터 유형을 판별해 UploadJob 을 등록하고 UploadBatch 로 묶는다.
+비동기 모드에서는 업로드 워커가 작업들을 동시에 처리하고(같은 배치의 같은 데이터 유형은 하나씩),
+동기 모드에서는 run_upload_batch 가 요청 안에서 데이터 유형별 스레드로 처리한다.
+"""
+import csv
+import os
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import close_old_connections, connection, transaction
+
+from apps.data_upload.idempotency import file_sha256
+from apps.data_upload.jobs import claim_job, new_job_file_path, run_upload_job
+from apps.data_upload.models import UploadBatch, UploadJob
+from apps.data_upload.schemas import detect_data_type
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def read_header(path: Path) -> List[str]:
+    """CSV 첫 줄(헤더)의 컬럼명 목록 (UTF-8 이 아니면 빈 목록)"""
+    with open(path, 'rb') as f:
+        line = f.readline()
+    try:
+        text = line.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return []
+    return next(csv.reader([text]), [])
+
+
+class _StagingLimit:
+    """일괄 업로드 전체의 파일 수·크기 제한 확인"""
+
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+
+    def add_file(self) -> None:
+        self.files += 1
+        if self.files > settings.UPLOAD_BATCH_MAX_FILES:
+            raise ValueError(f"한 번에 올릴 수 있는 파일은 {settings.UPLOAD_BATCH_MAX_FILES}개까지입니다.")
+
+    def add_bytes(self, size: int) -> None:
+        self.bytes += size
+        if self.bytes > settings.UPLOAD_BATCH_MAX_SIZE:
+            raise ValueError(
+                f"일괄 업로드 전체 크기는 {settings.UPLOAD_BATCH_MAX_SIZE // 1024 ** 2}MB 를 넘을 수 없습니다."
+            )
+
+
+def _copy_to_job_file(source: BinaryIO, limit: _StagingLimit) -> Path:
+    """원본 스트림을 작업 디렉터리의 새 파일로 복사 (ZIP 압축 해제 크기도 실제 바이트로 제한)"""
+    path = new_job_file_path()
+    try:
+        with open(path, 'wb') as destination:
+            for chunk in iter(lambda: source.read(COPY_CHUNK_SIZE), b''):
+                limit.add_bytes(len(chunk))
+                destination.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def stage_batch_files(
+    files: Iterable[UploadedFile],
+) -> Tuple[List[Tuple[str, Path]], List[Dict[str, Any]]]:
+    """
+    업로드 파일(CSV, ZIP)을 작업 디렉터리에 저장하고 ZIP 은 안의 CSV 를 풀어 둔다
+
+    Returns:
+        ([(파일명, 저장 경로)], [건너뛴 항목 {file_name, error}])
+
+    Raises:
+        ValueError: 지원하지 않는 파일, 손상된 ZIP, 파일 수·크기 제한 초과 (저장한 파일은 삭제)
+    """
+    limit = _StagingLimit()
+    staged = []
+    skipped = []
+    try:
+        for file in files:
+            name = file.name.lower()
+            if name.endswith('.csv'):
+                limit.add_file()
+                staged.append((file.name, _copy_to_job_file(file, limit)))
+            elif name.endswith('.zip'):
+                try:
+                    archive = zipfile.ZipFile(file)
+                except zipfile.BadZipFile:
+                    raise ValueError(f"ZIP 파일을 열 수 없습니다: {file.name}")
+                with archive:
+                    for entry in archive.infolist():
+                        entry_name = PurePosixPath(entry.filename).name
+                        if entry.is_dir() or entry.filename.startswith('__MACOSX/') or entry_name.startswith('.'):
+                            continue
+                        if not entry_name.lower().endswith('.csv'):
+                            skipped.append({"file_name": entry.filename, "error": "CSV 파일이 아닙니다."})
+                            continue
+                        limit.add_file()
+                        with archive.open(entry) as source:
+                            staged.append((entry_name, _copy_to_job_file(source, limit)))
+            else:
+                raise ValueError(f"CSV 또는 ZIP 파일만 업로드 가능합니다: {file.name}")
+    except Exception:
+        for _, path in staged:
+            os.remove(path)
+        raise
+    return staged, skipped
+
+
+def create_upload_batch(
+    files: Iterable[UploadedFile],
+    uploaded_by,
+) -> Tuple[Optional[UploadBatch], List[Dict[str, Any]]]:
+    """
+    파일마다 헤더로 데이터 유형을 판별해 queued 작업으로 등록하고 배치로 묶는다
+
+    Returns:
+        (batch, skipped) - 등록할 파일이 하나도 없으면 batch 는 None
+    """
+    staged, skipped = stage_batch_files(files)
+
+    jobs = []
+    for file_name, path in staged:
+        data_type = detect_data_type(read_header(path))
+        if data_type is None:
+            os.remove(path)
+            skipped.append({"file_name": file_name, "error": "헤더로 데이터 유형을 판별할 수 없습니다."})
+            continue
+        with open(path, 'rb') as f:
+            content_hash = file_sha256(f)
+        jobs.append(UploadJob(
+            file_name=file_name,
+            data_type=data_type,
+            file_path=str(path),
+            bytes_total=path.stat().st_size,
+            content_hash=content_hash,
+            uploaded_by=uploaded_by,
+        ))
+
+    if not jobs:
+        return None, skipped
+
+    with transaction.atomic():
+        batch = UploadBatch.objects.create(file_count=len(jobs), uploaded_by=uploaded_by)
+        for job in jobs:
+            job.batch = batch
+        UploadJob.objects.bulk_create(jobs)
+    return batch, skipped
+
+
+def _run_jobs_in_thread(jobs: List[UploadJob]) -> None:
+    close_old_connections()
+    try:
+        for job in jobs:
+            run_upload_job(job)
+    finally:
+        connection.close()
+
+
+def run_upload_batch(batch: UploadBatch, max_workers: Optional[int] = None) -> UploadBatch:
+    """
+    배치의 queued 작업을 요청 안에서 바로 처리 (동기 모드)
+
+    데이터 유형이 다른 파일은 서로 독립적이므로 스레드 풀에서 동시에 처리하고,
+    같은 데이터 유형의 파일은 같은 스레드에서 파일명 순서대로 처리한다.
+    SQLite 는 동시 쓰기를 지원하지 않으므로 현재 연결에서 차례로 처리한다.
+    """
+    groups = defaultdict(list)
+    for job in batch.jobs.select_related('uploaded_by').order_by('file_name'):
+        if claim_job(job.pk):
+            groups[job.data_type].append(job)
+
+    if connection.vendor == 'sqlite' or len(groups) <= 1:
+        for jobs in groups.values():
+            for job in jobs:
+                run_upload_job(job)
+        return batch
+
+    max_workers = min(len(groups), max_workers or settings.UPLOAD_WORKER_THREADS)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='upload-batch') as pool:
+        list(pool.map(_run_jobs_in_thread, groups.values()))
+    return batch
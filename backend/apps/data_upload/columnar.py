@@ -0,0 +1,166 @@
+"""
+Parquet / Arrow IPC 업로드 파일 읽기
+
+데이터 웨어하우스가 내보낸 컬럼형 파일을 CSV 로 바꾸지 않고 같은 검증 경로(CompiledSchema)에 넣는다.
+
+- 헤더 매핑과 검증 규칙은 CSV 와 같다 (schemas.py 의 헤더 후보, 범위, 허용 값, 자연키).
+- 이미 숫자·날짜 타입인 컬럼은 문자열로 바꾸지 않고 그대로 넘기며(validation 의 타입 경로),
+  문자열 컬럼은 CSV 와 똑같이 변환·검증한다. 스키마 필드와 맞지 않는 타입(예: 학년이 날짜)이면 파일을 거부한다.
+- Parquet 은 행 그룹 단위로, Arrow IPC 는 레코드 배치 단위로 읽으므로 메모리는 청크 크기에 비례한다.
+
+pyarrow 는 선택 의존성이므로 이 모듈은 컬럼형 파일을 처리할 때만 import 한다.
+"""
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+from apps.data_upload.arrow_csv import rebatch
+from apps.data_upload.schemas import AMOUNT, DATE, FLOAT, INT, TRUNCATED_INT, get_schema
+
+FORMAT_PARQUET = 'parquet'
+FORMAT_ARROW = 'arrow'
+
+NUMERIC_DTYPES = (INT, TRUNCATED_INT, AMOUNT, FLOAT)
+
+# 컬럼 변환 방식
+AS_TEXT = 'text'  # 문자열로 변환 (null → '')
+AS_NUMBER = 'number'  # 숫자 그대로 (null → NaN)
+AS_DATE = 'date'  # 날짜 그대로 (null → NaT)
+
+
+def _is_text(arrow_type: pa.DataType) -> bool:
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    # 값이 모두 비어 있는 컬럼(null 타입)은 빈 문자열 컬럼으로 다룬다
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type) or pa.types.is_null(arrow_type)
+
+
+def _is_number(arrow_type: pa.DataType) -> bool:
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type)
+
+
+def _is_date(arrow_type: pa.DataType) -> bool:
+    return pa.types.is_date(arrow_type) or pa.types.is_timestamp(arrow_type)
+
+
+def column_plan(arrow_schema: pa.Schema, data_type: str) -> Dict[str, str]:
+    """
+    파일 컬럼별 변환 방식 (스키마에 없는 컬럼은 문자열)
+
+    Raises:
+        ValueError: 스키마 필드와 맞지 않는 타입의 컬럼
+    """
+    dtypes = {
+        header: field.dtype
+        for field in get_schema(data_type).fields
+        for header in field.header_candidates
+    }
+    plan = {}
+    mismatched = []
+    for column in arrow_schema:
+        dtype = dtypes.get(column.name)
+        if _is_text(column.type) or dtype is None:
+            plan[column.name] = AS_TEXT
+        elif dtype in NUMERIC_DTYPES and _is_number(column.type):
+            plan[column.name] = AS_NUMBER
+        elif dtype == DATE and _is_date(column.type):
+            plan[column.name] = AS_DATE
+        elif dtype not in NUMERIC_DTYPES and dtype != DATE and (_is_number(column.type) or _is_date(column.type)):
+            plan[column.name] = AS_TEXT  # 문자열 필드의 숫자 컬럼 (예: 학번 int64)
+        else:
+            mismatched.append(f"{column.name}({column.type})")
+    if mismatched:
+        raise ValueError(f"컬럼 타입이 스키마와 맞지 않습니다: {', '.join(mismatched)}")
+    return plan
+
+
+def _convert(column: pa.ChunkedArray, how: str) -> pa.ChunkedArray:
+    if how == AS_TEXT:
+        if not pa.types.is_string(column.type):
+            column = pc.cast(column, pa.string())
+        return pc.fill_null(column, '')
+    if how == AS_NUMBER and pa.types.is_decimal(column.type):
+        return pc.cast(column, pa.float64())
+    if how == AS_DATE and pa.types.is_date(column.type):
+        return pc.cast(column, pa.timestamp('s'))
+    return column
+
+
+def to_frame(table: pa.Table, plan: Dict[str, str]) -> pd.DataFrame:
+    """변환 방식대로 바꾼 DataFrame (문자열은 object, 숫자는 float/int, 날짜는 datetime64)"""
+    columns = [_convert(table.column(name), plan[name]) for name in table.column_names]
+    return pa.table(columns, names=table.column_names).to_pandas()
+
+
+def _open(source: BinaryIO, file_format: str, columns: Optional[List[str]] = None, batch_size: int = 65536):
+    """(Arrow 스키마, 레코드 배치 이터레이터, 전체 행 수 - 스트림 형식은 None)"""
+    if file_format == FORMAT_PARQUET:
+        parquet = pq.ParquetFile(source)
+        # iter_batches 는 행 그룹을 하나씩 읽는다
+        batches = parquet.iter_batches(batch_size=batch_size, columns=columns)
+        return parquet.schema_arrow, batches, parquet.metadata.num_rows
+
+    start = source.tell()
+    try:
+        reader = pa.ipc.open_file(source)
+    except pa.ArrowInvalid:
+        # 파일 형식이 아니면 스트림 형식
+        source.seek(start)
+        stream = pa.ipc.open_stream(source)
+        batches = (batch.select(columns) if columns is not None else batch for batch in stream)
+        return stream.schema, batches, None
+    batches = (
+        reader.get_batch(i).select(columns) if columns is not None else reader.get_batch(i)
+        for i in range(reader.num_record_batches)
+    )
+    return reader.schema, batches, reader.count_rows()
+
+
+def read_schema(source: BinaryIO, file_format: str) -> Tuple[pa.Schema, Optional[int]]:
+    """
+    (Arrow 스키마, 전체 행 수 - 스트림 형식은 None), 읽은 뒤 처음 위치로 되감는다
+
+    Raises:
+        ValueError: 파일을 읽을 수 없음
+    """
+    start = source.tell()
+    try:
+        arrow_schema, _, num_rows = _open(source, file_format)
+    except (pa.ArrowException, OSError) as e:
+        raise ValueError(f"{file_format} 파일을 읽을 수 없습니다: {e}")
+    finally:
+        source.seek(start)
+    return arrow_schema, num_rows
+
+
+def iter_columnar_chunks(
+    source: BinaryIO,
+    file_format: str,
+    data_type: str,
+    chunk_size: int,
+    usecols: Optional[Iterable[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    컬럼형 파일을 chunk_size 행씩 DataFrame 으로 반환 (행 번호 계산이 CSV 와 같도록 청크 크기를 맞춘다)
+
+    Raises:
+        ValueError: 파일을 읽을 수 없거나 컬럼 타입이 스키마와 맞지 않음
+    """
+    try:
+        arrow_schema, _ = read_schema(source, file_format)
+        columns = None
+        if usecols is not None:
+            usecols = set(usecols)
+            columns = [name for name in arrow_schema.names if name in usecols]  # 파일에 없는 컬럼명은 무시
+            arrow_schema = pa.schema([arrow_schema.field(name) for name in columns])
+        plan = column_plan(arrow_schema, data_type)
+
+        _, batches, _ = _open(source, file_format, columns, chunk_size)
+        for table in rebatch(batches, arrow_schema, chunk_size):
+            yield to_frame(table, plan)
+    except (pa.ArrowException, OSError) as e:
+        raise ValueError(f"{file_format} 파일을 읽을 수 없습니다: {e}")
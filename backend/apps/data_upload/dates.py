@@ -0,0 +1,93 @@
+"""
+날짜 컬럼 파싱
+
+dateutil.parser.parse 를 행마다 호출하는 대신:
+1. 같은 문자열은 한 번만 파싱한다 (집행내역은 같은 집행일자가 수천 행씩 반복됨).
+2. 고유 값들에서 가장 많이 맞는 형식(ISO, 슬래시, 점, 숫자 8자리 등)을 고르고,
+   그 형식에 맞는 값은 pd.to_datetime(format=...) 으로 한 번에 변환한다.
+3. 형식에 맞지 않는 값만 dateutil 로 개별 파싱한다 (결과는 프로세스 단위로 캐시).
+
+결과는 dateutil.parser.parse(value).date() 와 같다.
+"""
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# (엄격한 패턴, strptime 형식) — 패턴에 맞는 값은 dateutil 과 같은 날짜로 해석되는 형식만 사용
+DATE_FORMATS = [
+    (r'\d{4}-\d{1,2}-\d{1,2}', '%Y-%m-%d'),
+    (r'\d{4}/\d{1,2}/\d{1,2}', '%Y/%m/%d'),
+    (r'\d{4}\.\d{1,2}\.\d{1,2}', '%Y.%m.%d'),
+    (r'\d{8}', '%Y%m%d'),
+    (r'\d{1,2}/\d{1,2}/\d{4}', '%m/%d/%Y'),
+]
+
+
+@lru_cache(maxsize=8192)
+def _parse_lenient(text: str) -> Optional[date]:
+    from dateutil.parser import parse
+
+    try:
+        return parse(text).date()
+    except (ValueError, TypeError, AttributeError, OverflowError):
+        return None
+
+
+def parse_date(text: str) -> date:
+    """
+    dateutil.parser.parse(text).date() 의 캐시 버전
+
+    Raises:
+        ValueError: 날짜로 해석할 수 없는 경우
+    """
+    parsed = _parse_lenient(text)
+    if parsed is None:
+        raise ValueError(f"날짜 형식이 아닙니다: {text}")
+    return parsed
+
+
+def infer_date_format(values: pd.Series) -> Optional[Tuple[str, str]]:
+    """
+    고유 날짜 문자열에서 가장 많이 맞는 (패턴, 형식) 선택 (맞는 형식이 없으면 None)
+    """
+    best, best_count = None, 0
+    for pattern, fmt in DATE_FORMATS:
+        count = int(values.str.fullmatch(pattern).sum())
+        if count > best_count:
+            best, best_count = (pattern, fmt), count
+    return best
+
+
+def parse_date_column(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    날짜 컬럼 일괄 파싱
+
+    Returns:
+        (values, ok) — values 는 datetime.date 객체 배열(실패한 셀은 None), ok 는 성공 여부
+    """
+    codes, uniques = pd.factorize(raw.astype(str), sort=False)
+    uniques = pd.Series(uniques, dtype=object)
+
+    parsed = np.full(len(uniques), None, dtype=object)
+    pending = np.ones(len(uniques), dtype=bool)
+
+    inferred = infer_date_format(uniques)
+    if inferred is not None:
+        pattern, fmt = inferred
+        matched = uniques.str.fullmatch(pattern).to_numpy(dtype=bool)
+        converted = pd.to_datetime(uniques[matched], format=fmt, errors='coerce')
+        converted_ok = converted.notna().to_numpy()
+        positions = np.flatnonzero(matched)[converted_ok]
+        parsed[positions] = converted[converted_ok].dt.date.to_numpy()
+        pending[positions] = False
+
+    for pos in np.flatnonzero(pending):
+        parsed[pos] = _parse_lenient(uniques.iat[pos])
+
+    values = parsed[codes]
+    ok = np.array([value is not None for value in values], dtype=bool)
+    return values, ok
@@ -0,0 +1,126 @@
+"""
+파일 안 자연키 중복 검출
+
+본 검증·저장 전에 자연키 컬럼만 읽어 파일 전체의 키를 해시 테이블로 훑고, 같은 키가 두 번 이상
+나온 행을 정책에 따라 행 오류로 표시한다. 어떤 행을 저장할지 적재 전에 정해지므로,
+같은 키가 한 배치에 들어가 유니크 제약 위반으로 배치가 되돌려지는 일이 없다.
+중복된 키의 행은 전체 필드를 검증해 유효한 행 중에서 저장할 행을 고른다
+(저장하기로 한 행이 검증에서 떨어져 그 키가 하나도 저장되지 않는 일이 없도록).
+
+Django 에 의존하지 않는다.
+"""
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from apps.data_upload.schemas import get_schema
+from apps.data_upload.validation import CompiledSchema, compile_schema
+
+DUPLICATE_LAST = 'last'      # 마지막 행 저장, 앞선 행은 오류
+DUPLICATE_FIRST = 'first'    # 첫 행 저장, 뒤따르는 행은 오류
+DUPLICATE_REJECT = 'reject'  # 중복된 키의 행 모두 오류
+DUPLICATE_POLICIES = (DUPLICATE_LAST, DUPLICATE_FIRST, DUPLICATE_REJECT)
+
+
+def key_columns(data_type: str) -> Set[str]:
+    """자연키 필드의 헤더 후보 (키 검사용으로 읽을 컬럼)"""
+    schema = get_schema(data_type)
+    return {
+        header
+        for field in schema.fields if field.name in schema.natural_key
+        for header in field.header_candidates
+    }
+
+
+def find_duplicate_rows(
+    chunks: Iterable[pd.DataFrame],
+    data_type: str,
+    policy: str = DUPLICATE_LAST,
+    invalid_rows: Optional[Callable[[Set[int]], Set[int]]] = None,
+) -> Dict[int, str]:
+    """
+    파일 안에서 자연키가 중복된 행 중 저장하지 않을 행 찾기
+
+    키 값은 본 검증과 같은 변환(공백 제거, 정수 변환 등)을 거친 값으로 비교하며,
+    키 자체가 유효하지 않은 행은 본 검증에서 오류가 되므로 비교 대상에서 뺀다.
+
+    Args:
+        chunks: 자연키 컬럼만 읽은 DataFrame 청크 (iter_csv_chunks(..., usecols=key_columns(...)))
+        data_type: 데이터 유형
+        policy: DUPLICATE_LAST / DUPLICATE_FIRST / DUPLICATE_REJECT
+        invalid_rows: 중복된 키의 행 번호 집합을 받아 그중 본 검증에서 실패하는 행을 돌려주는 함수
+            (find_invalid_rows). 실패하는 행은 저장 후보에서 빼고, 남은 유효한 행이 둘 이상일 때만 중복으로 본다.
+
+    Returns:
+        {CSV 행 번호: 오류 메시지}
+    """
+    if policy not in DUPLICATE_POLICIES:
+        raise ValueError(f"지원하지 않는 중복 키 처리 방식: {policy}")
+
+    schema = get_schema(data_type)
+    key_schema = replace(schema, fields=tuple(field for field in schema.fields if field.name in schema.natural_key))
+
+    first_rows: Dict[Tuple[Any, ...], int] = {}
+    repeated: Dict[Tuple[Any, ...], List[int]] = {}
+    compiled = None
+    start_row = 2
+    for chunk in chunks:
+        if compiled is None:
+            compiled = CompiledSchema(key_schema, chunk.columns)
+        records, errors = compiled.validate(chunk, start_row)
+        failed = {error['row'] for error in errors}
+        rows = [row for row in range(start_row, start_row + len(chunk)) if row not in failed]
+        for row, record in zip(rows, records):
+            key = tuple(record[name] for name in schema.natural_key)
+            first = first_rows.setdefault(key, row)
+            if first != row:
+                repeated.setdefault(key, [first]).append(row)
+        start_row += len(chunk)
+
+    if repeated and invalid_rows is not None:
+        # 본 검증에서 실패하는 행은 저장 후보에서 제외 (그 행은 자체 검증 오류로 보고됨)
+        failed = invalid_rows({row for rows in repeated.values() for row in rows})
+        valid_repeated: Dict[Tuple[Any, ...], List[int]] = {}
+        for key, rows in repeated.items():
+            rows = [row for row in rows if row not in failed]
+            if len(rows) > 1:
+                valid_repeated[key] = rows
+        repeated = valid_repeated
+
+    duplicates: Dict[int, str] = {}
+    for key, rows in repeated.items():
+        described = ", ".join(f"{name}={value}" for name, value in zip(schema.natural_key, key))
+        if policy == DUPLICATE_REJECT:
+            message = f"파일 안에서 키가 중복됩니다 ({described}): {', '.join(map(str, rows))}행 모두 제외"
+            rejected = rows
+        else:
+            kept = rows[-1] if policy == DUPLICATE_LAST else rows[0]
+            message = f"파일 안에서 키가 중복됩니다 ({described}): {kept}행만 저장"
+            rejected = [row for row in rows if row != kept]
+        for row in rejected:
+            duplicates[row] = message
+    return duplicates
+
+
+def find_invalid_rows(chunks: Iterable[pd.DataFrame], data_type: str, rows: Set[int]) -> Set[int]:
+    """
+    rows 중 전체 필드 검증에서 실패하는 행 번호
+
+    Args:
+        chunks: 전체 컬럼을 읽은 DataFrame 청크
+        data_type: 데이터 유형
+        rows: 검사할 CSV 행 번호 (나머지 행은 검증하지 않음)
+    """
+    failed: Set[int] = set()
+    compiled = None
+    start_row = 2
+    for chunk in chunks:
+        if compiled is None:
+            compiled = compile_schema(data_type, chunk.columns)
+        positions = [row - start_row for row in sorted(rows) if start_row <= row < start_row + len(chunk)]
+        if positions:
+            _, errors = compiled.validate(chunk.iloc[positions].reset_index(drop=True), 0)
+            failed.update(positions[error['row']] + start_row for error in errors)
+        start_row += len(chunk)
+    return failed
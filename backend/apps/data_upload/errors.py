@@ -0,0 +1,86 @@
+"""
+업로드 오류 수집
+
+실패한 행을 모두 메모리에 모으지 않고, 앞쪽 일부(표본)만 메모리에 남기고 전체 오류는
+gzip 압축 CSV 보고서 파일에 청크 단위로 이어서 기록한다. 보고서는 업로드 이력 API 로 내려받는다.
+"""
+import csv
+import gzip
+import io
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+REPORT_HEADER = ['행', '오류', '원본 데이터']
+
+
+class ErrorSink:
+    """
+    행 오류 수집기
+
+    Attributes:
+        count: 지금까지 받은 전체 오류 수
+        sample: 앞에서부터 sample_size 개의 오류 (응답·UploadLog.error_details 용)
+        path: 보고서 파일 경로 (오류가 없으면 None)
+    """
+
+    def __init__(self, sample_size: Optional[int] = None, report_dir: Optional[str] = None):
+        self.sample_size = settings.UPLOAD_ERROR_SAMPLE_SIZE if sample_size is None else sample_size
+        self.report_dir = Path(report_dir or settings.UPLOAD_ERROR_REPORT_DIR)
+        self.count = 0
+        self.sample: List[Dict[str, Any]] = []
+        self.path: Optional[str] = None
+        self._file = None
+        self._writer = None
+
+    def add(self, errors: Iterable[Dict[str, Any]]) -> None:
+        """청크 하나의 오류 목록 추가 ({row, reason, data})"""
+        for error in errors:
+            if len(self.sample) < self.sample_size:
+                self.sample.append(error)
+            if self._writer is None:
+                self._open()
+            self._writer.writerow([
+                error['row'],
+                error['reason'],
+                json.dumps(error['data'], ensure_ascii=False, default=str),
+            ])
+            self.count += 1
+
+    def _open(self) -> None:
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        self.path = str(self.report_dir / f"{uuid.uuid4()}.csv.gz")
+        # 압축을 푼 CSV 를 엑셀에서 바로 열 수 있도록 BOM 포함
+        self._file = io.TextIOWrapper(gzip.open(self.path, 'wb'), encoding='utf-8-sig', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(REPORT_HEADER)
+
+    def close(self) -> Optional[str]:
+        """보고서 파일을 닫고 경로 반환 (오류가 없었으면 None)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return self.path
+
+    def discard(self) -> None:
+        """처리 실패 시 보고서 파일 삭제"""
+        self.close()
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+
+    def __enter__(self) -> 'ErrorSink':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
@@ -0,0 +1,77 @@
+"""
+중복 업로드 감지
+
+- 같은 사용자가 같은 Idempotency-Key 로 다시 요청하면 이전 작업/결과를 그대로 돌려준다 (타임아웃 재시도).
+- 같은 data_type 의 마지막 업로드가 같은 사용자의 같은 파일 내용(SHA-256)이면 다시 파싱·저장하지 않고 이전 결과를 돌려준다.
+  그 사이 같은 유형의 다른 업로드가 있었다면 데이터가 달라졌을 수 있으므로 다시 처리한다.
+  다른 사용자의 업로드 로그는 돌려주지 않는다 (업로드 이력·오류 보고서는 올린 사람 기준).
+"""
+import hashlib
+from typing import BinaryIO, Optional, Union
+
+from apps.data_upload.models import UploadJob, UploadLog
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file: BinaryIO) -> str:
+    """
+    파일 객체의 SHA-256 (고정 크기 버퍼로 읽으며, 읽은 뒤 처음 위치로 되돌린다)
+    """
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def find_previous_upload(
+    uploaded_by,
+    data_type: str,
+    content_hash: str,
+    idempotency_key: Optional[str] = None,
+) -> Optional[Union[UploadJob, UploadLog]]:
+    """
+    이전 결과를 재사용할 수 있는 업로드 작업 또는 업로드 로그 조회
+
+    Returns:
+        실패하지 않은 UploadJob (대기/처리 중/완료), UploadLog, 또는 None
+    """
+    if idempotency_key:
+        job = (
+            UploadJob.objects.select_related('upload_log')
+            .filter(uploaded_by=uploaded_by, idempotency_key=idempotency_key)
+            .exclude(status=UploadJob.STATUS_FAILED)
+            .order_by('-created_at')
+            .first()
+        )
+        if job is not None:
+            return job
+        upload_log = (
+            UploadLog.objects.filter(uploaded_by=uploaded_by, idempotency_key=idempotency_key)
+            .order_by('-created_at')
+            .first()
+        )
+        if upload_log is not None:
+            return upload_log
+
+    # 아직 처리 중인 같은 파일의 작업 (작업 상태 조회는 본인만 가능하므로 같은 사용자로 한정)
+    job = (
+        UploadJob.objects.filter(
+            uploaded_by=uploaded_by,
+            data_type=data_type,
+            content_hash=content_hash,
+            status__in=[UploadJob.STATUS_QUEUED, UploadJob.STATUS_RUNNING],
+        )
+        .order_by('-created_at')
+        .first()
+    )
+    if job is not None:
+        return job
+
+    # 마지막 업로드가 다른 사용자 것이면 같은 파일이라도 그 사용자의 로그를 넘기지 않고 다시 처리
+    latest = UploadLog.objects.filter(data_type=data_type).order_by('-created_at').first()
+    if latest is not None and latest.content_hash == content_hash and latest.uploaded_by_id == uploaded_by.pk:
+        return latest
+    return None
@@ -0,0 +1,358 @@
+"""
+비동기 CSV 업로드 작업 처리
+
+업로드 요청은 파일을 디스크에 저장하고 UploadJob 을 queued 상태로 등록한 뒤 바로 응답한다.
+워커 프로세스(manage.py run_upload_worker)가 스레드 풀로 DB 에서 대기 작업을 가져가 처리한다.
+
+워커는 처리 중인 작업의 heartbeat_at 을 주기적으로 갱신한다. 워커가 죽어 하트비트가 끊긴 running 작업은
+워커 시작 시와 하트비트 주기마다 다시 대기열에 넣거나(시도 횟수가 남고 파일이 있으면) 실패로 기록한다.
+"""
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.move import file_move_safe
+from django.core.files.uploadedfile import UploadedFile
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from apps.data_upload.locks import advisory_xact_lock
+from apps.data_upload.models import UploadJob
+from apps.data_upload.services import ingest_csv_upload
+
+logger = logging.getLogger(__name__)
+
+
+def new_job_file_path() -> Path:
+    """작업 디렉터리 안의 새 파일 경로"""
+    job_dir = Path(settings.UPLOAD_JOB_DIR)
+    job_dir.mkdir(parents=True, exist_ok=True)
+    return job_dir / f"{uuid.uuid4()}.csv"
+
+
+def enqueue_upload_job(file: UploadedFile, data_type: str, uploaded_by, **identity) -> UploadJob:
+    """
+    업로드 파일을 작업 디렉터리에 저장하고 queued 상태의 작업을 등록
+
+    디스크에 스풀링된 파일(TemporaryUploadedFile)은 복사 없이 이동한다.
+    identity: content_hash, idempotency_key (작업과 처리 후 업로드 로그에 기록)
+    """
+    if hasattr(file, 'temporary_file_path'):
+        return enqueue_stored_file(file.temporary_file_path(), file.name, data_type, uploaded_by, **identity)
+
+    file_path = new_job_file_path()
+    with open(file_path, 'wb') as destination:
+        for chunk in file.chunks():
+            destination.write(chunk)
+
+    return UploadJob.objects.create(
+        file_name=file.name,
+        data_type=data_type,
+        file_path=str(file_path),
+        bytes_total=file_path.stat().st_size,
+        uploaded_by=uploaded_by,
+        **identity,
+    )
+
+
+def enqueue_stored_file(source_path: str, file_name: str, data_type: str, uploaded_by, **identity) -> UploadJob:
+    """
+    이미 서버 디스크에 있는 파일(스풀링된 업로드, 분할 업로드 세션)을 작업 디렉터리로 옮기고 작업 등록
+    """
+    file_path = new_job_file_path()
+    file_move_safe(source_path, str(file_path))
+
+    return UploadJob.objects.create(
+        file_name=file_name,
+        data_type=data_type,
+        file_path=str(file_path),
+        bytes_total=file_path.stat().st_size,
+        uploaded_by=uploaded_by,
+        **identity,
+    )
+
+
+def claim_job(job_id, data_type: Optional[str] = None) -> bool:
+    """
+    queued 작업을 running 으로 전환 (상태 조건부 UPDATE 이므로 한 작업은 한 번만 선점된다)
+
+    data_type 을 주면 같은 데이터 유형의 running 작업이 없을 때만 선점한다.
+    확인과 전환을 데이터 유형별 잠금 안의 UPDATE 한 문장으로 하므로, 여러 워커가 동시에 선점해도
+    같은 유형의 작업은 하나만 running 이 된다.
+    """
+    now = timezone.now()
+    jobs = UploadJob.objects.filter(pk=job_id, status=UploadJob.STATUS_QUEUED)
+    changes = {
+        'status': UploadJob.STATUS_RUNNING,
+        'started_at': now,
+        'heartbeat_at': now,
+        'attempts': F('attempts') + 1,
+    }
+    if data_type is None:
+        return bool(jobs.update(**changes))
+
+    with transaction.atomic():
+        advisory_xact_lock(f"upload_job.{data_type}")
+        busy = UploadJob.objects.filter(data_type=data_type, status=UploadJob.STATUS_RUNNING)
+        return bool(jobs.filter(data_type=data_type).filter(~Exists(busy)).update(**changes))
+
+
+def claim_next_job() -> Optional[UploadJob]:
+    """
+    가장 오래된 queued 작업을 running 으로 전환하여 가져온다
+
+    상태 조건부 UPDATE 로 선점하므로 여러 워커가 동시에 폴링해도 한 작업은 한 번만 처리된다.
+    같은 데이터 유형의 작업이 처리 중이면 (일괄 업로드 여부·배치와 무관하게) 그 작업이 끝날 때까지 건너뛴다
+    (같은 테이블·키를 동시에 쓰지 않도록). 후보 조회 뒤 다른 워커가 먼저 선점할 수 있으므로
+    선점할 때 claim_job 이 다시 확인한다.
+    """
+    busy_same_type = UploadJob.objects.filter(
+        data_type=OuterRef('data_type'),
+        status=UploadJob.STATUS_RUNNING,
+    )
+    candidates = (
+        UploadJob.objects.filter(status=UploadJob.STATUS_QUEUED)
+        .filter(~Exists(busy_same_type))
+        .order_by('created_at')
+        .values_list('pk', 'data_type')[:10]
+    )
+    busy_types = set()
+    for job_id, data_type in candidates:
+        if data_type in busy_types:
+            continue
+        if claim_job(job_id, data_type):
+            return UploadJob.objects.get(pk=job_id)
+        busy_types.add(data_type)
+    return None
+
+
+def beat(job_ids: Iterable) -> None:
+    """처리 중인 작업의 하트비트 기록"""
+    job_ids = list(job_ids)
+    if not job_ids:
+        return
+    try:
+        UploadJob.objects.filter(pk__in=job_ids, status=UploadJob.STATUS_RUNNING).update(
+            heartbeat_at=timezone.now(),
+        )
+    except DatabaseError as e:
+        logger.warning(f"[Upload Job] 하트비트 기록 실패: {e}")
+
+
+def recover_stale_jobs(timeout: Optional[float] = None) -> Tuple[int, int]:
+    """
+    하트비트가 timeout(초) 넘게 끊긴 running 작업 정리
+
+    처리 중 워커가 죽으면 작업이 running 으로 남아 같은 데이터 유형의 대기 작업을 막고,
+    중복 업로드 조회(idempotency.find_previous_upload)도 그 작업을 계속 돌려준다.
+    저장해 둔 파일이 있고 시도 횟수가 UPLOAD_JOB_MAX_ATTEMPTS 보다 적으면 queued 로 되돌리고
+    (upsert 이므로 다시 처리해도 결과가 같다), 아니면 failed 로 기록한다.
+
+    Returns:
+        (다시 대기열에 넣은 작업 수, 실패 처리한 작업 수)
+    """
+    if timeout is None:
+        timeout = settings.UPLOAD_JOB_STALE_TIMEOUT
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=timeout)
+    stale = UploadJob.objects.filter(status=UploadJob.STATUS_RUNNING).filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff)
+    )
+
+    requeued = failed = 0
+    for job in stale:
+        # 조회 뒤 하트비트가 갱신됐으면 (워커가 살아 있으면) 건드리지 않음
+        unchanged = UploadJob.objects.filter(
+            pk=job.pk, status=UploadJob.STATUS_RUNNING, heartbeat_at=job.heartbeat_at,
+        )
+        if job.attempts < settings.UPLOAD_JOB_MAX_ATTEMPTS and os.path.exists(job.file_path):
+            if unchanged.update(
+                status=UploadJob.STATUS_QUEUED, started_at=None, heartbeat_at=None,
+                rows_processed=0, bytes_processed=0,
+            ):
+                logger.warning(f"[Upload Job] {job.pk} 워커 중단으로 다시 대기열에 등록 (시도 {job.attempts}회)")
+                requeued += 1
+        elif unchanged.update(
+            status=UploadJob.STATUS_FAILED, finished_at=now,
+            error_message=f"처리 중 워커가 중단되었습니다 (시도 {job.attempts}회)",
+        ):
+            logger.warning(f"[Upload Job] {job.pk} 워커 중단으로 실패 처리")
+            failed += 1
+            try:
+                os.remove(job.file_path)
+            except OSError:
+                pass
+    return requeued, failed
+
+
+class JobProgressReporter:
+    """
+    작업 진행 상황(처리 행 수, 읽은 바이트 수) 기록
+
+    atomic 커밋 방식에서는 업로드 처리가 하나의 트랜잭션 안에서 실행되므로, 같은 연결로 기록하면 커밋 전까지
+    진행 상황 조회 API 에 보이지 않는다. 별도 스레드(= 별도 DB 연결)에서 기록해 바로 커밋한다.
+    SQLite 는 동시 쓰기를 지원하지 않으므로 같은 연결에서 기록한다.
+    """
+
+    def __init__(self, job: UploadJob):
+        self.job_id = job.pk
+        self.executor = None
+        if connection.vendor != 'sqlite':
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='upload-progress')
+
+    def __call__(self, rows_processed: int, bytes_processed: int) -> None:
+        if self.executor is None:
+            self._save(rows_processed, bytes_processed)
+        else:
+            self.executor.submit(self._save, rows_processed, bytes_processed)
+
+    def _save(self, rows_processed: int, bytes_processed: int) -> None:
+        try:
+            UploadJob.objects.filter(pk=self.job_id).update(
+                rows_processed=rows_processed,
+                bytes_processed=bytes_processed,
+            )
+        except DatabaseError as e:
+            logger.warning(f"[Upload Job] {self.job_id} 진행 상황 기록 실패: {e}")
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.submit(connection.close)
+            self.executor.shutdown(wait=True)
+
+
+def run_upload_job(job: UploadJob) -> UploadJob:
+    """
+    running 상태의 작업 하나를 처리하고 결과(done/failed)를 기록
+
+    처리가 끝나면 저장해 둔 파일을 삭제한다.
+    """
+    reporter = JobProgressReporter(job)
+    try:
+        with open(job.file_path, 'rb') as source:
+            upload_log, _ = ingest_csv_upload(
+                file_content=source,
+                data_type=job.data_type,
+                uploaded_by=job.uploaded_by,
+                file_name=job.file_name,
+                progress=reporter,
+                content_hash=job.content_hash,
+                idempotency_key=job.idempotency_key,
+            )
+    except Exception as e:
+        reporter.close()
+        logger.exception(f"[Upload Job] {job.pk} 처리 실패")
+        job.status = UploadJob.STATUS_FAILED
+        job.error_message = str(e)
+    else:
+        reporter.close()
+        job.status = UploadJob.STATUS_DONE
+        job.upload_log = upload_log
+        job.rows_processed = upload_log.total_rows
+        job.bytes_processed = job.bytes_total
+    finally:
+        try:
+            os.remove(job.file_path)
+        except OSError:
+            pass
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=[
+        'status', 'error_message', 'upload_log', 'rows_processed',
+        'bytes_processed', 'finished_at', 'updated_at',
+    ])
+    return job
+
+
+def job_progress(job: UploadJob) -> Dict[str, Any]:
+    """
+    작업 진행률, 처리량(행/초), 남은 예상 시간(초) 계산
+
+    전체 행 수는 처리가 끝나기 전까지 알 수 없으므로, 진행률과 ETA 는 읽은 바이트 수 기준으로 추정한다.
+    """
+    progress = 0.0
+    throughput = None
+    eta_seconds = None
+
+    if job.status == UploadJob.STATUS_DONE:
+        progress = 100.0
+        eta_seconds = 0
+    elif job.bytes_total:
+        progress = min(job.bytes_processed / job.bytes_total * 100, 100.0)
+
+    if job.started_at:
+        elapsed = ((job.finished_at or timezone.now()) - job.started_at).total_seconds()
+        if elapsed > 0:
+            throughput = round(job.rows_processed / elapsed, 1)
+            if job.status == UploadJob.STATUS_RUNNING and job.bytes_processed:
+                bytes_per_second = job.bytes_processed / elapsed
+                eta_seconds = round((job.bytes_total - job.bytes_processed) / bytes_per_second, 1)
+
+    return {
+        "progress": round(progress, 1),
+        "throughput_rows_per_sec": throughput,
+        "eta_seconds": eta_seconds,
+    }
+
+
+class UploadJobWorker:
+    """
+    DB 에서 queued 작업을 가져와 스레드 풀로 처리하는 워커
+
+    시작할 때와 하트비트 주기마다 처리 중인 작업의 하트비트를 기록하고, 다른 워커가 남긴 중단된 작업을 정리한다.
+
+    Args:
+        max_workers: 동시에 처리할 작업 수
+        poll_interval: 대기 작업이 없을 때 폴링 간격 (초)
+        heartbeat_interval: 하트비트 기록·중단 작업 정리 간격 (초)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        heartbeat_interval: Optional[float] = None,
+    ):
+        self.max_workers = max_workers or settings.UPLOAD_WORKER_THREADS
+        self.poll_interval = poll_interval or settings.UPLOAD_WORKER_POLL_INTERVAL
+        self.heartbeat_interval = heartbeat_interval or settings.UPLOAD_JOB_HEARTBEAT_INTERVAL
+
+    def run(self, once: bool = False) -> None:
+        """
+        작업을 계속 처리 (once=True 면 대기열이 빌 때까지만 처리하고 종료)
+        """
+        recover_stale_jobs()
+        last_beat = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='upload-worker') as pool:
+            running = {}
+            while True:
+                running = {future: job_id for future, job_id in running.items() if not future.done()}
+                if time.monotonic() - last_beat >= self.heartbeat_interval:
+                    beat(running.values())
+                    recover_stale_jobs()
+                    last_beat = time.monotonic()
+
+                while len(running) < self.max_workers:
+                    job = claim_next_job()
+                    if job is None:
+                        break
+                    logger.info(f"[Upload Job] {job.pk} 처리 시작: {job.file_name} ({job.data_type})")
+                    running[pool.submit(self._run, job)] = job.pk
+
+                if once and not running:
+                    return
+                time.sleep(self.poll_interval)
+
+    def _run(self, job: UploadJob) -> None:
+        close_old_connections()
+        try:
+            run_upload_job(job)
+        finally:
+            connection.close()
@@ -0,0 +1,17 @@
+"""
+트랜잭션 범위 이름 잠금
+
+PostgreSQL 은 이름을 해시한 트랜잭션 advisory lock 을 잡고, 트랜잭션이 끝나면 자동으로 푼다.
+SQLite 는 쓰기 트랜잭션이 DB 전체로 직렬화되므로 (늦은 쪽은 잠금 오류) 따로 잠그지 않는다.
+"""
+import zlib
+
+from django.db import connection
+
+
+def advisory_xact_lock(name: str) -> None:
+    """현재 트랜잭션이 끝날 때까지 name 잠금 (트랜잭션 안에서 호출)"""
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [zlib.crc32(name.encode())])
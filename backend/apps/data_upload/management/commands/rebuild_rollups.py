@@ -0,0 +1,37 @@
+"""
+대시보드 롤업 테이블 재계산
+
+업로드는 롤업을 증분 갱신하지만, QuerySet.update()/delete() 나 DB 직접 수정처럼
+모델 메서드를 거치지 않은 변경은 반영되지 않으므로 이 명령으로 원본에서 다시 계산한다.
+
+사용법:
+    python manage.py rebuild_rollups
+    python manage.py rebuild_rollups --data-type publication student
+"""
+from django.core.management.base import BaseCommand
+
+from apps.data_upload.overview import refresh_overview_snapshot
+from apps.data_upload.rollups import ROLLUPS, rebuild_rollups
+from apps.data_upload.versions import bump_data_version
+
+
+class Command(BaseCommand):
+    help = "논문·학생·연구비 롤업 테이블을 원본 데이터에서 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--data-type',
+            nargs='+',
+            choices=[rollup.data_type for rollup in ROLLUPS],
+            default=None,
+            help="다시 계산할 데이터 유형 (기본값: 전체)",
+        )
+
+    def handle(self, *args, **options):
+        result = rebuild_rollups(options['data_type'])
+        for data_type, rows in result.items():
+            # 롤업을 읽는 대시보드 캐시 무효화
+            bump_data_version(data_type)
+            self.stdout.write(f"{data_type}: 롤업 {rows}행")
+        # 롤업 합계를 쓰는 개요 지표(학생·예산) 포함
+        refresh_overview_snapshot(result)
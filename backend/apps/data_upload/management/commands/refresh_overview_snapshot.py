@@ -0,0 +1,26 @@
+"""
+대시보드 개요 스냅샷 재계산
+
+업로드는 바뀐 데이터 유형의 지표만 다시 계산한다. 최근 1년 논문 수와 1년 전 집행률은
+날짜가 지나면 업로드 없이도 바뀌고, 관리자 화면 등 업로드 외 경로의 변경도 있으므로
+이 명령을 주기적으로(예: 매일 cron) 실행해 전체 지표를 다시 계산한다.
+
+사용법:
+    python manage.py refresh_overview_snapshot
+"""
+from django.core.management.base import BaseCommand
+
+from apps.data_upload.overview import refresh_overview_snapshot
+
+
+class Command(BaseCommand):
+    help = "대시보드 개요 스냅샷(4개 주요 지표와 추세)을 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        snapshot = refresh_overview_snapshot()
+        self.stdout.write(
+            f"실적 {snapshot.performance_value:.1f}% ({snapshot.performance_trend}), "
+            f"논문 {snapshot.papers_count}건 ({snapshot.papers_trend}), "
+            f"학생 {snapshot.students_count}명 ({snapshot.students_trend}), "
+            f"예산 {snapshot.budget_value:.1f}% ({snapshot.budget_trend})"
+        )
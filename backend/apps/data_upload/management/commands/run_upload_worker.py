@@ -0,0 +1,45 @@
+"""
+비동기 CSV 업로드 작업 워커
+
+사용법:
+    python manage.py run_upload_worker
+    python manage.py run_upload_worker --workers 8
+    python manage.py run_upload_worker --once  # 대기열을 비우고 종료
+"""
+from django.core.management.base import BaseCommand
+
+from apps.data_upload.jobs import UploadJobWorker
+
+
+class Command(BaseCommand):
+    help = "DB 에 등록된 queued 업로드 작업을 스레드 풀로 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help="동시에 처리할 작업 수 (기본값: settings.UPLOAD_WORKER_THREADS)",
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=None,
+            help="대기 작업 폴링 간격(초) (기본값: settings.UPLOAD_WORKER_POLL_INTERVAL)",
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="대기 중인 작업을 모두 처리한 뒤 종료",
+        )
+
+    def handle(self, *args, **options):
+        worker = UploadJobWorker(
+            max_workers=options['workers'],
+            poll_interval=options['poll_interval'],
+        )
+        self.stdout.write(f"업로드 워커 시작 (스레드 {worker.max_workers}개)")
+        try:
+            worker.run(once=options['once'])
+        except KeyboardInterrupt:
+            self.stdout.write("업로드 워커 종료")
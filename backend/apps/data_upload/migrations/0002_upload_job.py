@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:32
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('file_name', models.CharField(help_text='업로드된 파일명', max_length=255)),
+                ('data_type', models.CharField(choices=[('kpi', 'kpi'), ('publication', 'publication'), ('project', 'project'), ('student', 'student')], help_text='데이터 유형', max_length=20)),
+                ('file_path', models.CharField(help_text='처리 대기 중인 파일의 서버 경로', max_length=500)),
+                ('status', models.CharField(choices=[('queued', 'queued'), ('running', 'running'), ('done', 'done'), ('failed', 'failed')], default='queued', help_text='작업 상태', max_length=20)),
+                ('bytes_total', models.BigIntegerField(default=0, help_text='파일 크기 (바이트)', validators=[django.core.validators.MinValueValidator(0)])),
+                ('bytes_processed', models.BigIntegerField(default=0, help_text='처리한 바이트 수', validators=[django.core.validators.MinValueValidator(0)])),
+                ('rows_processed', models.IntegerField(default=0, help_text='처리한 행 수', validators=[django.core.validators.MinValueValidator(0)])),
+                ('error_message', models.TextField(blank=True, help_text='실패 사유', null=True)),
+                ('started_at', models.DateTimeField(blank=True, help_text='처리 시작 시각', null=True)),
+                ('finished_at', models.DateTimeField(blank=True, help_text='처리 종료 시각', null=True)),
+                ('upload_log', models.ForeignKey(blank=True, help_text='처리 완료 후 생성된 업로드 로그', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='data_upload.uploadlog')),
+                ('uploaded_by', models.ForeignKey(help_text='업로드한 사용자', on_delete=django.db.models.deletion.RESTRICT, related_name='upload_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'upload_jobs',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='idx_upload_jobs_status_created'), models.Index(fields=['uploaded_by'], name='idx_upload_jobs_uploaded_by')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('status__in', ['queued', 'running', 'done', 'failed'])), name='check_upload_job_status_valid')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:37
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0002_upload_job'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('file_name', models.CharField(help_text='업로드할 파일명', max_length=255)),
+                ('data_type', models.CharField(choices=[('kpi', 'kpi'), ('publication', 'publication'), ('project', 'project'), ('student', 'student')], help_text='데이터 유형', max_length=20)),
+                ('file_path', models.CharField(help_text='조립 중인 임시 파일의 서버 경로', max_length=500)),
+                ('total_size', models.BigIntegerField(help_text='전체 파일 크기 (바이트)', validators=[django.core.validators.MinValueValidator(0)])),
+                ('received_bytes', models.BigIntegerField(default=0, help_text='지금까지 받은 바이트 수 (다음 PUT 시작 위치)', validators=[django.core.validators.MinValueValidator(0)])),
+                ('status', models.CharField(choices=[('open', 'open'), ('finalized', 'finalized')], default='open', help_text='세션 상태', max_length=20)),
+                ('upload_job', models.ForeignKey(blank=True, help_text='finalize 후 등록된 업로드 작업 (비동기 모드)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sessions', to='data_upload.uploadjob')),
+                ('upload_log', models.ForeignKey(blank=True, help_text='finalize 후 생성된 업로드 로그 (동기 모드)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sessions', to='data_upload.uploadlog')),
+                ('uploaded_by', models.ForeignKey(help_text='업로드한 사용자', on_delete=django.db.models.deletion.RESTRICT, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'upload_sessions',
+                'indexes': [models.Index(fields=['uploaded_by', 'status'], name='idx_upload_sessions_user_st')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('status__in', ['open', 'finalized'])), name='check_upload_session_status_valid'), models.CheckConstraint(condition=models.Q(('received_bytes__lte', models.F('total_size'))), name='check_upload_session_received_lte_total')],
+            },
+        ),
+    ]
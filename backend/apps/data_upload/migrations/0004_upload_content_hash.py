@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0003_upload_session'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadjob',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='업로드 파일 SHA-256', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadjob',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='클라이언트 Idempotency-Key 헤더 값', max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='업로드 파일 SHA-256 (동일 파일 재업로드 감지)', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='클라이언트 Idempotency-Key 헤더 값', max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='uploadjob',
+            index=models.Index(fields=['uploaded_by', 'idempotency_key'], name='idx_upload_jobs_user_idem'),
+        ),
+        migrations.AddIndex(
+            model_name='uploadlog',
+            index=models.Index(fields=['data_type', 'content_hash'], name='idx_upload_logs_type_hash'),
+        ),
+        migrations.AddIndex(
+            model_name='uploadlog',
+            index=models.Index(fields=['uploaded_by', 'idempotency_key'], name='idx_upload_logs_user_idem'),
+        ),
+    ]
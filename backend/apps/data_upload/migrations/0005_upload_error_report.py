@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0004_upload_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadlog',
+            name='error_report_path',
+            field=models.CharField(blank=True, help_text='전체 오류 보고서(gzip CSV) 서버 경로', max_length=500, null=True),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:58
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0005_upload_error_report'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='departmentkpi',
+            name='row_hash',
+            field=models.CharField(blank=True, editable=False, help_text='업로드 행 내용 해시 (변경 없는 행 건너뛰기)', max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='publicationlist',
+            name='row_hash',
+            field=models.CharField(blank=True, editable=False, help_text='업로드 행 내용 해시 (변경 없는 행 건너뛰기)', max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchprojectdata',
+            name='row_hash',
+            field=models.CharField(blank=True, editable=False, help_text='업로드 행 내용 해시 (변경 없는 행 건너뛰기)', max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='studentroster',
+            name='row_hash',
+            field=models.CharField(blank=True, editable=False, help_text='업로드 행 내용 해시 (변경 없는 행 건너뛰기)', max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='inserted_rows',
+            field=models.IntegerField(default=0, help_text='새로 추가된 행 수', validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='unchanged_rows',
+            field=models.IntegerField(default=0, help_text='기존과 내용이 같아 쓰지 않은 행 수', validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AddField(
+            model_name='uploadlog',
+            name='updated_rows',
+            field=models.IntegerField(default=0, help_text='내용이 바뀌어 수정된 행 수', validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:04
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0006_row_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadBatch',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('file_count', models.IntegerField(help_text='등록된 파일(작업) 수', validators=[django.core.validators.MinValueValidator(0)])),
+                ('uploaded_by', models.ForeignKey(help_text='업로드한 사용자', on_delete=django.db.models.deletion.RESTRICT, related_name='upload_batches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'upload_batches',
+            },
+        ),
+        migrations.AddField(
+            model_name='uploadjob',
+            name='batch',
+            field=models.ForeignKey(blank=True, help_text='일괄 업로드로 등록된 경우 소속 배치', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='data_upload.uploadbatch'),
+        ),
+        migrations.AddIndex(
+            model_name='uploadbatch',
+            index=models.Index(fields=['uploaded_by', 'created_at'], name='idx_upload_batches_user_crt'),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:35
+
+import uuid
+from django.db import migrations, models
+
+
+def build_rollups(apps, schema_editor):
+    from apps.data_upload.rollups import rebuild_rollups
+    # 연구비 롤업은 0011 에서 현재 집계 단위로 적재
+    rebuild_rollups(['publication', 'student'], get_model=apps.get_model)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0007_upload_batch'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectExpenseRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('execution_date', models.DateField(help_text='집행일자')),
+                ('department', models.CharField(help_text='소속학과', max_length=50)),
+                ('funding_agency', models.CharField(help_text='지원기관', max_length=100)),
+                ('status', models.CharField(help_text='상태', max_length=20)),
+                ('project_number', models.CharField(help_text='과제번호', max_length=50)),
+                ('project_name', models.CharField(help_text='과제명', max_length=200)),
+                ('row_count', models.IntegerField(default=0, help_text='집행 건수')),
+                ('total_budget', models.BigIntegerField(default=0, help_text='총연구비 합계 (원)')),
+                ('expense_amount', models.BigIntegerField(default=0, help_text='집행금액 합계 (원)')),
+            ],
+            options={
+                'db_table': 'rollup_project_expense',
+                'constraints': [models.UniqueConstraint(fields=('execution_date', 'department', 'funding_agency', 'status', 'project_number', 'project_name'), name='uniq_rollup_project_expense')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PublicationMonthlyRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('year', models.IntegerField(help_text='게재 연도')),
+                ('month', models.IntegerField(help_text='게재 월')),
+                ('college', models.CharField(help_text='단과대학명', max_length=50)),
+                ('department', models.CharField(help_text='학과명', max_length=50)),
+                ('journal_grade', models.CharField(help_text='저널등급', max_length=20)),
+                ('row_count', models.IntegerField(default=0, help_text='논문 수')),
+            ],
+            options={
+                'db_table': 'rollup_publication_monthly',
+                'constraints': [models.UniqueConstraint(fields=('year', 'month', 'college', 'department', 'journal_grade'), name='uniq_rollup_publication_monthly')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('college', models.CharField(help_text='단과대학명', max_length=50)),
+                ('department', models.CharField(help_text='학과명', max_length=50)),
+                ('program_type', models.CharField(help_text='과정구분', max_length=10)),
+                ('academic_status', models.CharField(help_text='학적상태', max_length=20)),
+                ('row_count', models.IntegerField(default=0, help_text='학생 수')),
+            ],
+            options={
+                'db_table': 'rollup_student',
+                'constraints': [models.UniqueConstraint(fields=('college', 'department', 'program_type', 'academic_status'), name='uniq_rollup_student')],
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
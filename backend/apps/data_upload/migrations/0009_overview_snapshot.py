@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:46
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0008_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OverviewSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('performance_value', models.FloatField(default=0, help_text='최신 평가년도 평균 취업률 (%)')),
+                ('performance_trend', models.CharField(choices=[('up', 'up'), ('down', 'down'), ('stable', 'stable')], default='stable', help_text='직전 평가년도 대비 추세', max_length=10)),
+                ('papers_count', models.IntegerField(default=0, help_text='최근 1년 논문 수')),
+                ('papers_trend', models.CharField(choices=[('up', 'up'), ('down', 'down'), ('stable', 'stable')], default='stable', help_text='직전 1년 대비 추세', max_length=10)),
+                ('students_count', models.IntegerField(default=0, help_text='재학생 수')),
+                ('students_trend', models.CharField(choices=[('up', 'up'), ('down', 'down'), ('stable', 'stable')], default='stable', help_text='직전 값 대비 추세', max_length=10)),
+                ('budget_value', models.FloatField(default=0, help_text='연구비 집행률 (%)')),
+                ('budget_trend', models.CharField(choices=[('up', 'up'), ('down', 'down'), ('stable', 'stable')], default='stable', help_text='1년 전 집행률 대비 추세', max_length=10)),
+            ],
+            options={
+                'db_table': 'overview_snapshot',
+            },
+        ),
+    ]
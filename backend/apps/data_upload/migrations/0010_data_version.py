@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:08
+
+import uuid
+from django.db import migrations, models
+
+
+def build_snapshot(apps, schema_editor):
+    from apps.data_upload.overview import refresh_overview_snapshot
+    refresh_overview_snapshot(get_model=apps.get_model)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0009_overview_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('data_type', models.CharField(help_text="데이터 유형 (개요 스냅샷은 'overview')", max_length=20, unique=True)),
+                ('version', models.BigIntegerField(help_text='변경될 때마다 1 씩 증가')),
+            ],
+            options={
+                'db_table': 'data_versions',
+            },
+        ),
+        migrations.RunPython(build_snapshot, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:19
+
+import uuid
+from django.db import migrations, models
+
+
+def clear_project_rollup(apps, schema_editor):
+    # 집계 단위가 바뀌므로 기존 행은 새 유니크 제약 전에 비우고 아래에서 다시 적재
+    apps.get_model('data_upload', 'ProjectExpenseRollup').objects.all().delete()
+
+
+def build_project_rollups(apps, schema_editor):
+    from apps.data_upload.rollups import rebuild_rollups
+    rebuild_rollups(['project'], get_model=apps.get_model)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0010_data_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_project_rollup, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ProjectMonthlyRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('year', models.IntegerField(help_text='집행 연도')),
+                ('month', models.IntegerField(help_text='집행 월')),
+                ('department', models.CharField(help_text='소속학과', max_length=50)),
+                ('funding_agency', models.CharField(help_text='지원기관', max_length=100)),
+                ('status', models.CharField(help_text='상태', max_length=20)),
+                ('project_number', models.CharField(help_text='과제번호', max_length=50)),
+                ('project_name', models.CharField(help_text='과제명', max_length=200)),
+                ('row_count', models.IntegerField(default=0, help_text='집행 건수')),
+                ('total_budget', models.BigIntegerField(default=0, help_text='총연구비 합계 (원)')),
+                ('expense_amount', models.BigIntegerField(default=0, help_text='집행금액 합계 (원)')),
+            ],
+            options={
+                'db_table': 'rollup_project_monthly',
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name='projectexpenserollup',
+            name='uniq_rollup_project_expense',
+        ),
+        migrations.RemoveField(
+            model_name='projectexpenserollup',
+            name='project_name',
+        ),
+        migrations.RemoveField(
+            model_name='projectexpenserollup',
+            name='project_number',
+        ),
+        migrations.AddConstraint(
+            model_name='projectexpenserollup',
+            constraint=models.UniqueConstraint(fields=('execution_date', 'department', 'funding_agency', 'status'), name='uniq_rollup_project_expense'),
+        ),
+        migrations.AddConstraint(
+            model_name='projectmonthlyrollup',
+            constraint=models.UniqueConstraint(fields=('year', 'month', 'department', 'funding_agency', 'status', 'project_number', 'project_name'), name='uniq_rollup_project_monthly'),
+        ),
+        migrations.RunPython(build_project_rollups, migrations.RunPython.noop),
+    ]
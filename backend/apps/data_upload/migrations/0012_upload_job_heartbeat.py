@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:25
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0011_project_rollup_grain'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadjob',
+            name='attempts',
+            field=models.IntegerField(default=0, help_text='처리 시도 횟수 (워커 중단으로 다시 대기열에 들어간 횟수 포함)', validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AddField(
+            model_name='uploadjob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, help_text='처리 중인 워커가 마지막으로 살아 있음을 알린 시각', null=True),
+        ),
+    ]
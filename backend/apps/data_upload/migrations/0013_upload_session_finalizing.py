@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_upload', '0012_upload_job_heartbeat'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='uploadsession',
+            name='check_upload_session_status_valid',
+        ),
+        migrations.AlterField(
+            model_name='uploadsession',
+            name='status',
+            field=models.CharField(choices=[('open', 'open'), ('finalizing', 'finalizing'), ('finalized', 'finalized')], default='open', help_text='세션 상태', max_length=20),
+        ),
+        migrations.AddConstraint(
+            model_name='uploadsession',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['open', 'finalizing', 'finalized'])), name='check_upload_session_status_valid'),
+        ),
+    ]
@@ -1,7 +1,10 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
+from apps.data_upload.overview import SNAPSHOT_ID, TREND_DOWN, TREND_STABLE, TREND_UP, publish_changes
+from apps.data_upload.rollups import apply_changes, lock_source, rollups_for, source_fields
+from apps.data_upload.schemas import data_type_for_model
 
 User = get_user_model()
 
@@ -24,7 +27,89 @@ class BaseModel(models.Model):
         super().save(*args, **kwargs)
 
 
-class DepartmentKPI(BaseModel):
+def publish_on_commit(model: type, using=None) -> None:
+    """업로드 외 경로의 변경이 커밋되면 해당 data_type 버전을 올리고 개요 스냅샷 갱신 (대시보드 캐시·ETag 무효화)"""
+    data_type = data_type_for_model(model._meta.object_name)
+    if data_type is not None:
+        transaction.on_commit(lambda: publish_changes([data_type]), using=using)
+
+
+class UploadedDataQuerySet(models.QuerySet):
+    """
+    업로드 데이터 QuerySet
+    일괄 삭제(관리자 화면의 선택 삭제 등)도 삭제한 행의 기여분을 롤업에서 빼고 대시보드 캐시를 무효화한다.
+    """
+
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            if rollups_for(self.model):
+                lock_source(self.model)
+                previous = list(self.select_for_update().values(*source_fields(self.model)))
+                result = super().delete()
+                apply_changes(self.model, previous, [])
+            else:
+                result = super().delete()
+            if result[0]:
+                publish_on_commit(self.model, using=self.db)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class UploadedDataModel(BaseModel):
+    """
+    CSV 업로드로 적재되는 데이터 모델의 공통 기본 클래스
+    - row_hash: 마지막으로 적재한 업로드 행의 내용 해시 (같은 내용의 재업로드는 다시 쓰지 않음)
+    """
+    row_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="업로드 행 내용 해시 (변경 없는 행 건너뛰기)"
+    )
+
+    objects = UploadedDataQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        """
+        업로드 외 경로(관리자 화면 등)로 저장하면 해시를 비워 다음 업로드에서 다시 쓰도록 함
+        롤업 테이블이 있는 모델은 이전 값과 새 값의 차이를 롤업에 반영
+        커밋 후 data_type 버전을 올려 대시보드 캐시를 무효화
+        """
+        self.row_hash = None
+        with transaction.atomic():
+            if rollups_for(type(self)):
+                lock_source(type(self))
+                previous = None if self._state.adding else self._previous()
+                super().save(*args, **kwargs)
+                apply_changes(type(self), [previous] if previous else [], [self])
+            else:
+                super().save(*args, **kwargs)
+            publish_on_commit(type(self))
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            if rollups_for(type(self)):
+                lock_source(type(self))
+                previous = self._previous()
+                result = super().delete(*args, **kwargs)
+                apply_changes(type(self), [previous] if previous else [], [])
+            else:
+                result = super().delete(*args, **kwargs)
+            publish_on_commit(type(self))
+        return result
+
+    def _previous(self):
+        """DB 에 저장된 현재 행 (롤업 차이 계산용)"""
+        return type(self)._default_manager.select_for_update().filter(pk=self.pk).first()
+
+
+class DepartmentKPI(UploadedDataModel):
     """
     학과별 연도별 주요 성과 지표(KPI) 데이터
     docs/database.md 2.2 참고
@@ -111,7 +196,7 @@ class DepartmentKPI(BaseModel):
         return f"{self.evaluation_year}년 {self.college} {self.department}"
 
 
-class PublicationList(BaseModel):
+class PublicationList(UploadedDataModel):
     """
     학과별 논문 게재 현황 데이터
     docs/database.md 2.3 참고
@@ -199,7 +284,7 @@ class PublicationList(BaseModel):
         return f"{self.publication_id}: {self.title}"
 
 
-class ResearchProjectData(BaseModel):
+class ResearchProjectData(UploadedDataModel):
     """
     연구과제별 예산 집행 내역 데이터
     docs/database.md 2.4 참고
@@ -290,7 +375,7 @@ class ResearchProjectData(BaseModel):
         return f"{self.execution_id}: {self.project_name}"
 
 
-class StudentRoster(BaseModel):
+class StudentRoster(UploadedDataModel):
     """
     학부생 및 대학원생의 기본 정보
     docs/database.md 2.5 참고
@@ -431,11 +516,44 @@ class UploadLog(BaseModel):
         validators=[MinValueValidator(0)],
         help_text="처리 실패한 행 수"
     )
+    inserted_rows = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="새로 추가된 행 수"
+    )
+    updated_rows = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="내용이 바뀌어 수정된 행 수"
+    )
+    unchanged_rows = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="기존과 내용이 같아 쓰지 않은 행 수"
+    )
     error_details = models.TextField(
         blank=True,
         null=True,
         help_text="오류 상세 정보 (JSON 형식)"
     )
+    error_report_path = models.CharField(
+        max_length=500,
+        blank=True,
+        null=True,
+        help_text="전체 오류 보고서(gzip CSV) 서버 경로"
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="업로드 파일 SHA-256 (동일 파일 재업로드 감지)"
+    )
+    idempotency_key = models.CharField(
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text="클라이언트 Idempotency-Key 헤더 값"
+    )
     uploaded_by = models.ForeignKey(
         User,
         on_delete=models.RESTRICT,
@@ -467,7 +585,415 @@ class UploadLog(BaseModel):
             models.Index(fields=['uploaded_by'], name='idx_upload_logs_uploaded_by'),
             models.Index(fields=['data_type'], name='idx_upload_logs_data_type'),
             models.Index(fields=['created_at'], name='idx_upload_logs_created_at'),
+            models.Index(fields=['data_type', 'content_hash'], name='idx_upload_logs_type_hash'),
+            models.Index(fields=['uploaded_by', 'idempotency_key'], name='idx_upload_logs_user_idem'),
         ]
 
     def __str__(self):
         return f"{self.file_name} ({self.data_type}) - {self.uploaded_by.username}"
+
+
+class UploadBatch(BaseModel):
+    """
+    여러 파일(CSV 여러 개 또는 ZIP)을 한 번에 올린 일괄 업로드
+    파일마다 UploadJob 을 하나씩 등록하며, 서로 다른 데이터 유형의 파일은 동시에 처리된다.
+    """
+    file_count = models.IntegerField(
+        validators=[MinValueValidator(0)],
+        help_text="등록된 파일(작업) 수"
+    )
+    uploaded_by = models.ForeignKey(
+        User,
+        on_delete=models.RESTRICT,
+        related_name='upload_batches',
+        help_text="업로드한 사용자"
+    )
+
+    class Meta:
+        db_table = 'upload_batches'
+        indexes = [
+            models.Index(fields=['uploaded_by', 'created_at'], name='idx_upload_batches_user_crt'),
+        ]
+
+    def __str__(self):
+        return f"일괄 업로드 {self.pk} ({self.file_count}개 파일)"
+
+
+class UploadJob(BaseModel):
+    """
+    비동기 CSV 업로드 작업
+    업로드 요청은 작업을 queued 상태로 등록하고 즉시 응답하며,
+    워커(run_upload_worker)가 작업을 가져가 처리한 뒤 UploadLog 를 연결한다.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    file_name = models.CharField(
+        max_length=255,
+        help_text="업로드된 파일명"
+    )
+    data_type = models.CharField(
+        max_length=20,
+        choices=[
+            ('kpi', 'kpi'),
+            ('publication', 'publication'),
+            ('project', 'project'),
+            ('student', 'student'),
+        ],
+        help_text="데이터 유형"
+    )
+    file_path = models.CharField(
+        max_length=500,
+        help_text="처리 대기 중인 파일의 서버 경로"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_QUEUED, STATUS_QUEUED),
+            (STATUS_RUNNING, STATUS_RUNNING),
+            (STATUS_DONE, STATUS_DONE),
+            (STATUS_FAILED, STATUS_FAILED),
+        ],
+        default=STATUS_QUEUED,
+        help_text="작업 상태"
+    )
+    bytes_total = models.BigIntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="파일 크기 (바이트)"
+    )
+    bytes_processed = models.BigIntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="처리한 바이트 수"
+    )
+    rows_processed = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="처리한 행 수"
+    )
+    error_message = models.TextField(
+        blank=True,
+        null=True,
+        help_text="실패 사유"
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="업로드 파일 SHA-256"
+    )
+    idempotency_key = models.CharField(
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text="클라이언트 Idempotency-Key 헤더 값"
+    )
+    started_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="처리 시작 시각"
+    )
+    finished_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="처리 종료 시각"
+    )
+    heartbeat_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="처리 중인 워커가 마지막으로 살아 있음을 알린 시각"
+    )
+    attempts = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="처리 시도 횟수 (워커 중단으로 다시 대기열에 들어간 횟수 포함)"
+    )
+    upload_log = models.ForeignKey(
+        UploadLog,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='jobs',
+        help_text="처리 완료 후 생성된 업로드 로그"
+    )
+    batch = models.ForeignKey(
+        UploadBatch,
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name='jobs',
+        help_text="일괄 업로드로 등록된 경우 소속 배치"
+    )
+    uploaded_by = models.ForeignKey(
+        User,
+        on_delete=models.RESTRICT,
+        related_name='upload_jobs',
+        help_text="업로드한 사용자"
+    )
+
+    class Meta:
+        db_table = 'upload_jobs'
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(status__in=['queued', 'running', 'done', 'failed']),
+                name='check_upload_job_status_valid'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='idx_upload_jobs_status_created'),
+            models.Index(fields=['uploaded_by'], name='idx_upload_jobs_uploaded_by'),
+            models.Index(fields=['uploaded_by', 'idempotency_key'], name='idx_upload_jobs_user_idem'),
+        ]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.data_type}) - {self.status}"
+
+
+class UploadSession(BaseModel):
+    """
+    재개 가능한 분할 업로드 세션
+    클라이언트는 세션을 만든 뒤 바이트 범위(Content-Range)별로 PUT 하여 서버 임시 파일에 이어 붙이고,
+    모든 바이트를 보내면 finalize 로 기존 CSV 처리 파이프라인에 넘긴다.
+    """
+    STATUS_OPEN = 'open'
+    STATUS_FINALIZING = 'finalizing'
+    STATUS_FINALIZED = 'finalized'
+
+    file_name = models.CharField(
+        max_length=255,
+        help_text="업로드할 파일명"
+    )
+    data_type = models.CharField(
+        max_length=20,
+        choices=[
+            ('kpi', 'kpi'),
+            ('publication', 'publication'),
+            ('project', 'project'),
+            ('student', 'student'),
+        ],
+        help_text="데이터 유형"
+    )
+    file_path = models.CharField(
+        max_length=500,
+        help_text="조립 중인 임시 파일의 서버 경로"
+    )
+    total_size = models.BigIntegerField(
+        validators=[MinValueValidator(0)],
+        help_text="전체 파일 크기 (바이트)"
+    )
+    received_bytes = models.BigIntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text="지금까지 받은 바이트 수 (다음 PUT 시작 위치)"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_OPEN, STATUS_OPEN),
+            (STATUS_FINALIZING, STATUS_FINALIZING),
+            (STATUS_FINALIZED, STATUS_FINALIZED),
+        ],
+        default=STATUS_OPEN,
+        help_text="세션 상태"
+    )
+    upload_job = models.ForeignKey(
+        UploadJob,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='sessions',
+        help_text="finalize 후 등록된 업로드 작업 (비동기 모드)"
+    )
+    upload_log = models.ForeignKey(
+        UploadLog,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='sessions',
+        help_text="finalize 후 생성된 업로드 로그 (동기 모드)"
+    )
+    uploaded_by = models.ForeignKey(
+        User,
+        on_delete=models.RESTRICT,
+        related_name='upload_sessions',
+        help_text="업로드한 사용자"
+    )
+
+    class Meta:
+        db_table = 'upload_sessions'
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(status__in=['open', 'finalizing', 'finalized']),
+                name='check_upload_session_status_valid'
+            ),
+            models.CheckConstraint(
+                check=models.Q(received_bytes__lte=models.F('total_size')),
+                name='check_upload_session_received_lte_total'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['uploaded_by', 'status'], name='idx_upload_sessions_user_st'),
+        ]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.received_bytes}/{self.total_size})"
+
+
+class PublicationMonthlyRollup(BaseModel):
+    """
+    논문 수 롤업: (게재 연·월, 단과대학, 학과, 저널등급) 별 논문 수
+    PublicationList 저장 시 증분 갱신 (apps/data_upload/rollups.py)
+    """
+    year = models.IntegerField(help_text="게재 연도")
+    month = models.IntegerField(help_text="게재 월")
+    college = models.CharField(max_length=50, help_text="단과대학명")
+    department = models.CharField(max_length=50, help_text="학과명")
+    journal_grade = models.CharField(max_length=20, help_text="저널등급")
+    row_count = models.IntegerField(default=0, help_text="논문 수")
+
+    class Meta:
+        db_table = 'rollup_publication_monthly'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['year', 'month', 'college', 'department', 'journal_grade'],
+                name='uniq_rollup_publication_monthly',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.year}-{self.month:02d} {self.department} {self.journal_grade}: {self.row_count}"
+
+
+class StudentRollup(BaseModel):
+    """
+    학생 수 롤업: (단과대학, 학과, 과정구분, 학적상태) 별 학생 수
+    StudentRoster 저장 시 증분 갱신 (apps/data_upload/rollups.py)
+    """
+    college = models.CharField(max_length=50, help_text="단과대학명")
+    department = models.CharField(max_length=50, help_text="학과명")
+    program_type = models.CharField(max_length=10, help_text="과정구분")
+    academic_status = models.CharField(max_length=20, help_text="학적상태")
+    row_count = models.IntegerField(default=0, help_text="학생 수")
+
+    class Meta:
+        db_table = 'rollup_student'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['college', 'department', 'program_type', 'academic_status'],
+                name='uniq_rollup_student',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.department} {self.program_type} {self.academic_status}: {self.row_count}"
+
+
+class ProjectExpenseRollup(BaseModel):
+    """
+    연구비 집행 롤업: (집행일자, 학과, 지원기관, 상태) 별 집행 건수·총연구비·집행금액 합계
+    ResearchProjectData 저장 시 증분 갱신 (apps/data_upload/rollups.py)
+    """
+    execution_date = models.DateField(help_text="집행일자")
+    department = models.CharField(max_length=50, help_text="소속학과")
+    funding_agency = models.CharField(max_length=100, help_text="지원기관")
+    status = models.CharField(max_length=20, help_text="상태")
+    row_count = models.IntegerField(default=0, help_text="집행 건수")
+    total_budget = models.BigIntegerField(default=0, help_text="총연구비 합계 (원)")
+    expense_amount = models.BigIntegerField(default=0, help_text="집행금액 합계 (원)")
+
+    class Meta:
+        db_table = 'rollup_project_expense'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['execution_date', 'department', 'funding_agency', 'status'],
+                name='uniq_rollup_project_expense',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.execution_date} {self.department} {self.funding_agency}: {self.expense_amount}"
+
+
+class ProjectMonthlyRollup(BaseModel):
+    """
+    과제별 월 집행 롤업: (집행 연·월, 학과, 지원기관, 상태, 과제) 별 집행 건수·총연구비·집행금액 합계
+    ResearchProjectData 저장 시 증분 갱신 (apps/data_upload/rollups.py)
+    """
+    year = models.IntegerField(help_text="집행 연도")
+    month = models.IntegerField(help_text="집행 월")
+    department = models.CharField(max_length=50, help_text="소속학과")
+    funding_agency = models.CharField(max_length=100, help_text="지원기관")
+    status = models.CharField(max_length=20, help_text="상태")
+    project_number = models.CharField(max_length=50, help_text="과제번호")
+    project_name = models.CharField(max_length=200, help_text="과제명")
+    row_count = models.IntegerField(default=0, help_text="집행 건수")
+    total_budget = models.BigIntegerField(default=0, help_text="총연구비 합계 (원)")
+    expense_amount = models.BigIntegerField(default=0, help_text="집행금액 합계 (원)")
+
+    class Meta:
+        db_table = 'rollup_project_monthly'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['year', 'month', 'department', 'funding_agency', 'status', 'project_number', 'project_name'],
+                name='uniq_rollup_project_monthly',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.year}-{self.month:02d} {self.project_number}: {self.expense_amount}"
+
+
+class OverviewSnapshot(BaseModel):
+    """
+    대시보드 개요 스냅샷: 4개 주요 지표와 추세
+    업로드 파이프라인과 refresh_overview_snapshot 명령이 다시 계산 (apps/data_upload/overview.py)
+    개요 API 는 고정 키(SNAPSHOT_ID) 행 하나만 읽는다.
+    """
+    SNAPSHOT_ID = SNAPSHOT_ID
+
+    TREND_CHOICES = [
+        (TREND_UP, TREND_UP),
+        (TREND_DOWN, TREND_DOWN),
+        (TREND_STABLE, TREND_STABLE),
+    ]
+
+    performance_value = models.FloatField(default=0, help_text="최신 평가년도 평균 취업률 (%)")
+    performance_trend = models.CharField(
+        max_length=10, choices=TREND_CHOICES, default=TREND_STABLE, help_text="직전 평가년도 대비 추세"
+    )
+    papers_count = models.IntegerField(default=0, help_text="최근 1년 논문 수")
+    papers_trend = models.CharField(
+        max_length=10, choices=TREND_CHOICES, default=TREND_STABLE, help_text="직전 1년 대비 추세"
+    )
+    students_count = models.IntegerField(default=0, help_text="재학생 수")
+    students_trend = models.CharField(
+        max_length=10, choices=TREND_CHOICES, default=TREND_STABLE, help_text="직전 값 대비 추세"
+    )
+    budget_value = models.FloatField(default=0, help_text="연구비 집행률 (%)")
+    budget_trend = models.CharField(
+        max_length=10, choices=TREND_CHOICES, default=TREND_STABLE, help_text="1년 전 집행률 대비 추세"
+    )
+
+    class Meta:
+        db_table = 'overview_snapshot'
+
+    def __str__(self):
+        return f"개요 스냅샷 ({self.updated_at})"
+
+
+class DataVersion(BaseModel):
+    """
+    데이터 유형별 버전 카운터 (apps/data_upload/versions.py)
+    업로드 워커·여러 웹 프로세스가 같은 값을 보도록 DB 에 저장하며, 대시보드 캐시 키와 ETag 에 쓰인다.
+    """
+    data_type = models.CharField(max_length=20, unique=True, help_text="데이터 유형 (개요 스냅샷은 'overview')")
+    version = models.BigIntegerField(help_text="변경될 때마다 1 씩 증가")
+
+    class Meta:
+        db_table = 'data_versions'
+
+    def __str__(self):
+        return f"{self.data_type}: {self.version}"
@@ -0,0 +1,183 @@
+"""
+대시보드 개요 스냅샷 계산
+
+개요 API 는 매 요청마다 4개 지표를 집계하지 않고 OverviewSnapshot 한 행(SNAPSHOT_ID)만 읽는다.
+스냅샷은 다음 경로에서 다시 계산한다.
+
+- 업로드: 행이 추가·수정된 data_type 의 지표만 (services.ingest_csv_upload)
+- 관리자 화면 등 모델 저장·삭제: 바뀐 data_type 의 지표만 (models.UploadedDataModel, 커밋 후)
+- python manage.py refresh_overview_snapshot: 전체 지표 (최근 1년 기간이 날짜에 따라 움직이므로 매일 실행)
+- python manage.py rebuild_rollups: 다시 계산한 data_type 의 지표
+
+지표와 추세:
+- 실적: 최신 평가년도 평균 취업률, 직전 평가년도 평균과 비교
+- 논문: 최근 1년 논문 수, 그 전 1년과 비교
+- 학생: 재학생 수, 스냅샷에 저장된 직전 값과 비교 (값이 그대로면 이전 추세 유지)
+- 예산: 연구비 집행률, 1년 전까지의 집행분만으로 계산한 집행률과 비교
+
+스냅샷 값이 바뀌면 'overview' 버전을 올려 개요 캐시를 무효화한다.
+"""
+import logging
+import uuid
+from datetime import timedelta
+from typing import Callable, Iterable, Optional
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Avg, Count, Q, Sum
+from django.utils import timezone
+
+from apps.data_upload.versions import bump_data_version
+
+logger = logging.getLogger(__name__)
+
+APP_LABEL = 'data_upload'
+
+SNAPSHOT_ID = uuid.UUID(int=1)
+OVERVIEW_VERSION = 'overview'
+
+TREND_UP = 'up'
+TREND_DOWN = 'down'
+TREND_STABLE = 'stable'
+
+# data_type → 스냅샷 지표
+METRICS = {
+    'kpi': 'performance',
+    'publication': 'papers',
+    'student': 'students',
+    'project': 'budget',
+}
+
+SNAPSHOT_FIELDS = (
+    'performance_value', 'performance_trend',
+    'papers_count', 'papers_trend',
+    'students_count', 'students_trend',
+    'budget_value', 'budget_trend',
+)
+
+
+def trend(current: float, previous: Optional[float]) -> str:
+    """현재 값과 비교 기준 값의 추세 (소수 첫째 자리까지 같으면 유지, 기준이 없으면 유지)"""
+    if previous is None:
+        return TREND_STABLE
+    current, previous = round(current, 1), round(previous, 1)
+    if current > previous:
+        return TREND_UP
+    if current < previous:
+        return TREND_DOWN
+    return TREND_STABLE
+
+
+def _execution_rate(total_budget, total_expense) -> Optional[float]:
+    if not total_budget:
+        return None
+    return (total_expense or 0) / total_budget * 100
+
+
+def _performance(snapshot, get_model: Callable) -> None:
+    """최신 평가년도와 직전 평가년도의 평균 취업률"""
+    rows = list(
+        get_model(APP_LABEL, 'DepartmentKPI').objects.values('evaluation_year').annotate(
+            avg=Avg('employment_rate')
+        ).order_by('-evaluation_year')[:2]
+    )
+    averages = [float(row['avg'] or 0) for row in rows]
+    snapshot.performance_value = averages[0] if averages else 0.0
+    snapshot.performance_trend = trend(snapshot.performance_value, averages[1] if len(averages) > 1 else None)
+
+
+def _papers(snapshot, get_model: Callable) -> None:
+    """최근 1년과 그 전 1년의 논문 수"""
+    one_year_ago = timezone.localdate() - timedelta(days=365)
+    two_years_ago = one_year_ago - timedelta(days=365)
+    counts = get_model(APP_LABEL, 'PublicationList').objects.aggregate(
+        current=Count('id', filter=Q(publication_date__gte=one_year_ago)),
+        previous=Count('id', filter=Q(publication_date__gte=two_years_ago, publication_date__lt=one_year_ago)),
+    )
+    snapshot.papers_count = counts['current']
+    snapshot.papers_trend = trend(counts['current'], counts['previous'])
+
+
+def _students(snapshot, get_model: Callable, previous: Optional[int]) -> None:
+    """재학생 수 (학생 롤업 합계)"""
+    count = get_model(APP_LABEL, 'StudentRollup').objects.filter(
+        academic_status='재학'
+    ).aggregate(count=Sum('row_count'))['count'] or 0
+    if previous is None or count != previous:
+        snapshot.students_trend = trend(count, previous)
+    snapshot.students_count = count
+
+
+def _budget(snapshot, get_model: Callable) -> None:
+    """전체 집행률과 1년 전까지 집행분의 집행률 (연구비 롤업 합계)"""
+    one_year_ago = timezone.localdate() - timedelta(days=365)
+    past = Q(execution_date__lt=one_year_ago)
+    sums = get_model(APP_LABEL, 'ProjectExpenseRollup').objects.aggregate(
+        budget=Sum('total_budget'),
+        expense=Sum('expense_amount'),
+        past_budget=Sum('total_budget', filter=past),
+        past_expense=Sum('expense_amount', filter=past),
+    )
+    snapshot.budget_value = _execution_rate(sums['budget'], sums['expense']) or 0.0
+    snapshot.budget_trend = trend(
+        snapshot.budget_value, _execution_rate(sums['past_budget'], sums['past_expense'])
+    )
+
+
+def refresh_overview_snapshot(
+    data_types: Optional[Iterable[str]] = None,
+    get_model: Callable = apps.get_model,
+):
+    """
+    개요 스냅샷 다시 계산
+
+    스냅샷 행을 잠그고 계산하므로 동시에 끝난 업로드도 순서대로 반영된다.
+
+    Args:
+        data_types: 다시 계산할 데이터 유형 (기본값: 전체, 스냅샷이 없으면 항상 전체)
+        get_model: 모델 조회 함수 (마이그레이션에서는 apps.get_model)
+
+    Returns:
+        OverviewSnapshot
+    """
+    model = get_model(APP_LABEL, 'OverviewSnapshot')
+    with transaction.atomic():
+        _, created = model.objects.get_or_create(pk=SNAPSHOT_ID)
+        snapshot = model.objects.select_for_update().get(pk=SNAPSHOT_ID)
+        before = tuple(getattr(snapshot, field) for field in SNAPSHOT_FIELDS)
+
+        metrics = set(METRICS.values()) if created or data_types is None else {
+            METRICS[data_type] for data_type in data_types
+        }
+        if 'performance' in metrics:
+            _performance(snapshot, get_model)
+        if 'papers' in metrics:
+            _papers(snapshot, get_model)
+        if 'students' in metrics:
+            _students(snapshot, get_model, None if created else snapshot.students_count)
+        if 'budget' in metrics:
+            _budget(snapshot, get_model)
+
+        changed = created or before != tuple(getattr(snapshot, field) for field in SNAPSHOT_FIELDS)
+        if changed:
+            snapshot.save()
+
+    if changed:
+        bump_data_version(OVERVIEW_VERSION, get_model)
+    return snapshot
+
+
+def publish_changes(data_types: Iterable[str]) -> None:
+    """
+    커밋된 데이터 변경을 대시보드에 반영 (data_type 버전을 올려 캐시 무효화, 개요 스냅샷의 해당 지표 다시 계산)
+
+    호출한 쪽의 결과나 원래 예외를 가리지 않도록 실패는 기록만 한다.
+    스냅샷은 python manage.py refresh_overview_snapshot 으로 다시 맞출 수 있다.
+    """
+    data_types = list(data_types)
+    try:
+        for data_type in data_types:
+            bump_data_version(data_type)
+        refresh_overview_snapshot(data_types)
+    except Exception:
+        logger.exception(f"{', '.join(data_types)} 대시보드 캐시 무효화·개요 스냅샷 갱신 실패")
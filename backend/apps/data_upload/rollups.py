@@ -0,0 +1,241 @@
+"""
+대시보드 집계용 롤업 테이블 증분 갱신
+
+대시보드 패널은 원본 테이블을 매번 GROUP BY 하는 대신 차원별로 미리 합계를 낸 롤업 테이블을 읽는다.
+롤업 행 수는 차원 값 조합 수에 비례하므로 패널 조회 시간이 원본 행 수와 무관해진다.
+
+- PublicationMonthlyRollup: (연, 월, 단과대학, 학과, 저널등급) 별 논문 수
+- StudentRollup: (단과대학, 학과, 과정구분, 학적상태) 별 학생 수
+- ProjectExpenseRollup: (집행일자, 학과, 지원기관, 상태) 별 건수·총연구비·집행금액
+- ProjectMonthlyRollup: (연, 월, 학과, 지원기관, 상태, 과제) 별 건수·총연구비·집행금액 (과제별 집행률)
+
+원본 행이 추가/수정/삭제되면 같은 트랜잭션 안에서 이전 값의 기여분을 빼고 새 값의 기여분을 더한다
+(upsert.write_records, UploadedDataModel.save/delete, UploadedDataQuerySet.delete). 차원 키별 변화량을
+INSERT ... ON CONFLICT DO UPDATE SET row_count = row_count + 변화량 한 문장으로 합치므로
+업로드 한 배치당 롤업 쓰기는 바뀐 차원 키 수만큼의 행에만 일어난다.
+이전 값을 읽기 전에 원본 모델별 잠금(lock_source)을 잡아, 겹친 업로드가 같은 새 키를 두 번 더하지 않게 한다.
+
+QuerySet.update() 나 DB 직접 수정처럼 위 경로를 거치지 않는 변경은 반영되지 않는다.
+이때는 python manage.py rebuild_rollups 로 원본에서 다시 계산한다.
+"""
+import uuid
+from collections import defaultdict
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+from apps.data_upload.locks import advisory_xact_lock
+
+APP_LABEL = 'data_upload'
+MERGE_BATCH_SIZE = 500
+
+DATE_PARTS = {'year': ExtractYear, 'month': ExtractMonth}
+
+
+class Rollup(NamedTuple):
+    """
+    롤업 정의
+
+    Attributes:
+        data_type: 데이터 유형
+        source: 원본 모델명
+        model: 롤업 모델명
+        dimensions: 롤업 차원 필드 (date_parts 에 없으면 원본의 같은 이름 필드)
+        measures: 합계를 내는 원본 숫자 필드 (롤업의 같은 이름 필드, 건수는 항상 row_count)
+        date_parts: {롤업 필드('year'|'month'): 원본 날짜 필드}
+    """
+    data_type: str
+    source: str
+    model: str
+    dimensions: Tuple[str, ...]
+    measures: Tuple[str, ...] = ()
+    date_parts: Dict[str, str] = {}
+
+    @property
+    def source_fields(self) -> Tuple[str, ...]:
+        """키·합계 계산에 필요한 원본 필드"""
+        fields = [self.date_parts.get(dimension, dimension) for dimension in self.dimensions]
+        return tuple(dict.fromkeys([*fields, *self.measures]))
+
+    def key(self, row: Any) -> Tuple[Any, ...]:
+        values = []
+        for dimension in self.dimensions:
+            if dimension in self.date_parts:
+                day = _value(row, self.date_parts[dimension])
+                if isinstance(day, str):  # 저장 전 인스턴스에 문자열로 넣은 날짜
+                    day = date.fromisoformat(day)
+                values.append(getattr(day, dimension))
+            else:
+                values.append(_value(row, dimension))
+        return tuple(values)
+
+
+ROLLUPS = (
+    Rollup(
+        'publication', 'PublicationList', 'PublicationMonthlyRollup',
+        ('year', 'month', 'college', 'department', 'journal_grade'),
+        date_parts={'year': 'publication_date', 'month': 'publication_date'},
+    ),
+    Rollup(
+        'student', 'StudentRoster', 'StudentRollup',
+        ('college', 'department', 'program_type', 'academic_status'),
+    ),
+    Rollup(
+        'project', 'ResearchProjectData', 'ProjectExpenseRollup',
+        ('execution_date', 'department', 'funding_agency', 'status'),
+        measures=('total_budget', 'expense_amount'),
+    ),
+    Rollup(
+        'project', 'ResearchProjectData', 'ProjectMonthlyRollup',
+        ('year', 'month', 'department', 'funding_agency', 'status', 'project_number', 'project_name'),
+        measures=('total_budget', 'expense_amount'),
+        date_parts={'year': 'execution_date', 'month': 'execution_date'},
+    ),
+)
+ROLLUPS_BY_SOURCE = {
+    source: tuple(rollup for rollup in ROLLUPS if rollup.source == source)
+    for source in dict.fromkeys(rollup.source for rollup in ROLLUPS)
+}
+
+
+def _value(row: Any, field: str) -> Any:
+    return row[field] if isinstance(row, dict) else getattr(row, field)
+
+
+def rollups_for(model: type) -> Tuple[Rollup, ...]:
+    """원본 모델의 롤업 정의 (롤업이 없는 모델은 빈 튜플)"""
+    return ROLLUPS_BY_SOURCE.get(model._meta.object_name, ())
+
+
+def source_fields(model: type) -> Tuple[str, ...]:
+    """원본 모델의 모든 롤업 키·합계 계산에 필요한 필드"""
+    return tuple(dict.fromkeys(field for rollup in rollups_for(model) for field in rollup.source_fields))
+
+
+def lock_source(model: type) -> None:
+    """
+    원본 모델의 롤업 반영을 현재 트랜잭션이 끝날 때까지 직렬화 (트랜잭션 안에서, 이전 값을 읽기 전에 호출)
+
+    아직 없는 자연키는 잠글 기존 행이 없으므로, 겹친 두 업로드가 같은 키를 모두 새 행으로 보고 롤업에 두 번 더할 수 있다.
+    """
+    advisory_xact_lock(f"{APP_LABEL}.rollup.{model._meta.db_table}")
+
+
+def _deltas(rollup: Rollup, old_rows: Iterable[Any], new_rows: Iterable[Any]) -> Dict[Tuple, List[int]]:
+    """{차원 키: [건수 변화량, 합계 변화량...]} (변화가 0 인 키는 제외)"""
+    deltas = defaultdict(lambda: [0] * (1 + len(rollup.measures)))
+    for rows, sign in ((old_rows, -1), (new_rows, 1)):
+        for row in rows:
+            delta = deltas[rollup.key(row)]
+            delta[0] += sign
+            for i, measure in enumerate(rollup.measures, start=1):
+                delta[i] += sign * (_value(row, measure) or 0)
+    return {key: delta for key, delta in deltas.items() if any(delta)}
+
+
+def _merge(model: type, rollup: Rollup, deltas: Dict[Tuple, List[int]]) -> None:
+    """차원 키별 변화량을 롤업 테이블에 더하고, 건수가 0 이하가 된 행은 삭제"""
+    meta = model._meta
+    qn = connection.ops.quote_name
+    table = qn(meta.db_table)
+    fields = [
+        meta.get_field(name)
+        for name in ('id', 'created_at', 'updated_at', *rollup.dimensions, 'row_count', *rollup.measures)
+    ]
+    columns = ', '.join(qn(field.column) for field in fields)
+    conflict = ', '.join(qn(meta.get_field(name).column) for name in rollup.dimensions)
+    additions = ', '.join(
+        f"{qn(column)} = {table}.{qn(column)} + EXCLUDED.{qn(column)}"
+        for column in (meta.get_field(name).column for name in ('row_count', *rollup.measures))
+    )
+    placeholder = f"({', '.join(['%s'] * len(fields))})"
+
+    now = timezone.now()
+    items = list(deltas.items())
+    with connection.cursor() as cursor:
+        for start in range(0, len(items), MERGE_BATCH_SIZE):
+            batch = items[start:start + MERGE_BATCH_SIZE]
+            params = []
+            for key, delta in batch:
+                values = (uuid.uuid4(), now, now, *key, *delta)
+                params.extend(field.get_db_prep_save(value, connection) for field, value in zip(fields, values))
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES {', '.join([placeholder] * len(batch))} "
+                f"ON CONFLICT ({conflict}) DO UPDATE SET {additions}, "
+                f"{qn('updated_at')} = EXCLUDED.{qn('updated_at')}",
+                params,
+            )
+        if any(delta[0] < 0 for delta in deltas.values()):
+            cursor.execute(f"DELETE FROM {table} WHERE {qn('row_count')} <= 0")
+
+
+def apply_changes(
+    source: type,
+    old_rows: Iterable[Any],
+    new_rows: Iterable[Any],
+    get_model: Callable[[str, str], type] = apps.get_model,
+) -> None:
+    """
+    원본 행 변경을 롤업에 반영 (원본 쓰기와 같은 트랜잭션 안에서 호출)
+
+    Args:
+        source: 원본 모델
+        old_rows: 변경 전 행 (수정·삭제된 기존 행, 인스턴스 또는 딕셔너리)
+        new_rows: 변경 후 행 (추가·수정된 행)
+    """
+    old_rows, new_rows = list(old_rows), list(new_rows)
+    for rollup in rollups_for(source):
+        deltas = _deltas(rollup, old_rows, new_rows)
+        if deltas:
+            _merge(get_model(APP_LABEL, rollup.model), rollup, deltas)
+
+
+def rebuild_rollups(
+    data_types: Optional[Sequence[str]] = None,
+    get_model: Callable[[str, str], type] = apps.get_model,
+) -> Dict[str, int]:
+    """
+    롤업 테이블을 원본 테이블에서 다시 계산 (초기 적재, 업로드 외 경로 변경 후 보정)
+
+    Args:
+        data_types: 다시 계산할 데이터 유형 (기본값: 전체)
+        get_model: 모델 조회 함수 (마이그레이션에서는 과거 모델 조회 함수)
+
+    Returns:
+        {data_type: 롤업 행 수 (롤업이 여러 개인 유형은 합계)}
+    """
+    result = {}
+    for rollup in ROLLUPS:
+        if data_types is not None and rollup.data_type not in data_types:
+            continue
+        source = get_model(APP_LABEL, rollup.source)
+        model = get_model(APP_LABEL, rollup.model)
+        parts = {
+            dimension: DATE_PARTS[dimension](field) for dimension, field in rollup.date_parts.items()
+        }
+        sums = {f"sum_{measure}": Sum(measure) for measure in rollup.measures}
+        groups = (
+            source.objects.annotate(**parts)
+            .values(*rollup.dimensions)
+            .annotate(group_count=Count('pk'), **sums)
+            .order_by()
+        )
+        with transaction.atomic():
+            lock_source(source)
+            model.objects.all().delete()
+            rows = [
+                model(
+                    **{dimension: group[dimension] for dimension in rollup.dimensions},
+                    row_count=group['group_count'],
+                    **{measure: group[f"sum_{measure}"] or 0 for measure in rollup.measures},
+                )
+                for group in groups.iterator()
+            ]
+            model.objects.bulk_create(rows, batch_size=1000)
+        result[rollup.data_type] = result.get(rollup.data_type, 0) + len(rows)
+    return result
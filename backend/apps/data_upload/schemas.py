@@ -0,0 +1,268 @@
+"""
+업로드 데이터 유형별 스키마 레지스트리
+
+데이터 유형마다 컬럼(헤더 별칭 포함), 변환 타입, 범위, 허용 값, 자연키, 저장 모델을 한 곳에 선언한다.
+검증 엔진(validation.py)과 저장(services.py)은 데이터 유형과 무관하게 이 선언만 보고 동작하므로,
+새 데이터 유형은 스키마를 등록하는 것만으로 같은 처리 경로를 사용한다.
+
+Django 에 의존하지 않으므로 병렬 검증 프로세스에서도 그대로 import 할 수 있다.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# 변환 타입
+TEXT = 'text'                    # str(value).strip()
+OPTIONAL_TEXT = 'optional_text'  # str(value).strip() or None
+INT = 'int'                      # int(value)
+TRUNCATED_INT = 'truncated_int'  # int(float(value))
+AMOUNT = 'amount'                # int(float(str(value).replace(',', '')))
+FLOAT = 'float'                  # float(value)
+DATE = 'date'                    # dateutil.parser.parse(str(value)).date()
+
+JOURNAL_GRADES = ('SCIE', 'KCI', '일반')
+PROJECT_LINKED_VALUES = ('Y', 'N')
+PROJECT_STATUSES = ('집행완료', '처리중', '반려')
+PROGRAM_TYPES = ('학사', '석사', '박사')
+ACADEMIC_STATUSES = ('재학', '휴학', '졸업', '제적')
+GENDERS = ('남', '여')
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    컬럼 하나의 선언
+
+    Attributes:
+        name: 저장 필드명 (영문 헤더와 같음)
+        dtype: 변환 타입 (TEXT, INT, FLOAT, DATE 등)
+        headers: 헤더 후보 (앞 헤더의 값이 비어 있으면 다음 헤더 값 사용, 기본값: (name,))
+        default: 컬럼이 없을 때의 값
+        empty_as: 빈 문자열 대체값 (예: '0' → float(value or 0))
+        required: 빈 값일 때의 오류 메시지
+        minimum, maximum: 허용 범위 (양 끝 포함)
+        range_message: 범위 밖일 때의 오류 메시지 ({value}: 변환된 값)
+        invalid_message: 변환 실패 시 오류 메시지 ({raw}: 원본 값)
+        nullable: 빈 값·변환 실패·NaN 을 오류 없이 None 으로 저장
+        only_if: (다른 필드명, 값) — 그 필드의 값이 같을 때만 변환, 아니면 None
+        choices: 허용 값
+        choice_message: 허용 값이 아닐 때의 오류 메시지 ({value}), 없으면 fallback 으로 대체
+        fallback: 허용 값이 아닐 때 대체값
+        upper: 대문자로 정규화
+        categorical: 값 종류가 적은 컬럼 (PyArrow 엔진에서 사전 배열로 읽음, 허용 값이 있는 컬럼은 자동)
+    """
+    name: str
+    dtype: str = TEXT
+    headers: Tuple[str, ...] = ()
+    default: Any = ''
+    empty_as: Optional[str] = None
+    required: Optional[str] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    range_message: Optional[str] = None
+    invalid_message: Optional[str] = None
+    nullable: bool = False
+    only_if: Optional[Tuple[str, Any]] = None
+    choices: Tuple[str, ...] = ()
+    choice_message: Optional[str] = None
+    fallback: Optional[str] = None
+    upper: bool = False
+    categorical: bool = False
+
+    @property
+    def header_candidates(self) -> Tuple[str, ...]:
+        return self.headers or (self.name,)
+
+    @property
+    def low_cardinality(self) -> bool:
+        return self.categorical or bool(self.choices)
+
+
+@dataclass(frozen=True)
+class UploadSchema:
+    """
+    데이터 유형 하나의 선언
+
+    Attributes:
+        data_type: 데이터 유형 ('kpi' 등)
+        model: 저장 모델 클래스명 (data_upload 앱)
+        natural_key: 업서트 기준 자연키 필드
+        fields: 컬럼 선언 (오류 메시지는 이 순서대로 쌓인다)
+    """
+    data_type: str
+    model: str
+    natural_key: Tuple[str, ...]
+    fields: Tuple[FieldSpec, ...]
+
+
+SCHEMAS: Dict[str, UploadSchema] = {}
+
+
+def register_schema(schema: UploadSchema) -> UploadSchema:
+    """스키마 등록 (같은 데이터 유형은 덮어씀)"""
+    SCHEMAS[schema.data_type] = schema
+    return schema
+
+
+def get_schema(data_type: str) -> UploadSchema:
+    schema = SCHEMAS.get(data_type)
+    if schema is None:
+        raise ValueError(f"지원하지 않는 데이터 유형: {data_type}")
+    return schema
+
+
+def data_type_for_model(model_name: str) -> Optional[str]:
+    """모델명으로 데이터 유형 조회 (업로드 대상이 아니면 None)"""
+    for schema in SCHEMAS.values():
+        if schema.model == model_name:
+            return schema.data_type
+    return None
+
+
+def categorical_headers(data_type: str) -> Tuple[str, ...]:
+    """값 종류가 적은 필드의 헤더 후보 전체"""
+    return tuple(
+        header
+        for field in get_schema(data_type).fields if field.low_cardinality
+        for header in field.header_candidates
+    )
+
+
+def detect_data_type(columns: Iterable[str]) -> Optional[str]:
+    """
+    CSV 헤더로 데이터 유형 추정
+
+    자연키 필드의 헤더가 모두 있는 스키마 중 헤더가 일치하는 필드가 가장 많은 유형을 고른다.
+    후보가 없거나 동점이면 None.
+    """
+    columns = set(columns)
+    scores = []
+    for schema in SCHEMAS.values():
+        present = {
+            field.name for field in schema.fields
+            if any(header in columns for header in field.header_candidates)
+        }
+        if set(schema.natural_key) <= present:
+            scores.append((len(present), schema.data_type))
+    scores.sort(reverse=True)
+    if not scores or (len(scores) > 1 and scores[0][0] == scores[1][0]):
+        return None
+    return scores[0][1]
+
+
+register_schema(UploadSchema(
+    data_type='kpi',
+    model='DepartmentKPI',
+    natural_key=('evaluation_year', 'department'),
+    fields=(
+        FieldSpec(
+            'evaluation_year', INT, headers=('평가년도', 'evaluation_year'),
+            invalid_message="평가년도가 유효하지 않습니다: {raw}",
+            minimum=2023, maximum=2025, range_message="평가년도는 2023~2025 사이여야 합니다",
+        ),
+        FieldSpec('college', headers=('단과대학', 'college'), required="단과대학명이 필수입니다", categorical=True),
+        FieldSpec('department', headers=('학과', 'department'), required="학과명이 필수입니다", categorical=True),
+        FieldSpec(
+            'employment_rate', FLOAT, headers=('졸업생 취업률 (%)', 'employment_rate'), empty_as='0',
+            minimum=0, maximum=100, range_message="취업률은 0~100 사이여야 합니다: {value}",
+            invalid_message="취업률이 유효하지 않습니다: {raw}",
+        ),
+        FieldSpec(
+            'fulltime_faculty_count', TRUNCATED_INT, headers=('전임교원 수 (명)', 'fulltime_faculty_count'),
+            empty_as='0', minimum=0, range_message="전임교원 수는 0 이상이어야 합니다: {value}",
+            invalid_message="전임교원 수가 유효하지 않습니다",
+        ),
+        FieldSpec(
+            'visiting_faculty_count', TRUNCATED_INT, headers=('초빙교원 수 (명)', 'visiting_faculty_count'),
+            empty_as='0', minimum=0, range_message="초빙교원 수는 0 이상이어야 합니다: {value}",
+            invalid_message="초빙교원 수가 유효하지 않습니다",
+        ),
+        FieldSpec(
+            'tech_transfer_revenue', FLOAT, headers=('연간 기술이전 수입액 (억원)', 'tech_transfer_revenue'),
+            empty_as='0', minimum=0, range_message="기술이전 수입액은 0 이상이어야 합니다: {value}",
+            invalid_message="기술이전 수입액이 유효하지 않습니다",
+        ),
+        FieldSpec(
+            'intl_conference_count', TRUNCATED_INT, headers=('국제학술대회 개최 횟수', 'intl_conference_count'),
+            empty_as='0', minimum=0, range_message="국제학술대회 개최 횟수는 0 이상이어야 합니다: {value}",
+            invalid_message="국제학술대회 개최 횟수가 유효하지 않습니다",
+        ),
+    ),
+))
+
+register_schema(UploadSchema(
+    data_type='publication',
+    model='PublicationList',
+    natural_key=('publication_id',),
+    fields=(
+        FieldSpec('publication_id', required="논문ID가 필수입니다"),
+        FieldSpec('publication_date', DATE, invalid_message="게재일이 유효하지 않습니다: {raw}"),
+        FieldSpec('college', categorical=True),
+        FieldSpec('department', categorical=True),
+        FieldSpec('title'),
+        FieldSpec('first_author'),
+        FieldSpec('co_authors', OPTIONAL_TEXT),
+        FieldSpec('journal_name'),
+        FieldSpec(
+            'journal_grade', choices=JOURNAL_GRADES,
+            choice_message="저널등급이 유효하지 않습니다: {value} (SCIE, KCI, 일반 중 하나)",
+        ),
+        # Impact Factor 는 SCIE 논문만, 값이 있을 때만, 변환 실패 시 None
+        FieldSpec('impact_factor', FLOAT, nullable=True, only_if=('journal_grade', 'SCIE')),
+        FieldSpec('project_linked', default='N', upper=True, choices=PROJECT_LINKED_VALUES, fallback='N'),
+    ),
+))
+
+register_schema(UploadSchema(
+    data_type='project',
+    model='ResearchProjectData',
+    natural_key=('execution_id',),
+    fields=(
+        FieldSpec('execution_id', required="집행ID가 필수입니다"),
+        FieldSpec('project_number'),
+        FieldSpec('project_name'),
+        FieldSpec('principal_investigator'),
+        FieldSpec('department', categorical=True),
+        FieldSpec('funding_agency', categorical=True),
+        FieldSpec(
+            'total_budget', AMOUNT, default=0,
+            minimum=0, range_message="총연구비는 0 이상이어야 합니다: {value}",
+            invalid_message="총연구비가 유효하지 않습니다: {raw}",
+        ),
+        FieldSpec('execution_date', DATE, invalid_message="집행일자가 유효하지 않습니다: {raw}"),
+        FieldSpec('expense_item', categorical=True),
+        FieldSpec(
+            'expense_amount', AMOUNT, default=0,
+            minimum=0, range_message="집행금액은 0 이상이어야 합니다: {value}",
+            invalid_message="집행금액이 유효하지 않습니다: {raw}",
+        ),
+        FieldSpec('status', default='처리중', choices=PROJECT_STATUSES, fallback='처리중'),
+        FieldSpec('notes', OPTIONAL_TEXT),
+    ),
+))
+
+register_schema(UploadSchema(
+    data_type='student',
+    model='StudentRoster',
+    natural_key=('student_id',),
+    fields=(
+        FieldSpec('student_id', required="학번이 필수입니다"),
+        FieldSpec('name'),
+        FieldSpec('college', categorical=True),
+        FieldSpec('department', categorical=True),
+        FieldSpec(
+            'grade', TRUNCATED_INT, default=0,
+            minimum=0, maximum=4, range_message="학년은 0~4 사이여야 합니다: {value}",
+            invalid_message="학년이 유효하지 않습니다: {raw}",
+        ),
+        FieldSpec('program_type', choices=PROGRAM_TYPES, choice_message="과정구분이 유효하지 않습니다: {value}"),
+        FieldSpec('academic_status', choices=ACADEMIC_STATUSES, choice_message="학적상태가 유효하지 않습니다: {value}"),
+        FieldSpec('gender', choices=GENDERS, choice_message="성별이 유효하지 않습니다: {value}"),
+        FieldSpec(
+            'admission_year', INT,
+            minimum=2000, maximum=2100, range_message="입학년도는 2000~2100 사이여야 합니다: {value}",
+            invalid_message="입학년도가 유효하지 않습니다: {raw}",
+        ),
+        FieldSpec('advisor', OPTIONAL_TEXT),
+        FieldSpec('email'),
+    ),
+))
@@ -3,33 +3,88 @@ Pandas를 사용한 CSV 파싱 및 데이터 검증 로직
 """
 import pandas as pd
 import json
-from io import StringIO
+import os
+import random
+from contextlib import nullcontext
+from io import BytesIO, StringIO
+from itertools import islice
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
-from typing import Dict, List, Tuple, Any
-from apps.data_upload.models import (
-    DepartmentKPI,
-    PublicationList,
-    ResearchProjectData,
-    StudentRoster,
-    UploadLog,
-)
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any, Union
+from apps.data_upload.models import UploadLog
+from apps.data_upload.dates import parse_date
+from apps.data_upload.duplicates import find_duplicate_rows, find_invalid_rows, key_columns
+from apps.data_upload.errors import ErrorSink
+from apps.data_upload.overview import publish_changes
+from apps.data_upload.schemas import categorical_headers, get_schema
+from apps.data_upload.upsert import WriteCounts, count_changes, write_in_batches, write_records
+from apps.data_upload.validation import iter_validated_chunks, validate_frame
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
 
-def parse_csv_file(file_content: bytes, encoding: str = 'utf-8-sig') -> pd.DataFrame:
+
+def upsert_target(data_type: str) -> Tuple[type, Tuple[str, ...]]:
+    """
+    데이터 유형별 저장 대상 모델과 자연키 (schemas.py 선언 기준)
+    
+    Raises:
+        ValueError: 등록되지 않은 데이터 유형
+    """
+    schema = get_schema(data_type)
+    return apps.get_model('data_upload', schema.model), schema.natural_key
+
+
+CSV_ENGINE_PANDAS = 'pandas'  # pandas C 파서 (단일 스레드, 모든 셀을 파이썬 문자열로)
+CSV_ENGINE_PYARROW = 'pyarrow'  # PyArrow 다중 스레드 파서 (원본 바이트 직접 파싱, 저카디널리티 컬럼은 Categorical)
+CSV_ENGINES = (CSV_ENGINE_PANDAS, CSV_ENGINE_PYARROW)
+
+
+def _arrow_engine(engine: Optional[str]):
+    """
+    PyArrow 엔진을 고른 경우 arrow_csv 모듈, pandas 엔진이면 None
+    
+    Raises:
+        ImproperlyConfigured: 지원하지 않는 엔진이거나 pyarrow 가 설치되지 않음
+    """
+    engine = engine or settings.CSV_PARSER_ENGINE
+    if engine not in CSV_ENGINES:
+        raise ImproperlyConfigured(f"지원하지 않는 CSV 파싱 엔진: {engine}")
+    if engine == CSV_ENGINE_PANDAS:
+        return None
+    try:
+        from apps.data_upload import arrow_csv
+    except ImportError:
+        raise ImproperlyConfigured("CSV_PARSER_ENGINE='pyarrow' 를 쓰려면 pyarrow 패키지를 설치해야 합니다.")
+    return arrow_csv
+
+
+def parse_csv_file(
+    file_content: bytes,
+    encoding: str = 'utf-8-sig',
+    engine: Optional[str] = None,
+    categorical_columns: Iterable[str] = (),
+) -> pd.DataFrame:
     """
     CSV 파일을 Pandas DataFrame으로 파싱
     
     Args:
         file_content: CSV 파일 바이트 콘텐츠
         encoding: 파일 인코딩 (기본값: utf-8-sig, BOM 포함)
+        engine: 파싱 엔진 (기본값: settings.CSV_PARSER_ENGINE)
+        categorical_columns: PyArrow 엔진에서 Categorical 로 읽을 컬럼 (schemas.categorical_headers)
     
     Returns:
         pandas.DataFrame
     """
+    arrow = _arrow_engine(engine)
     try:
+        if arrow is not None:
+            return arrow.read_csv(file_content, encoding, dictionary_columns=categorical_columns)
+        
         # BOM 제거 및 UTF-8 디코딩
         content = file_content.decode(encoding).strip()
         
@@ -45,6 +100,110 @@ def parse_csv_file(file_content: bytes, encoding: str = 'utf-8-sig') -> pd.DataF
         raise ValueError(f"CSV 파일 파싱 실패: {str(e)}")
 
 
+def iter_csv_chunks(
+    source: BinaryIO,
+    chunk_size: Optional[int] = None,
+    encoding: str = 'utf-8-sig',
+    usecols: Optional[Iterable[str]] = None,
+    engine: Optional[str] = None,
+    categorical_columns: Iterable[str] = (),
+) -> Iterator[pd.DataFrame]:
+    """
+    CSV 파일을 청크 단위 DataFrame 으로 스트리밍 파싱
+    
+    파일 전체를 디코딩하거나 메모리에 복사하지 않고 파일 객체에서 바로 읽으므로,
+    파일 크기와 관계없이 메모리 사용량은 청크 크기에 비례한다.
+    
+    Args:
+        source: 바이너리 파일 객체 (업로드 파일, 임시 파일 등)
+        chunk_size: 청크당 행 수 (기본값: settings.CSV_UPLOAD_CHUNK_ROWS)
+        encoding: 파일 인코딩 (기본값: utf-8-sig, BOM 포함)
+        usecols: 읽을 컬럼명 (기본값: 전체 컬럼)
+        engine: 파싱 엔진 (기본값: settings.CSV_PARSER_ENGINE)
+        categorical_columns: PyArrow 엔진에서 Categorical 로 읽을 컬럼 (schemas.categorical_headers)
+    
+    Yields:
+        pandas.DataFrame (모든 컬럼 문자열)
+    """
+    chunk_size = chunk_size or settings.CSV_UPLOAD_CHUNK_ROWS
+    arrow = _arrow_engine(engine)
+    if arrow is not None:
+        try:
+            yield from arrow.iter_csv_chunks(source, chunk_size, encoding, usecols, categorical_columns)
+        except Exception as e:
+            raise ValueError(f"CSV 파일 파싱 실패: {str(e)}")
+        return
+    
+    if usecols is not None:
+        usecols = set(usecols).__contains__  # 파일에 없는 컬럼명은 무시
+    try:
+        reader = pd.read_csv(
+            source,
+            encoding=encoding,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=chunk_size,
+            usecols=usecols,
+        )
+        for chunk in reader:
+            yield chunk
+    except Exception as e:
+        raise ValueError(f"CSV 파일 파싱 실패: {str(e)}")
+
+
+FORMAT_CSV = 'csv'
+FORMAT_PARQUET = 'parquet'
+FORMAT_ARROW = 'arrow'  # Arrow IPC (파일·스트림 형식)
+UPLOAD_FORMATS = {
+    '.csv': FORMAT_CSV,
+    '.parquet': FORMAT_PARQUET,
+    '.arrow': FORMAT_ARROW,
+    '.feather': FORMAT_ARROW,
+    '.ipc': FORMAT_ARROW,
+}
+
+
+def upload_format(file_name: str) -> Optional[str]:
+    """파일 확장자로 업로드 형식 판별 (지원하지 않는 확장자는 None)"""
+    return UPLOAD_FORMATS.get(os.path.splitext(file_name.lower())[1])
+
+
+def columnar_formats_available() -> bool:
+    """Parquet/Arrow 업로드에 필요한 pyarrow 설치 여부"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _columnar():
+    try:
+        from apps.data_upload import columnar
+    except ImportError:
+        raise ImproperlyConfigured("Parquet/Arrow 파일을 처리하려면 pyarrow 패키지를 설치해야 합니다.")
+    return columnar
+
+
+def iter_file_chunks(
+    source: BinaryIO,
+    data_type: str,
+    file_format: str = FORMAT_CSV,
+    chunk_size: Optional[int] = None,
+    usecols: Optional[Iterable[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    업로드 파일을 형식에 맞게 청크 단위 DataFrame 으로 스트리밍
+    
+    CSV 는 iter_csv_chunks(모든 컬럼 문자열), Parquet/Arrow IPC 는 columnar.iter_columnar_chunks
+    (숫자·날짜 타입 컬럼은 타입 그대로, Parquet 은 행 그룹 단위로 읽음)를 사용한다.
+    """
+    chunk_size = chunk_size or settings.CSV_UPLOAD_CHUNK_ROWS
+    if file_format == FORMAT_CSV:
+        return iter_csv_chunks(source, chunk_size, usecols=usecols, categorical_columns=categorical_headers(data_type))
+    return _columnar().iter_columnar_chunks(source, file_format, data_type, chunk_size, usecols)
+
+
 def validate_and_parse_kpi(row: pd.Series, row_index: int) -> Dict[str, Any]:
     """
     Department KPI 행 검증 및 파싱
@@ -143,8 +302,7 @@ def validate_and_parse_publication(row: pd.Series, row_index: int) -> Dict[str,
         errors.append("논문ID가 필수입니다")
     
     try:
-        from dateutil.parser import parse
-        publication_date = parse(str(row.get('publication_date', ''))).date()
+        publication_date = parse_date(str(row.get('publication_date', '')))
     except (ValueError, TypeError, AttributeError):
         errors.append(f"게재일이 유효하지 않습니다: {row.get('publication_date')}")
         publication_date = None
@@ -215,8 +373,7 @@ def validate_and_parse_project(row: pd.Series, row_index: int) -> Dict[str, Any]
         total_budget = None
     
     try:
-        from dateutil.parser import parse
-        execution_date = parse(str(row.get('execution_date', ''))).date()
+        execution_date = parse_date(str(row.get('execution_date', '')))
     except (ValueError, TypeError, AttributeError):
         errors.append(f"집행일자가 유효하지 않습니다: {row.get('execution_date')}")
         execution_date = None
@@ -319,162 +476,407 @@ def validate_and_parse_student(row: pd.Series, row_index: int) -> Dict[str, Any]
     }
 
 
-@transaction.atomic
+def iter_upload_chunks(
+    file_content: BinaryIO,
+    data_type: str,
+    chunk_size: Optional[int] = None,
+    validation_workers: Optional[int] = None,
+    duplicate_policy: Optional[str] = None,
+    file_format: str = FORMAT_CSV,
+) -> Iterator[Tuple[int, List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    업로드 파일을 청크 단위로 검증하여 (행 수, valid_records, errors) 를 행 순서대로 반환
+    
+    자연키 컬럼만 먼저 훑어 파일 안 중복 키를 찾은 뒤(find_duplicate_rows) 처음으로 되감아
+    전체 컬럼을 검증하며, 중복 키 오류는 해당 행의 검증 오류 뒤에 덧붙는다.
+    중복 키가 있으면 그 행들만 전체 필드로 한 번 더 검증해 유효한 행 중에서 저장할 행을 고른다.
+    저장(ingest_csv_upload)과 저장 없는 검증(dry_run_csv_upload)이 같은 경로를 사용한다.
+    
+    Args:
+        file_content: 되감을 수 있는 바이너리 파일 객체
+        data_type: 데이터 유형
+        chunk_size: 청크당 행 수 (기본값: settings.CSV_UPLOAD_CHUNK_ROWS)
+        validation_workers: 병렬 검증 프로세스 수 (기본값: settings.CSV_VALIDATION_WORKERS)
+        duplicate_policy: 파일 안 중복 키 처리 방식 (기본값: settings.CSV_DUPLICATE_KEY_POLICY)
+        file_format: 업로드 형식 (FORMAT_CSV, FORMAT_PARQUET, FORMAT_ARROW)
+    """
+    if duplicate_policy is None:
+        duplicate_policy = settings.CSV_DUPLICATE_KEY_POLICY
+    if validation_workers is None:
+        validation_workers = settings.CSV_VALIDATION_WORKERS
+    
+    def invalid_rows(rows):
+        file_content.seek(0)
+        return find_invalid_rows(iter_file_chunks(file_content, data_type, file_format, chunk_size), data_type, rows)
+    
+    duplicates = find_duplicate_rows(
+        iter_file_chunks(file_content, data_type, file_format, chunk_size, usecols=key_columns(data_type)),
+        data_type,
+        duplicate_policy,
+        invalid_rows,
+    )
+    file_content.seek(0)
+    
+    # 컬럼 단위 검증 (행 번호: +2 = 헤더(1) + 0-based index(1)), 결과는 원래 행 순서대로 전달
+    yield from iter_validated_chunks(
+        iter_file_chunks(file_content, data_type, file_format, chunk_size),
+        data_type,
+        workers=validation_workers,
+        min_rows=settings.CSV_PARALLEL_MIN_ROWS,
+        row_errors=duplicates,
+    )
+
+
+COMMIT_ATOMIC = 'atomic'  # 업로드 전체를 한 트랜잭션으로 (하나라도 실패하면 전체 롤백)
+COMMIT_BATCH = 'batch'  # settings.CSV_UPLOAD_COMMIT_ROWS 행 단위로 커밋, 실패 배치는 행 단위 재시도
+COMMIT_MODES = (COMMIT_ATOMIC, COMMIT_BATCH)
+
+
+def ingest_csv_upload(
+    file_content: Union[bytes, BinaryIO],
+    data_type: str,
+    uploaded_by: User,
+    file_name: str,
+    chunk_size: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    validation_workers: Optional[int] = None,
+    content_hash: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    commit_mode: Optional[str] = None,
+    duplicate_policy: Optional[str] = None,
+    file_format: Optional[str] = None,
+) -> Tuple[UploadLog, List[Dict[str, Any]]]:
+    """
+    CSV 파일을 파싱하고 데이터베이스에 저장한 뒤 업로드 로그를 생성
+    
+    파일을 청크 단위로 읽어 청크마다 검증·저장하므로 최대 메모리 사용량이 파일 크기와 무관하다.
+    오류 행도 앞쪽 표본(settings.UPLOAD_ERROR_SAMPLE_SIZE)만 메모리에 남기고,
+    전체 오류는 압축 보고서 파일(UploadLog.error_report_path)에 기록한다.
+    저장한 행은 추가/수정/변경 없음(기존 행과 내용 해시가 같아 쓰지 않음)으로 나눠 업로드 로그에 기록한다.
+    추가·수정된 행이 있으면 data_type 버전을 올려 그 데이터를 쓰는 대시보드 캐시를 무효화하고
+    개요 스냅샷의 해당 지표를 다시 계산한다.
+    
+    Args:
+        file_content: CSV 파일 바이트 콘텐츠 또는 바이너리 파일 객체
+        data_type: 데이터 유형 ('kpi', 'publication', 'project', 'student')
+        uploaded_by: 업로드한 사용자
+        file_name: 파일명
+        chunk_size: 청크당 행 수 (기본값: settings.CSV_UPLOAD_CHUNK_ROWS)
+        progress: 청크 처리 후 (처리한 행 수, 읽은 바이트 수) 로 호출되는 콜백
+        validation_workers: 병렬 검증 프로세스 수 (기본값: settings.CSV_VALIDATION_WORKERS,
+            settings.CSV_PARALLEL_MIN_ROWS 행 이후 청크부터 적용, DB 저장은 항상 직렬)
+        content_hash: 파일 SHA-256 (업로드 로그에 기록, 동일 파일 재업로드 감지용)
+        idempotency_key: 클라이언트 Idempotency-Key (업로드 로그에 기록)
+        commit_mode: 커밋 방식 (기본값: settings.CSV_UPLOAD_COMMIT_MODE)
+            COMMIT_ATOMIC 이면 전체를 한 트랜잭션으로 처리한다.
+            COMMIT_BATCH 이면 배치마다 커밋하고 저장에 실패한 배치는 행 단위로 다시 시도해 문제 행만 오류로 기록한다.
+            진행 상황 콜백은 커밋된 뒤 호출된다. 도중에 실패하면 이미 커밋된 배치는 남는다.
+        duplicate_policy: 파일 안에서 자연키가 중복된 행 처리 (기본값: settings.CSV_DUPLICATE_KEY_POLICY)
+            'last' 는 마지막 행, 'first' 는 첫 행만 저장하고 'reject' 는 모두 제외한다.
+            저장하지 않는 행은 적재 전에 행 오류로 기록된다.
+        file_format: 업로드 형식 (기본값: file_name 확장자, 알 수 없으면 CSV)
+    
+    Returns:
+        (upload_log, errors) 튜플
+        errors: 오류 표본 [{row: int, reason: str, data: dict}] (전체 오류 수는 upload_log.failed_rows)
+    """
+    model, key_fields = upsert_target(data_type)
+    
+    if commit_mode is None:
+        commit_mode = settings.CSV_UPLOAD_COMMIT_MODE
+    if commit_mode not in COMMIT_MODES:
+        raise ValueError(f"지원하지 않는 커밋 방식: {commit_mode}")
+    
+    if isinstance(file_content, bytes):
+        file_content = BytesIO(file_content)
+    file_format = file_format or upload_format(file_name) or FORMAT_CSV
+    
+    total_rows = 0
+    counts = WriteCounts()
+    
+    atomic = transaction.atomic() if commit_mode == COMMIT_ATOMIC else nullcontext()
+    try:
+        with atomic, ErrorSink() as error_sink:
+            validated_chunks = iter_upload_chunks(
+                file_content, data_type, chunk_size, validation_workers, duplicate_policy, file_format,
+            )
+            for chunk_rows, records, chunk_errors in validated_chunks:
+                chunk_start = total_rows + 2
+                total_rows += chunk_rows
+            
+                # 자연키 기준 일괄 업서트 (PostgreSQL: COPY + 스테이징 병합, 그 외: bulk_create/bulk_update)
+                if commit_mode == COMMIT_ATOMIC:
+                    written = write_records(model, key_fields, records)
+                else:
+                    failed = {error['row'] for error in chunk_errors}
+                    rows = [row for row in range(chunk_start, chunk_start + chunk_rows) if row not in failed]
+                    written, write_errors = write_in_batches(
+                        model, key_fields, records, rows, settings.CSV_UPLOAD_COMMIT_ROWS,
+                    )
+                    if write_errors:
+                        chunk_errors = sorted(chunk_errors + write_errors, key=lambda error: error['row'])
+            
+                counts = WriteCounts(*map(sum, zip(counts, written)))
+                error_sink.add(chunk_errors)
+            
+                if progress:
+                    progress(total_rows, file_content.tell())
+        
+            errors = error_sink.sample
+        
+            # 업로드 로그 저장
+            upload_log = UploadLog.objects.create(
+                file_name=file_name,
+                data_type=data_type,
+                total_rows=total_rows,
+                success_rows=sum(counts),
+                failed_rows=error_sink.count,
+                inserted_rows=counts.created,
+                updated_rows=counts.updated,
+                unchanged_rows=counts.unchanged,
+                error_details=json.dumps(errors, ensure_ascii=False, default=str),  # 앞쪽 표본만 저장
+                error_report_path=error_sink.close(),
+                content_hash=content_hash,
+                idempotency_key=idempotency_key,
+                uploaded_by=uploaded_by,
+            )
+    except Exception:
+        # batch 모드는 실패 전에 커밋된 배치가 있을 수 있음 (atomic 모드는 전체 롤백되어 변경 없음)
+        if commit_mode == COMMIT_BATCH:
+            publish_changes([data_type])
+        raise
+    
+    # 변경 없는 재업로드는 캐시·스냅샷 유지
+    if counts.created or counts.updated:
+        publish_changes([data_type])
+    
+    return upload_log, errors
+
+
 def process_csv_upload(
-    file_content: bytes,
+    file_content: Union[bytes, BinaryIO],
     data_type: str,
     uploaded_by: User,
-    file_name: str
+    file_name: str,
+    chunk_size: Optional[int] = None,
 ) -> Tuple[int, int, List[Dict[str, Any]]]:
     """
     CSV 파일을 파싱하고 데이터베이스에 저장
     
     Args:
-        file_content: CSV 파일 바이트 콘텐츠
+        file_content: CSV 파일 바이트 콘텐츠 또는 바이너리 파일 객체
         data_type: 데이터 유형 ('kpi', 'publication', 'project', 'student')
         uploaded_by: 업로드한 사용자
         file_name: 파일명
+        chunk_size: 청크당 행 수 (기본값: settings.CSV_UPLOAD_CHUNK_ROWS)
     
     Returns:
         (success_rows, failed_rows, errors) 튜플
-        errors: [{row: int, reason: str, data: dict}]
+        errors: 오류 표본 [{row: int, reason: str, data: dict}]
     """
-    # CSV 파싱
-    df = parse_csv_file(file_content)
-    total_rows = len(df)
+    upload_log, errors = ingest_csv_upload(file_content, data_type, uploaded_by, file_name, chunk_size)
+    return upload_log.success_rows, upload_log.failed_rows, errors
+
+
+DRY_RUN_FULL = 'full'  # 파일 전체 검증 (저장 없음)
+DRY_RUN_PREVIEW = 'preview'  # 앞부분 + 임의 표본만 검증해 추정
+DRY_RUN_MODES = (DRY_RUN_FULL, DRY_RUN_PREVIEW)
+
+
+def dry_run_csv_upload(
+    file_content: Union[bytes, BinaryIO],
+    data_type: str,
+    chunk_size: Optional[int] = None,
+    validation_workers: Optional[int] = None,
+    duplicate_policy: Optional[str] = None,
+    file_format: str = FORMAT_CSV,
+) -> Dict[str, Any]:
+    """
+    저장 없이 업로드 파일 전체를 검증 (ingest_csv_upload 와 같은 헤더 매핑·검증·중복 키 처리)
+    
+    기존 데이터는 조회만 하여 유효한 행이 추가/수정/변경 없음 중 어느 쪽이 될지 센다.
+    
+    Returns:
+        {dry_run, exact, rows_checked, total_rows, success_rows, failed_rows, error_rate,
+         inserted_rows, updated_rows, unchanged_rows, errors(표본)}
+    """
+    model, key_fields = upsert_target(data_type)
+    if isinstance(file_content, bytes):
+        file_content = BytesIO(file_content)
     
-    success_rows = 0
+    total_rows = 0
     failed_rows = 0
+    counts = WriteCounts()
     errors = []
+    chunks = iter_upload_chunks(
+        file_content, data_type, chunk_size, validation_workers, duplicate_policy, file_format,
+    )
+    for chunk_rows, records, chunk_errors in chunks:
+        total_rows += chunk_rows
+        failed_rows += len(chunk_errors)
+        errors.extend(chunk_errors[:settings.UPLOAD_ERROR_SAMPLE_SIZE - len(errors)])
+        counts = WriteCounts(*map(sum, zip(counts, count_changes(model, key_fields, records))))
     
-    # 데이터 유형별 처리
-    if data_type == 'kpi':
-        models_to_create = []
-        for idx, row in df.iterrows():
-            parsed = validate_and_parse_kpi(row, idx + 2)  # +2: 헤더(1) + 0-based index(1)
-            if "errors" in parsed:
-                failed_rows += 1
-                errors.append({
-                    "row": parsed["row"],
-                    "reason": "; ".join(parsed["errors"]),
-                    "data": row.to_dict(),
-                })
-            else:
-                # 중복 체크 (evaluation_year, department)
-                existing = DepartmentKPI.objects.filter(
-                    evaluation_year=parsed["evaluation_year"],
-                    department=parsed["department"]
-                ).first()
-                
-                if existing:
-                    # 업데이트
-                    for key, value in parsed.items():
-                        setattr(existing, key, value)
-                    existing.save()
-                else:
-                    models_to_create.append(DepartmentKPI(**parsed))
-                
-                success_rows += 1
-        
-        if models_to_create:
-            DepartmentKPI.objects.bulk_create(models_to_create)
-    
-    elif data_type == 'publication':
-        models_to_create = []
-        for idx, row in df.iterrows():
-            parsed = validate_and_parse_publication(row, idx + 2)
-            if "errors" in parsed:
-                failed_rows += 1
-                errors.append({
-                    "row": parsed["row"],
-                    "reason": "; ".join(parsed["errors"]),
-                    "data": row.to_dict(),
-                })
-            else:
-                existing = PublicationList.objects.filter(
-                    publication_id=parsed["publication_id"]
-                ).first()
-                
-                if existing:
-                    for key, value in parsed.items():
-                        setattr(existing, key, value)
-                    existing.save()
-                else:
-                    models_to_create.append(PublicationList(**parsed))
-                
-                success_rows += 1
-        
-        if models_to_create:
-            PublicationList.objects.bulk_create(models_to_create)
-    
-    elif data_type == 'project':
-        models_to_create = []
-        for idx, row in df.iterrows():
-            parsed = validate_and_parse_project(row, idx + 2)
-            if "errors" in parsed:
-                failed_rows += 1
-                errors.append({
-                    "row": parsed["row"],
-                    "reason": "; ".join(parsed["errors"]),
-                    "data": row.to_dict(),
-                })
-            else:
-                existing = ResearchProjectData.objects.filter(
-                    execution_id=parsed["execution_id"]
-                ).first()
-                
-                if existing:
-                    for key, value in parsed.items():
-                        setattr(existing, key, value)
-                    existing.save()
-                else:
-                    models_to_create.append(ResearchProjectData(**parsed))
-                
-                success_rows += 1
+    return {
+        "dry_run": DRY_RUN_FULL,
+        "exact": True,
+        "rows_checked": total_rows,
+        "total_rows": total_rows,
+        "success_rows": sum(counts),
+        "failed_rows": failed_rows,
+        "error_rate": round(failed_rows / total_rows, 4) if total_rows else 0.0,
+        "inserted_rows": counts.created,
+        "updated_rows": counts.updated,
+        "unchanged_rows": counts.unchanged,
+        "errors": errors,
+    }
+
+
+def _with_newline(line: bytes) -> bytes:
+    return line if line.endswith(b'\n') else line + b'\n'
+
+
+def _sample_lines(source: BinaryIO, start: int, size: int, count: int, rng: random.Random) -> List[bytes]:
+    """
+    [start, size) 구간의 임의 바이트 위치마다 그 다음에 시작하는 줄 하나씩 읽기 (같은 줄은 한 번만)
+    
+    파일 전체를 읽지 않으므로 파일 크기와 관계없이 count 회의 seek/readline 으로 끝난다.
+    긴 줄일수록 뽑힐 확률이 길이에 비례해 높다 (행 수 추정 시 보정).
+    """
+    lines = []
+    seen = set()
+    for offset in sorted(rng.randrange(start, size) for _ in range(count)):
+        # offset 바로 앞에서 줄 끝까지 버리면 offset 이후 처음 시작하는 줄에 위치
+        source.seek(offset - 1)
+        source.readline()
+        line_start = source.tell()
+        if line_start >= size or line_start in seen:
+            continue
+        seen.add(line_start)
+        lines.append(source.readline())
+    return lines
+
+
+def preview_csv_upload(
+    file_content: Union[bytes, BinaryIO],
+    data_type: str,
+    head_rows: Optional[int] = None,
+    sample_rows: Optional[int] = None,
+    seed: Optional[int] = None,
+    file_format: str = FORMAT_CSV,
+) -> Dict[str, Any]:
+    """
+    파일 앞부분과 임의 표본 행만 검증해 오류율과 추가/수정 건수를 추정 (저장 없음)
+    
+    앞의 head_rows 행과, 나머지 구간의 임의 위치에서 뽑은 최대 sample_rows 행을
+    parse_csv_file + validate_frame 으로 검증한다. 파일 크기와 관계없이 읽는 양이 일정하므로
+    큰 파일도 수십 밀리초 안에 형식 오류를 확인할 수 있다.
+    
+    - 파일이 앞부분 안에 모두 들어가면 exact=True 이고 값은 추정이 아닌 실제 결과다.
+    - 표본은 줄 단위로 뽑으므로 따옴표 안 줄바꿈이 있는 파일에서는 추정이 어긋날 수 있다.
+    - 파일 안 중복 키는 전체를 읽어야 알 수 있으므로 검사하지 않는다 (전체 dry run 에서 검사).
+    - 임의 표본 행의 오류는 행 번호를 알 수 없어 row 가 None 이다.
+    - Parquet/Arrow IPC 파일은 _preview_columnar 로 검증한다.
+    
+    Args:
+        head_rows: 앞부분 검증 행 수 (기본값: settings.UPLOAD_PREVIEW_HEAD_ROWS)
+        sample_rows: 임의 표본 행 수 (기본값: settings.UPLOAD_PREVIEW_SAMPLE_ROWS)
+        seed: 표본 난수 시드 (테스트용)
+        file_format: 업로드 형식 (FORMAT_CSV, FORMAT_PARQUET, FORMAT_ARROW)
+    
+    Returns:
+        dry_run_csv_upload 와 같은 형식 (exact=False 이면 total_rows 이하 행 수는 추정치)
+    """
+    model, key_fields = upsert_target(data_type)
+    head_rows = head_rows or settings.UPLOAD_PREVIEW_HEAD_ROWS
+    if sample_rows is None:
+        sample_rows = settings.UPLOAD_PREVIEW_SAMPLE_ROWS
+    if isinstance(file_content, bytes):
+        file_content = BytesIO(file_content)
+    if file_format != FORMAT_CSV:
+        return _preview_columnar(file_content, data_type, file_format, head_rows)
+    
+    size = file_content.seek(0, os.SEEK_END)
+    file_content.seek(0)
+    header = _with_newline(file_content.readline())
+    head = list(islice(iter(file_content.readline, b''), head_rows))
+    head_end = file_content.tell()
+    exact = head_end >= size
+    sampled = [] if exact else _sample_lines(file_content, head_end, size, sample_rows, random.Random(seed))
+    
+    categorical_columns = categorical_headers(data_type)
+    head_df = parse_csv_file(header + b''.join(map(_with_newline, head)), categorical_columns=categorical_columns)
+    head_records, head_errors = validate_frame(head_df, data_type)
+    head_counts = count_changes(model, key_fields, head_records)
+    
+    total_rows = len(head_df)
+    projected_failed = float(len(head_errors))
+    projected = list(head_counts)
+    sample_errors = []
+    if sampled:
+        sample_df = parse_csv_file(
+            header + b''.join(map(_with_newline, sampled)), categorical_columns=categorical_columns,
+        )
+        sample_records, sample_errors = validate_frame(sample_df, data_type)
+        sample_counts = count_changes(model, key_fields, sample_records)
         
-        if models_to_create:
-            ResearchProjectData.objects.bulk_create(models_to_create)
-    
-    elif data_type == 'student':
-        models_to_create = []
-        for idx, row in df.iterrows():
-            parsed = validate_and_parse_student(row, idx + 2)
-            if "errors" in parsed:
-                failed_rows += 1
-                errors.append({
-                    "row": parsed["row"],
-                    "reason": "; ".join(parsed["errors"]),
-                    "data": row.to_dict(),
-                })
-            else:
-                existing = StudentRoster.objects.filter(
-                    student_id=parsed["student_id"]
-                ).first()
-                
-                if existing:
-                    for key, value in parsed.items():
-                        setattr(existing, key, value)
-                    existing.save()
-                else:
-                    models_to_create.append(StudentRoster(**parsed))
-                
-                success_rows += 1
+        # 길이 편향 표본이므로 평균 줄 길이는 조화평균으로 추정
+        mean_line_bytes = len(sampled) / sum(1 / len(line) for line in sampled)
+        remaining_rows = round((size - head_end) / mean_line_bytes)
+        scale = remaining_rows / len(sample_df) if len(sample_df) else 0
         
-        if models_to_create:
-            StudentRoster.objects.bulk_create(models_to_create)
-    
-    else:
-        raise ValueError(f"지원하지 않는 데이터 유형: {data_type}")
-    
-    # 업로드 로그 저장
-    upload_log = UploadLog.objects.create(
-        file_name=file_name,
-        data_type=data_type,
-        total_rows=total_rows,
-        success_rows=success_rows,
-        failed_rows=failed_rows,
-        error_details=json.dumps(errors[:100], ensure_ascii=False),  # 최대 100개만 저장
-        uploaded_by=uploaded_by,
-    )
+        total_rows += remaining_rows
+        projected_failed += len(sample_errors) * scale
+        projected = [known + sample * scale for known, sample in zip(projected, sample_counts)]
+    
+    inserted, updated, unchanged = (round(value) for value in projected)
+    failed_rows = round(projected_failed)
+    errors = head_errors + [{**error, "row": None} for error in sample_errors]
+    return {
+        "dry_run": DRY_RUN_PREVIEW,
+        "exact": exact,
+        "rows_checked": len(head) + len(sampled),
+        "total_rows": total_rows,
+        "success_rows": inserted + updated + unchanged,
+        "failed_rows": failed_rows,
+        "error_rate": round(projected_failed / total_rows, 4) if total_rows else 0.0,
+        "inserted_rows": inserted,
+        "updated_rows": updated,
+        "unchanged_rows": unchanged,
+        "errors": errors[:settings.UPLOAD_ERROR_SAMPLE_SIZE],
+    }
+
+
+def _preview_columnar(source: BinaryIO, data_type: str, file_format: str, head_rows: int) -> Dict[str, Any]:
+    """
+    컬럼형 파일 미리보기: 앞의 head_rows 행만 검증하고 메타데이터의 전체 행 수로 확대 추정
     
-    return success_rows, failed_rows, errors
+    Parquet 과 Arrow IPC 파일 형식은 전체 행 수를 읽지 않고 알 수 있다.
+    행 수를 알 수 없는 Arrow 스트림 형식은 파일 전체를 검증한다 (dry_run_csv_upload).
+    """
+    model, key_fields = upsert_target(data_type)
+    _, total_rows = _columnar().read_schema(source, file_format)
+    if total_rows is None:
+        return {**dry_run_csv_upload(source, data_type, file_format=file_format), "dry_run": DRY_RUN_PREVIEW}
+    
+    head_df = next(iter_file_chunks(source, data_type, file_format, head_rows), None)
+    if head_df is None:
+        head_df = pd.DataFrame()
+    records, errors = validate_frame(head_df, data_type) if len(head_df) else ([], [])
+    checked = len(head_df)
+    scale = total_rows / checked if checked else 0
+    inserted, updated, unchanged = (round(value * scale) for value in count_changes(model, key_fields, records))
+    projected_failed = len(errors) * scale
+    return {
+        "dry_run": DRY_RUN_PREVIEW,
+        "exact": checked >= total_rows,
+        "rows_checked": checked,
+        "total_rows": total_rows,
+        "success_rows": inserted + updated + unchanged,
+        "failed_rows": round(projected_failed),
+        "error_rate": round(projected_failed / total_rows, 4) if total_rows else 0.0,
+        "inserted_rows": inserted,
+        "updated_rows": updated,
+        "unchanged_rows": unchanged,
+        "errors": errors[:settings.UPLOAD_ERROR_SAMPLE_SIZE],
+    }
@@ -0,0 +1,174 @@
+"""
+재개 가능한 분할 업로드 세션
+
+1. POST   /api/data/upload-sessions/                 세션 생성 (file_name, data_type, total_size)
+2. PUT    /api/data/upload-sessions/{id}/            Content-Range 바이트 범위 전송 (순서대로, 이어서)
+3. GET    /api/data/upload-sessions/{id}/            받은 바이트 수 조회 (연결이 끊긴 뒤 재개 위치)
+4. POST   /api/data/upload-sessions/{id}/finalize/   조립된 파일을 CSV 처리 파이프라인에 넘김
+
+각 PUT 본문은 메모리에 모으지 않고 고정 크기 버퍼로 읽어 디스크 임시 파일의 해당 위치에 바로 쓴다.
+"""
+import os
+import re
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.data_upload.idempotency import file_sha256
+from apps.data_upload.jobs import enqueue_stored_file
+from apps.data_upload.models import UploadSession
+from apps.data_upload.services import ingest_csv_upload
+
+COPY_BUFFER_SIZE = 64 * 1024
+
+CONTENT_RANGE_PATTERN = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+def parse_content_range(header: Optional[str]) -> Tuple[int, int, int]:
+    """
+    Content-Range 헤더 파싱 ("bytes 0-1048575/52428800")
+
+    Returns:
+        (start, end, total) — end 는 포함 범위
+    """
+    match = CONTENT_RANGE_PATTERN.match((header or '').strip())
+    if not match:
+        raise ValueError("Content-Range 헤더 형식이 올바르지 않습니다. (예: bytes 0-1048575/52428800)")
+    start, end, total = (int(value) for value in match.groups())
+    if end < start or end >= total:
+        raise ValueError(f"Content-Range 범위가 올바르지 않습니다: {header}")
+    return start, end, total
+
+
+def create_upload_session(file_name: str, data_type: str, total_size: int, uploaded_by) -> UploadSession:
+    """
+    빈 임시 파일을 만들고 세션 등록
+    """
+    session_dir = Path(settings.UPLOAD_SESSION_DIR)
+    session_dir.mkdir(parents=True, exist_ok=True)
+    file_path = session_dir / f"{uuid.uuid4()}.part"
+    file_path.touch()
+
+    return UploadSession.objects.create(
+        file_name=file_name,
+        data_type=data_type,
+        file_path=str(file_path),
+        total_size=total_size,
+        uploaded_by=uploaded_by,
+    )
+
+
+def append_session_chunk(session: UploadSession, start: int, stream: BinaryIO, length: int) -> bool:
+    """
+    요청 본문 스트림을 임시 파일의 start 위치부터 length 바이트 기록
+
+    start 는 현재 received_bytes 와 같아야 한다(호출 전 확인). 같은 위치에 대한 요청이 동시에 들어오면
+    received_bytes 조건부 UPDATE 로 하나만 반영되고, 나머지는 False 를 반환한다.
+
+    Returns:
+        받은 바이트 수가 갱신되었는지 여부
+    """
+    remaining = length
+    with open(session.file_path, 'r+b') as destination:
+        destination.seek(start)
+        while remaining > 0:
+            buffer = stream.read(min(COPY_BUFFER_SIZE, remaining))
+            if not buffer:
+                raise ValueError(f"요청 본문이 Content-Range 보다 짧습니다. ({length - remaining}/{length} 바이트)")
+            destination.write(buffer)
+            remaining -= len(buffer)
+
+    advanced = UploadSession.objects.filter(
+        pk=session.pk,
+        status=UploadSession.STATUS_OPEN,
+        received_bytes=start,
+    ).update(received_bytes=start + length, updated_at=timezone.now())
+    if advanced:
+        session.received_bytes = start + length
+    return bool(advanced)
+
+
+def claim_upload_session(session: UploadSession) -> bool:
+    """
+    open 세션을 finalizing 으로 전환 (상태 조건부 UPDATE 이므로 동시에 들어온 finalize 중 하나만 성공한다)
+
+    Returns:
+        선점했는지 여부 (이미 finalize 중이거나 완료된 세션이면 False)
+    """
+    claimed = UploadSession.objects.filter(pk=session.pk, status=UploadSession.STATUS_OPEN).update(
+        status=UploadSession.STATUS_FINALIZING, updated_at=timezone.now(),
+    )
+    if claimed:
+        session.status = UploadSession.STATUS_FINALIZING
+    return bool(claimed)
+
+
+def finalize_upload_session(session: UploadSession, run_async: bool):
+    """
+    claim_upload_session 으로 선점한, 모든 바이트를 받은 세션을 CSV 처리 파이프라인에 넘김
+
+    - 비동기 모드: 임시 파일을 작업 디렉터리로 옮기고 UploadJob 등록
+    - 동기 모드: 임시 파일에서 바로 ingest_csv_upload 실행 후 파일 삭제
+
+    처리에 실패하면 세션을 open 으로 되돌리고 파일을 그대로 두어 finalize 를 다시 시도하거나
+    DELETE 로 취소할 수 있게 한다.
+
+    Returns:
+        run_async 이면 UploadJob, 아니면 (UploadLog, errors)
+    """
+    try:
+        return _finalize(session, run_async)
+    except Exception:
+        UploadSession.objects.filter(pk=session.pk, status=UploadSession.STATUS_FINALIZING).update(
+            status=UploadSession.STATUS_OPEN, updated_at=timezone.now(),
+        )
+        session.status = UploadSession.STATUS_OPEN
+        raise
+
+
+def _finalize(session: UploadSession, run_async: bool):
+    if session.received_bytes != session.total_size:
+        raise ValueError(
+            f"아직 모든 바이트를 받지 않았습니다. ({session.received_bytes}/{session.total_size})"
+        )
+
+    # 중단된 PUT 이 받은 바이트 뒤에 남긴 데이터 제거
+    os.truncate(session.file_path, session.total_size)
+
+    with open(session.file_path, 'rb') as source:
+        content_hash = file_sha256(source)
+
+    if run_async:
+        job = enqueue_stored_file(
+            session.file_path, session.file_name, session.data_type, session.uploaded_by,
+            content_hash=content_hash,
+        )
+        session.upload_job = job
+        result = job
+    else:
+        with open(session.file_path, 'rb') as source:
+            upload_log, errors = ingest_csv_upload(
+                file_content=source,
+                data_type=session.data_type,
+                uploaded_by=session.uploaded_by,
+                file_name=session.file_name,
+                content_hash=content_hash,
+            )
+        discard_session_file(session)
+        session.upload_log = upload_log
+        result = (upload_log, errors)
+
+    session.status = UploadSession.STATUS_FINALIZED
+    session.save(update_fields=['status', 'upload_job', 'upload_log', 'updated_at'])
+    return result
+
+
+def discard_session_file(session: UploadSession) -> None:
+    """세션 임시 파일 삭제 (이미 없으면 무시)"""
+    try:
+        os.remove(session.file_path)
+    except OSError:
+        pass
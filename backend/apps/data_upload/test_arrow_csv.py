@@ -0,0 +1,135 @@
+"""
+PyArrow CSV 파싱 엔진 테스트 (pyarrow 가 없으면 건너뜀)
+"""
+from io import BytesIO
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from apps.data_upload.schemas import categorical_headers
+from apps.data_upload.services import iter_csv_chunks, parse_csv_file, process_csv_upload
+from apps.data_upload.validation import validate_frame
+from apps.data_upload.models import ResearchProjectData
+from benchmarks.synthetic import synthetic_csv_bytes
+
+pytest.importorskip('pyarrow')
+
+PROJECT_CSV = '''execution_id,project_number,project_name,principal_investigator,department,funding_agency,total_budget,execution_date,expense_item,expense_amount,status,notes
+T001,NRF-1,"과제, 1차",김민준,전자공학과,한국연구재단,"1,000,000",2023-03-15,장비,0012,집행완료,
+T002,NRF-2,과제 2,이서연,컴퓨터공학과,,500000,2023-04-20,인건비,100,반려,"비고 ""따옴표"""
+'''.encode('utf-8-sig')
+
+
+def frames_equal(left, right):
+    assert list(left.columns) == list(right.columns)
+    assert left.astype(object).to_dict('records') == right.astype(object).to_dict('records')
+
+
+class TestParseEngines:
+
+    def test_same_values_as_pandas_engine(self):
+        pandas_df = parse_csv_file(PROJECT_CSV, engine='pandas')
+        arrow_df = parse_csv_file(PROJECT_CSV, engine='pyarrow', categorical_columns=categorical_headers('project'))
+
+        frames_equal(arrow_df, pandas_df)
+        assert arrow_df.loc[0, 'expense_amount'] == '0012'
+        assert arrow_df.loc[0, 'notes'] == ''
+        assert arrow_df['execution_id'].dtype == object
+
+    def test_low_cardinality_columns_are_categorical(self):
+        df = parse_csv_file(PROJECT_CSV, engine='pyarrow', categorical_columns=categorical_headers('project'))
+
+        for column in ('department', 'funding_agency', 'expense_item', 'status'):
+            assert df[column].dtype == 'category', column
+
+    def test_bom_handling(self):
+        without_bom = PROJECT_CSV[3:]
+
+        frames_equal(parse_csv_file(without_bom, engine='pyarrow'), parse_csv_file(PROJECT_CSV, engine='pyarrow'))
+        assert parse_csv_file(PROJECT_CSV, engine='pyarrow').columns[0] == 'execution_id'
+
+    def test_validation_matches_with_both_header_aliases(self):
+        content = "평가년도,단과대학,학과,department,졸업생 취업률 (%)\n2024,공대,,컴공,50\n2024,공대,전자,,abc\n".encode('utf-8')
+        results = [
+            validate_frame(parse_csv_file(content, engine=engine, categorical_columns=categorical_headers('kpi')), 'kpi')
+            for engine in ('pandas', 'pyarrow')
+        ]
+
+        assert results[0] == results[1]
+        assert results[1][0][0]['department'] == '컴공'
+
+    def test_short_rows_match_pandas_engine(self):
+        """컬럼이 모자란 행은 파일 전체를 거부하지 않고 빈 값으로 채워 행 단위로 검증"""
+        lines = PROJECT_CSV.decode('utf-8-sig').splitlines()
+        content = '\n'.join([*lines, 'T003,NRF-3,과제 3', lines[1].replace('T001', 'T004')]).encode('utf-8')
+        frames = {
+            engine: parse_csv_file(content, engine=engine, categorical_columns=categorical_headers('project'))
+            for engine in ('pandas', 'pyarrow')
+        }
+
+        frames_equal(frames['pyarrow'], frames['pandas'])
+        assert list(frames['pyarrow']['execution_id']) == ['T001', 'T002', 'T003', 'T004']
+        assert frames['pyarrow'].loc[2, 'notes'] == ''
+        results = [validate_frame(frame, 'project') for frame in frames.values()]
+        assert results[0] == results[1]
+        assert [error['data']['execution_id'] for error in results[1][1]] == ['T003']
+
+    def test_duplicate_headers_rejected(self):
+        with pytest.raises(ValueError, match="중복된 컬럼명: a"):
+            parse_csv_file(b'a,a,b\n1,2,3\n', engine='pyarrow')
+
+    def test_unknown_engine(self):
+        with pytest.raises(ImproperlyConfigured):
+            parse_csv_file(PROJECT_CSV, engine='polars')
+
+
+class TestStreamingChunks:
+
+    def test_chunk_sizes_match_pandas_engine(self):
+        content, _ = synthetic_csv_bytes('student', 2500, seed=1)
+
+        chunks = {
+            engine: list(iter_csv_chunks(BytesIO(content), 1000, engine=engine))
+            for engine in ('pandas', 'pyarrow')
+        }
+
+        assert [len(chunk) for chunk in chunks['pyarrow']] == [1000, 1000, 500]
+        for arrow_chunk, pandas_chunk in zip(chunks['pyarrow'], chunks['pandas']):
+            frames_equal(arrow_chunk.reset_index(drop=True), pandas_chunk.reset_index(drop=True))
+
+    def test_short_rows_across_blocks_match_pandas_engine(self, monkeypatch):
+        monkeypatch.setattr('apps.data_upload.arrow_csv.BLOCK_SIZE', 256)
+        content, _ = synthetic_csv_bytes('student', 60, seed=2)
+        lines = content.split(b'\n')
+        for i in (1, 2, 30, 59):
+            lines[i] = lines[i].split(b',')[0]
+        content = b'\n'.join(lines)
+
+        chunks = {
+            engine: list(iter_csv_chunks(BytesIO(content), 25, usecols={'student_id', 'name'}, engine=engine))
+            for engine in ('pandas', 'pyarrow')
+        }
+
+        assert [len(chunk) for chunk in chunks['pyarrow']] == [25, 25, 10]
+        for arrow_chunk, pandas_chunk in zip(chunks['pyarrow'], chunks['pandas']):
+            frames_equal(arrow_chunk.reset_index(drop=True), pandas_chunk.reset_index(drop=True))
+
+    def test_usecols_ignores_missing_columns(self):
+        chunks = list(iter_csv_chunks(BytesIO(PROJECT_CSV), 10, usecols={'execution_id', 'missing'}, engine='pyarrow'))
+
+        assert list(chunks[0].columns) == ['execution_id']
+
+    def test_parse_error_is_value_error(self):
+        broken = b'a,b\n1,2,3\n'
+
+        with pytest.raises(ValueError, match="CSV 파일 파싱 실패"):
+            list(iter_csv_chunks(BytesIO(broken), 10, engine='pyarrow'))
+
+
+def test_upload_with_pyarrow_engine(user, settings):
+    settings.CSV_PARSER_ENGINE = 'pyarrow'
+    content, generated = synthetic_csv_bytes('project', 1200, invalid_rate=0.05, duplicate_rate=0.05, seed=5)
+
+    success_rows, failed_rows, errors = process_csv_upload(content, 'project', user, 'project.csv', chunk_size=500)
+
+    assert failed_rows == generated.expected_failed_rows
+    assert ResearchProjectData.objects.count() == success_rows == 1200 - failed_rows
+    assert all(isinstance(error['data']['department'], str) for error in errors)
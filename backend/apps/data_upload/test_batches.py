@@ -0,0 +1,162 @@
+"""
+일괄 업로드(CSV 여러 개, ZIP) 테스트
+"""
+import io
+import os
+import zipfile
+from io import BytesIO
+import pytest
+from rest_framework import status
+from apps.data_upload.jobs import UploadJobWorker, claim_next_job
+from apps.data_upload.models import DepartmentKPI, StudentRoster, UploadBatch, UploadJob, UploadLog
+from apps.data_upload.schemas import detect_data_type
+
+STUDENT_CSV = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+20240002,김철수,공과대학,전기공학과,9,학사,재학,남,2022,,kim@example.com
+"""
+
+KPI_CSV = """평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수
+2024,공과대학,컴퓨터공학과,85.5,10,2,5.2,3
+"""
+
+
+def named_file(content, name):
+    file = BytesIO(content if isinstance(content, bytes) else content.encode('utf-8-sig'))
+    file.name = name
+    return file
+
+
+def zip_file(entries, name='term.zip'):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for entry_name, content in entries.items():
+            archive.writestr(entry_name, content.encode('utf-8-sig'))
+    return named_file(buffer.getvalue(), name)
+
+
+@pytest.fixture
+def job_dir(settings, tmp_path):
+    settings.UPLOAD_JOB_DIR = str(tmp_path / 'upload_jobs')
+    return tmp_path / 'upload_jobs'
+
+
+def post_batch(client, files):
+    return client.post('/api/data/upload-batches/', {'files': files}, format='multipart')
+
+
+class TestDetectDataType:
+
+    @pytest.mark.parametrize('header, expected', [
+        (STUDENT_CSV.splitlines()[0], 'student'),
+        (KPI_CSV.splitlines()[0], 'kpi'),
+        ('evaluation_year,college,department,employment_rate', 'kpi'),
+        ('publication_id,publication_date,title,journal_grade', 'publication'),
+        ('execution_id,project_name,total_budget', 'project'),
+        ('name,college,department', None),
+    ])
+    def test_detects_by_key_and_matching_headers(self, header, expected):
+        assert detect_data_type(header.split(',')) == expected
+
+
+class TestUploadBatchAPI:
+
+    def test_multiple_csv_files_processed_with_combined_result(self, authenticated_client, job_dir):
+        response = post_batch(authenticated_client, [
+            named_file(STUDENT_CSV, 'students.csv'),
+            named_file(KPI_CSV, 'kpi.csv'),
+            named_file('name,email\n홍길동,a@example.com\n', 'unknown.csv'),
+        ])
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()['data']
+        assert data['status'] == 'done'
+        assert data['file_count'] == 2
+        assert (data['total_rows'], data['success_rows'], data['failed_rows']) == (3, 2, 1)
+        assert {job['data_type'] for job in data['jobs']} == {'student', 'kpi'}
+        assert set(data['upload_ids']) == {str(pk) for pk in UploadLog.objects.values_list('pk', flat=True)}
+        assert data['skipped'] == [{"file_name": 'unknown.csv', "error": "헤더로 데이터 유형을 판별할 수 없습니다."}]
+        assert StudentRoster.objects.count() == 1
+        assert DepartmentKPI.objects.count() == 1
+        assert os.listdir(job_dir) == []
+
+    def test_zip_archive_entries(self, authenticated_client, job_dir):
+        archive = zip_file({
+            'term/students.csv': STUDENT_CSV,
+            'term/kpi.csv': KPI_CSV,
+            'term/readme.txt': 'notes',
+            '__MACOSX/term/._kpi.csv': 'junk',
+        })
+
+        response = post_batch(authenticated_client, [archive])
+
+        data = response.json()['data']
+        assert sorted(job['file_name'] for job in data['jobs']) == ['kpi.csv', 'students.csv']
+        assert data['skipped'] == [{"file_name": 'term/readme.txt', "error": "CSV 파일이 아닙니다."}]
+        assert UploadLog.objects.count() == 2
+
+    def test_no_usable_files(self, authenticated_client, job_dir):
+        response = post_batch(authenticated_client, [named_file('a,b\n1,2\n', 'unknown.csv')])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert UploadBatch.objects.count() == 0
+
+    def test_rejects_unsupported_and_too_many_files(self, authenticated_client, job_dir, settings):
+        response = post_batch(authenticated_client, [named_file('x', 'notes.txt')])
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        settings.UPLOAD_BATCH_MAX_FILES = 1
+        response = post_batch(authenticated_client, [
+            named_file(STUDENT_CSV, 'a.csv'), named_file(KPI_CSV, 'b.csv'),
+        ])
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert os.listdir(job_dir) == []
+
+    def test_rejects_oversized_zip_content(self, authenticated_client, job_dir, settings):
+        settings.UPLOAD_BATCH_MAX_SIZE = 100
+
+        response = post_batch(authenticated_client, [zip_file({'students.csv': STUDENT_CSV})])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert os.listdir(job_dir) == []
+
+    @pytest.mark.django_db(transaction=True)
+    def test_async_batch_and_detail(self, authenticated_client, job_dir, settings):
+        """비동기 모드는 작업만 등록하고 워커가 처리 (SQLite 는 동시 쓰기 불가 → 1 스레드)"""
+        settings.UPLOAD_JOBS_ASYNC = True
+        response = post_batch(authenticated_client, [
+            named_file(STUDENT_CSV, 'students.csv'), named_file(KPI_CSV, 'kpi.csv'),
+        ])
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        batch_id = response.json()['data']['batch_id']
+        assert response.json()['data']['status'] == 'queued'
+
+        UploadJobWorker(max_workers=1, poll_interval=0.01).run(once=True)
+
+        detail = authenticated_client.get(f'/api/data/upload-batches/{batch_id}/').json()['data']
+        assert detail['status'] == 'done'
+        assert detail['finished_files'] == 2
+        assert len(detail['upload_ids']) == 2
+
+    def test_detail_of_other_users_batch_not_found(self, authenticated_client, django_user_model):
+        other = django_user_model.objects.create_user(username='other', password='pw')
+        batch = UploadBatch.objects.create(file_count=0, uploaded_by=other)
+
+        response = authenticated_client.get(f'/api/data/upload-batches/{batch.pk}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_worker_runs_same_type_batch_jobs_one_at_a_time(django_user_model):
+    user = django_user_model.objects.create_user(username='batch', password='pw')
+    batch = UploadBatch.objects.create(file_count=3, uploaded_by=user)
+    for name, data_type in [('a.csv', 'student'), ('b.csv', 'student'), ('c.csv', 'kpi')]:
+        UploadJob.objects.create(
+            file_name=name, data_type=data_type, file_path=name, batch=batch, uploaded_by=user,
+        )
+
+    claimed = [claim_next_job() for _ in range(3)]
+
+    assert sorted(job.file_name for job in claimed if job) == ['a.csv', 'c.csv']
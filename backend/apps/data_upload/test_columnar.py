@@ -0,0 +1,215 @@
+"""
+Parquet / Arrow IPC 업로드 테스트 (pyarrow 가 없으면 건너뜀)
+"""
+import datetime
+from io import BytesIO
+import pytest
+from apps.data_upload.models import ResearchProjectData, StudentRoster
+from apps.data_upload.services import (
+    FORMAT_ARROW,
+    FORMAT_PARQUET,
+    dry_run_csv_upload,
+    iter_file_chunks,
+    parse_csv_file,
+    preview_csv_upload,
+    process_csv_upload,
+    upload_format,
+)
+from apps.data_upload.validation import validate_frame
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+pytest.importorskip('pyarrow.ipc')
+
+PROJECT_CSV = '''execution_id,project_number,project_name,principal_investigator,department,funding_agency,total_budget,execution_date,expense_item,expense_amount,status,notes
+T001,NRF-1,과제 1,김민준,전자공학과,한국연구재단,1000000,2023-03-15,장비,12.7,집행완료,
+T002,NRF-2,과제 2,이서연,컴퓨터공학과,,500000,2023-04-20,인건비,,반려,비고
+T003,NRF-3,과제 3,박지훈,전자공학과,한국연구재단,-5,,장비,100,집행완료,
+'''.encode('utf-8-sig')
+
+
+def project_table():
+    """PROJECT_CSV 와 같은 값을 숫자·날짜 타입 컬럼으로 담은 테이블"""
+    return pa.table({
+        'execution_id': ['T001', 'T002', 'T003'],
+        'project_number': ['NRF-1', 'NRF-2', 'NRF-3'],
+        'project_name': ['과제 1', '과제 2', '과제 3'],
+        'principal_investigator': ['김민준', '이서연', '박지훈'],
+        'department': pa.array(['전자공학과', '컴퓨터공학과', '전자공학과']).dictionary_encode(),
+        'funding_agency': ['한국연구재단', None, '한국연구재단'],
+        'total_budget': pa.array([1000000, 500000, -5], pa.int64()),
+        'execution_date': pa.array([datetime.date(2023, 3, 15), datetime.date(2023, 4, 20), None], pa.date32()),
+        'expense_item': ['장비', '인건비', '장비'],
+        'expense_amount': pa.array([12.7, None, 100.0], pa.float64()),
+        'status': ['집행완료', '반려', '집행완료'],
+        'notes': [None, '비고', None],
+    })
+
+
+def student_table(rows):
+    return pa.table({
+        'student_id': pa.array(range(20240000, 20240000 + rows), pa.int64()),
+        'name': [f'학생{i}' for i in range(rows)],
+        'college': ['공과대학'] * rows,
+        'department': ['컴퓨터공학과'] * rows,
+        'grade': pa.array([i % 5 + i % 2 for i in range(rows)], pa.int32()),  # 5 는 학년 범위 밖
+        'program_type': ['학사'] * rows,
+        'academic_status': ['재학'] * rows,
+        'gender': ['여'] * rows,
+        'admission_year': pa.array([2021] * rows, pa.int16()),
+        'advisor': [None] * rows,
+        'email': [''] * rows,
+    })
+
+
+def to_parquet(table, row_group_size=None):
+    buffer = BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    return buffer.getvalue()
+
+
+def to_arrow(table, stream=False, max_chunksize=None):
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream if stream else pa.ipc.new_file
+    with writer(sink, table.schema) as ipc:
+        ipc.write_table(table, max_chunksize=max_chunksize)
+    return sink.getvalue().to_pybytes()
+
+
+def validate_columnar(content, file_format, data_type):
+    frames = list(iter_file_chunks(BytesIO(content), data_type, file_format, chunk_size=100))
+    return validate_frame(frames[0], data_type)
+
+
+class TestColumnarValidation:
+
+    @pytest.mark.parametrize('file_format, encode', [
+        (FORMAT_PARQUET, to_parquet),
+        (FORMAT_ARROW, to_arrow),
+        (FORMAT_ARROW, lambda table: to_arrow(table, stream=True)),
+    ])
+    def test_same_result_as_csv(self, file_format, encode):
+        expected_records, expected_errors = validate_frame(parse_csv_file(PROJECT_CSV), 'project')
+
+        records, errors = validate_columnar(encode(project_table()), file_format, 'project')
+
+        assert records == expected_records
+        assert records[0]['execution_date'] == datetime.date(2023, 3, 15)
+        assert records[0]['expense_amount'] == 12  # AMOUNT 는 CSV 와 같이 소수점 버림
+        assert [(error['row'], error['reason']) for error in errors] == [
+            (error['row'], error['reason']) for error in expected_errors
+        ]
+        assert errors[0]['reason'] == "집행금액이 유효하지 않습니다: "  # null 은 CSV 빈 칸과 같이
+        assert errors[0]['data']['expense_amount'] is None
+
+    def test_numeric_column_keeps_integer_rules(self):
+        table = student_table(3).set_column(
+            8, 'admission_year', pa.array([2021.5, 2022.0, None], pa.float64()),
+        ).set_column(4, 'grade', pa.array([3.7, 2.0, 9.0], pa.float64()))
+
+        records, errors = validate_columnar(to_parquet(table), FORMAT_PARQUET, 'student')
+
+        assert [(record['student_id'], record['grade']) for record in records] == [('20240001', 2)]
+        assert [(error['row'], error['reason']) for error in errors] == [
+            (2, "입학년도가 유효하지 않습니다: 2021.5"),  # INT 는 int('2021.5') 와 같이 실패
+            (4, "학년은 0~4 사이여야 합니다: 9; 입학년도가 유효하지 않습니다: "),
+        ]
+        assert errors[0]['data']['grade'] == 3.7
+
+    def test_type_mismatch_rejected(self):
+        table = student_table(1).set_column(
+            4, 'grade', pa.array([datetime.date(2024, 1, 1)], pa.date32()),
+        )
+
+        with pytest.raises(ValueError, match="컬럼 타입이 스키마와 맞지 않습니다: grade"):
+            list(iter_file_chunks(BytesIO(to_parquet(table)), 'student', FORMAT_PARQUET))
+
+    def test_unreadable_file(self):
+        with pytest.raises(ValueError, match="파일을 읽을 수 없습니다"):
+            list(iter_file_chunks(BytesIO(b'not parquet'), 'student', FORMAT_PARQUET))
+
+    @pytest.mark.parametrize('file_format, encode', [
+        (FORMAT_PARQUET, lambda table: to_parquet(table, row_group_size=300)),
+        (FORMAT_ARROW, lambda table: to_arrow(table, max_chunksize=300)),
+    ])
+    def test_chunks_independent_of_row_groups(self, file_format, encode):
+        content = encode(student_table(1000))
+
+        chunks = list(iter_file_chunks(BytesIO(content), 'student', file_format, chunk_size=400))
+
+        assert [len(chunk) for chunk in chunks] == [400, 400, 200]
+        assert chunks[2]['student_id'].iloc[-1] == '20240999'
+
+    def test_key_columns_only(self):
+        chunks = list(iter_file_chunks(
+            BytesIO(to_parquet(student_table(3))), 'student', FORMAT_PARQUET, usecols={'student_id', 'missing'},
+        ))
+
+        assert list(chunks[0].columns) == ['student_id']
+
+
+def test_upload_format():
+    assert upload_format('data.CSV') == 'csv'
+    assert upload_format('export.parquet') == FORMAT_PARQUET
+    assert upload_format('export.feather') == FORMAT_ARROW
+    assert upload_format('export.xlsx') is None
+
+
+def test_process_parquet_upload(user):
+    content = to_parquet(student_table(1000), row_group_size=256)
+
+    success_rows, failed_rows, errors = process_csv_upload(
+        content, 'student', user, 'students.parquet', chunk_size=300,
+    )
+
+    assert (success_rows, failed_rows) == (900, 100)
+    assert StudentRoster.objects.count() == 900
+    assert errors[0]['row'] == 11
+    assert errors[0]['data']['grade'] == 5
+
+
+def test_dry_run_and_preview(user):
+    content = to_parquet(student_table(1000))
+
+    full = dry_run_csv_upload(content, 'student', file_format=FORMAT_PARQUET)
+    preview = preview_csv_upload(content, 'student', head_rows=100, file_format=FORMAT_PARQUET)
+    stream_preview = preview_csv_upload(to_arrow(student_table(10), stream=True), 'student', file_format=FORMAT_ARROW)
+
+    assert (full['success_rows'], full['failed_rows']) == (900, 100)
+    assert preview['exact'] is False
+    assert preview['rows_checked'] == 100
+    assert (preview['total_rows'], preview['inserted_rows'], preview['failed_rows']) == (1000, 900, 100)
+    assert stream_preview['exact'] is True
+    assert stream_preview['total_rows'] == 10
+    assert StudentRoster.objects.count() == 0
+
+
+class TestUploadAPI:
+
+    def post(self, client, content, name, **data):
+        file = BytesIO(content)
+        file.name = name
+        return client.post('/api/data/upload/', {'file': file, 'data_type': 'project', **data}, format='multipart')
+
+    def test_parquet_upload(self, authenticated_client):
+        response = self.post(authenticated_client, to_parquet(project_table()), 'projects.parquet')
+
+        assert response.status_code == 200
+        assert response.json()['data']['success_rows'] == 1
+        assert response.json()['data']['errors'][0]['data']['execution_date'] == '2023-04-20T00:00:00'
+        assert ResearchProjectData.objects.get(execution_id='T001').execution_date == datetime.date(2023, 3, 15)
+
+    def test_arrow_dry_run(self, authenticated_client):
+        response = self.post(authenticated_client, to_arrow(project_table()), 'projects.arrow', dry_run='preview')
+
+        assert response.status_code == 200
+        assert response.json()['data']['failed_rows'] == 2
+        assert ResearchProjectData.objects.count() == 0
+
+    def test_rejects_mismatched_types_and_unknown_extension(self, authenticated_client):
+        table = project_table().set_column(
+            7, 'execution_date', pa.array([1, 2, 3], pa.int64()),
+        )
+
+        assert self.post(authenticated_client, to_parquet(table), 'projects.parquet').status_code == 400
+        assert self.post(authenticated_client, b'x', 'projects.xlsx').status_code == 400
@@ -0,0 +1,52 @@
+"""
+날짜 컬럼 파싱 테스트
+"""
+import pytest
+import pandas as pd
+from datetime import date
+from dateutil.parser import parse
+from apps.data_upload.dates import _parse_lenient, infer_date_format, parse_date, parse_date_column
+
+
+MIXED = [
+    '2024-01-15', '2024-1-5', '2024/02/20', '2024.03.04', '20240115', '03/04/2024',
+    'March 3 2024', ' 2024-01-15 ', '2024-13-01', '20241301', 'not-a-date', '', 'nan',
+]
+
+
+def expected(text):
+    try:
+        return parse(text).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+class TestParseDateColumn:
+
+    def test_matches_dateutil(self):
+        values, ok = parse_date_column(pd.Series(MIXED))
+
+        assert list(values) == [expected(text) for text in MIXED]
+        assert list(ok) == [expected(text) is not None for text in MIXED]
+
+    def test_infers_dominant_format(self):
+        values = pd.Series(['2024/01/02', '2024/01/03', '2024-01-04'])
+
+        assert infer_date_format(values) == (r'\d{4}/\d{1,2}/\d{1,2}', '%Y/%m/%d')
+        assert infer_date_format(pd.Series(['abc'])) is None
+
+    def test_repeated_values_parsed_once(self):
+        """형식에 맞지 않는 값도 고유 값 단위로 한 번만 dateutil 파싱"""
+        _parse_lenient.cache_clear()
+
+        values, ok = parse_date_column(pd.Series(['15 Jan 2024'] * 1000 + ['2024-01-16'] * 1000))
+
+        assert ok.all()
+        assert values[0] == date(2024, 1, 15)
+        assert _parse_lenient.cache_info().misses == 1
+
+
+def test_parse_date_raises_on_invalid():
+    assert parse_date('2024-01-15') == date(2024, 1, 15)
+    with pytest.raises(ValueError):
+        parse_date('not-a-date')
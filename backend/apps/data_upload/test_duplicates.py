@@ -0,0 +1,143 @@
+"""
+파일 안 자연키 중복 검출 테스트
+"""
+from io import BytesIO
+import pytest
+from django.contrib.auth import get_user_model
+from apps.data_upload.duplicates import find_duplicate_rows, key_columns
+from apps.data_upload.models import DepartmentKPI, StudentRoster
+from apps.data_upload.services import ingest_csv_upload, iter_csv_chunks
+
+User = get_user_model()
+
+STUDENT_CSV = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+20240002,김철수,공과대학,컴퓨터공학과,2,학사,재학,남,2022,,kim@example.com
+ 20240001 ,홍길동2,공과대학,컴퓨터공학과,4,학사,재학,남,2021,,hong2@example.com
+,이름없음,공과대학,컴퓨터공학과,1,학사,재학,여,2024,,none@example.com
+20240003,이영희,공과대학,컴퓨터공학과,1,학사,재학,여,2024,,lee@example.com
+20240001,홍길동3,공과대학,컴퓨터공학과,4,학사,재학,남,2021,,hong3@example.com
+""".encode('utf-8-sig')
+
+
+def scan(content, data_type, policy, chunk_size=2):
+    chunks = iter_csv_chunks(BytesIO(content), chunk_size, usecols=key_columns(data_type))
+    return find_duplicate_rows(chunks, data_type, policy)
+
+
+class TestFindDuplicateRows:
+
+    def test_last_policy_keeps_last_row_across_chunks(self):
+        duplicates = scan(STUDENT_CSV, 'student', 'last')
+
+        # 공백이 있는 키도 검증과 같은 정규화를 거쳐 같은 키로 판단, 빈 키(5행)는 제외
+        assert sorted(duplicates) == [2, 4]
+        assert duplicates[2] == "파일 안에서 키가 중복됩니다 (student_id=20240001): 7행만 저장"
+
+    def test_first_policy_keeps_first_row(self):
+        duplicates = scan(STUDENT_CSV, 'student', 'first')
+
+        assert sorted(duplicates) == [4, 7]
+        assert duplicates[7].endswith("2행만 저장")
+
+    def test_reject_policy_rejects_every_copy(self):
+        duplicates = scan(STUDENT_CSV, 'student', 'reject')
+
+        assert sorted(duplicates) == [2, 4, 7]
+        assert duplicates[4].endswith("2, 4, 7행 모두 제외")
+
+    def test_composite_key_with_header_aliases(self):
+        content = """평가년도,단과대학,학과,졸업생 취업률 (%)
+2024,공과대학,컴퓨터공학과,80
+2025,공과대학,컴퓨터공학과,81
+2024,공과대학, 컴퓨터공학과,82
+""".encode('utf-8-sig')
+
+        duplicates = scan(content, 'kpi', 'last')
+
+        assert duplicates == {2: "파일 안에서 키가 중복됩니다 (evaluation_year=2024, department=컴퓨터공학과): 4행만 저장"}
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="지원하지 않는 중복 키 처리 방식"):
+            scan(STUDENT_CSV, 'student', 'merge')
+
+
+@pytest.mark.django_db
+class TestIngestDuplicatePolicy:
+
+    @pytest.fixture
+    def sample_user(self):
+        return User.objects.create_user(username='testuser', password='testpass123')
+
+    @pytest.mark.parametrize('commit_mode', ['batch', 'atomic'])
+    def test_last_row_wins(self, sample_user, commit_mode):
+        upload_log, errors = ingest_csv_upload(
+            STUDENT_CSV, 'student', sample_user, 'dup.csv', chunk_size=2, commit_mode=commit_mode,
+        )
+
+        assert upload_log.success_rows == 3
+        assert [error['row'] for error in errors] == [2, 4, 5]
+        assert StudentRoster.objects.get(student_id='20240001').name == '홍길동3'
+
+    def test_first_row_wins(self, sample_user):
+        upload_log, errors = ingest_csv_upload(
+            STUDENT_CSV, 'student', sample_user, 'dup.csv', chunk_size=2, duplicate_policy='first',
+        )
+
+        assert upload_log.success_rows == 3
+        assert [error['row'] for error in errors] == [4, 5, 7]
+        assert StudentRoster.objects.get(student_id='20240001').name == '홍길동'
+
+    def test_reject_all_copies(self, sample_user, settings):
+        settings.CSV_DUPLICATE_KEY_POLICY = 'reject'
+
+        upload_log, errors = ingest_csv_upload(STUDENT_CSV, 'student', sample_user, 'dup.csv')
+
+        assert upload_log.success_rows == 2
+        assert upload_log.failed_rows == 4
+        assert not StudentRoster.objects.filter(student_id='20240001').exists()
+
+    def test_invalid_copy_is_not_reported_as_duplicate(self, sample_user):
+        content = """평가년도,단과대학,학과,졸업생 취업률 (%)
+2024,공과대학,컴퓨터공학과,120
+2024,공과대학,컴퓨터공학과,80
+""".encode('utf-8-sig')
+
+        upload_log, errors = ingest_csv_upload(content, 'kpi', sample_user, 'kpi.csv')
+
+        # 검증에서 떨어지는 행은 자체 오류만 보고 (저장 후보가 아니므로 중복 키 오류 없음)
+        assert errors[0]['reason'] == "취업률은 0~100 사이여야 합니다: 120.0"
+        assert errors[0]['data']['졸업생 취업률 (%)'] == '120'
+        assert DepartmentKPI.objects.get().employment_rate == 80
+
+    @pytest.mark.parametrize('policy', ['last', 'first', 'reject'])
+    def test_valid_copy_saved_when_chosen_copy_is_invalid(self, sample_user, policy):
+        content = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+S1,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,
+S1,홍길동2,공과대학,컴퓨터공학과,9,학사,재학,남,2021,,
+S1,홍길동3,공과대학,컴퓨터공학과,9,학사,재학,남,2021,,
+""".encode('utf-8')
+
+        upload_log, errors = ingest_csv_upload(
+            content, 'student', sample_user, 'dup.csv', chunk_size=2, duplicate_policy=policy,
+        )
+
+        # 유효한 행이 하나뿐이므로 중복이 아님 (마지막 행을 고르고 그 행이 검증에서 떨어져 0행 저장되던 문제)
+        assert upload_log.success_rows == 1
+        assert [error['row'] for error in errors] == [3, 4]
+        assert all("중복" not in error['reason'] for error in errors)
+        assert StudentRoster.objects.get(student_id='S1').name == '홍길동'
+
+    def test_last_valid_copy_wins(self, sample_user):
+        content = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+S1,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,
+S1,홍길동2,공과대학,컴퓨터공학과,4,학사,재학,남,2021,,
+S1,홍길동3,공과대학,컴퓨터공학과,9,학사,재학,남,2021,,
+""".encode('utf-8')
+
+        upload_log, errors = ingest_csv_upload(content, 'student', sample_user, 'dup.csv', chunk_size=2)
+
+        assert upload_log.success_rows == 1
+        assert errors[0]['row'] == 2
+        assert errors[0]['reason'].endswith("3행만 저장")
+        assert StudentRoster.objects.get(student_id='S1').name == '홍길동2'
@@ -0,0 +1,105 @@
+"""
+업로드 오류 수집기 및 오류 보고서 다운로드 테스트
+"""
+import csv
+import gzip
+import io
+import json
+import os
+import pytest
+from rest_framework import status
+from apps.data_upload.errors import REPORT_HEADER, ErrorSink
+from apps.data_upload.models import UploadLog
+from apps.data_upload.services import ingest_csv_upload
+
+
+def make_errors(start, count):
+    return [{"row": row, "reason": "학번이 필수입니다", "data": {"student_id": "", "name": "홍길동"}}
+            for row in range(start, start + count)]
+
+
+def read_report(path_or_bytes):
+    if isinstance(path_or_bytes, bytes):
+        text = gzip.decompress(path_or_bytes).decode('utf-8-sig')
+    else:
+        with gzip.open(path_or_bytes, 'rb') as f:
+            text = f.read().decode('utf-8-sig')
+    return list(csv.reader(io.StringIO(text)))
+
+
+class TestErrorSink:
+
+    def test_keeps_bounded_sample_and_full_report(self, tmp_path):
+        with ErrorSink(sample_size=3, report_dir=str(tmp_path)) as sink:
+            sink.add(make_errors(2, 2))
+            sink.add(make_errors(4, 5))
+
+        assert sink.count == 7
+        assert [error['row'] for error in sink.sample] == [2, 3, 4]
+
+        rows = read_report(sink.path)
+        assert rows[0] == REPORT_HEADER
+        assert [int(row[0]) for row in rows[1:]] == list(range(2, 9))
+        assert json.loads(rows[1][2]) == {"student_id": "", "name": "홍길동"}
+
+    def test_no_report_without_errors(self, tmp_path):
+        with ErrorSink(report_dir=str(tmp_path)) as sink:
+            sink.add([])
+
+        assert sink.path is None
+        assert os.listdir(tmp_path) == []
+
+    def test_report_removed_on_failure(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with ErrorSink(report_dir=str(tmp_path)) as sink:
+                sink.add(make_errors(2, 1))
+                raise RuntimeError
+
+        assert os.listdir(tmp_path) == []
+
+
+STUDENT_HEADER = "student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email\n"
+
+
+@pytest.mark.django_db
+class TestErrorReport:
+
+    def test_ingest_stores_sample_and_report(self, user, settings):
+        settings.UPLOAD_ERROR_SAMPLE_SIZE = 5
+        rows = "".join(f",이름{i},공과대학,학과,1,학사,재학,남,2021,,a@b.c\n" for i in range(30))
+
+        upload_log, errors = ingest_csv_upload(
+            (STUDENT_HEADER + rows).encode(), 'student', user, 'students.csv', chunk_size=7,
+        )
+
+        assert upload_log.failed_rows == 30
+        assert len(errors) == 5
+        assert len(json.loads(upload_log.error_details)) == 5
+        assert len(read_report(upload_log.error_report_path)) == 31
+
+    def test_download_report(self, authenticated_client, user):
+        upload_log, _ = ingest_csv_upload(
+            (STUDENT_HEADER + ",홍길동,공과대학,학과,1,학사,재학,남,2021,,a@b.c\n").encode(),
+            'student', user, 'students.csv',
+        )
+
+        detail = authenticated_client.get(f'/api/data/upload-logs/{upload_log.id}/')
+        assert detail.json()['data']['error_report_available'] is True
+
+        response = authenticated_client.get(f'/api/data/upload-logs/{upload_log.id}/errors/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/gzip'
+        assert 'students_errors.csv.gz' in response['Content-Disposition']
+        rows = read_report(b''.join(response.streaming_content))
+        assert rows[1][:2] == ['2', '학번이 필수입니다']
+
+    def test_download_without_report_not_found(self, authenticated_client, user):
+        upload_log = UploadLog.objects.create(
+            file_name='ok.csv', data_type='student', total_rows=1, success_rows=1, failed_rows=0,
+            uploaded_by=user,
+        )
+
+        response = authenticated_client.get(f'/api/data/upload-logs/{upload_log.id}/errors/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
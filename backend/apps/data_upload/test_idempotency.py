@@ -0,0 +1,105 @@
+"""
+중복 업로드 감지(내용 해시, Idempotency-Key) 테스트
+"""
+import hashlib
+import pytest
+from io import BytesIO
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from apps.data_upload.idempotency import file_sha256
+from apps.data_upload.models import StudentRoster, UploadJob, UploadLog
+
+
+STUDENT_CSV = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+"""
+
+
+def post_csv(client, content, data_type='student', **headers):
+    file = BytesIO(content.encode('utf-8-sig'))
+    file.name = 'students.csv'
+    return client.post('/api/data/upload/', {'file': file, 'data_type': data_type}, format='multipart', **headers)
+
+
+def test_file_sha256_rewinds():
+    file = BytesIO(b'a' * 3_000_000)
+    file.read(10)
+
+    assert file_sha256(file) == hashlib.sha256(b'a' * 3_000_000).hexdigest()
+    assert file.tell() == 0
+
+
+class TestContentHashDeduplication:
+
+    def test_same_file_returns_previous_result(self, authenticated_client):
+        first = post_csv(authenticated_client, STUDENT_CSV).json()['data']
+        StudentRoster.objects.update(name='변경됨')
+
+        response = post_csv(authenticated_client, STUDENT_CSV)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()['data']
+        assert data['deduplicated'] is True
+        assert data['upload_id'] == first['upload_id']
+        assert UploadLog.objects.count() == 1
+        # 데이터 테이블은 다시 쓰지 않음
+        assert StudentRoster.objects.get().name == '변경됨'
+
+    def test_same_file_after_other_upload_is_reprocessed(self, authenticated_client):
+        post_csv(authenticated_client, STUDENT_CSV)
+        post_csv(authenticated_client, STUDENT_CSV.replace('홍길동', '김철수'))
+
+        response = post_csv(authenticated_client, STUDENT_CSV)
+
+        assert 'deduplicated' not in response.json()['data']
+        assert UploadLog.objects.count() == 3
+        assert StudentRoster.objects.get().name == '홍길동'
+
+    def test_same_file_from_other_user_not_deduplicated(self, authenticated_client, api_client):
+        first = post_csv(authenticated_client, STUDENT_CSV).json()['data']
+        other = get_user_model().objects.create_user(username='otheruser', email='other@example.com', password='testpass123')
+        api_client.force_authenticate(user=other)
+
+        response = post_csv(api_client, STUDENT_CSV)
+
+        data = response.json()['data']
+        assert 'deduplicated' not in data
+        assert data['upload_id'] != first['upload_id']
+        assert UploadLog.objects.filter(uploaded_by=other).count() == 1
+
+    def test_same_file_for_other_data_type_not_deduplicated(self, authenticated_client):
+        post_csv(authenticated_client, STUDENT_CSV)
+
+        response = post_csv(authenticated_client, STUDENT_CSV, data_type='kpi')
+
+        assert 'deduplicated' not in response.json()['data']
+        assert UploadLog.objects.filter(data_type='kpi').count() == 1
+
+
+class TestIdempotencyKey:
+
+    def test_repeated_key_returns_previous_result(self, authenticated_client):
+        first = post_csv(authenticated_client, STUDENT_CSV, HTTP_IDEMPOTENCY_KEY='retry-1').json()['data']
+
+        response = post_csv(
+            authenticated_client,
+            STUDENT_CSV.replace('홍길동', '김철수'),
+            HTTP_IDEMPOTENCY_KEY='retry-1',
+        )
+
+        data = response.json()['data']
+        assert data['deduplicated'] is True
+        assert data['upload_id'] == first['upload_id']
+        assert StudentRoster.objects.get().name == '홍길동'
+
+    def test_repeated_key_returns_queued_job(self, authenticated_client, settings, tmp_path):
+        settings.UPLOAD_JOBS_ASYNC = True
+        settings.UPLOAD_JOB_DIR = str(tmp_path)
+        first = post_csv(authenticated_client, STUDENT_CSV, HTTP_IDEMPOTENCY_KEY='retry-2').json()['data']
+
+        response = post_csv(authenticated_client, STUDENT_CSV, HTTP_IDEMPOTENCY_KEY='retry-2')
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()['data']['job_id'] == first['job_id']
+        assert UploadJob.objects.count() == 1
+        assert UploadJob.objects.get().content_hash == hashlib.sha256(STUDENT_CSV.encode('utf-8-sig')).hexdigest()
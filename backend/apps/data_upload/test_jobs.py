@@ -0,0 +1,219 @@
+"""
+비동기 업로드 작업 테스트
+"""
+import os
+import pytest
+from datetime import timedelta
+from io import BytesIO
+from django.utils import timezone
+from rest_framework import status
+from apps.data_upload.idempotency import find_previous_upload
+from apps.data_upload.jobs import (
+    UploadJobWorker,
+    claim_job,
+    claim_next_job,
+    job_progress,
+    recover_stale_jobs,
+    run_upload_job,
+)
+from apps.data_upload.models import StudentRoster, UploadBatch, UploadJob, UploadLog
+
+
+STUDENT_CSV = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+20240002,김철수,공과대학,전기공학과,9,학사,재학,남,2022,,kim@example.com
+"""
+
+
+@pytest.fixture
+def async_uploads(settings, tmp_path):
+    settings.UPLOAD_JOBS_ASYNC = True
+    settings.UPLOAD_JOB_DIR = str(tmp_path / 'upload_jobs')
+    return settings
+
+
+def post_csv(client, content, filename='students.csv', data_type='student'):
+    file = BytesIO(content.encode('utf-8-sig'))
+    file.name = filename
+    return client.post('/api/data/upload/', {'file': file, 'data_type': data_type}, format='multipart')
+
+
+class TestUploadJobFlow:
+    """업로드 작업 등록 → 처리 → 조회 흐름 테스트"""
+
+    def test_post_returns_202_with_queued_job(self, authenticated_client, async_uploads):
+        response = post_csv(authenticated_client, STUDENT_CSV)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()['data']
+        assert data['status'] == 'queued'
+
+        job = UploadJob.objects.get(pk=data['job_id'])
+        assert os.path.exists(job.file_path)
+        assert job.bytes_total == len(STUDENT_CSV.encode('utf-8-sig'))
+        # 처리 전에는 데이터가 저장되지 않음
+        assert StudentRoster.objects.count() == 0
+
+    def test_run_job_and_fetch_result(self, authenticated_client, async_uploads):
+        job_id = post_csv(authenticated_client, STUDENT_CSV).json()['data']['job_id']
+
+        job = claim_next_job()
+        assert str(job.pk) == job_id
+        assert job.status == UploadJob.STATUS_RUNNING
+        assert claim_next_job() is None  # 같은 작업을 두 번 가져가지 않음
+
+        run_upload_job(job)
+
+        assert not os.path.exists(job.file_path)
+        assert StudentRoster.objects.filter(student_id='20240001').exists()
+
+        response = authenticated_client.get(f'/api/data/upload-jobs/{job_id}/')
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()['data']
+        assert data['status'] == 'done'
+        assert data['rows_processed'] == 2
+        assert data['progress'] == 100.0
+        assert data['upload_id'] == str(UploadLog.objects.get().id)
+        assert data['result']['success_rows'] == 1
+        assert data['result']['failed_rows'] == 1
+        assert data['result']['errors'][0]['row'] == 3
+
+    def test_failed_job_records_error(self, authenticated_client, async_uploads):
+        job_id = post_csv(authenticated_client, '').json()['data']['job_id']
+
+        run_upload_job(claim_next_job())
+
+        job = UploadJob.objects.get(pk=job_id)
+        assert job.status == UploadJob.STATUS_FAILED
+        assert "CSV 파일 파싱 실패" in job.error_message
+        assert job.upload_log is None
+
+    def test_job_of_other_user_not_found(self, api_client, authenticated_client, async_uploads, django_user_model):
+        job_id = post_csv(authenticated_client, STUDENT_CSV).json()['data']['job_id']
+        other = django_user_model.objects.create_user(username='other', password='testpass123')
+        api_client.force_authenticate(user=other)
+
+        response = api_client.get(f'/api/data/upload-jobs/{job_id}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_drains_queue(authenticated_client, async_uploads):
+    """워커가 스레드 풀에서 대기 중인 작업을 모두 처리하는지 테스트 (SQLite 는 동시 쓰기 불가 → 1 스레드)"""
+    post_csv(authenticated_client, STUDENT_CSV, 'a.csv')
+    post_csv(authenticated_client, STUDENT_CSV.replace('2024000', '2025000'), 'b.csv')
+
+    UploadJobWorker(max_workers=1, poll_interval=0.01).run(once=True)
+
+    assert set(UploadJob.objects.values_list('status', flat=True)) == {UploadJob.STATUS_DONE}
+    assert StudentRoster.objects.count() == 2
+
+
+def test_job_progress_estimates_eta():
+    """읽은 바이트 기준 진행률·처리량·ETA 계산 테스트"""
+    now = timezone.now()
+    job = UploadJob(
+        status=UploadJob.STATUS_RUNNING,
+        bytes_total=1000,
+        bytes_processed=250,
+        rows_processed=500,
+        started_at=now - timedelta(seconds=10),
+    )
+
+    stats = job_progress(job)
+
+    assert stats['progress'] == 25.0
+    assert stats['throughput_rows_per_sec'] == pytest.approx(50, rel=0.05)
+    assert stats['eta_seconds'] == pytest.approx(30, rel=0.05)
+
+
+@pytest.mark.django_db
+def test_jobs_of_same_type_run_one_at_a_time(django_user_model):
+    """배치 여부·배치와 무관하게 같은 데이터 유형의 처리 중 작업을 기다림 (NULL = NULL 비교가 아님)"""
+    user = django_user_model.objects.create_user(username='single', password='pw')
+    batch = UploadBatch.objects.create(file_count=2, uploaded_by=user)
+    for name, data_type, job_batch in [
+        ('a.csv', 'student', None), ('b.csv', 'student', None), ('c.csv', 'kpi', None),
+        ('d.csv', 'student', batch), ('e.csv', 'publication', batch),
+    ]:
+        UploadJob.objects.create(
+            file_name=name, data_type=data_type, file_path=name, batch=job_batch, uploaded_by=user,
+        )
+
+    claimed = [claim_next_job() for _ in range(5)]
+
+    assert sorted(job.file_name for job in claimed if job) == ['a.csv', 'c.csv', 'e.csv']
+
+
+@pytest.mark.django_db
+def test_claim_rechecks_running_job_of_same_type(django_user_model):
+    """후보 조회 뒤 다른 워커가 같은 유형 작업을 선점했으면 선점하지 않음"""
+    user = django_user_model.objects.create_user(username='race', password='pw')
+    first, second = (
+        UploadJob.objects.create(file_name=name, data_type='student', file_path=name, uploaded_by=user)
+        for name in ('a.csv', 'b.csv')
+    )
+
+    assert claim_job(first.pk, 'student')
+    assert not claim_job(second.pk, 'student')
+    assert UploadJob.objects.get(pk=second.pk).status == UploadJob.STATUS_QUEUED
+    assert claim_job(second.pk)  # 동기 일괄 처리는 유형 확인 없이 선점
+
+
+class TestStaleJobRecovery:
+    """워커가 중단되어 running 으로 남은 작업 정리 테스트"""
+
+    def stale_job(self, authenticated_client, seconds_ago=3600):
+        post_csv(authenticated_client, STUDENT_CSV)
+        job = claim_next_job()
+        UploadJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(seconds=seconds_ago))
+        return UploadJob.objects.get(pk=job.pk)
+
+    def test_requeues_job_with_stale_heartbeat(self, authenticated_client, async_uploads):
+        job = self.stale_job(authenticated_client)
+        blocked_id = post_csv(authenticated_client, STUDENT_CSV.replace('2024000', '2025000')).json()['data']['job_id']
+        assert claim_next_job() is None  # 같은 데이터 유형의 중단된 작업이 막고 있음
+
+        assert recover_stale_jobs() == (1, 0)
+
+        job.refresh_from_db()
+        assert job.status == UploadJob.STATUS_QUEUED
+        assert job.started_at is None
+        assert claim_next_job().pk == job.pk  # 먼저 등록된 작업부터 다시 처리
+        assert claim_next_job() is None
+        assert UploadJob.objects.get(pk=blocked_id).status == UploadJob.STATUS_QUEUED
+
+    def test_fails_job_after_max_attempts(self, authenticated_client, async_uploads, user):
+        async_uploads.UPLOAD_JOB_MAX_ATTEMPTS = 1
+        job = self.stale_job(authenticated_client)
+
+        assert recover_stale_jobs() == (0, 1)
+
+        job.refresh_from_db()
+        assert job.status == UploadJob.STATUS_FAILED
+        assert "워커가 중단" in job.error_message
+        assert not os.path.exists(job.file_path)
+        # 실패한 작업은 중복 업로드 조회에서 제외되어 같은 파일을 다시 올릴 수 있음
+        assert find_previous_upload(user, 'student', job.content_hash) is None
+
+    def test_live_job_untouched(self, authenticated_client, async_uploads):
+        job = self.stale_job(authenticated_client, seconds_ago=10)
+
+        assert recover_stale_jobs() == (0, 0)
+        job.refresh_from_db()
+        assert job.status == UploadJob.STATUS_RUNNING
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_recovers_stale_jobs_on_start(authenticated_client, async_uploads):
+    post_csv(authenticated_client, STUDENT_CSV)
+    job = claim_next_job()
+    UploadJob.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+
+    UploadJobWorker(max_workers=1, poll_interval=0.01).run(once=True)
+
+    job.refresh_from_db()
+    assert job.status == UploadJob.STATUS_DONE
+    assert job.attempts == 2
+    assert StudentRoster.objects.filter(student_id='20240001').exists()
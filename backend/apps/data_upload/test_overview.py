@@ -0,0 +1,148 @@
+"""
+대시보드 개요 스냅샷 테스트
+"""
+from datetime import date, timedelta
+from io import StringIO
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from apps.data_upload.models import DepartmentKPI, OverviewSnapshot, PublicationList, StudentRoster
+from apps.data_upload.overview import (
+    OVERVIEW_VERSION,
+    SNAPSHOT_ID,
+    TREND_DOWN,
+    TREND_STABLE,
+    TREND_UP,
+    refresh_overview_snapshot,
+    trend,
+)
+from apps.data_upload.services import process_csv_upload
+from apps.data_upload.versions import data_version
+
+pytestmark = pytest.mark.django_db
+
+STUDENT_HEADER = "student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email\n"
+
+
+def student_csv(*rows):
+    return (STUDENT_HEADER + ''.join(
+        f"{student_id},이름,공과대학,컴공,3,학사,{status},남,2021,,\n" for student_id, status in rows
+    )).encode('utf-8')
+
+
+def kpi(year, department, employment_rate):
+    DepartmentKPI.objects.create(
+        evaluation_year=year, college='공과대학', department=department, employment_rate=employment_rate,
+        fulltime_faculty_count=10, visiting_faculty_count=2, tech_transfer_revenue=0, intl_conference_count=0,
+    )
+
+
+def paper(publication_id, days_ago):
+    PublicationList.objects.create(
+        publication_id=publication_id, publication_date=timezone.localdate() - timedelta(days=days_ago),
+        college='공과대학', department='컴공', title='제목', first_author='저자',
+        journal_name='학술지', journal_grade='SCIE', project_linked='N',
+    )
+
+
+@pytest.mark.parametrize('current, previous, expected', [
+    (10, None, TREND_STABLE),
+    (10, 5, TREND_UP),
+    (5, 10, TREND_DOWN),
+    (70.04, 70.01, TREND_STABLE),
+])
+def test_trend(current, previous, expected):
+    assert trend(current, previous) == expected
+
+
+def test_metrics_and_trends(db):
+    kpi(2023, '컴공', 80)
+    kpi(2024, '컴공', 70)
+    kpi(2024, '전자', 60)
+    paper('P1', 10)
+    paper('P2', 400)
+    paper('P3', 500)
+
+    snapshot = refresh_overview_snapshot()
+
+    assert snapshot.performance_value == 65
+    assert snapshot.performance_trend == TREND_DOWN  # 2023 평균 80 → 2024 평균 65
+    assert snapshot.papers_count == 1
+    assert snapshot.papers_trend == TREND_DOWN  # 그 전 1년 2건
+    assert (snapshot.students_count, snapshot.students_trend) == (0, TREND_STABLE)
+    assert (snapshot.budget_value, snapshot.budget_trend) == (0, TREND_STABLE)
+
+
+def test_budget_trend_compares_rate_a_year_ago(user):
+    old = (date.today() - timedelta(days=500)).isoformat()
+    recent = (date.today() - timedelta(days=10)).isoformat()
+    content = (
+        "execution_id,project_number,project_name,principal_investigator,department,funding_agency,"
+        "total_budget,execution_date,expense_item,expense_amount,status,notes\n"
+        f"T1,P-1,과제,김,컴공,재단,1000,{old},장비,100,집행완료,\n"
+        f"T2,P-1,과제,김,컴공,재단,1000,{recent},장비,500,집행완료,\n"
+    ).encode('utf-8')
+
+    process_csv_upload(content, 'project', user, 'p.csv')
+
+    snapshot = OverviewSnapshot.objects.get(pk=SNAPSHOT_ID)
+    assert snapshot.budget_value == 30  # 600 / 2000, 1년 전에는 100 / 1000
+    assert snapshot.budget_trend == TREND_UP
+
+
+def test_upload_refreshes_student_count_and_trend(user):
+    process_csv_upload(student_csv(('1', '재학'), ('2', '재학'), ('3', '휴학')), 'student', user, 'a.csv')
+    snapshot = OverviewSnapshot.objects.get(pk=SNAPSHOT_ID)
+    assert (snapshot.students_count, snapshot.students_trend) == (2, TREND_STABLE)
+
+    process_csv_upload(student_csv(('3', '재학')), 'student', user, 'b.csv')
+    snapshot.refresh_from_db()
+    assert (snapshot.students_count, snapshot.students_trend) == (3, TREND_UP)
+
+    # 재학생 수가 그대로인 변경은 직전 추세 유지
+    process_csv_upload(student_csv(('1', '재학'), ('4', '졸업')), 'student', user, 'c.csv')
+    snapshot.refresh_from_db()
+    assert (snapshot.students_count, snapshot.students_trend) == (3, TREND_UP)
+
+    process_csv_upload(student_csv(('1', '졸업')), 'student', user, 'd.csv')
+    snapshot.refresh_from_db()
+    assert (snapshot.students_count, snapshot.students_trend) == (2, TREND_DOWN)
+
+
+def test_upload_refreshes_only_its_metric(user):
+    refresh_overview_snapshot()
+    kpi(2024, '컴공', 70)  # 업로드를 거치지 않은 변경
+
+    process_csv_upload(student_csv(('1', '재학')), 'student', user, 'a.csv')
+
+    snapshot = OverviewSnapshot.objects.get(pk=SNAPSHOT_ID)
+    assert (snapshot.students_count, snapshot.performance_value) == (1, 0)
+
+    call_command('refresh_overview_snapshot', stdout=StringIO())
+    snapshot.refresh_from_db()
+    assert snapshot.performance_value == 70
+
+
+def test_overview_version_bumped_only_on_change(db):
+    refresh_overview_snapshot()
+    version = data_version(OVERVIEW_VERSION)
+
+    refresh_overview_snapshot()
+    assert data_version(OVERVIEW_VERSION) == version
+
+    StudentRoster.objects.create(
+        student_id='1', name='이름', college='공과대학', department='컴공', grade=3,
+        program_type='학사', academic_status='재학', gender='남', admission_year=2021,
+    )
+    refresh_overview_snapshot(['student'])
+    assert data_version(OVERVIEW_VERSION) != version
+
+
+def test_overview_view_reads_snapshot(authenticated_client, user, django_assert_num_queries):
+    process_csv_upload(student_csv(('1', '재학'), ('2', '재학')), 'student', user, 'a.csv')
+
+    # 데이터 버전 조회 + 스냅샷 기본키 조회
+    with django_assert_num_queries(2):
+        response = authenticated_client.get('/api/dashboard/overview/')
+
+    assert response.json()['data']['students'] == {"label": "학생", "value": 2, "unit": "명", "trend": TREND_STABLE}
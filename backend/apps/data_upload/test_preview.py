@@ -0,0 +1,127 @@
+"""
+저장 없는 업로드 검증(dry run) 및 표본 미리보기 테스트
+"""
+import random
+from io import BytesIO
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from apps.data_upload.models import StudentRoster, UploadLog
+from apps.data_upload.services import dry_run_csv_upload, ingest_csv_upload, preview_csv_upload
+
+User = get_user_model()
+
+HEADER = "student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email\n"
+
+
+def student_line(student_id, grade=1, name='홍길동'):
+    return f"{student_id},{name},공과대학,컴퓨터공학과,{grade},학사,재학,남,2021,,{student_id}@example.com\n"
+
+
+def student_csv(lines):
+    return (HEADER + ''.join(lines)).encode('utf-8-sig')
+
+
+@pytest.fixture
+def sample_user(db):
+    return User.objects.create_user(username='testuser', password='testpass123')
+
+
+@pytest.mark.django_db
+class TestDryRun:
+
+    def test_counts_changes_without_writing(self, sample_user):
+        ingest_csv_upload(student_csv([student_line('20240001'), student_line('20240002')]), 'student', sample_user, 'a.csv')
+        content = student_csv([
+            student_line('20240001'),
+            student_line('20240002', grade=2),
+            student_line('20240003'),
+            student_line('20240004', grade=9),
+            student_line('20240003', name='이영희'),
+        ])
+
+        result = dry_run_csv_upload(content, 'student')
+
+        assert (result['total_rows'], result['success_rows'], result['failed_rows']) == (5, 3, 2)
+        assert (result['inserted_rows'], result['updated_rows'], result['unchanged_rows']) == (1, 1, 1)
+        assert [error['row'] for error in result['errors']] == [4, 5]
+        assert result['exact'] is True
+        assert StudentRoster.objects.count() == 2
+        assert UploadLog.objects.count() == 1
+
+    def test_preview_of_small_file_is_exact(self, sample_user):
+        content = student_csv([student_line('20240001'), student_line('20240002', grade=9), student_line('20240003')])
+
+        preview = preview_csv_upload(content, 'student')
+        full = dry_run_csv_upload(content, 'student')
+
+        assert preview['exact'] is True
+        for field in ('total_rows', 'success_rows', 'failed_rows', 'inserted_rows', 'errors'):
+            assert preview[field] == full[field]
+
+
+@pytest.mark.django_db
+class TestPreviewSampling:
+
+    @pytest.fixture
+    def large_file(self):
+        """20,000 행 중 약 10% 는 학년 오류"""
+        rng = random.Random(7)
+        lines = [student_line(f"{i:08d}", grade=9 if rng.random() < 0.1 else 1) for i in range(20000)]
+        return student_csv(lines)
+
+    def test_estimates_error_rate_and_row_count(self, large_file, django_assert_max_num_queries):
+        with django_assert_max_num_queries(2):
+            preview = preview_csv_upload(BytesIO(large_file), 'student', head_rows=100, sample_rows=800, seed=1)
+
+        assert preview['exact'] is False
+        assert preview['rows_checked'] <= 900
+        assert 18000 <= preview['total_rows'] <= 22000
+        assert 0.07 <= preview['error_rate'] <= 0.13
+        assert preview['success_rows'] + preview['failed_rows'] == pytest.approx(preview['total_rows'], abs=2)
+        # 앞부분 오류는 실제 행 번호, 임의 표본 오류는 행 번호 없음
+        assert all(error['row'] is None or error['row'] <= 101 for error in preview['errors'])
+
+    def test_estimates_inserts_against_existing_rows(self, large_file):
+        StudentRoster.objects.bulk_create(
+            StudentRoster(
+                student_id=f"{i:08d}", name='기존', college='공과대학', department='컴퓨터공학과', grade=1,
+                program_type='학사', academic_status='재학', gender='남', admission_year=2021,
+                email=f"{i:08d}@example.com",
+            )
+            for i in range(0, 20000, 2)
+        )
+
+        preview = preview_csv_upload(large_file, 'student', head_rows=100, sample_rows=800, seed=1)
+
+        valid = preview['success_rows']
+        assert preview['unchanged_rows'] == 0
+        assert preview['inserted_rows'] == pytest.approx(valid / 2, rel=0.15)
+        assert preview['updated_rows'] == pytest.approx(valid / 2, rel=0.15)
+        assert StudentRoster.objects.count() == 10000
+
+
+class TestUploadDryRunAPI:
+
+    def post(self, client, content, dry_run):
+        file = BytesIO(content)
+        file.name = 'students.csv'
+        return client.post(
+            '/api/data/upload/', {'file': file, 'data_type': 'student', 'dry_run': dry_run}, format='multipart',
+        )
+
+    @pytest.mark.parametrize('dry_run, mode', [('true', 'full'), ('preview', 'preview')])
+    def test_dry_run_does_not_write(self, authenticated_client, dry_run, mode):
+        response = self.post(authenticated_client, student_csv([student_line('20240001')]), dry_run)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()['data']
+        assert data['dry_run'] == mode
+        assert data['inserted_rows'] == 1
+        assert StudentRoster.objects.count() == 0
+        assert UploadLog.objects.count() == 0
+
+    def test_invalid_dry_run_value(self, authenticated_client):
+        response = self.post(authenticated_client, student_csv([student_line('20240001')]), 'maybe')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,228 @@
+"""
+롤업 테이블 증분 갱신 테스트
+"""
+import threading
+from datetime import date
+from io import StringIO
+import pytest
+from django.core.management import call_command
+from django.db import connection, transaction
+from apps.data_upload import upsert
+from apps.data_upload.models import (
+    ProjectExpenseRollup,
+    ProjectMonthlyRollup,
+    PublicationList,
+    PublicationMonthlyRollup,
+    ResearchProjectData,
+    StudentRollup,
+    StudentRoster,
+)
+from apps.data_upload.rollups import rebuild_rollups
+from apps.data_upload.upsert import write_records
+from apps.data_upload.services import process_csv_upload
+from benchmarks.synthetic import synthetic_csv_bytes
+
+pytestmark = pytest.mark.django_db
+
+STUDENT_HEADER = "student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email\n"
+
+
+def snapshot(model):
+    """롤업 행 (id·시각 제외)"""
+    exclude = {'id', 'created_at', 'updated_at'}
+    rows = model.objects.values(*[f.name for f in model._meta.fields if f.name not in exclude])
+    return sorted(tuple(row.values()) for row in rows)
+
+
+def student_csv(*rows):
+    return (STUDENT_HEADER + ''.join(
+        f"{student_id},이름,공과대학,{department},3,학사,{status},남,2021,,\n"
+        for student_id, department, status in rows
+    )).encode('utf-8-sig')
+
+
+@pytest.mark.parametrize('data_type, model', [
+    ('publication', PublicationMonthlyRollup),
+    ('student', StudentRollup),
+    ('project', ProjectExpenseRollup),
+    ('project', ProjectMonthlyRollup),
+])
+def test_incremental_matches_rebuild(user, data_type, model):
+    content, _ = synthetic_csv_bytes(data_type, 600, invalid_rate=0.05, duplicate_rate=0.05, seed=11)
+    changed, _ = synthetic_csv_bytes(data_type, 300, seed=12)  # 일부 키가 겹쳐 수정·차원 이동 발생
+
+    process_csv_upload(content, data_type, user, 'first.csv', chunk_size=200)
+    process_csv_upload(changed, data_type, user, 'second.csv', chunk_size=200)
+    incremental = snapshot(model)
+    rebuild_rollups([data_type])
+
+    assert incremental == snapshot(model)
+    assert incremental
+
+
+def test_update_moves_counts_between_groups(user):
+    process_csv_upload(student_csv(('1', '컴공', '재학'), ('2', '컴공', '재학')), 'student', user, 'a.csv')
+    process_csv_upload(student_csv(('2', '전자', '휴학')), 'student', user, 'b.csv')
+
+    assert snapshot(StudentRollup) == [
+        ('공과대학', '전자', '학사', '휴학', 1),
+        ('공과대학', '컴공', '학사', '재학', 1),
+    ]
+
+    process_csv_upload(student_csv(('1', '전자', '휴학')), 'student', user, 'c.csv')
+
+    # 학생 수가 0 이 된 조합은 삭제
+    assert snapshot(StudentRollup) == [('공과대학', '전자', '학사', '휴학', 2)]
+
+
+def test_unchanged_reupload_keeps_rollup(user):
+    content = student_csv(('1', '컴공', '재학'), ('2', '컴공', '재학'))
+    process_csv_upload(content, 'student', user, 'a.csv')
+    before = StudentRollup.objects.get().updated_at
+
+    process_csv_upload(content, 'student', user, 'a.csv')
+
+    assert StudentRollup.objects.get().updated_at == before
+
+
+def test_model_save_and_delete(db):
+    paper = PublicationList.objects.create(
+        publication_id='PUB-1', publication_date=date(2024, 3, 5), college='공과대학', department='컴공',
+        title='제목', first_author='저자', journal_name='학술지', journal_grade='SCIE', project_linked='N',
+    )
+    assert snapshot(PublicationMonthlyRollup) == [(2024, 3, '공과대학', '컴공', 'SCIE', 1)]
+
+    paper.publication_date = '2024-04-01'
+    paper.save()
+    assert snapshot(PublicationMonthlyRollup) == [(2024, 4, '공과대학', '컴공', 'SCIE', 1)]
+
+    paper.delete()
+    assert snapshot(PublicationMonthlyRollup) == []
+
+
+def test_project_sums(user):
+    content = (
+        "execution_id,project_number,project_name,principal_investigator,department,funding_agency,"
+        "total_budget,execution_date,expense_item,expense_amount,status,notes\n"
+        "T1,P-1,과제,김,컴공,재단,1000,2024-01-02,장비,100,집행완료,\n"
+        "T2,P-1,과제,김,컴공,재단,1000,2024-01-02,인건비,250,집행완료,\n"
+        "T3,P-1,과제,김,컴공,재단,1000,2024-01-03,장비,50,집행완료,\n"
+    ).encode('utf-8')
+
+    process_csv_upload(content, 'project', user, 'p.csv')
+
+    assert snapshot(ProjectExpenseRollup) == [
+        (date(2024, 1, 2), '컴공', '재단', '집행완료', 2, 2000, 350),
+        (date(2024, 1, 3), '컴공', '재단', '집행완료', 1, 1000, 50),
+    ]
+    assert snapshot(ProjectMonthlyRollup) == [
+        (2024, 1, '컴공', '재단', '집행완료', 'P-1', '과제', 3, 3000, 400),
+    ]
+
+
+def test_bulk_delete_updates_rollups(user):
+    """QuerySet.delete (관리자 '선택 항목 삭제' 액션 포함)도 롤업에서 뺀다"""
+    content, _ = synthetic_csv_bytes('project', 300, seed=13)
+    process_csv_upload(content, 'project', user, 'p.csv', chunk_size=100)
+
+    ResearchProjectData.objects.filter(department=ResearchProjectData.objects.first().department).delete()
+    incremental = (snapshot(ProjectExpenseRollup), snapshot(ProjectMonthlyRollup))
+    rebuild_rollups(['project'])
+
+    assert incremental == (snapshot(ProjectExpenseRollup), snapshot(ProjectMonthlyRollup))
+
+    ResearchProjectData.objects.all().delete()
+    assert snapshot(ProjectExpenseRollup) == snapshot(ProjectMonthlyRollup) == []
+
+
+def test_admin_delete_selected_updates_rollups(admin_client):
+    for student_id in ('1', '2'):
+        StudentRoster.objects.create(
+            student_id=student_id, name='이름', college='공과대학', department='컴공', grade=3,
+            program_type='학사', academic_status='재학', gender='남', admission_year=2021,
+        )
+
+    response = admin_client.post('/admin/data_upload/studentroster/', {
+        'action': 'delete_selected',
+        '_selected_action': [StudentRoster.objects.get(student_id='1').pk],
+        'post': 'yes',
+    })
+
+    assert response.status_code == 302
+    assert snapshot(StudentRollup) == [('공과대학', '컴공', '학사', '재학', 1)]
+
+
+def test_rebuild_command_fixes_bypassed_changes(user):
+    process_csv_upload(student_csv(('1', '컴공', '재학'), ('2', '컴공', '재학')), 'student', user, 'a.csv')
+    StudentRoster.objects.filter(student_id='1').update(academic_status='졸업')  # 모델 메서드를 거치지 않음
+
+    call_command('rebuild_rollups', data_type=['student'], stdout=StringIO())
+
+    assert snapshot(StudentRollup) == [
+        ('공과대학', '컴공', '학사', '재학', 1),
+        ('공과대학', '컴공', '학사', '졸업', 1),
+    ]
+
+
+def student_record(student_id, status='재학'):
+    return {
+        'student_id': student_id, 'name': '이름', 'college': '공과대학', 'department': '컴공', 'grade': 3,
+        'program_type': '학사', 'academic_status': status, 'gender': '남', 'admission_year': 2021,
+        'advisor': '', 'email': '',
+    }
+
+
+def test_source_locked_before_previous_rows_read(monkeypatch):
+    """아직 없는 키는 잠글 행이 없으므로 이전 값을 읽기 전에 모델 잠금을 잡아야 함"""
+    calls = []
+    fetch_existing = upsert.fetch_existing
+    monkeypatch.setattr(upsert, 'lock_source', lambda model: calls.append(('lock', model)))
+
+    def fetch(*args, **kwargs):
+        calls.append(('fetch', args[0]))
+        return fetch_existing(*args, **kwargs)
+    monkeypatch.setattr(upsert, 'fetch_existing', fetch)
+
+    write_records(StudentRoster, ('student_id',), [student_record('1')])
+
+    assert calls[:2] == [('lock', StudentRoster), ('fetch', StudentRoster)]
+
+
+@pytest.mark.skipif(connection.vendor != 'postgresql', reason="트랜잭션 advisory lock 은 PostgreSQL 전용")
+@pytest.mark.django_db(transaction=True)
+def test_overlapping_uploads_count_new_key_once():
+    """같은 새 키를 쓰는 두 업로드가 겹쳐도 롤업에는 한 번만 더해짐"""
+    first_written = threading.Event()
+    errors = []
+
+    def first():
+        try:
+            with transaction.atomic():
+                write_records(StudentRoster, ('student_id',), [student_record('1')])
+                first_written.set()
+                # 커밋 전에 두 번째 업로드가 시작되도록 잠시 유지
+                threading.Event().wait(0.5)
+        except Exception as e:
+            errors.append(e)
+            first_written.set()
+        finally:
+            connection.close()
+
+    def second():
+        try:
+            first_written.wait()
+            write_records(StudentRoster, ('student_id',), [student_record('1', '휴학')])
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert StudentRoster.objects.get().academic_status == '휴학'
+    assert snapshot(StudentRollup) == [('공과대학', '컴공', '학사', '휴학', 1)]
@@ -0,0 +1,60 @@
+"""
+업로드 스키마 레지스트리 테스트
+"""
+import pytest
+from django.apps import apps
+from apps.data_upload.schemas import (
+    INT,
+    SCHEMAS,
+    FieldSpec,
+    UploadSchema,
+    get_schema,
+    register_schema,
+)
+from apps.data_upload.test_validation import read_frame
+from apps.data_upload.validation import compile_schema, validate_frame
+
+
+@pytest.mark.parametrize('data_type', list(SCHEMAS))
+def test_schema_matches_model(data_type):
+    """선언된 필드·자연키가 저장 모델 필드와 일치하는지 테스트"""
+    schema = get_schema(data_type)
+    model = apps.get_model('data_upload', schema.model)
+    model_fields = {field.name for field in model._meta.get_fields()}
+
+    assert {field.name for field in schema.fields} <= model_fields
+    assert set(schema.natural_key) <= {field.name for field in schema.fields}
+
+
+def test_header_mapping_resolved_from_file_columns():
+    compiled = compile_schema('kpi', ['평가년도', 'evaluation_year', '학과'])
+
+    assert compiled.sources['evaluation_year'] == ['평가년도', 'evaluation_year']
+    assert compiled.sources['department'] == ['학과']
+    assert compiled.sources['college'] == []
+
+
+def test_registered_schema_uses_generic_pipeline():
+    """새 데이터 유형은 스키마 등록만으로 같은 검증 경로를 사용"""
+    register_schema(UploadSchema(
+        data_type='room',
+        model='Room',
+        natural_key=('code',),
+        fields=(
+            FieldSpec('code', headers=('호실', 'code'), required="호실이 필수입니다"),
+            FieldSpec(
+                'seats', INT, minimum=1, range_message="좌석 수는 1 이상이어야 합니다: {value}",
+                invalid_message="좌석 수가 유효하지 않습니다: {raw}",
+            ),
+        ),
+    ))
+    try:
+        records, errors = validate_frame(read_frame("호실,seats\nA101,30\n,0\nB202,x\n"), 'room')
+    finally:
+        del SCHEMAS['room']
+
+    assert records == [{'code': 'A101', 'seats': 30}]
+    assert [(error['row'], error['reason']) for error in errors] == [
+        (3, "호실이 필수입니다; 좌석 수는 1 이상이어야 합니다: 0"),
+        (4, "좌석 수가 유효하지 않습니다: x"),
+    ]
@@ -7,12 +7,16 @@ from io import BytesIO
 from django.contrib.auth import get_user_model
 from apps.data_upload.services import (
     parse_csv_file,
+    iter_csv_chunks,
     validate_and_parse_kpi,
     validate_and_parse_publication,
     validate_and_parse_project,
     validate_and_parse_student,
     process_csv_upload,
+    ingest_csv_upload,
 )
+from apps.data_upload import overview, services, upsert
+from django.db import IntegrityError, OperationalError
 from apps.data_upload.models import (
     DepartmentKPI,
     PublicationList,
@@ -20,6 +24,7 @@ from apps.data_upload.models import (
     StudentRoster,
     UploadLog,
 )
+from apps.data_upload.versions import data_version
 
 User = get_user_model()
 
@@ -67,6 +72,25 @@ class TestParseCSVFile:
         assert len(df) == 0
 
 
+class TestIterCSVChunks:
+    """CSV 청크 스트리밍 파싱 함수 테스트"""
+
+    def test_yields_chunks_from_file_object(self):
+        """파일 객체에서 청크 단위로 읽는지 테스트"""
+        csv_content = "col1,col2\n" + "".join(f"v{i},w{i}\n" for i in range(5))
+        source = BytesIO(csv_content.encode('utf-8-sig'))
+
+        chunks = list(iter_csv_chunks(source, chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert list(chunks[0].columns) == ['col1', 'col2']  # BOM 제거
+        assert chunks[2].iloc[0]['col1'] == 'v4'
+
+    def test_empty_file_raises_error(self):
+        with pytest.raises(ValueError, match="CSV 파일 파싱 실패"):
+            list(iter_csv_chunks(BytesIO(b""), chunk_size=2))
+
+
 class TestValidateAndParseKPI:
     """KPI 데이터 검증 및 파싱 함수 테스트"""
 
@@ -486,3 +510,161 @@ T2401001,PRJ-2024-001,Test Project,홍길동,컴퓨터공학과,과학기술정
                 file_name='test.csv'
             )
 
+    def test_process_upload_in_chunks(self, sample_user):
+        """청크 단위 처리 시 행 번호와 저장 결과 테스트"""
+        csv_content = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+20240002,김철수,공과대학,컴퓨터공학과,9,학사,재학,남,2021,,kim@example.com
+20240003,이영희,공과대학,컴퓨터공학과,1,학사,재학,여,2024,,lee@example.com
+20240004,박민수,공과대학,컴퓨터공학과,2,학사,재학,남,1999,,park@example.com
+20240005,최지우,공과대학,컴퓨터공학과,2,학사,휴학,여,2023,,choi@example.com
+"""
+        success_rows, failed_rows, errors = process_csv_upload(
+            file_content=BytesIO(csv_content.encode('utf-8-sig')),
+            data_type='student',
+            uploaded_by=sample_user,
+            file_name='test_chunks.csv',
+            chunk_size=2,
+        )
+
+        assert success_rows == 3
+        assert failed_rows == 2
+        assert [error['row'] for error in errors] == [3, 5]
+        assert StudentRoster.objects.count() == 3
+        assert UploadLog.objects.get(file_name='test_chunks.csv').total_rows == 5
+
+
+class TestCommitModes:
+    """batch / atomic 커밋 방식 테스트"""
+
+    CSV = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+20240002,김철수,공과대학,컴퓨터공학과,9,학사,재학,남,2021,,kim@example.com
+20240003,이영희,공과대학,컴퓨터공학과,1,학사,재학,여,2021,,lee@example.com
+20240004,박민수,공과대학,컴퓨터공학과,2,학사,재학,남,2021,,park@example.com
+20240005,최지우,공과대학,컴퓨터공학과,2,학사,휴학,여,2023,,choi@example.com
+""".encode('utf-8-sig')
+
+    @pytest.fixture
+    def sample_user(self, db):
+        return User.objects.create_user(username='testuser', password='testpass123')
+
+    @pytest.fixture
+    def failing_writes(self, monkeypatch):
+        """지정한 학번이 포함된 저장 호출을 실패시킴"""
+        original = upsert.write_records
+
+        def install(student_id, error=IntegrityError):
+            def write_records(model, key_fields, records, *args, **kwargs):
+                if any(record['student_id'] == student_id for record in records):
+                    raise error(f"{student_id} 저장 불가")
+                return original(model, key_fields, records, *args, **kwargs)
+            monkeypatch.setattr(upsert, 'write_records', write_records)
+            monkeypatch.setattr(services, 'write_records', write_records)
+
+        return install
+
+    def ingest(self, user, commit_mode):
+        return ingest_csv_upload(self.CSV, 'student', user, 'students.csv', commit_mode=commit_mode)
+
+    def test_batch_mode_isolates_failing_row(self, sample_user, settings, failing_writes):
+        settings.CSV_UPLOAD_COMMIT_ROWS = 2
+        failing_writes('20240004')
+
+        upload_log, errors = self.ingest(sample_user, 'batch')
+
+        assert upload_log.success_rows == 3
+        assert [error['row'] for error in errors] == [3, 5]
+        assert errors[1]['reason'].startswith("저장 실패: 20240004 저장 불가")
+        assert errors[1]['data']['student_id'] == '20240004'
+        assert set(StudentRoster.objects.values_list('student_id', flat=True)) == {'20240001', '20240003', '20240005'}
+
+    def test_batch_mode_keeps_committed_batches_on_fatal_error(self, sample_user, settings, failing_writes):
+        settings.CSV_UPLOAD_COMMIT_ROWS = 2
+        failing_writes('20240005', OperationalError)
+
+        with pytest.raises(OperationalError):
+            self.ingest(sample_user, 'batch')
+
+        # 유효한 행 [20240001, 20240003] 배치는 커밋되고, 실패한 [20240004, 20240005] 배치만 롤백
+        assert set(StudentRoster.objects.values_list('student_id', flat=True)) == {'20240001', '20240003'}
+
+    def test_duplicate_key_in_file_reported_before_write(self, sample_user):
+        """파일 안 중복 학번은 적재 전에 행 오류가 되어 배치가 되돌려지지 않음"""
+        csv_content = self.CSV + "20240001,홍길동2,공과대학,컴퓨터공학과,4,학사,재학,남,2021,,hong@example.com\n".encode()
+
+        upload_log, errors = ingest_csv_upload(csv_content, 'student', sample_user, 'dup.csv', commit_mode='batch')
+
+        assert upload_log.success_rows == 4
+        assert [error['row'] for error in errors] == [2, 3]
+        assert errors[0]['reason'] == "파일 안에서 키가 중복됩니다 (student_id=20240001): 7행만 저장"
+        assert StudentRoster.objects.get(student_id='20240001').name == '홍길동2'
+
+    @pytest.mark.parametrize('commit_mode', ['batch', 'atomic'])
+    def test_reupload_counts_inserted_updated_unchanged(self, sample_user, commit_mode):
+        self.ingest(sample_user, commit_mode)
+        changed = self.CSV.replace('이영희,공과대학,컴퓨터공학과,1'.encode(), '이영희,공과대학,컴퓨터공학과,2'.encode())
+
+        upload_log, _ = ingest_csv_upload(changed, 'student', sample_user, 'students.csv', commit_mode=commit_mode)
+
+        assert upload_log.success_rows == 4
+        assert (upload_log.inserted_rows, upload_log.updated_rows, upload_log.unchanged_rows) == (0, 1, 3)
+        assert StudentRoster.objects.get(student_id='20240003').grade == 2
+
+    def test_atomic_mode_rolls_back_everything(self, sample_user, failing_writes):
+        failing_writes('20240004')
+
+        with pytest.raises(IntegrityError):
+            self.ingest(sample_user, 'atomic')
+
+        assert StudentRoster.objects.count() == 0
+        assert UploadLog.objects.count() == 0
+
+    def test_default_commit_mode_is_atomic(self, sample_user, settings, failing_writes):
+        """배치 커밋은 설정으로 켜는 경우에만 (기본값은 실패 시 전체 롤백)"""
+        settings.CSV_UPLOAD_COMMIT_ROWS = 2
+        failing_writes('20240005')
+
+        with pytest.raises(IntegrityError):
+            ingest_csv_upload(self.CSV, 'student', sample_user, 'students.csv')
+
+        assert StudentRoster.objects.count() == 0
+
+    def test_atomic_failure_keeps_dashboard_version(self, sample_user, failing_writes):
+        """전체 롤백된 업로드는 캐시를 무효화하지 않음"""
+        failing_writes('20240004')
+        version = data_version('student')
+
+        with pytest.raises(IntegrityError):
+            self.ingest(sample_user, 'atomic')
+
+        assert data_version('student') == version
+
+    def test_refresh_failure_does_not_mask_upload_error(self, sample_user, settings, failing_writes, monkeypatch):
+        settings.CSV_UPLOAD_COMMIT_ROWS = 2
+        failing_writes('20240005', OperationalError)
+        version = data_version('student')
+
+        def refresh(data_types):
+            raise RuntimeError("스냅샷 갱신 실패")
+        monkeypatch.setattr(overview, 'refresh_overview_snapshot', refresh)
+
+        with pytest.raises(OperationalError):
+            self.ingest(sample_user, 'batch')
+
+        # 먼저 커밋된 배치가 있으므로 캐시는 무효화
+        assert data_version('student') != version
+
+    def test_refresh_failure_keeps_upload_result(self, sample_user, monkeypatch):
+        def refresh(data_types):
+            raise RuntimeError("스냅샷 갱신 실패")
+        monkeypatch.setattr(overview, 'refresh_overview_snapshot', refresh)
+
+        upload_log, _ = self.ingest(sample_user, 'atomic')
+
+        assert upload_log.success_rows == 4
+        assert UploadLog.objects.filter(pk=upload_log.pk).exists()
+
+    def test_invalid_commit_mode(self, sample_user):
+        with pytest.raises(ValueError, match="지원하지 않는 커밋 방식"):
+            self.ingest(sample_user, 'eventual')
@@ -0,0 +1,191 @@
+"""
+재개 가능한 분할 업로드 세션 테스트
+"""
+import os
+import pytest
+from rest_framework import status
+from apps.data_upload import sessions
+from apps.data_upload.models import StudentRoster, UploadJob, UploadLog, UploadSession
+from apps.data_upload.sessions import claim_upload_session, parse_content_range
+
+
+STUDENT_CSV = """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+20240002,김철수,공과대학,전기공학과,9,학사,재학,남,2022,,kim@example.com
+""".encode('utf-8-sig')
+
+
+@pytest.fixture
+def session_dirs(settings, tmp_path):
+    settings.UPLOAD_SESSION_DIR = str(tmp_path / 'upload_sessions')
+    settings.UPLOAD_JOB_DIR = str(tmp_path / 'upload_jobs')
+    return settings
+
+
+def create_session(client, content=STUDENT_CSV, file_name='students.csv'):
+    response = client.post(
+        '/api/data/upload-sessions/',
+        {'file_name': file_name, 'data_type': 'student', 'total_size': len(content)},
+        format='json',
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()['data']['session_id']
+
+
+def put_range(client, session_id, content, start, end):
+    return client.put(
+        f'/api/data/upload-sessions/{session_id}/',
+        data=content[start:end + 1],
+        content_type='application/octet-stream',
+        HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{len(content)}',
+    )
+
+
+class TestParseContentRange:
+
+    def test_valid_range(self):
+        assert parse_content_range('bytes 0-99/1000') == (0, 99, 1000)
+
+    @pytest.mark.parametrize('header', [None, '', 'bytes */1000', 'bytes 10-5/1000', 'bytes 0-1000/1000'])
+    def test_invalid_range(self, header):
+        with pytest.raises(ValueError, match="Content-Range"):
+            parse_content_range(header)
+
+
+class TestUploadSessionFlow:
+    """세션 생성 → 분할 전송 → 재개 → finalize 흐름 테스트"""
+
+    def test_chunked_upload_and_finalize_sync(self, authenticated_client, session_dirs):
+        session_id = create_session(authenticated_client)
+        middle = len(STUDENT_CSV) // 2
+
+        assert put_range(authenticated_client, session_id, STUDENT_CSV, 0, middle - 1).status_code == 200
+        response = put_range(authenticated_client, session_id, STUDENT_CSV, middle, len(STUDENT_CSV) - 1)
+        assert response.json()['data']['received_bytes'] == len(STUDENT_CSV)
+
+        response = authenticated_client.post(f'/api/data/upload-sessions/{session_id}/finalize/')
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()['data']
+        assert data['success_rows'] == 1
+        assert data['failed_rows'] == 1
+        assert StudentRoster.objects.filter(student_id='20240001').exists()
+
+        session = UploadSession.objects.get(pk=session_id)
+        assert session.status == UploadSession.STATUS_FINALIZED
+        assert str(session.upload_log_id) == data['upload_id']
+        assert not os.path.exists(session.file_path)
+
+    def test_resume_after_out_of_order_range(self, authenticated_client, session_dirs):
+        """현재 위치와 다른 범위는 409 와 재개 위치를 돌려준다"""
+        session_id = create_session(authenticated_client)
+        put_range(authenticated_client, session_id, STUDENT_CSV, 0, 9)
+
+        response = put_range(authenticated_client, session_id, STUDENT_CSV, 20, 29)
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.json()['errors']['received_bytes'] == 10
+
+        status_response = authenticated_client.get(f'/api/data/upload-sessions/{session_id}/')
+        assert status_response.json()['data']['received_bytes'] == 10
+
+        # 같은 범위를 다시 보내면(응답 유실 후 재전송) 충돌로 처리되고 위치는 그대로
+        assert put_range(authenticated_client, session_id, STUDENT_CSV, 0, 9).status_code == 409
+        assert put_range(authenticated_client, session_id, STUDENT_CSV, 10, len(STUDENT_CSV) - 1).status_code == 200
+
+    def test_finalize_incomplete_session_rejected(self, authenticated_client, session_dirs):
+        session_id = create_session(authenticated_client)
+        put_range(authenticated_client, session_id, STUDENT_CSV, 0, 9)
+
+        response = authenticated_client.post(f'/api/data/upload-sessions/{session_id}/finalize/')
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert StudentRoster.objects.count() == 0
+
+    def test_finalize_async_enqueues_job(self, authenticated_client, session_dirs):
+        session_dirs.UPLOAD_JOBS_ASYNC = True
+        session_id = create_session(authenticated_client)
+        put_range(authenticated_client, session_id, STUDENT_CSV, 0, len(STUDENT_CSV) - 1)
+
+        response = authenticated_client.post(f'/api/data/upload-sessions/{session_id}/finalize/')
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = UploadJob.objects.get(pk=response.json()['data']['job_id'])
+        assert job.bytes_total == len(STUDENT_CSV)
+        with open(job.file_path, 'rb') as f:
+            assert f.read() == STUDENT_CSV
+
+    @pytest.mark.parametrize('run_async', [False, True])
+    def test_concurrent_finalize_runs_once(self, authenticated_client, session_dirs, run_async):
+        """다른 요청이 먼저 선점한 세션의 finalize 는 409 (파일을 두 번 넘기지 않음)"""
+        session_dirs.UPLOAD_JOBS_ASYNC = run_async
+        session_id = create_session(authenticated_client)
+        put_range(authenticated_client, session_id, STUDENT_CSV, 0, len(STUDENT_CSV) - 1)
+        session = UploadSession.objects.get(pk=session_id)
+        assert claim_upload_session(session)  # 먼저 들어온 finalize 요청
+        assert not claim_upload_session(UploadSession.objects.get(pk=session_id))
+
+        response = authenticated_client.post(f'/api/data/upload-sessions/{session_id}/finalize/')
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert UploadJob.objects.count() == UploadLog.objects.count() == 0
+        assert os.path.exists(session.file_path)
+        # 처리 중인 세션은 취소할 수 없음
+        assert authenticated_client.delete(f'/api/data/upload-sessions/{session_id}/').status_code == 409
+
+    @pytest.mark.parametrize('run_async', [False, True])
+    def test_failed_finalize_reopens_session(self, authenticated_client, session_dirs, monkeypatch, run_async):
+        session_dirs.UPLOAD_JOBS_ASYNC = run_async
+        session_id = create_session(authenticated_client)
+        put_range(authenticated_client, session_id, STUDENT_CSV, 0, len(STUDENT_CSV) - 1)
+
+        def fail(*args, **kwargs):
+            raise OSError("디스크 공간 부족")
+        target = 'enqueue_stored_file' if run_async else 'ingest_csv_upload'
+        original = getattr(sessions, target)
+        monkeypatch.setattr(sessions, target, fail)
+
+        response = authenticated_client.post(f'/api/data/upload-sessions/{session_id}/finalize/')
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert "디스크 공간 부족" in response.json()['detail']
+        session = UploadSession.objects.get(pk=session_id)
+        assert session.status == UploadSession.STATUS_OPEN
+        assert os.path.exists(session.file_path)
+
+        # 다시 시도하면 처리됨
+        monkeypatch.setattr(sessions, target, original)
+        response = authenticated_client.post(f'/api/data/upload-sessions/{session_id}/finalize/')
+        assert response.status_code == (status.HTTP_202_ACCEPTED if run_async else status.HTTP_200_OK)
+        assert UploadSession.objects.get(pk=session_id).status == UploadSession.STATUS_FINALIZED
+
+    def test_size_limit_and_chunk_limit(self, authenticated_client, session_dirs):
+        session_dirs.UPLOAD_SESSION_MAX_SIZE = 100
+        session_dirs.UPLOAD_SESSION_MAX_CHUNK = 8
+        response = authenticated_client.post(
+            '/api/data/upload-sessions/',
+            {'file_name': 'big.csv', 'data_type': 'student', 'total_size': 101},
+            format='json',
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        session_id = create_session(authenticated_client, STUDENT_CSV[:50])
+        assert put_range(authenticated_client, session_id, STUDENT_CSV[:50], 0, 8).status_code == 400
+
+    def test_delete_cancels_session(self, authenticated_client, session_dirs):
+        session_id = create_session(authenticated_client)
+        file_path = UploadSession.objects.get(pk=session_id).file_path
+
+        response = authenticated_client.delete(f'/api/data/upload-sessions/{session_id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not UploadSession.objects.filter(pk=session_id).exists()
+        assert not os.path.exists(file_path)
+
+    def test_session_of_other_user_not_found(self, api_client, authenticated_client, session_dirs, django_user_model):
+        session_id = create_session(authenticated_client)
+        other = django_user_model.objects.create_user(username='other', password='testpass123')
+        api_client.force_authenticate(user=other)
+
+        response = api_client.get(f'/api/data/upload-sessions/{session_id}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
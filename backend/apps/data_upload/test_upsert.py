@@ -0,0 +1,155 @@
+"""
+자연키 기반 일괄 업서트 테스트
+"""
+import pytest
+from datetime import date
+from apps.data_upload.models import DepartmentKPI, StudentRoster
+from apps.data_upload.upsert import bulk_upsert, copy_rows, fetch_existing, row_hash, write_records
+
+
+def make_kpi(year, department, employment_rate=80.0):
+    return {
+        "evaluation_year": year,
+        "college": "공과대학",
+        "department": department,
+        "employment_rate": employment_rate,
+        "fulltime_faculty_count": 10,
+        "visiting_faculty_count": 2,
+        "tech_transfer_revenue": 1.5,
+        "intl_conference_count": 1,
+    }
+
+
+def make_student(student_id, grade=1):
+    return {
+        "student_id": student_id,
+        "name": "홍길동",
+        "college": "공과대학",
+        "department": "컴퓨터공학과",
+        "grade": grade,
+        "program_type": "학사",
+        "academic_status": "재학",
+        "gender": "남",
+        "admission_year": 2024,
+        "advisor": None,
+        "email": f"{student_id}@example.com",
+    }
+
+
+@pytest.mark.django_db
+class TestBulkUpsert:
+    """bulk_upsert 함수 테스트"""
+
+    def test_creates_and_updates(self):
+        """신규 행은 추가, 기존 행은 수정되는지 테스트"""
+        DepartmentKPI.objects.create(**make_kpi(2024, '컴퓨터공학과'))
+
+        counts = bulk_upsert(
+            DepartmentKPI,
+            ('evaluation_year', 'department'),
+            [make_kpi(2024, '컴퓨터공학과', 90.0), make_kpi(2024, '전기공학과'), make_kpi(2023, '컴퓨터공학과')],
+        )
+
+        assert counts == (2, 1, 0)
+        assert DepartmentKPI.objects.count() == 3
+        assert DepartmentKPI.objects.get(evaluation_year=2024, department='컴퓨터공학과').employment_rate == 90.0
+
+    def test_composite_key_matches_exactly(self):
+        """복합키의 필드별 IN 조회가 다른 조합을 기존 행으로 착각하지 않는지 테스트"""
+        DepartmentKPI.objects.create(**make_kpi(2024, '컴퓨터공학과'))
+        DepartmentKPI.objects.create(**make_kpi(2023, '전기공학과'))
+
+        existing = fetch_existing(
+            DepartmentKPI,
+            ('evaluation_year', 'department'),
+            [(2024, '전기공학과'), (2024, '컴퓨터공학과')],
+        )
+
+        assert list(existing) == [(2024, '컴퓨터공학과')]
+
+    def test_updates_refresh_updated_at(self):
+        student = StudentRoster.objects.create(**make_student('20240001'))
+
+        bulk_upsert(StudentRoster, ('student_id',), [make_student('20240001', grade=2)])
+
+        student.refresh_from_db()
+        assert student.grade == 2
+        assert student.updated_at > student.created_at
+
+    def test_query_count_scales_with_batches(self, django_assert_max_num_queries):
+        """쿼리 수가 행 수가 아닌 배치 수에 비례하는지 테스트"""
+        StudentRoster.objects.bulk_create(
+            StudentRoster(**make_student(f"2024{i:04d}")) for i in range(0, 250, 2)
+        )
+        records = [make_student(f"2024{i:04d}", grade=3) for i in range(250)]
+
+        # 조회 3 + 추가 3 + 수정 2 배치 (수정은 bulk_update 가 트랜잭션으로 감쌈)
+        with django_assert_max_num_queries(12):
+            counts = bulk_upsert(StudentRoster, ('student_id',), records, batch_size=100)
+
+        assert counts == (125, 125, 0)
+        assert StudentRoster.objects.filter(grade=3).count() == 250
+
+    def test_empty_records(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert bulk_upsert(StudentRoster, ('student_id',), []) == (0, 0, 0)
+
+    def test_skips_unchanged_rows(self):
+        """내용 해시가 같은 기존 행은 쓰지 않고 updated_at 도 그대로인지 테스트"""
+        bulk_upsert(StudentRoster, ('student_id',), [make_student('20240001'), make_student('20240002')])
+        before = StudentRoster.objects.get(student_id='20240001').updated_at
+
+        counts = bulk_upsert(
+            StudentRoster, ('student_id',), [make_student('20240001'), make_student('20240002', grade=2)],
+        )
+
+        assert (counts.created, counts.updated, counts.unchanged) == (0, 1, 1)
+        assert StudentRoster.objects.get(student_id='20240001').updated_at == before
+        assert StudentRoster.objects.get(student_id='20240002').row_hash == row_hash(make_student('20240002', grade=2))
+
+    def test_unchanged_rows_need_no_writes(self, django_assert_num_queries):
+        bulk_upsert(StudentRoster, ('student_id',), [make_student(f"2024{i:04d}") for i in range(50)])
+
+        # 기존 행 조회 1회만 발생
+        with django_assert_num_queries(1):
+            counts = bulk_upsert(StudentRoster, ('student_id',), [make_student(f"2024{i:04d}") for i in range(50)])
+
+        assert counts == (0, 0, 50)
+
+    def test_rows_saved_outside_upload_are_rewritten(self):
+        """관리자 화면 등에서 저장한 행은 해시가 비워져 다음 업로드에서 다시 쓰는지 테스트"""
+        bulk_upsert(StudentRoster, ('student_id',), [make_student('20240001')])
+        student = StudentRoster.objects.get()
+        student.name = '수정됨'
+        student.save()
+
+        counts = bulk_upsert(StudentRoster, ('student_id',), [make_student('20240001')])
+
+        assert counts == (0, 1, 0)
+        assert StudentRoster.objects.get().name == '홍길동'
+
+
+class TestCopyPath:
+    """PostgreSQL COPY 경로 보조 함수 및 폴백 테스트"""
+
+    def test_copy_rows_escapes_text_format(self):
+        buffer = copy_rows(
+            [{"a": "탭\t줄\n역\\", "b": None, "c": date(2024, 1, 5), "d": 3.5}],
+            ["a", "b", "c", "d"],
+        )
+
+        assert buffer.read() == "탭\\t줄\\n역\\\\\t\\N\t2024-01-05\t3.5\n"
+
+    @pytest.mark.django_db
+    def test_write_records_falls_back_to_orm_on_sqlite(self, settings):
+        settings.CSV_UPLOAD_USE_COPY = True
+        bulk_upsert(DepartmentKPI, ("evaluation_year", "department"), [make_kpi(2024, "컴퓨터공학과")])
+
+        counts = write_records(
+            DepartmentKPI,
+            ("evaluation_year", "department"),
+            [make_kpi(2024, "컴퓨터공학과", 90.0), make_kpi(2024, "전기공학과")],
+        )
+
+        assert counts == (1, 1, 0)
+        assert DepartmentKPI.objects.get(department="컴퓨터공학과").employment_rate == 90.0
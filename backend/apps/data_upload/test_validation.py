@@ -0,0 +1,133 @@
+"""
+컬럼 단위 검증 엔진 테스트
+
+행 단위 validate_and_parse_* 함수와 결과(레코드, 오류 메시지, 행 번호)가 같은지 확인
+"""
+import pytest
+from io import StringIO
+import pandas as pd
+from apps.data_upload.services import (
+    validate_and_parse_kpi,
+    validate_and_parse_publication,
+    validate_and_parse_project,
+    validate_and_parse_student,
+)
+from apps.data_upload.validation import iter_validated_chunks, validate_frame
+
+
+ROW_VALIDATORS = {
+    'kpi': validate_and_parse_kpi,
+    'publication': validate_and_parse_publication,
+    'project': validate_and_parse_project,
+    'student': validate_and_parse_student,
+}
+
+
+def read_frame(csv_content: str) -> pd.DataFrame:
+    return pd.read_csv(StringIO(csv_content), dtype=str, keep_default_na=False)
+
+
+def validate_rows(df: pd.DataFrame, data_type: str):
+    """기존 iterrows() 방식의 기대 결과"""
+    records, errors = [], []
+    for idx, row in df.iterrows():
+        parsed = ROW_VALIDATORS[data_type](row, idx + 2)
+        if "errors" in parsed:
+            errors.append({
+                "row": parsed["row"],
+                "reason": "; ".join(parsed["errors"]),
+                "data": row.to_dict(),
+            })
+        else:
+            records.append(parsed)
+    return records, errors
+
+
+CASES = {
+    'kpi': """평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수
+2024,공과대학,컴퓨터공학과,85.5,10,2,5.2,3
+2022,공과대학,전기공학과,80.0,8,1,4.0,2
+2024.0,,  ,150,-1,abc,-2.5,1_000
+ 2025 ,인문대학,철학과,,,,,
+abc,인문대학,사학과,x,3.9,2,y,-3
+""",
+    'kpi_english': """evaluation_year,college,department,employment_rate,fulltime_faculty_count,visiting_faculty_count,tech_transfer_revenue,intl_conference_count
+2024,공과대학,컴퓨터공학과,85.5,10,2,5.2,3
+bad,공과대학,,85.5,10,2,5.2,3
+""",
+    'publication': """publication_id,publication_date,college,department,title,first_author,journal_name,journal_grade,impact_factor,project_linked,co_authors
+PUB-24-001,2024-01-15,공과대학,컴퓨터공학과,Paper,홍길동,Journal,SCIE,3.5,y,김철수
+PUB-24-002,2024/02/20,공과대학,전기공학과,Paper,김철수,Journal,KCI,2.0,X,
+PUB-24-003,March 3 2024,공과대학,전기공학과,Paper,김철수,Journal,SCIE,n/a,N,
+,not-a-date,공과대학,전기공학과,Paper,김철수,Journal,SSCI,,Y,
+PUB-24-005,2024-1-5,공과대학,전기공학과,Paper,김철수,Journal,일반, ,Y,
+""",
+    'project': """execution_id,project_number,project_name,principal_investigator,department,funding_agency,total_budget,execution_date,expense_item,expense_amount,status,notes
+T2401001,PRJ-1,Project,홍길동,컴퓨터공학과,기관,"100,000,000",2024-01-15,인건비,50000000,처리중,note
+T2401002,PRJ-1,Project,홍길동,컴퓨터공학과,기관,-5,2024-13-01,인건비,,보류,
+,PRJ-1,Project,홍길동,컴퓨터공학과,기관,abc,20240115,인건비,-7,집행완료,
+T2401004,PRJ-1,Project,홍길동,컴퓨터공학과,기관,1.9e3,15 Jan 2024,인건비,1000.7,반려,
+""",
+    'student': """student_id,name,college,department,grade,program_type,academic_status,gender,admission_year,advisor,email
+20240001,홍길동,공과대학,컴퓨터공학과,3,학사,재학,남,2021,,hong@example.com
+20240002,김철수,공과대학,전기공학과,5,학부,재학,M,1999,교수,kim@example.com
+,이영희,공과대학,컴퓨터공학과,x,석사,자퇴,여,2021.0,,lee@example.com
+20240004,박민수,공과대학,컴퓨터공학과,2.7,박사,휴학,여, 2022 ,교수,park@example.com
+""",
+}
+
+
+class TestValidateFrame:
+    """행 단위 검증과 동일한 결과를 내는지 테스트"""
+
+    @pytest.mark.parametrize('case', list(CASES))
+    def test_matches_row_validators(self, case):
+        data_type = case.split('_')[0]
+        df = read_frame(CASES[case])
+
+        assert validate_frame(df, data_type) == validate_rows(df, data_type)
+
+    def test_missing_columns_match_row_validators(self):
+        """컬럼이 없을 때의 기본값과 오류 메시지 테스트"""
+        df = read_frame("student_id,name\n20240001,홍길동\n")
+
+        assert validate_frame(df, 'student') == validate_rows(df, 'student')
+
+    def test_start_row_offsets_row_numbers(self):
+        """청크 단위 처리 시 행 번호 오프셋 테스트"""
+        df = read_frame(CASES['kpi'])
+
+        _, errors = validate_frame(df, 'kpi', start_row=1002)
+
+        assert [error['row'] for error in errors] == [1003, 1004, 1006]
+
+    def test_invalid_data_type(self):
+        with pytest.raises(ValueError, match="지원하지 않는 데이터 유형"):
+            validate_frame(read_frame("col1\nvalue\n"), 'invalid_type')
+
+
+class TestIterValidatedChunks:
+    """청크 검증(직렬/병렬) 테스트"""
+
+    def chunks(self, size=2):
+        df = read_frame(CASES['kpi'] + CASES['kpi'].split('\n', 1)[1])
+        return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+    def collect(self, **options):
+        records, errors, rows = [], [], 0
+        for chunk_rows, chunk_records, chunk_errors in iter_validated_chunks(self.chunks(), 'kpi', **options):
+            rows += chunk_rows
+            records.extend(chunk_records)
+            errors.extend(chunk_errors)
+        return rows, records, errors
+
+    def test_row_numbers_continue_across_chunks(self):
+        rows, records, errors = self.collect()
+
+        assert rows == 10
+        assert [error['row'] for error in errors] == [3, 4, 6, 8, 9, 11]
+        assert len(records) == 4
+
+    def test_parallel_matches_serial(self):
+        """프로세스 풀 병렬 검증 결과가 순서까지 직렬 검증과 같은지 테스트"""
+        assert self.collect(workers=2, min_rows=4) == self.collect()
@@ -0,0 +1,368 @@
+"""
+자연키 기반 일괄 업서트(upsert)
+
+행마다 filter().first() / save() 를 호출하는 대신, 기존 키를 배치 단위 IN 조회로 한 번에 가져오고
+bulk_create / bulk_update 로 배치 단위 저장한다. DB 왕복 횟수는 O(rows / batch_size).
+
+PostgreSQL 에서는 COPY 로 임시 스테이징 테이블에 적재한 뒤 INSERT ... ON CONFLICT DO UPDATE
+한 문장으로 병합하는 경로(copy_upsert)를 사용한다.
+
+두 경로 모두 행 내용 해시(row_hash)를 함께 저장하고, 기존 행과 해시가 같으면 쓰지 않는다.
+대부분 그대로인 재업로드에서 UPDATE·WAL·updated_at 변경이 실제로 바뀐 행에만 생긴다.
+"""
+import hashlib
+import json
+import uuid
+from datetime import date, datetime
+from io import StringIO
+from django.conf import settings
+from django.db import DataError, IntegrityError, connection, models, transaction
+from django.utils import timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+from apps.data_upload.rollups import apply_changes, lock_source, rollups_for, source_fields
+
+UPSERT_BATCH_SIZE = 1000
+
+Key = Tuple[Any, ...]
+
+
+class WriteCounts(NamedTuple):
+    """저장 결과 행 수"""
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+def natural_key(record: Dict[str, Any], key_fields: Sequence[str]) -> Key:
+    return tuple(record[field] for field in key_fields)
+
+
+def row_hash(record: Dict[str, Any]) -> str:
+    """
+    레코드 내용 해시 (필드명·값 기준 128비트 BLAKE2b, 16진수 32자)
+
+    같은 스키마로 변환한 레코드끼리만 비교하므로 값의 파이썬 표현을 그대로 직렬화한다.
+    """
+    payload = json.dumps(record, ensure_ascii=False, default=str, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def fetch_existing(
+    model: type,
+    key_fields: Sequence[str],
+    keys: Iterable[Key],
+    batch_size: int = UPSERT_BATCH_SIZE,
+    fields: Sequence[str] = ('row_hash',),
+    lock: bool = False,
+) -> Dict[Key, models.Model]:
+    """
+    주어진 자연키에 해당하는 기존 레코드를 배치 단위 IN 조회로 가져온다
+
+    복합키는 필드별 IN 조건으로 상위 집합을 조회한 뒤 파이썬에서 정확히 일치하는 키만 남긴다.
+
+    Args:
+        fields: 키 필드 외에 로드할 필드
+        lock: SELECT ... FOR UPDATE 로 행 잠금 (트랜잭션 안에서만)
+
+    Returns:
+        {자연키: 인스턴스} (pk, 키 필드, fields 만 로드)
+    """
+    keys = list(keys)
+    wanted = set(keys)
+    existing = {}
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start:start + batch_size]
+        filters = {
+            f"{field}__in": {key[i] for key in batch}
+            for i, field in enumerate(key_fields)
+        }
+        queryset = model.objects.filter(**filters).only(*key_fields, *fields)
+        if lock:
+            queryset = queryset.select_for_update()
+        for instance in queryset:
+            key = tuple(getattr(instance, field) for field in key_fields)
+            if key in wanted:
+                existing[key] = instance
+    return existing
+
+
+def bulk_upsert(
+    model: type,
+    key_fields: Sequence[str],
+    records: List[Dict[str, Any]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> WriteCounts:
+    """
+    검증된 레코드를 자연키 기준으로 일괄 추가/수정
+
+    기존 행의 row_hash 가 레코드 해시와 같으면 수정하지 않는다.
+    같은 키가 여러 번 나오면 기존 행 수정은 마지막 값이 반영된다.
+
+    Args:
+        model: 저장 대상 모델
+        key_fields: 자연키 필드명 (예: ('evaluation_year', 'department'))
+        records: 필드명 -> 값 딕셔너리 목록
+        batch_size: IN 조회 및 bulk 쓰기 배치 크기
+
+    Returns:
+        WriteCounts(created, updated, unchanged)
+    """
+    if not records:
+        return WriteCounts()
+
+    existing = fetch_existing(
+        model,
+        key_fields,
+        {natural_key(record, key_fields) for record in records},
+        batch_size,
+    )
+
+    to_create = []
+    to_update = {}
+    unchanged = 0
+    for record in records:
+        key = natural_key(record, key_fields)
+        digest = row_hash(record)
+        instance = existing.get(key)
+        if instance is None:
+            to_create.append(model(**record, row_hash=digest))
+        elif instance.row_hash == digest and key not in to_update:
+            unchanged += 1
+        else:
+            for field, value in record.items():
+                setattr(instance, field, value)
+            instance.row_hash = digest
+            to_update[key] = instance
+
+    if to_create:
+        model.objects.bulk_create(to_create, batch_size=batch_size)
+
+    if to_update:
+        # bulk_update 는 auto_now 를 적용하지 않으므로 updated_at 을 직접 갱신
+        now = timezone.now()
+        for instance in to_update.values():
+            instance.updated_at = now
+        model.objects.bulk_update(
+            list(to_update.values()),
+            fields=[*records[0].keys(), 'row_hash', 'updated_at'],
+            batch_size=batch_size,
+        )
+
+    return WriteCounts(len(to_create), len(to_update), unchanged)
+
+
+def count_changes(
+    model: type,
+    key_fields: Sequence[str],
+    records: List[Dict[str, Any]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> WriteCounts:
+    """
+    저장하지 않고 레코드가 추가/수정/변경 없음 중 어느 쪽이 될지만 센다 (dry run 용, 조회만 실행)
+
+    Returns:
+        WriteCounts(created, updated, unchanged)
+    """
+    existing = fetch_existing(
+        model,
+        key_fields,
+        {natural_key(record, key_fields) for record in records},
+        batch_size,
+    )
+    created = updated = 0
+    for record in records:
+        instance = existing.get(natural_key(record, key_fields))
+        if instance is None:
+            created += 1
+        elif instance.row_hash != row_hash(record):
+            updated += 1
+    return WriteCounts(created, updated, len(records) - created - updated)
+
+
+def _copy_value(value: Any) -> str:
+    """COPY text 형식 값 (NULL 은 \\N, 구분자·개행·백슬래시 이스케이프)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (date, datetime)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return (
+        text.replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def copy_rows(records: List[Dict[str, Any]], fields: Sequence[str]) -> StringIO:
+    """레코드를 COPY FROM STDIN 용 탭 구분 텍스트 버퍼로 변환"""
+    buffer = StringIO()
+    for record in records:
+        buffer.write('\t'.join(_copy_value(record[field]) for field in fields))
+        buffer.write('\n')
+    buffer.seek(0)
+    return buffer
+
+
+def copy_upsert(
+    model: type,
+    key_fields: Sequence[str],
+    records: List[Dict[str, Any]],
+) -> WriteCounts:
+    """
+    PostgreSQL COPY + 스테이징 테이블 기반 일괄 업서트
+
+    1. 데이터 유형별 임시 스테이징 테이블(<table>_staging)을 만든다.
+       임시 테이블은 WAL 에 기록되지 않고(unlogged) 세션 전용이므로 동시 업로드끼리 간섭하지 않는다.
+    2. 레코드를 COPY FROM STDIN 으로 적재한다.
+    3. INSERT ... SELECT ... ON CONFLICT (자연키) DO UPDATE 한 문장으로 대상 테이블에 병합한다.
+       row_hash 가 같은 기존 행은 WHERE 조건으로 건너뛰어 행 버전(WAL)을 만들지 않는다.
+
+    Returns:
+        WriteCounts(created, updated, unchanged)
+    """
+    if not records:
+        return WriteCounts()
+
+    meta = model._meta
+    qn = connection.ops.quote_name
+    fields = [*records[0], 'row_hash']
+    columns = [meta.get_field(field).column for field in fields]
+    key_columns = [meta.get_field(field).column for field in key_fields]
+
+    table = qn(meta.db_table)
+    staging = qn(f"{meta.db_table}_staging")
+    staging_columns = ', '.join(qn(column) for column in ['id', *columns])
+    column_list = ', '.join(qn(column) for column in columns)
+    updates = ', '.join(
+        [f"{qn(column)} = EXCLUDED.{qn(column)}" for column in columns if column not in key_columns]
+        + [f"{qn('updated_at')} = EXCLUDED.{qn('updated_at')}"]
+    )
+
+    # PK 는 모델 기본값과 같이 uuid4 로 생성 (충돌 시 기존 행의 id 유지)
+    rows = [{'id': uuid.uuid4(), **record, 'row_hash': row_hash(record)} for record in records]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging} ON COMMIT DROP AS "
+            f"SELECT {staging_columns} FROM {table} WITH NO DATA"
+        )
+        cursor.execute(f"TRUNCATE {staging}")
+
+        copy_sql = f"COPY {staging} ({staging_columns}) FROM STDIN"
+        buffer = copy_rows(rows, ['id', *fields])
+        if hasattr(cursor.cursor, 'copy_expert'):  # psycopg2
+            cursor.cursor.copy_expert(copy_sql, buffer)
+        else:  # psycopg 3
+            with cursor.cursor.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+
+        cursor.execute(
+            f"""
+            WITH merged AS (
+                INSERT INTO {table} ({qn('id')}, {qn('created_at')}, {qn('updated_at')}, {column_list})
+                SELECT {qn('id')}, now(), now(), {column_list} FROM {staging}
+                ON CONFLICT ({', '.join(qn(column) for column in key_columns)}) DO UPDATE SET {updates}
+                WHERE {table}.{qn('row_hash')} IS DISTINCT FROM EXCLUDED.{qn('row_hash')}
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                count(*) FILTER (WHERE inserted),
+                count(*) FILTER (WHERE NOT inserted)
+            FROM merged
+            """
+        )
+        created, updated = cursor.fetchone()
+
+    return WriteCounts(created, updated, len(records) - created - updated)
+
+
+def write_records(
+    model: type,
+    key_fields: Sequence[str],
+    records: List[Dict[str, Any]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> WriteCounts:
+    """
+    검증된 레코드 저장
+
+    PostgreSQL 이고 settings.CSV_UPLOAD_USE_COPY 가 True 이면 COPY 경로,
+    그 외(SQLite 테스트 환경 등)는 ORM bulk_upsert 경로를 사용한다.
+
+    롤업 테이블이 있는 모델은 같은 트랜잭션에서 모델별 잠금을 잡은 뒤 기존 행(이전 값)을 읽고,
+    저장 후 이전 값과 새 값의 차이만큼 롤업을 갱신한다 (rollups.py).
+    잠금은 트랜잭션이 끝날 때까지 유지되므로, 같은 모델에 겹쳐 쓰는 업로드는 앞 업로드가 커밋한 값을 이전 값으로 본다.
+
+    Returns:
+        WriteCounts(created, updated, unchanged)
+    """
+    if not rollups_for(model):
+        return _write(model, key_fields, records, batch_size)
+
+    with transaction.atomic():
+        lock_source(model)
+        latest = {natural_key(record, key_fields): record for record in records}
+        previous = fetch_existing(model, key_fields, latest, batch_size, fields=source_fields(model), lock=True)
+        counts = _write(model, key_fields, records, batch_size)
+        apply_changes(model, previous.values(), latest.values())
+    return counts
+
+
+def _write(
+    model: type,
+    key_fields: Sequence[str],
+    records: List[Dict[str, Any]],
+    batch_size: int,
+) -> WriteCounts:
+    if connection.vendor == 'postgresql' and settings.CSV_UPLOAD_USE_COPY:
+        return copy_upsert(model, key_fields, records)
+    return bulk_upsert(model, key_fields, records, batch_size)
+
+
+def _failed_row(record: Dict[str, Any], row: int, error: Exception) -> Dict[str, Any]:
+    """저장에 실패한 행의 오류 항목 (검증 오류와 같은 형식, data 는 변환된 값)"""
+    return {
+        "row": row,
+        "reason": f"저장 실패: {error}",
+        "data": {field: '' if value is None else str(value) for field, value in record.items()},
+    }
+
+
+def write_in_batches(
+    model: type,
+    key_fields: Sequence[str],
+    records: List[Dict[str, Any]],
+    rows: Sequence[int],
+    batch_size: int,
+) -> Tuple[WriteCounts, List[Dict[str, Any]]]:
+    """
+    batch_size 행씩 각자의 트랜잭션(바깥 트랜잭션 안이면 세이브포인트)으로 저장
+
+    배치가 무결성·데이터 오류로 실패하면 그 배치만 롤백하고 행 단위로 다시 저장하여
+    문제 행만 오류로 돌려준다. 연결 끊김 같은 그 밖의 DB 오류는 그대로 전파된다.
+
+    Args:
+        rows: records 와 같은 순서의 CSV 행 번호
+
+    Returns:
+        (저장 결과 행 수 WriteCounts, 저장 실패 행 오류 목록)
+    """
+    counts = []
+    failures = []
+    for start in range(0, len(records), batch_size):
+        batch = records[start:start + batch_size]
+        try:
+            with transaction.atomic():
+                counts.append(write_records(model, key_fields, batch))
+            continue
+        except (IntegrityError, DataError):
+            pass
+
+        for record, row in zip(batch, rows[start:start + batch_size]):
+            try:
+                with transaction.atomic():
+                    counts.append(write_records(model, key_fields, [record]))
+            except (IntegrityError, DataError) as e:
+                failures.append(_failed_row(record, row, e))
+    return WriteCounts(*map(sum, zip(*counts))) if counts else WriteCounts(), failures
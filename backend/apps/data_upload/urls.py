@@ -1,8 +1,26 @@
 from django.urls import path
-from .views import UploadView, UploadLogListView, UploadLogDetailView
+from .views import (
+    UploadView,
+    UploadJobDetailView,
+    UploadBatchView,
+    UploadBatchDetailView,
+    UploadSessionCreateView,
+    UploadSessionDetailView,
+    UploadSessionFinalizeView,
+    UploadLogListView,
+    UploadLogDetailView,
+    UploadLogErrorReportView,
+)
 
 urlpatterns = [
     path('upload/', UploadView.as_view(), name='upload_csv'),
+    path('upload-jobs/<uuid:pk>/', UploadJobDetailView.as_view(), name='upload_jobs_detail'),
+    path('upload-batches/', UploadBatchView.as_view(), name='upload_batches_create'),
+    path('upload-batches/<uuid:pk>/', UploadBatchDetailView.as_view(), name='upload_batches_detail'),
+    path('upload-sessions/', UploadSessionCreateView.as_view(), name='upload_sessions_create'),
+    path('upload-sessions/<uuid:pk>/', UploadSessionDetailView.as_view(), name='upload_sessions_detail'),
+    path('upload-sessions/<uuid:pk>/finalize/', UploadSessionFinalizeView.as_view(), name='upload_sessions_finalize'),
     path('upload-logs/', UploadLogListView.as_view(), name='upload_logs_list'),
     path('upload-logs/<uuid:pk>/', UploadLogDetailView.as_view(), name='upload_logs_detail'),
+    path('upload-logs/<uuid:pk>/errors/', UploadLogErrorReportView.as_view(), name='upload_logs_errors'),
 ]
@@ -0,0 +1,414 @@
+"""
+컬럼 단위(벡터화) CSV 데이터 검증 엔진
+
+services.validate_and_parse_* 함수와 같은 규칙·오류 메시지·행 번호를 사용하지만,
+행마다 함수를 호출하는 대신 pandas/NumPy 연산으로 컬럼 전체를 한 번에 변환하고
+불리언 마스크로 행별 오류 목록을 만든다.
+
+데이터 유형별 규칙은 schemas.py 의 선언을 따르며, 모든 유형이 같은 CompiledSchema 경로로 검증된다.
+"""
+import bisect
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from apps.data_upload.dates import parse_date_column
+from apps.data_upload.schemas import (
+    AMOUNT,
+    DATE,
+    FLOAT,
+    INT,
+    OPTIONAL_TEXT,
+    TEXT,
+    TRUNCATED_INT,
+    FieldSpec,
+    UploadSchema,
+    get_schema,
+)
+
+# int() 로 바로 변환 가능한 문자열 (예: " 2024", "+3")
+INT_PATTERN = r'\s*[+-]?\d+\s*'
+
+
+class FrameValidation:
+    """
+    DataFrame 한 개(또는 청크)에 대한 검증 상태
+
+    검사를 호출한 순서대로 행별 오류 메시지를 누적하므로, 한 행에 여러 오류가 있을 때
+    메시지 순서가 행 단위 검증 함수와 동일하게 유지된다.
+    """
+
+    def __init__(self, df: pd.DataFrame, start_row: int = 2):
+        self.df = df
+        self.size = len(df)
+        self.start_row = start_row  # 첫 데이터 행의 CSV 행 번호 (헤더 1행 + 1)
+        self.messages: Dict[int, List[str]] = {}
+
+    def column(self, name: str, default: Any = '') -> pd.Series:
+        """row.get(name, default) 와 같은 의미의 컬럼 조회"""
+        if name in self.df.columns:
+            return self.df[name]
+        return pd.Series([default] * self.size, index=self.df.index, dtype=object)
+
+    def raw(self, name: str, pos: int) -> Any:
+        """오류 메시지용 원본 값 (row.get(name) 과 동일하게 컬럼이 없으면 None, 타입 컬럼의 null 은 빈 문자열)"""
+        if name in self.df.columns:
+            value = self.df[name].iat[pos]
+            return '' if pd.isna(value) else value
+        return None
+
+    def either(self, key_ko: str, key_en: str) -> pd.Series:
+        """row.get(key_ko, '') or row.get(key_en, '') 의 컬럼 버전"""
+        first = self.column(key_ko)
+        second = self.column(key_en)
+        return first.where(first.isna() | (first != ''), second)
+
+    def text(self, values: pd.Series) -> pd.Series:
+        """str(value).strip() 의 컬럼 버전"""
+        return values.astype(str).str.strip()
+
+    def add_errors(self, mask: np.ndarray, message: Callable[[int], str]) -> None:
+        """mask 가 True 인 행마다 오류 메시지를 추가"""
+        for pos in np.flatnonzero(mask):
+            self.messages.setdefault(int(pos), []).append(message(int(pos)))
+
+    def require(self, values: pd.Series, message: str) -> None:
+        self.add_errors((values == '').to_numpy(), lambda pos: message)
+
+    def result(self, columns: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        검증 결과를 (valid_records, errors) 로 변환
+
+        columns: 필드명 -> 길이 size 의 배열/Series (오류 없는 행만 레코드로 만든다)
+        """
+        error_positions = sorted(self.messages)
+        valid = np.ones(self.size, dtype=bool)
+        valid[error_positions] = False
+
+        fields = list(columns)
+        values = [_select(columns[field], valid) for field in fields]
+        records = [dict(zip(fields, row)) for row in zip(*values)]
+
+        errors = []
+        if error_positions:
+            # 타입 컬럼(Parquet/Arrow)의 NaN·NaT 는 JSON 으로 보낼 수 있도록 None 으로
+            error_frame = self.df.iloc[error_positions].astype(object)
+            rows = error_frame.where(error_frame.notna(), None).to_dict('records')
+            for pos, data in zip(error_positions, rows):
+                errors.append({
+                    "row": pos + self.start_row,
+                    "reason": "; ".join(self.messages[pos]),
+                    "data": data,
+                })
+        return records, errors
+
+
+def _select(values: Any, mask: np.ndarray) -> List[Any]:
+    """유효한 행의 값만 파이썬 기본 타입 리스트로 반환"""
+    if isinstance(values, pd.Series):
+        values = values.to_numpy()
+    return values[mask].tolist()
+
+
+def to_float(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    float(value) 의 컬럼 버전
+
+    pd.to_numeric 으로 일괄 변환하고, 실패한 셀만 파이썬 float() 로 다시 시도한다
+    (예: "1_000", "nan" 처럼 pandas 가 거부하지만 float() 는 허용하는 값).
+
+    Returns:
+        (values, ok) - ok 가 False 인 셀은 변환 실패
+    """
+    values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    ok = ~np.isnan(values)
+    for pos in np.flatnonzero(~ok):
+        try:
+            values[pos] = float(raw.iat[pos])
+            ok[pos] = True
+        except (ValueError, TypeError):
+            pass
+    return values, ok
+
+
+def to_int(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """int(value) 의 컬럼 버전 (소수점·지수 표기는 int() 와 같이 실패 처리)"""
+    values = np.full(len(raw), np.nan)
+    ok = np.zeros(len(raw), dtype=bool)
+    matched = raw.astype(str).str.fullmatch(INT_PATTERN).to_numpy(dtype=bool)
+    if matched.any():
+        values[matched] = pd.to_numeric(raw[matched], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        ok = matched & ~np.isnan(values)
+    for pos in np.flatnonzero(~ok):
+        try:
+            values[pos] = int(raw.iat[pos])
+            ok[pos] = True
+        except (ValueError, TypeError):
+            pass
+    return values, ok
+
+
+def to_truncated_int(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """int(float(value)) 의 컬럼 버전"""
+    values, ok = to_float(raw)
+    ok &= np.isfinite(values)
+    values = np.trunc(np.where(ok, values, 0))
+    return values, ok
+
+
+def to_date(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    dateutil.parser.parse(str(value)).date() 의 컬럼 버전
+
+    고유 값 단위로 주 형식을 추론해 한 번에 변환하고, 나머지만 dateutil 로 파싱한다 (dates.parse_date_column).
+    """
+    return parse_date_column(raw)
+
+
+def from_typed_numbers(raw: pd.Series, dtype: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    이미 숫자 타입인 컬럼(Parquet/Arrow)의 변환 — 문자열로 바꾸지 않고 문자열 경로와 같은 규칙 적용
+
+    null 은 변환 실패, INT 는 소수부가 있으면 실패 (int('3.5') 와 같이), 나머지 정수 타입은 버림.
+    """
+    values = raw.to_numpy(dtype=float, na_value=np.nan)
+    ok = ~np.isnan(values)
+    if dtype != FLOAT:
+        ok &= np.isfinite(values)
+        if dtype == INT:
+            ok &= values == np.trunc(np.where(ok, values, 0))
+        values = np.trunc(np.where(ok, values, 0))
+    return values, ok
+
+
+def from_typed_dates(raw: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """이미 날짜 타입인 컬럼(Parquet/Arrow)의 변환 (null 은 변환 실패)"""
+    ok = raw.notna().to_numpy()
+    values = np.full(len(raw), None, dtype=object)
+    values[ok] = raw[ok].dt.date.to_numpy()
+    return values, ok
+
+
+def _as_int(values: np.ndarray, ok: np.ndarray) -> np.ndarray:
+    """검증 통과한 정수 값을 int64 배열로 (실패한 셀은 0, 레코드로 쓰이지 않음)"""
+    return np.where(ok, values, 0).astype(np.int64)
+
+
+def _or_none(values: pd.Series) -> np.ndarray:
+    """빈 문자열을 None 으로 (str(value).strip() or None)"""
+    return values.where(values != '', None).to_numpy(dtype=object)
+
+
+class CompiledSchema:
+    """
+    헤더 매핑을 해석해 둔 스키마
+
+    필드별로 어떤 헤더(한글/영문 별칭)가 파일에 있는지를 한 번만 계산하고, 같은 파일의 모든 청크에 재사용한다.
+    프로세스 풀로 보낼 수 있도록 선언(dataclass)과 헤더 목록만 가진다.
+    """
+
+    def __init__(self, schema: UploadSchema, columns: Iterable[str]):
+        columns = set(columns)
+        self.schema = schema
+        self.sources: Dict[str, List[str]] = {
+            field.name: [header for header in field.header_candidates if header in columns]
+            for field in schema.fields
+        }
+
+    def validate(
+        self,
+        df: pd.DataFrame,
+        start_row: int = 2,
+        row_errors: Optional[Dict[int, str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        청크 검증
+
+        Args:
+            row_errors: 필드 검증 뒤에 덧붙일 오류 {CSV 행 번호: 메시지} (파일 안 중복 키 등, 이 청크 범위만)
+
+        Returns:
+            (valid_records, errors) 튜플
+        """
+        v = FrameValidation(df, start_row)
+        output: Dict[str, Any] = {}
+        for field in self.schema.fields:
+            output[field.name] = self._convert(v, field, output)
+        for row, message in (row_errors or {}).items():
+            v.messages.setdefault(row - start_row, []).append(message)
+        return v.result(output)
+
+    def _resolve(self, v: FrameValidation, field: FieldSpec) -> pd.Series:
+        """헤더 후보 중 앞 헤더 값이 비어 있으면 다음 헤더 값 사용 (row.get(ko, '') or row.get(en, ''))"""
+        sources = self.sources[field.name]
+        if not sources:
+            return v.column(field.name, field.default)
+        values = v.df[sources[0]]
+        if len(sources) == 1:
+            return values
+        # Categorical 컬럼(PyArrow 엔진)끼리는 범주가 달라 where 로 합칠 수 없으므로 문자열로 바꿔 합친다
+        values = values.astype(object)
+        for header in sources[1:]:
+            values = values.where(values.isna() | (values != ''), v.df[header].astype(object))
+        return values.infer_objects()
+
+    def _convert(self, v: FrameValidation, field: FieldSpec, output: Dict[str, Any]) -> Any:
+        raw = self._resolve(v, field)
+        values = raw if field.empty_as is None else raw.mask(raw == '', field.empty_as)
+
+        if field.dtype in (TEXT, OPTIONAL_TEXT):
+            return self._convert_text(v, field, values)
+
+        if field.dtype == DATE:
+            if pd.api.types.is_datetime64_any_dtype(values):
+                parsed, ok = from_typed_dates(values)
+            else:
+                parsed, ok = to_date(values)
+            self._invalid(v, field, ok)
+            return parsed
+
+        if pd.api.types.is_numeric_dtype(values):
+            # 숫자 타입 컬럼: 빈 값(null)은 문자열 경로의 빈 문자열과 같이 empty_as 로 대체
+            if field.empty_as is not None:
+                values = values.fillna(float(field.empty_as))
+            numbers, ok = from_typed_numbers(values, field.dtype)
+        else:
+            if field.dtype == AMOUNT:
+                values = values.astype(str).str.replace(',', '', regex=False)
+            numbers, ok = NUMERIC_CONVERTERS[field.dtype](values)
+
+        if field.nullable:
+            # 빈 값·변환 실패·NaN 은 오류 없이 None
+            present = (raw.isna() | (raw != '')).to_numpy()
+            if field.only_if is not None:
+                other, expected = field.only_if
+                present &= np.asarray(output[other] == expected, dtype=bool)
+            return np.where(present & ok & ~np.isnan(numbers), numbers, None)
+
+        if field.range_message is not None:
+            # 두 경계: not (min <= v <= max), 한 경계: v < min / v > max (NaN 처리가 행 단위 규칙과 같도록)
+            if field.minimum is not None and field.maximum is not None:
+                out_of_range = ~((field.minimum <= numbers) & (numbers <= field.maximum))
+            elif field.minimum is not None:
+                out_of_range = numbers < field.minimum
+            else:
+                out_of_range = numbers > field.maximum
+            cast = float if field.dtype == FLOAT else int
+            v.add_errors(ok & out_of_range, lambda pos: field.range_message.format(value=cast(numbers[pos])))
+        self._invalid(v, field, ok)
+
+        if field.dtype == FLOAT:
+            return numbers
+        return _as_int(numbers, ok)
+
+    def _convert_text(self, v: FrameValidation, field: FieldSpec, values: pd.Series) -> Any:
+        text = v.text(values)
+        if field.upper:
+            text = text.str.upper()
+        if field.required:
+            v.require(text, field.required)
+        if field.choices:
+            allowed = text.isin(field.choices)
+            if field.choice_message:
+                v.add_errors(~allowed.to_numpy(), lambda pos: field.choice_message.format(value=text.iat[pos]))
+            else:
+                text = text.where(allowed, field.fallback)
+        if field.dtype == OPTIONAL_TEXT:
+            return _or_none(text)
+        return text
+
+    def _invalid(self, v: FrameValidation, field: FieldSpec, ok: np.ndarray) -> None:
+        if field.invalid_message is not None:
+            v.add_errors(~ok, lambda pos: field.invalid_message.format(raw=v.raw(field.name, pos)))
+
+
+NUMERIC_CONVERTERS: Dict[str, Callable[[pd.Series], Tuple[np.ndarray, np.ndarray]]] = {
+    INT: to_int,
+    TRUNCATED_INT: to_truncated_int,
+    AMOUNT: to_truncated_int,
+    FLOAT: to_float,
+}
+
+
+def compile_schema(data_type: str, columns: Iterable[str]) -> CompiledSchema:
+    """데이터 유형 스키마를 파일 헤더에 맞춰 컴파일"""
+    return CompiledSchema(get_schema(data_type), columns)
+
+
+def validate_frame(
+    df: pd.DataFrame,
+    data_type: str,
+    start_row: int = 2,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    데이터 유형에 맞는 컬럼 단위 검증 실행
+
+    Returns:
+        (valid_records, errors) 튜플
+        errors: [{row: int, reason: str, data: dict}] (행 순서)
+    """
+    return compile_schema(data_type, df.columns).validate(df, start_row)
+
+
+def iter_validated_chunks(
+    chunks: Iterable[pd.DataFrame],
+    data_type: str,
+    workers: int = 0,
+    min_rows: int = 0,
+    row_errors: Optional[Dict[int, str]] = None,
+) -> Iterator[Tuple[int, List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    청크를 차례로 검증하여 (행 수, valid_records, errors) 를 원래 순서대로 반환
+
+    workers > 1 이면 min_rows 행 이후의 청크를 ProcessPoolExecutor 로 병렬 검증한다.
+    검증은 순수 CPU 작업(숫자·날짜 파싱, 문자열 처리)이므로 코어 수에 비례해 빨라지고,
+    결과는 제출 순서대로 꺼내므로 행 순서와 오류 순서가 유지된다.
+    호출 측(DB 쓰기)은 그대로 직렬로 실행된다.
+
+    Args:
+        chunks: DataFrame 청크 (iter_csv_chunks 결과 등)
+        data_type: 데이터 유형
+        workers: 검증 프로세스 수 (0 또는 1 이면 현재 프로세스에서 검증)
+        min_rows: 병렬 검증을 시작할 최소 누적 행 수 (작은 파일은 프로세스 기동 비용이 더 큼)
+        row_errors: 필드 검증 외에 덧붙일 파일 전체의 오류 {CSV 행 번호: 메시지} (청크별로 나눠 전달)
+    """
+    get_schema(data_type)
+
+    row_errors = row_errors or {}
+    error_rows = sorted(row_errors)
+    start_row = 2
+    pending = deque()
+    pool = None
+    compiled = None
+    try:
+        for chunk in chunks:
+            if compiled is None:
+                # 헤더 매핑은 파일당 한 번만 해석
+                compiled = compile_schema(data_type, chunk.columns)
+
+            if pool is None and workers > 1 and start_row - 2 >= min_rows:
+                # Django DB 연결·스레드를 물려받지 않도록 spawn 으로 기동 (검증 모듈은 Django 비의존)
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+            lo = bisect.bisect_left(error_rows, start_row)
+            hi = bisect.bisect_left(error_rows, start_row + len(chunk))
+            chunk_errors = {row: row_errors[row] for row in error_rows[lo:hi]}
+
+            if pool is None:
+                yield (len(chunk), *compiled.validate(chunk, start_row, chunk_errors))
+            else:
+                pending.append((len(chunk), pool.submit(compiled.validate, chunk, start_row, chunk_errors)))
+                # 앞선 결과를 소비하면서 진행하여 메모리에 쌓이는 청크 수를 제한
+                if len(pending) >= workers * 2:
+                    size, future = pending.popleft()
+                    yield (size, *future.result())
+            start_row += len(chunk)
+
+        while pending:
+            size, future = pending.popleft()
+            yield (size, *future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
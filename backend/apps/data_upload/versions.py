@@ -0,0 +1,51 @@
+"""
+데이터 유형별 버전 카운터
+
+업로드로 데이터가 바뀔 때마다 해당 data_type 의 버전을 올린다.
+대시보드 캐시 키와 ETag 가 이 버전을 포함하므로, 버전이 바뀌면 그 데이터를 쓰는 응답만 무효화된다.
+
+카운터는 DB(DataVersion)에 저장하므로 업로드 워커나 다른 웹 프로세스가 올린 버전도
+모든 프로세스가 바로 본다 (로컬 메모리 캐시를 써도 무효화가 프로세스 사이에 전달됨).
+새 카운터는 현재 시각 기반 값에서 시작하므로 DB 를 다시 만들어도 예전 캐시 키와 겹치지 않는다.
+"""
+import time
+from typing import Callable, Dict, Iterable
+
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+APP_LABEL = 'data_upload'
+
+
+def _initial() -> int:
+    return time.time_ns() // 1000
+
+
+def data_versions(data_types: Iterable[str], get_model: Callable = apps.get_model) -> Dict[str, int]:
+    """{data_type: 버전} (한 번의 조회, 아직 올린 적 없는 유형은 0)"""
+    data_types = list(data_types)
+    stored = dict(
+        get_model(APP_LABEL, 'DataVersion').objects.filter(
+            data_type__in=data_types
+        ).values_list('data_type', 'version')
+    )
+    return {data_type: stored.get(data_type, 0) for data_type in data_types}
+
+
+def data_version(data_type: str) -> int:
+    return data_versions([data_type])[data_type]
+
+
+def bump_data_version(data_type: str, get_model: Callable = apps.get_model) -> int:
+    """data_type 데이터가 바뀌었음을 기록하고 새 버전 반환"""
+    model = get_model(APP_LABEL, 'DataVersion')
+    with transaction.atomic():
+        if not model.objects.filter(data_type=data_type).update(version=F('version') + 1):
+            try:
+                with transaction.atomic():
+                    return model.objects.create(data_type=data_type, version=_initial()).version
+            except IntegrityError:
+                # 다른 프로세스가 먼저 만듦
+                model.objects.filter(data_type=data_type).update(version=F('version') + 1)
+        return model.objects.values_list('version', flat=True).get(data_type=data_type)
@@ -1,10 +1,32 @@
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.conf import settings
+from django.http import FileResponse
 from config.responses import success_response, error_response
-from .services import process_csv_upload
-from .models import UploadLog
+from .batches import create_upload_batch, run_upload_batch
+from .idempotency import file_sha256, find_previous_upload
+from .jobs import enqueue_upload_job, job_progress
+from .services import (
+    DRY_RUN_FULL,
+    DRY_RUN_PREVIEW,
+    FORMAT_CSV,
+    columnar_formats_available,
+    dry_run_csv_upload,
+    ingest_csv_upload,
+    preview_csv_upload,
+    upload_format,
+)
+from .sessions import (
+    append_session_chunk,
+    claim_upload_session,
+    create_upload_session,
+    discard_session_file,
+    finalize_upload_session,
+    parse_content_range,
+)
+from .models import UploadBatch, UploadJob, UploadLog, UploadSession
+from .schemas import SCHEMAS
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 import json
@@ -17,6 +39,32 @@ class UploadPagination(PageNumberPagination):
     max_page_size = 100
 
 
+# dry_run 요청 값 -> 검증 방식 (빈 값·false 는 실제 업로드)
+DRY_RUN_VALUES = {
+    '': None,
+    'false': None,
+    '0': None,
+    'true': DRY_RUN_FULL,
+    '1': DRY_RUN_FULL,
+    DRY_RUN_FULL: DRY_RUN_FULL,
+    DRY_RUN_PREVIEW: DRY_RUN_PREVIEW,
+}
+
+
+UNSUPPORTED_FORMAT_MESSAGE = "CSV, Parquet, Arrow IPC 파일만 업로드 가능합니다."
+PYARROW_MISSING_MESSAGE = "Parquet/Arrow 파일을 처리하려면 서버에 pyarrow 패키지가 설치되어 있어야 합니다."
+
+
+def check_upload_format(file_name: str):
+    """(업로드 형식, 오류 메시지) - 지원하지 않거나 처리할 수 없는 형식이면 형식은 None"""
+    file_format = upload_format(file_name)
+    if file_format is None:
+        return None, UNSUPPORTED_FORMAT_MESSAGE
+    if file_format != FORMAT_CSV and not columnar_formats_available():
+        return None, PYARROW_MISSING_MESSAGE
+    return file_format, None
+
+
 class UploadView(APIView):
     """
     CSV 파일 업로드 API
@@ -30,9 +78,23 @@ class UploadView(APIView):
         """
         CSV 파일을 업로드하고 파싱하여 데이터베이스에 저장합니다.
         
+        settings.UPLOAD_JOBS_ASYNC 가 True 이면 업로드 작업만 등록하고 202 를 반환합니다.
+        처리 결과는 GET /api/data/upload-jobs/{job_id}/ 로 조회합니다.
+        
+        같은 Idempotency-Key 로 다시 요청하거나, 같은 data_type 의 마지막 업로드와 파일 내용이 같으면
+        데이터를 다시 저장하지 않고 이전 작업/결과를 반환합니다 (deduplicated: true).
+        
+        dry_run 을 보내면 저장하지 않고 검증 결과만 바로(동기) 반환합니다.
+        - true / full: 파일 전체 검증, 추가/수정/변경 없음 행 수 계산
+        - preview: 앞부분과 임의 표본 행만 검증해 오류율·건수 추정 (큰 파일도 즉시 응답)
+        
+        Parquet(.parquet)·Arrow IPC(.arrow, .feather, .ipc) 파일도 CSV 와 같은 헤더·검증 규칙으로 처리합니다.
+        
         Request:
-        - file: CSV 파일 (multipart/form-data)
+        - file: CSV / Parquet / Arrow IPC 파일 (multipart/form-data)
         - data_type: 데이터 유형 ('kpi', 'publication', 'project', 'student')
+        - dry_run: 'true' | 'full' | 'preview' (선택)
+        - Idempotency-Key 헤더 (선택)
         """
         file = request.FILES.get('file')
         data_type = request.data.get('data_type')
@@ -44,48 +106,67 @@ class UploadView(APIView):
         if not data_type:
             return error_response("데이터 유형(data_type)이 제공되지 않았습니다.", status_code=400)
         
-        if data_type not in ['kpi', 'publication', 'project', 'student']:
+        if data_type not in SCHEMAS:
             return error_response(
-                f"지원하지 않는 데이터 유형: {data_type}. (kpi, publication, project, student 중 하나)",
+                f"지원하지 않는 데이터 유형: {data_type}. ({', '.join(SCHEMAS)} 중 하나)",
                 status_code=400
             )
         
-        if not file.name.endswith('.csv'):
-            return error_response("CSV 파일만 업로드 가능합니다.", status_code=400)
+        file_format, format_error = check_upload_format(file.name)
+        if format_error:
+            return error_response(format_error, status_code=400)
         
         # 파일 크기 제한 (100MB)
         if file.size > 100 * 1024 * 1024:
             return error_response("파일 크기는 100MB를 초과할 수 없습니다.", status_code=400)
         
+        dry_run_value = str(request.data.get('dry_run', '')).lower()
+        if dry_run_value not in DRY_RUN_VALUES:
+            return error_response("dry_run 은 true, full, preview 중 하나여야 합니다.", status_code=400)
+        dry_run = DRY_RUN_VALUES[dry_run_value]
+        if dry_run:
+            try:
+                if dry_run == DRY_RUN_PREVIEW:
+                    return success_response(preview_csv_upload(file, data_type, file_format=file_format))
+                return success_response(dry_run_csv_upload(file, data_type, file_format=file_format))
+            except ValueError as e:
+                return error_response(str(e), status_code=400)
+        
+        idempotency_key = request.headers.get('Idempotency-Key') or None
+        if idempotency_key and len(idempotency_key) > 255:
+            return error_response("Idempotency-Key 는 255자를 초과할 수 없습니다.", status_code=400)
+        
+        # 중복 업로드: 이전 작업/결과 재사용
+        content_hash = file_sha256(file)
+        previous = find_previous_upload(request.user, data_type, content_hash, idempotency_key)
+        if isinstance(previous, UploadJob):
+            return success_response({**serialize_upload_job(previous), "deduplicated": True}, status_code=202)
+        if previous is not None:
+            return success_response({**build_upload_result_from_log(previous), "deduplicated": True})
+        
+        # 비동기 모드: 작업만 등록하고 즉시 202 응답 (진행 상황은 upload-jobs API 로 조회)
+        if settings.UPLOAD_JOBS_ASYNC:
+            job = enqueue_upload_job(
+                file, data_type, request.user,
+                content_hash=content_hash, idempotency_key=idempotency_key,
+            )
+            return success_response(serialize_upload_job(job), status_code=202)
+        
         try:
-            # 파일 내용 읽기
-            file_content = file.read()
-            
-            # CSV 처리
-            success_rows, failed_rows, errors = process_csv_upload(
-                file_content=file_content,
+            # CSV 처리 (파일 객체에서 청크 단위로 스트리밍, 큰 파일은 디스크 임시 파일에서 읽음)
+            upload_log, errors = ingest_csv_upload(
+                file_content=file,
                 data_type=data_type,
                 uploaded_by=request.user,
-                file_name=file.name
+                file_name=file.name,
+                content_hash=content_hash,
+                idempotency_key=idempotency_key,
+                file_format=file_format,
             )
             
-            # 최근 업로드 로그 조회
-            upload_log = UploadLog.objects.filter(
-                uploaded_by=request.user,
-                file_name=file.name
-            ).order_by('-created_at').first()
-            
-            response_data = {
-                "status": "success" if failed_rows == 0 else "partial",
-                "message": f"파일 처리 완료. 성공: {success_rows}행, 실패: {failed_rows}행",
-                "upload_id": str(upload_log.id) if upload_log else None,
-                "total_rows": success_rows + failed_rows,
-                "success_rows": success_rows,
-                "failed_rows": failed_rows,
-                "errors": errors[:50],  # 최대 50개만 반환
-            }
+            response_data = build_upload_result(upload_log, errors)
             
-            if failed_rows == 0:
+            if upload_log.failed_rows == 0:
                 return success_response(response_data, status_code=201)
             else:
                 return success_response(response_data, status_code=200)
@@ -96,6 +177,390 @@ class UploadView(APIView):
             return error_response(f"파일 처리 중 오류가 발생했습니다: {str(e)}", status_code=500)
 
 
+def build_upload_result(upload_log, errors):
+    """업로드 처리 결과 응답 데이터 (동기 업로드 응답 및 완료된 작업 조회에 공통 사용)"""
+    success_rows = upload_log.success_rows
+    failed_rows = upload_log.failed_rows
+    return {
+        "status": "success" if failed_rows == 0 else "partial",
+        "message": (
+            f"파일 처리 완료. 성공: {success_rows}행 (추가 {upload_log.inserted_rows}, "
+            f"수정 {upload_log.updated_rows}, 변경 없음 {upload_log.unchanged_rows}), 실패: {failed_rows}행"
+        ),
+        "upload_id": str(upload_log.id),
+        "total_rows": success_rows + failed_rows,
+        "success_rows": success_rows,
+        "failed_rows": failed_rows,
+        "inserted_rows": upload_log.inserted_rows,
+        "updated_rows": upload_log.updated_rows,
+        "unchanged_rows": upload_log.unchanged_rows,
+        "errors": errors[:50],  # 최대 50개만 반환
+    }
+
+
+def build_upload_result_from_log(upload_log):
+    """저장된 업로드 로그(error_details)로 처리 결과 응답 데이터 재구성"""
+    errors = []
+    if upload_log.error_details:
+        try:
+            errors = json.loads(upload_log.error_details)
+        except json.JSONDecodeError:
+            errors = []
+    return build_upload_result(upload_log, errors)
+
+
+def serialize_upload_job(job):
+    """업로드 작업 상태 응답 데이터"""
+    response_data = {
+        "job_id": str(job.id),
+        "status": job.status,
+        "file_name": job.file_name,
+        "data_type": job.data_type,
+        "rows_processed": job.rows_processed,
+        "bytes_processed": job.bytes_processed,
+        "bytes_total": job.bytes_total,
+        **job_progress(job),
+        "upload_id": str(job.upload_log_id) if job.upload_log_id else None,
+        "error": job.error_message,
+        "result": None,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+    
+    if job.status == UploadJob.STATUS_DONE and job.upload_log:
+        response_data["result"] = build_upload_result_from_log(job.upload_log)
+    
+    return response_data
+
+
+class UploadJobDetailView(APIView):
+    """
+    비동기 업로드 작업 상태 조회 API
+    GET /api/data/upload-jobs/{id}/
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, pk):
+        """
+        작업 상태(queued, running, done, failed)와 처리 행 수, 처리량, 남은 예상 시간을 조회합니다.
+        """
+        try:
+            job = UploadJob.objects.select_related('upload_log').get(pk=pk, uploaded_by=request.user)
+        except UploadJob.DoesNotExist:
+            return error_response("업로드 작업을 찾을 수 없습니다.", status_code=404)
+        
+        return success_response(serialize_upload_job(job))
+
+
+def serialize_upload_batch(batch):
+    """일괄 업로드 상태 및 합산 결과 응답 데이터 (파일별 작업·업로드 로그 포함)"""
+    jobs = list(batch.jobs.select_related('upload_log').order_by('file_name'))
+    statuses = {job.status for job in jobs}
+    finished = {UploadJob.STATUS_DONE, UploadJob.STATUS_FAILED}
+    if not statuses <= finished:
+        status = UploadJob.STATUS_QUEUED if statuses == {UploadJob.STATUS_QUEUED} else UploadJob.STATUS_RUNNING
+    elif UploadJob.STATUS_FAILED not in statuses:
+        status = UploadJob.STATUS_DONE
+    else:
+        status = UploadJob.STATUS_FAILED if statuses == {UploadJob.STATUS_FAILED} else "partial"
+    
+    logs = [job.upload_log for job in jobs if job.upload_log]
+    return {
+        "batch_id": str(batch.id),
+        "status": status,
+        "file_count": batch.file_count,
+        "finished_files": sum(job.status in finished for job in jobs),
+        "total_rows": sum(log.total_rows for log in logs),
+        "success_rows": sum(log.success_rows for log in logs),
+        "failed_rows": sum(log.failed_rows for log in logs),
+        "inserted_rows": sum(log.inserted_rows for log in logs),
+        "updated_rows": sum(log.updated_rows for log in logs),
+        "unchanged_rows": sum(log.unchanged_rows for log in logs),
+        "upload_ids": [str(log.id) for log in logs],
+        "jobs": [serialize_upload_job(job) for job in jobs],
+        "created_at": batch.created_at.isoformat(),
+    }
+
+
+class UploadBatchView(APIView):
+    """
+    일괄 업로드 API (CSV 여러 개 또는 ZIP)
+    POST /api/data/upload-batches/
+    """
+    
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+    
+    def post(self, request):
+        """
+        여러 파일을 한 번에 업로드합니다. 파일마다 헤더로 데이터 유형을 판별해 작업으로 등록하며,
+        서로 다른 데이터 유형의 파일은 동시에 처리됩니다.
+        
+        settings.UPLOAD_JOBS_ASYNC 가 True 이면 작업만 등록하고 202 를 반환합니다.
+        진행 상황과 합산 결과는 GET /api/data/upload-batches/{batch_id}/ 로 조회합니다.
+        
+        Request:
+        - files: CSV 또는 ZIP 파일 (여러 개, multipart/form-data)
+        
+        Response:
+        - skipped: 판별할 수 없거나 CSV 가 아니어서 건너뛴 파일
+        """
+        files = request.FILES.getlist('files') or request.FILES.getlist('file')
+        if not files:
+            return error_response("파일이 제공되지 않았습니다.", status_code=400)
+        
+        try:
+            batch, skipped = create_upload_batch(files, request.user)
+        except ValueError as e:
+            return error_response(str(e), status_code=400)
+        
+        if batch is None:
+            return error_response("처리할 수 있는 CSV 파일이 없습니다.", errors={"skipped": skipped}, status_code=400)
+        
+        if settings.UPLOAD_JOBS_ASYNC:
+            return success_response({**serialize_upload_batch(batch), "skipped": skipped}, status_code=202)
+        
+        run_upload_batch(batch)
+        return success_response({**serialize_upload_batch(batch), "skipped": skipped})
+
+
+class UploadBatchDetailView(APIView):
+    """
+    일괄 업로드 상태 조회 API
+    GET /api/data/upload-batches/{id}/
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, pk):
+        """
+        파일별 작업 상태와 완료된 업로드 로그의 합산 결과를 조회합니다.
+        """
+        try:
+            batch = UploadBatch.objects.get(pk=pk, uploaded_by=request.user)
+        except UploadBatch.DoesNotExist:
+            return error_response("일괄 업로드를 찾을 수 없습니다.", status_code=404)
+        
+        return success_response(serialize_upload_batch(batch))
+
+
+def serialize_upload_session(session):
+    """분할 업로드 세션 상태 응답 데이터"""
+    return {
+        "session_id": str(session.id),
+        "status": session.status,
+        "file_name": session.file_name,
+        "data_type": session.data_type,
+        "total_size": session.total_size,
+        "received_bytes": session.received_bytes,
+        "max_chunk_size": settings.UPLOAD_SESSION_MAX_CHUNK,
+        "job_id": str(session.upload_job_id) if session.upload_job_id else None,
+        "upload_id": str(session.upload_log_id) if session.upload_log_id else None,
+        "created_at": session.created_at.isoformat(),
+    }
+
+
+class UploadSessionCreateView(APIView):
+    """
+    재개 가능한 분할 업로드 세션 생성 API
+    POST /api/data/upload-sessions/
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        """
+        분할 업로드 세션을 만듭니다. 100MB 를 넘는 파일도 업로드할 수 있습니다.
+        
+        Request:
+        - file_name: 파일명 (.csv, .parquet, .arrow, .feather, .ipc)
+        - data_type: 데이터 유형 ('kpi', 'publication', 'project', 'student')
+        - total_size: 전체 파일 크기 (바이트)
+        """
+        file_name = request.data.get('file_name')
+        data_type = request.data.get('data_type')
+        total_size = request.data.get('total_size')
+        
+        if not file_name:
+            return error_response("파일명(file_name)이 제공되지 않았습니다.", status_code=400)
+        
+        if data_type not in SCHEMAS:
+            return error_response(
+                f"지원하지 않는 데이터 유형: {data_type}. ({', '.join(SCHEMAS)} 중 하나)",
+                status_code=400
+            )
+        
+        _, format_error = check_upload_format(file_name)
+        if format_error:
+            return error_response(format_error, status_code=400)
+        
+        try:
+            total_size = int(total_size)
+        except (TypeError, ValueError):
+            return error_response("파일 크기(total_size)가 올바르지 않습니다.", status_code=400)
+        
+        if total_size <= 0:
+            return error_response("파일 크기(total_size)가 올바르지 않습니다.", status_code=400)
+        
+        if total_size > settings.UPLOAD_SESSION_MAX_SIZE:
+            return error_response(
+                f"파일 크기는 {settings.UPLOAD_SESSION_MAX_SIZE // 1024 ** 2}MB를 초과할 수 없습니다.",
+                status_code=400
+            )
+        
+        session = create_upload_session(file_name, data_type, total_size, request.user)
+        return success_response(serialize_upload_session(session), status_code=201)
+
+
+class UploadSessionDetailView(APIView):
+    """
+    분할 업로드 세션 API
+    GET    /api/data/upload-sessions/{id}/  받은 바이트 수 조회
+    PUT    /api/data/upload-sessions/{id}/  바이트 범위 전송 (Content-Range: bytes start-end/total)
+    DELETE /api/data/upload-sessions/{id}/  세션 취소
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get_session(self, request, pk):
+        try:
+            return UploadSession.objects.get(pk=pk, uploaded_by=request.user)
+        except UploadSession.DoesNotExist:
+            return None
+    
+    def get(self, request, pk):
+        """
+        세션 상태를 조회합니다. 연결이 끊긴 경우 received_bytes 위치부터 이어서 전송합니다.
+        """
+        session = self.get_session(request, pk)
+        if session is None:
+            return error_response("업로드 세션을 찾을 수 없습니다.", status_code=404)
+        
+        return success_response(serialize_upload_session(session))
+    
+    def put(self, request, pk):
+        """
+        요청 본문(application/octet-stream)을 Content-Range 위치에 기록합니다.
+        
+        범위 시작은 현재 received_bytes 와 같아야 하며, 다르면 409 와 함께 현재 위치를 반환합니다.
+        """
+        session = self.get_session(request, pk)
+        if session is None:
+            return error_response("업로드 세션을 찾을 수 없습니다.", status_code=404)
+        
+        if session.status != UploadSession.STATUS_OPEN:
+            return error_response("이미 완료된 업로드 세션입니다.", status_code=409)
+        
+        try:
+            start, end, total = parse_content_range(request.headers.get('Content-Range'))
+        except ValueError as e:
+            return error_response(str(e), status_code=400)
+        
+        length = end - start + 1
+        if total != session.total_size:
+            return error_response("Content-Range 의 전체 크기가 세션과 다릅니다.", status_code=400)
+        
+        if length > settings.UPLOAD_SESSION_MAX_CHUNK:
+            return error_response(
+                f"한 번에 보낼 수 있는 크기는 {settings.UPLOAD_SESSION_MAX_CHUNK}바이트입니다.",
+                status_code=400
+            )
+        
+        if request.headers.get('Content-Length') not in (None, '', str(length)):
+            return error_response("Content-Length 가 Content-Range 와 일치하지 않습니다.", status_code=400)
+        
+        if start != session.received_bytes:
+            return error_response(
+                f"전송 위치가 맞지 않습니다. {session.received_bytes}바이트부터 이어서 보내주세요.",
+                errors={"received_bytes": session.received_bytes},
+                status_code=409
+            )
+        
+        try:
+            advanced = append_session_chunk(session, start, request.stream, length)
+        except ValueError as e:
+            return error_response(str(e), status_code=400)
+        
+        if not advanced:
+            session.refresh_from_db()
+            return error_response(
+                f"전송 위치가 맞지 않습니다. {session.received_bytes}바이트부터 이어서 보내주세요.",
+                errors={"received_bytes": session.received_bytes},
+                status_code=409
+            )
+        
+        return success_response(serialize_upload_session(session))
+    
+    def delete(self, request, pk):
+        """
+        진행 중인 세션을 취소하고 임시 파일을 삭제합니다.
+        """
+        session = self.get_session(request, pk)
+        if session is None:
+            return error_response("업로드 세션을 찾을 수 없습니다.", status_code=404)
+        
+        # finalize 와 동시에 들어와도 open 상태인 세션만 삭제
+        deleted, _ = UploadSession.objects.filter(pk=session.pk, status=UploadSession.STATUS_OPEN).delete()
+        if not deleted:
+            return error_response("이미 처리 중이거나 완료된 업로드 세션입니다.", status_code=409)
+        
+        discard_session_file(session)
+        return success_response({"session_id": str(pk)})
+
+
+class UploadSessionFinalizeView(APIView):
+    """
+    분할 업로드 완료 API
+    POST /api/data/upload-sessions/{id}/finalize/
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request, pk):
+        """
+        모든 바이트를 받은 세션의 파일을 CSV 처리 파이프라인에 넘깁니다.
+        
+        응답은 POST /api/data/upload/ 와 같습니다 (비동기 모드 202 작업, 동기 모드 처리 결과).
+        """
+        try:
+            session = UploadSession.objects.get(pk=pk, uploaded_by=request.user)
+        except UploadSession.DoesNotExist:
+            return error_response("업로드 세션을 찾을 수 없습니다.", status_code=404)
+        
+        if session.status != UploadSession.STATUS_OPEN:
+            return error_response("이미 완료된 업로드 세션입니다.", status_code=409)
+        
+        if session.received_bytes != session.total_size:
+            return error_response(
+                f"아직 모든 바이트를 받지 않았습니다. ({session.received_bytes}/{session.total_size})",
+                errors={"received_bytes": session.received_bytes},
+                status_code=409
+            )
+        
+        # 동시에 들어온 finalize 요청 중 하나만 진행
+        if not claim_upload_session(session):
+            return error_response("이미 처리 중이거나 완료된 업로드 세션입니다.", status_code=409)
+        
+        try:
+            if settings.UPLOAD_JOBS_ASYNC:
+                job = finalize_upload_session(session, run_async=True)
+                return success_response(serialize_upload_job(job), status_code=202)
+            upload_log, errors = finalize_upload_session(session, run_async=False)
+        except ValueError as e:
+            return error_response(str(e), status_code=400)
+        except Exception as e:
+            return error_response(f"파일 처리 중 오류가 발생했습니다: {str(e)}", status_code=500)
+        
+        response_data = build_upload_result(upload_log, errors)
+        
+        if upload_log.failed_rows == 0:
+            return success_response(response_data, status_code=201)
+        else:
+            return success_response(response_data, status_code=200)
+
+
 class UploadLogListView(APIView):
     """
     업로드 이력 목록 조회 API
@@ -196,7 +661,11 @@ class UploadLogDetailView(APIView):
             "total_rows": upload_log.total_rows,
             "success_rows": upload_log.success_rows,
             "failed_rows": upload_log.failed_rows,
+            "inserted_rows": upload_log.inserted_rows,
+            "updated_rows": upload_log.updated_rows,
+            "unchanged_rows": upload_log.unchanged_rows,
             "error_details": error_details,
+            "error_report_available": bool(upload_log.error_report_path),
             "uploaded_by": {
                 "id": upload_log.uploaded_by.id,
                 "username": upload_log.uploaded_by.username,
@@ -206,3 +675,37 @@ class UploadLogDetailView(APIView):
         }
         
         return success_response(response_data)
+
+
+class UploadLogErrorReportView(APIView):
+    """
+    업로드 전체 오류 보고서 다운로드 API
+    GET /api/data/upload-logs/{id}/errors/
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, pk):
+        """
+        실패한 모든 행(행 번호, 오류, 원본 데이터)을 gzip 압축 CSV 로 내려받습니다.
+        """
+        try:
+            upload_log = UploadLog.objects.get(pk=pk, uploaded_by=request.user)
+        except UploadLog.DoesNotExist:
+            return error_response("업로드 이력을 찾을 수 없습니다.", status_code=404)
+        
+        if not upload_log.error_report_path:
+            return error_response("오류 보고서가 없습니다.", status_code=404)
+        
+        try:
+            report = open(upload_log.error_report_path, 'rb')
+        except OSError:
+            return error_response("오류 보고서 파일을 찾을 수 없습니다.", status_code=404)
+        
+        stem = upload_log.file_name.rsplit('.', 1)[0]
+        return FileResponse(
+            report,
+            as_attachment=True,
+            filename=f"{stem}_errors.csv.gz",
+            content_type='application/gzip',
+        )
@@ -0,0 +1,6 @@
+"""
+업로드 성능 벤치마크
+
+- synthetic.py: docs/samples 의 컬럼 구성으로 만드는 합성 CSV
+- upload.py: process_csv_upload 종단 간 벤치마크 (처리량, 최대 메모리, 쿼리 수)
+"""
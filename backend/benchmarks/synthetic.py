@@ -0,0 +1,166 @@
+"""
+벤치마크용 합성 CSV 생성
+
+docs/samples/*.csv 의 컬럼 순서와 값을 바탕으로 원하는 행 수의 CSV 를 만든다.
+헤더는 업로드 스키마(apps/data_upload/schemas.py)가 받는 첫 번째 헤더 후보를 쓰므로
+기존 검증기를 그대로 통과하고, 지정한 비율만큼 검증 오류 행과 자연키 중복 행을 섞는다.
+
+행은 한 줄씩 스트림에 쓰므로 100만 행도 메모리에 모두 올리지 않는다.
+"""
+import csv
+import io
+import random
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, NamedTuple, Tuple
+
+from apps.data_upload.duplicates import DUPLICATE_FIRST, DUPLICATE_LAST, DUPLICATE_POLICIES
+from apps.data_upload.schemas import AMOUNT, get_schema
+
+SAMPLES_DIR = Path(__file__).resolve().parents[2] / 'docs' / 'samples'
+
+SAMPLE_FILES = {
+    'kpi': 'department_kpi.csv',
+    'publication': 'publication_list.csv',
+    'project': 'research_project_data.csv',
+    'student': 'student_roster.csv',
+}
+
+# 검증에 걸리는 값 (자연키가 아닌 컬럼만 바꾸므로 중복 판정에 영향을 주지 않는다)
+INVALID_VALUES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    'kpi': (('employment_rate', '120'), ('fulltime_faculty_count', '-3'), ('intl_conference_count', 'abc')),
+    'publication': (('journal_grade', 'SSCI'), ('publication_date', 'not-a-date')),
+    'project': (('total_budget', '-1000'), ('execution_date', '2023-13-45'), ('expense_amount', 'abc')),
+    'student': (('grade', '7'), ('gender', 'X'), ('admission_year', '1990')),
+}
+
+# 행 번호 → 자연키 값 (행마다 서로 다른 키)
+KEY_FACTORIES: Dict[str, Callable[[int, List[List[str]]], Dict[str, str]]] = {
+    'kpi': lambda index, pools: {
+        'evaluation_year': str(2023 + index % 3),
+        'department': f"{pools[2][index % len(pools[2])]}-{index // 3:07d}",
+    },
+    'publication': lambda index, pools: {'publication_id': f"PUB-{index:08d}"},
+    'project': lambda index, pools: {'execution_id': f"T{index:08d}"},
+    'student': lambda index, pools: {'student_id': str(20000000 + index)},
+}
+
+
+class SyntheticFile(NamedTuple):
+    """생성한 CSV 요약 (expected_failed_rows: 업로드 시 오류가 되어야 하는 행 수)"""
+    rows: int
+    invalid_rows: int
+    duplicate_rows: int
+    expected_failed_rows: int
+
+
+def sample_columns(data_type: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    샘플 CSV 의 컬럼을 스키마 필드 순서로 읽기
+
+    Returns:
+        (헤더, 컬럼별 값 목록)
+    """
+    schema = get_schema(data_type)
+    with open(SAMPLES_DIR / SAMPLE_FILES[data_type], encoding='utf-8-sig', newline='') as f:
+        sample_header, *rows = list(csv.reader(f))
+    if len(sample_header) != len(schema.fields):
+        raise ValueError(f"샘플 컬럼 수가 스키마와 다릅니다: {data_type}")
+    header = [field.header_candidates[0] for field in schema.fields]
+    pools = [[row[i] for row in rows] for i in range(len(header))]
+    return header, pools
+
+
+def _failed_rows(occurrences: Dict[int, List[int]], invalid: set, policy: str) -> int:
+    """중복 키 처리 방식대로 저장하지 않는 행과 검증 오류 행의 합집합 크기 (중복은 유효한 행끼리만)"""
+    failed = set(invalid)
+    for rows in occurrences.values():
+        rows = [row for row in rows if row not in invalid]
+        if len(rows) < 2:
+            continue
+        if policy == DUPLICATE_LAST:
+            failed.update(rows[:-1])
+        elif policy == DUPLICATE_FIRST:
+            failed.update(rows[1:])
+        else:
+            failed.update(rows)
+    return len(failed)
+
+
+def write_synthetic_csv(
+    target: BinaryIO,
+    data_type: str,
+    rows: int,
+    invalid_rate: float = 0.0,
+    duplicate_rate: float = 0.0,
+    seed: int = 0,
+    duplicate_policy: str = DUPLICATE_LAST,
+) -> SyntheticFile:
+    """
+    합성 CSV 를 target 에 UTF-8(BOM) 으로 쓰기
+
+    Args:
+        target: 바이너리 스트림 (파일 위치는 쓴 끝에 남는다)
+        data_type: 데이터 유형 ('kpi', 'publication', 'project', 'student')
+        rows: 데이터 행 수
+        invalid_rate: 검증 오류 행 비율 (0~1)
+        duplicate_rate: 앞쪽 행의 자연키를 다시 쓰는 행 비율 (0~1)
+        seed: 난수 시드 (같은 인자면 같은 파일)
+        duplicate_policy: expected_failed_rows 계산에 쓸 중복 키 처리 방식
+    """
+    if duplicate_policy not in DUPLICATE_POLICIES:
+        raise ValueError(f"지원하지 않는 중복 키 처리 방식: {duplicate_policy}")
+
+    schema = get_schema(data_type)
+    header, pools = sample_columns(data_type)
+    positions = {field.name: i for i, field in enumerate(schema.fields)}
+    amount_columns = [i for i, field in enumerate(schema.fields) if field.dtype == AMOUNT]
+    make_key = KEY_FACTORIES[data_type]
+    invalid_values = INVALID_VALUES[data_type]
+    rng = random.Random(seed)
+
+    duplicate_of: Dict[int, int] = {}
+    occurrences: Dict[int, List[int]] = {}
+    invalid = set()
+
+    text = io.TextIOWrapper(target, encoding='utf-8-sig', newline='')
+    writer = csv.writer(text)
+    writer.writerow(header)
+    for index in range(rows):
+        row = [rng.choice(pool) for pool in pools]
+
+        key_index = index
+        if index and rng.random() < duplicate_rate:
+            key_index = rng.randrange(index)
+            key_index = duplicate_of.get(key_index, key_index)
+            duplicate_of[index] = key_index
+            occurrences.setdefault(key_index, [key_index]).append(index)
+        for name, value in make_key(key_index, pools).items():
+            row[positions[name]] = value
+
+        # 금액은 절반 정도 천 단위 구분 기호로 (예: "500,000,000")
+        for i in amount_columns:
+            if row[i].isdigit() and rng.random() < 0.5:
+                row[i] = f"{int(row[i]):,}"
+
+        if rng.random() < invalid_rate:
+            name, value = rng.choice(invalid_values)
+            row[positions[name]] = value
+            invalid.add(index)
+
+        writer.writerow(row)
+    text.flush()
+    text.detach()
+
+    return SyntheticFile(
+        rows=rows,
+        invalid_rows=len(invalid),
+        duplicate_rows=len(duplicate_of),
+        expected_failed_rows=_failed_rows(occurrences, invalid, duplicate_policy),
+    )
+
+
+def synthetic_csv_bytes(data_type: str, rows: int, **options) -> Tuple[bytes, SyntheticFile]:
+    """작은 합성 CSV 를 바이트로 (테스트용)"""
+    buffer = io.BytesIO()
+    summary = write_synthetic_csv(buffer, data_type, rows, **options)
+    return buffer.getvalue(), summary
@@ -0,0 +1,58 @@
+"""
+합성 CSV 생성기와 업로드 벤치마크 테스트
+"""
+import pytest
+from apps.data_upload.duplicates import DUPLICATE_REJECT
+from apps.data_upload.services import parse_csv_file, process_csv_upload
+from benchmarks.synthetic import SAMPLE_FILES, synthetic_csv_bytes
+from benchmarks.upload import compare, run_case
+
+
+@pytest.mark.parametrize('data_type', list(SAMPLE_FILES))
+def test_valid_rows_pass_existing_validators(user, data_type):
+    content, generated = synthetic_csv_bytes(data_type, 300, seed=1)
+
+    success_rows, failed_rows, errors = process_csv_upload(content, data_type, user, 'synthetic.csv')
+
+    assert (success_rows, failed_rows) == (300, 0), errors[:3]
+    assert generated == (300, 0, 0, 0)
+
+
+@pytest.mark.parametrize('data_type', list(SAMPLE_FILES))
+def test_invalid_and_duplicate_rows_fail_as_expected(user, data_type):
+    content, generated = synthetic_csv_bytes(data_type, 500, invalid_rate=0.1, duplicate_rate=0.1, seed=2)
+
+    success_rows, failed_rows, _ = process_csv_upload(content, data_type, user, 'synthetic.csv')
+
+    assert generated.invalid_rows > 0 and generated.duplicate_rows > 0
+    assert failed_rows == generated.expected_failed_rows
+    assert success_rows == 500 - failed_rows
+
+
+def test_same_seed_same_file():
+    assert synthetic_csv_bytes('project', 50, seed=3) == synthetic_csv_bytes('project', 50, seed=3)
+    content, _ = synthetic_csv_bytes('project', 50, seed=3)
+    assert any(',' in value for value in parse_csv_file(content)['total_budget'])
+
+
+def test_reject_policy_counts_every_occurrence(user, settings):
+    settings.CSV_DUPLICATE_KEY_POLICY = DUPLICATE_REJECT
+    content, generated = synthetic_csv_bytes(
+        'student', 300, duplicate_rate=0.2, seed=4, duplicate_policy=DUPLICATE_REJECT,
+    )
+
+    _, failed_rows, _ = process_csv_upload(content, 'student', user, 'synthetic.csv')
+
+    assert failed_rows == generated.expected_failed_rows > generated.duplicate_rows
+
+
+def test_run_case_reports_metrics(user):
+    result = run_case('kpi', 200, user, invalid_rate=0.05, duplicate_rate=0.05)
+
+    assert result['failed_rows'] == result['expected_failed_rows']
+    assert result['rows_per_second'] > 0
+    assert result['peak_memory_bytes'] > 0
+    assert result['queries'] > 0
+
+    lines = compare([result], {"results": [dict(result, rows_per_second=result['rows_per_second'] / 2)]})
+    assert '2.00x' in lines[0]
@@ -0,0 +1,90 @@
+"""
+검증 함수 마이크로 벤치마크 테스트
+"""
+import json
+import pytest
+from benchmarks.validators import (
+    BASELINE_PATH,
+    PARSE_ROWS,
+    PIPELINE_ROWS,
+    VALIDATOR_ROWS,
+    build_cases,
+    find_regressions,
+    measure,
+)
+
+
+@pytest.fixture(scope='module')
+def cases():
+    return {case.name: case for case in build_cases()}
+
+
+def test_inputs_match_case_kind(cases):
+    """valid/edge 입력은 모두 통과하고 invalid 입력은 모두 오류여야 측정이 의미 있음"""
+    for name, case in cases.items():
+        if name.startswith('iter_csv_chunks'):
+            [chunk] = case.func(*case.inputs[0])
+            assert len(chunk) == PARSE_ROWS
+            continue
+        if name.startswith('iter_validated_chunks'):
+            rows, valid, errors = case.func(*case.inputs[0])
+            assert rows == valid + errors == PIPELINE_ROWS, name
+            assert valid and errors, name
+            continue
+        results = [case.func(*args) for args in case.inputs]
+        rows = sum(len(chunk) for _, chunk in case.inputs)
+        if name.endswith('/invalid'):
+            assert rows == VALIDATOR_ROWS
+            assert sum(len(errors) for _, errors in results) == rows, name
+        else:
+            assert sum(len(records) for records, _ in results) == rows, name
+            assert not any(errors for _, errors in results), name
+
+
+def test_only_pipeline_validators_measured(cases):
+    """업로드 경로에서 쓰지 않는 행 단위 검증 함수는 측정하지 않음"""
+    assert {name.split('/')[0] for name in cases} == {
+        'iter_csv_chunks', 'CompiledSchema.validate', 'iter_validated_chunks',
+    }
+    for data_type in ('kpi', 'publication', 'project', 'student'):
+        assert f'iter_validated_chunks/{data_type}' in cases
+        for kind in ('valid', 'invalid', 'edge'):
+            assert f'CompiledSchema.validate/{data_type}/{kind}' in cases
+
+
+def test_bom_and_comma_amounts(cases):
+    [with_bom] = cases['iter_csv_chunks/bom'].func(*cases['iter_csv_chunks/bom'].inputs[0])
+    [without_bom] = cases['iter_csv_chunks/no_bom'].func(*cases['iter_csv_chunks/no_bom'].inputs[0])
+    assert list(with_bom.columns) == list(without_bom.columns)
+    assert with_bom.columns[0] == 'student_id'
+
+    edge = cases['CompiledSchema.validate/project/edge']
+    records, _ = edge.func(*edge.inputs[0])
+    assert records[0]['total_budget'] == 1_200_000_000
+
+
+def test_baseline_covers_every_case(cases):
+    baseline = json.loads(BASELINE_PATH.read_text(encoding='utf-8'))
+
+    assert set(baseline['cases']) == set(cases)
+
+
+def test_measure_and_regression_threshold(cases):
+    current = measure([cases['CompiledSchema.validate/kpi/edge']], number=2, repeat=1)
+    baseline = {
+        "calibration": current['calibration'],
+        "cases": {'CompiledSchema.validate/kpi/edge': current['cases']['CompiledSchema.validate/kpi/edge'] / 2},
+    }
+
+    [item] = find_regressions(current, baseline, threshold=0.5)
+    assert item['ratio'] == pytest.approx(2)
+    assert item['regressed']
+    assert not find_regressions(current, baseline, threshold=1.5)[0]['regressed']
+
+
+def test_calibration_scales_baseline():
+    """기계가 두 배 느리면 기준 작업도 두 배 느리므로 회귀가 아님"""
+    baseline = {"calibration": 1.0, "cases": {'a': 1.0}}
+    current = {"calibration": 2.0, "cases": {'a': 2.1}}
+
+    assert find_regressions(current, baseline, threshold=0.1) == [{"name": 'a', "ratio": 1.05, "regressed": False}]
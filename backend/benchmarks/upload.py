@@ -0,0 +1,220 @@
+"""
+CSV 업로드 종단 간 벤치마크
+
+데이터 유형·행 수마다 합성 CSV 를 만들어 process_csv_upload 로 적재하고
+처리량(행/초), 최대 메모리(tracemalloc), 실행한 쿼리 수를 JSON 으로 남긴다.
+설정된 데이터베이스의 테스트 DB(test_<DB_NAME>)를 만들어 쓰고 끝나면 지운다.
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.upload
+    python -m benchmarks.upload --data-types student kpi --rows 10000 100000 --output before.json
+    python -m benchmarks.upload --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List
+
+DEFAULT_ROWS = (10_000, 100_000, 1_000_000)
+
+
+@contextmanager
+def count_queries(connection) -> Iterator[List[int]]:
+    """실행한 쿼리 수 (쿼리 문자열은 보관하지 않음, COPY 는 포함되지 않음)"""
+    counter = [0]
+
+    def wrapper(execute, sql, params, many, context):
+        counter[0] += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(wrapper):
+        yield counter
+
+
+def _reset_tables(model) -> None:
+    from django.db import connection
+
+    from apps.data_upload.models import UploadLog
+
+    with connection.cursor() as cursor:
+        for table in (model._meta.db_table, UploadLog._meta.db_table):
+            cursor.execute(f"DELETE FROM {table}")
+
+
+def run_case(
+    data_type: str,
+    rows: int,
+    user,
+    invalid_rate: float = 0.01,
+    duplicate_rate: float = 0.005,
+    seed: int = 0,
+    measure_memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    합성 CSV 하나를 빈 테이블에 적재해 측정
+
+    시간·쿼리 수와 메모리는 따로 측정한다 (tracemalloc 이 처리 속도를 떨어뜨리므로).
+    """
+    from django.conf import settings
+    from django.db import connection
+
+    from apps.data_upload.services import process_csv_upload, upsert_target
+    from benchmarks.synthetic import write_synthetic_csv
+
+    model, _ = upsert_target(data_type)
+    with tempfile.TemporaryFile() as source:
+        generated = write_synthetic_csv(
+            source, data_type, rows, invalid_rate, duplicate_rate, seed,
+            duplicate_policy=settings.CSV_DUPLICATE_KEY_POLICY,
+        )
+        file_bytes = source.tell()
+        file_name = f"bench_{data_type}_{rows}.csv"
+
+        _reset_tables(model)
+        source.seek(0)
+        with count_queries(connection) as queries:
+            started = time.perf_counter()
+            success_rows, failed_rows, _ = process_csv_upload(source, data_type, user, file_name)
+            seconds = time.perf_counter() - started
+
+        peak_memory = None
+        if measure_memory:
+            _reset_tables(model)
+            source.seek(0)
+            tracemalloc.start()
+            try:
+                process_csv_upload(source, data_type, user, file_name)
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        _reset_tables(model)
+
+    return {
+        "data_type": data_type,
+        "rows": rows,
+        "invalid_rate": invalid_rate,
+        "duplicate_rate": duplicate_rate,
+        "file_bytes": file_bytes,
+        "seconds": round(seconds, 4),
+        "rows_per_second": round(rows / seconds, 1) if seconds else None,
+        "peak_memory_bytes": peak_memory,
+        "queries": queries[0],
+        "success_rows": success_rows,
+        "failed_rows": failed_rows,
+        "expected_failed_rows": generated.expected_failed_rows,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    import django
+    from django.conf import settings
+    from django.db import connection
+
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "settings": {
+            name: getattr(settings, name)
+            for name in (
+                'CSV_UPLOAD_CHUNK_ROWS', 'CSV_VALIDATION_WORKERS', 'CSV_UPLOAD_USE_COPY',
+                'CSV_UPLOAD_COMMIT_MODE', 'CSV_UPLOAD_COMMIT_ROWS', 'CSV_DUPLICATE_KEY_POLICY',
+            )
+        },
+    }
+
+
+def compare(results: List[Dict[str, Any]], previous: Dict[str, Any]) -> List[str]:
+    """이전 결과 파일과 같은 (데이터 유형, 행 수) 끼리 처리량·메모리 비교"""
+    before = {(result['data_type'], result['rows']): result for result in previous['results']}
+    lines = []
+    for result in results:
+        old = before.get((result['data_type'], result['rows']))
+        if not old or not old['rows_per_second'] or not result['rows_per_second']:
+            continue
+        line = (
+            f"{result['data_type']:<12}{result['rows']:>10,}행  "
+            f"{old['rows_per_second']:>12,.0f} → {result['rows_per_second']:>12,.0f} 행/초 "
+            f"({result['rows_per_second'] / old['rows_per_second']:.2f}x)"
+        )
+        if old['peak_memory_bytes'] and result['peak_memory_bytes']:
+            line += f"  메모리 {result['peak_memory_bytes'] / old['peak_memory_bytes']:.2f}x"
+        lines.append(line)
+    return lines
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="CSV 업로드 종단 간 벤치마크")
+    parser.add_argument('--data-types', nargs='+', default=['kpi', 'publication', 'project', 'student'])
+    parser.add_argument('--rows', nargs='+', type=int, default=list(DEFAULT_ROWS))
+    parser.add_argument('--invalid-rate', type=float, default=0.01, help="검증 오류 행 비율")
+    parser.add_argument('--duplicate-rate', type=float, default=0.005, help="자연키 중복 행 비율")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="메모리 측정(두 번째 적재) 생략")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본값: 표준 출력)")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test.utils import override_settings
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        with tempfile.TemporaryDirectory() as report_dir, override_settings(UPLOAD_ERROR_REPORT_DIR=report_dir):
+            user = get_user_model().objects.create_user(username='benchmark', password=None)
+            results = []
+            for data_type in args.data_types:
+                for rows in args.rows:
+                    result = run_case(
+                        data_type, rows, user, args.invalid_rate, args.duplicate_rate, args.seed,
+                        measure_memory=not args.no_memory,
+                    )
+                    print(
+                        f"{data_type:<12}{rows:>10,}행  {result['rows_per_second']:>12,.0f} 행/초  "
+                        f"쿼리 {result['queries']:,}",
+                        file=sys.stderr,
+                    )
+                    results.append(result)
+            document = {"environment": environment(), "results": results}
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    output = json.dumps(document, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+        for line in compare(results, previous):
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+CSV 파싱·검증 마이크로 벤치마크
+
+업로드 파이프라인이 실제로 실행하는 경로를 데이터 유형별로 측정한다.
+
+- iter_csv_chunks: CSV 청크 파싱 (BOM 유무, 따옴표로 감싼 천 단위 금액)
+- CompiledSchema.validate: 청크 하나의 컬럼 단위 검증 (정상/오류/경계값 입력)
+- iter_validated_chunks: 여러 청크로 나뉜 파일 전체 검증 (헤더 매핑 해석 포함, 오류 행 일부 섞임)
+
+저장된 기준값(baseline_validators.json)보다 threshold 이상 느려진 항목이 있으면 실패(종료 코드 1)한다.
+행 단위 검증 함수(validate_and_parse_*)와 parse_csv_file 은 업로드 경로에서 쓰지 않으므로 측정하지 않는다.
+
+기계마다 속도가 다르므로 같은 실행에서 잰 순수 파이썬 기준 작업(calibration) 시간으로 나눈 값을 비교한다.
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.validators                  # 기준값과 비교
+    python -m benchmarks.validators --threshold 0.1  # 10% 이상 느려지면 실패
+    python -m benchmarks.validators --save-baseline  # 현재 결과를 기준값으로 저장
+"""
+import argparse
+import codecs
+import csv
+import io
+import json
+import os
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline_validators.json'
+DEFAULT_THRESHOLD = 0.25  # 25% 이상 느려지면 회귀
+REPEAT = 7
+
+
+class Case(NamedTuple):
+    """
+    벤치마크 항목
+
+    Attributes:
+        name: '<함수>/<입력 종류>' 또는 '<함수>/<데이터 유형>/<입력 종류>'
+        func: 측정할 함수
+        inputs: 호출마다 넘길 인자 튜플 목록 (한 번 측정에 모두 호출)
+    """
+    name: str
+    func: Callable
+    inputs: Sequence[tuple]
+
+
+# 행 검증 경계값 입력 (검증기가 받아들이는 값 중 처리 경로가 다른 것들)
+EDGE_ROWS: Dict[str, List[Dict[str, str]]] = {
+    'kpi': [
+        # 영문 헤더, 빈 숫자 → 0, 소수점 교원 수
+        {'evaluation_year': '2024', 'college': '공과대학', 'department': '컴퓨터공학과',
+         'employment_rate': '', 'fulltime_faculty_count': '12.0', 'visiting_faculty_count': '',
+         'tech_transfer_revenue': '0', 'intl_conference_count': '1'},
+        # 경계값 (취업률 0, 100)
+        {'평가년도': '2023', '단과대학': ' 인문대학 ', '학과': ' 철학과 ', '졸업생 취업률 (%)': '100',
+         '전임교원 수 (명)': '0', '초빙교원 수 (명)': '0', '연간 기술이전 수입액 (억원)': '0.0',
+         '국제학술대회 개최 횟수': '0'},
+    ],
+    'publication': [
+        # SCIE 가 아니면 Impact Factor 무시, 과제연계여부 소문자
+        {'publication_id': 'PUB-EDGE-1', 'publication_date': '2023/05/22', 'college': '인문대학',
+         'department': '철학과', 'title': '제목', 'first_author': '윤지원', 'co_authors': '',
+         'journal_name': '철학연구', 'journal_grade': 'KCI', 'impact_factor': '1.2', 'project_linked': 'y'},
+        # SCIE 인데 Impact Factor 없음, 점 구분 날짜
+        {'publication_id': 'PUB-EDGE-2', 'publication_date': '2024.01.05', 'college': '공과대학',
+         'department': '전자공학과', 'title': 'Title', 'first_author': '김민준', 'co_authors': '박지훈;최민서',
+         'journal_name': 'IEEE', 'journal_grade': 'SCIE', 'impact_factor': '', 'project_linked': ''},
+    ],
+    'project': [
+        # 천 단위 구분 기호, 소수점 금액, 알 수 없는 상태 → 처리중
+        {'execution_id': 'T-EDGE-1', 'project_number': 'NRF-1', 'project_name': '과제',
+         'principal_investigator': '김민준', 'department': '전자공학과', 'funding_agency': '한국연구재단',
+         'total_budget': '1,200,000,000', 'execution_date': '20230315', 'expense_item': '장비',
+         'expense_amount': '5000000.0', 'status': '보류', 'notes': ''},
+        {'execution_id': 'T-EDGE-2', 'project_number': 'IITP-1', 'project_name': '과제',
+         'principal_investigator': '이서연', 'department': '컴퓨터공학과', 'funding_agency': '정보통신기획평가원',
+         'total_budget': '0', 'execution_date': '3/15/2023', 'expense_item': '인건비',
+         'expense_amount': '12,345', 'status': '집행완료', 'notes': '비고'},
+    ],
+    'student': [
+        # 소수점 학년, 앞뒤 공백, 지도교수 없음
+        {'student_id': ' 20240001 ', 'name': '홍길동', 'college': '공과대학', 'department': '컴퓨터공학과',
+         'grade': '3.0', 'program_type': '학사', 'academic_status': '재학', 'gender': '남',
+         'admission_year': '2021', 'advisor': '', 'email': 'hong@example.com'},
+        {'student_id': '20240002', 'name': '김영희', 'college': '자연과학대학', 'department': '수학과',
+         'grade': '0', 'program_type': '박사', 'academic_status': '휴학', 'gender': '여',
+         'admission_year': '2100', 'advisor': '이서연', 'email': ''},
+    ],
+}
+
+PARSE_ROWS = 5000  # 파싱 입력 행 수
+VALIDATOR_ROWS = 2000  # 청크 검증 정상/오류 입력 행 수
+PIPELINE_ROWS = 8000  # 파일 전체 검증 입력 행 수
+PIPELINE_CHUNK_ROWS = 2000
+PIPELINE_INVALID_RATE = 0.05
+
+
+def edge_csv_bytes(rows: List[Dict[str, str]]) -> bytes:
+    """경계값 행을 업로드 파일과 같은 CSV(UTF-8 BOM)로"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return codecs.BOM_UTF8 + buffer.getvalue().encode('utf-8')
+
+
+def read_chunks(content: bytes, data_type: str, chunk_size: Optional[int] = None) -> list:
+    """업로드 경로(iter_file_chunks)로 CSV 를 읽은 청크 목록"""
+    from apps.data_upload.services import iter_file_chunks
+
+    return list(iter_file_chunks(io.BytesIO(content), data_type, chunk_size=chunk_size))
+
+
+def validate_chunks(chunks: list, data_type: str) -> tuple:
+    """iter_validated_chunks 결과를 모두 소비 (행 수, 정상 행 수, 오류 수)"""
+    from apps.data_upload.validation import iter_validated_chunks
+
+    totals = [0, 0, 0]
+    for rows, records, errors in iter_validated_chunks(chunks, data_type):
+        totals[0] += rows
+        totals[1] += len(records)
+        totals[2] += len(errors)
+    return tuple(totals)
+
+
+def build_cases() -> List[Case]:
+    """측정 항목 목록 (합성 CSV 는 고정 시드라 실행마다 같은 입력)"""
+    from apps.data_upload.validation import CompiledSchema, compile_schema
+    from benchmarks.synthetic import synthetic_csv_bytes
+
+    student_csv, _ = synthetic_csv_bytes('student', PARSE_ROWS, seed=0)
+    project_csv, _ = synthetic_csv_bytes('project', PARSE_ROWS, seed=0)
+    cases = [
+        Case('iter_csv_chunks/bom', read_chunks, [(student_csv, 'student', PARSE_ROWS)]),
+        Case('iter_csv_chunks/no_bom', read_chunks, [(student_csv[len(codecs.BOM_UTF8):], 'student', PARSE_ROWS)]),
+        Case('iter_csv_chunks/quoted_amounts', read_chunks, [(project_csv, 'project', PARSE_ROWS)]),
+    ]
+
+    for data_type in ('kpi', 'publication', 'project', 'student'):
+        # 헤더 매핑은 파일당 한 번 해석하므로 청크 검증 측정에서는 제외
+        for kind, invalid_rate in (('valid', 0.0), ('invalid', 1.0)):
+            content, _ = synthetic_csv_bytes(data_type, VALIDATOR_ROWS, invalid_rate=invalid_rate, seed=0)
+            [chunk] = read_chunks(content, data_type, VALIDATOR_ROWS)
+            schema = compile_schema(data_type, chunk.columns)
+            cases.append(Case(f'CompiledSchema.validate/{data_type}/{kind}', CompiledSchema.validate, [(schema, chunk)]))
+        edge_inputs = []
+        for row in EDGE_ROWS[data_type]:
+            [chunk] = read_chunks(edge_csv_bytes([row]), data_type)
+            edge_inputs.append((compile_schema(data_type, chunk.columns), chunk))
+        cases.append(Case(f'CompiledSchema.validate/{data_type}/edge', CompiledSchema.validate, edge_inputs))
+
+        content, _ = synthetic_csv_bytes(data_type, PIPELINE_ROWS, invalid_rate=PIPELINE_INVALID_RATE, seed=0)
+        chunks = read_chunks(content, data_type, PIPELINE_CHUNK_ROWS)
+        cases.append(Case(f'iter_validated_chunks/{data_type}', validate_chunks, [(chunks, data_type)]))
+    return cases
+
+
+def _run(case: Case) -> None:
+    func = case.func
+    for args in case.inputs:
+        func(*args)
+
+
+def _calibration_workload() -> None:
+    total = 0
+    for i in range(20000):
+        total += i * i % 7
+    str(total).encode('utf-8')
+
+
+def time_call(func: Callable[[], None], number: Optional[int] = None, repeat: int = REPEAT) -> float:
+    """func 한 번 호출 시간 (초, repeat 번 중 최솟값)"""
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure(
+    cases: Sequence[Case],
+    number: Optional[int] = None,
+    repeat: int = REPEAT,
+) -> Dict[str, Any]:
+    """
+    항목별 입력 한 건당 시간 측정
+
+    Returns:
+        {"calibration": 기준 작업 시간(초), "cases": {항목: 입력 한 건당 시간(초)}}
+    """
+    calibration = time_call(_calibration_workload, number, repeat)
+    timings = {
+        case.name: time_call(lambda: _run(case), number, repeat) / len(case.inputs)
+        for case in cases
+    }
+    # 측정 도중 기계 부하가 바뀌는 경우를 줄이려고 기준 작업은 앞뒤로 재서 빠른 쪽을 쓴다
+    calibration = min(calibration, time_call(_calibration_workload, number, repeat))
+    return {"calibration": calibration, "cases": timings}
+
+
+def find_regressions(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """
+    기준값 대비 상대 시간 비교
+
+    Returns:
+        항목별 {name, ratio, regressed} (ratio: 보정한 현재 시간 / 보정한 기준 시간, 기준값에 없는 항목은 제외)
+    """
+    scale = baseline['calibration'] / current['calibration']
+    report = []
+    for name, seconds in current['cases'].items():
+        base = baseline['cases'].get(name)
+        if not base:
+            continue
+        ratio = seconds * scale / base
+        report.append({"name": name, "ratio": round(ratio, 3), "regressed": ratio > 1 + threshold})
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="CSV 파싱·검증 마이크로 벤치마크")
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help="기준값 JSON 경로")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="허용 감속 비율 (0.25 = 25%%)")
+    parser.add_argument('--save-baseline', action='store_true', help="현재 결과를 기준값으로 저장")
+    parser.add_argument('--cases', nargs='+', help="이 이름으로 시작하는 항목만 측정")
+    parser.add_argument('--output', help="측정 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+
+    cases = build_cases()
+    if args.cases:
+        cases = [case for case in cases if case.name.startswith(tuple(args.cases))]
+    current = measure(cases)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+            f.write('\n')
+        print(f"기준값 저장: {args.baseline}", file=sys.stderr)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    report = find_regressions(current, baseline, args.threshold)
+    for item in report:
+        mark = '회귀' if item['regressed'] else ''
+        print(f"{item['name']:<45}{current['cases'][item['name']] * 1e6:>12.1f}µs  {item['ratio']:.2f}x  {mark}")
+
+    regressed = [item['name'] for item in report if item['regressed']]
+    if regressed:
+        print(f"{len(regressed)}개 항목이 기준값보다 {args.threshold:.0%} 이상 느려졌습니다.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
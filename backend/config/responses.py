@@ -17,6 +17,14 @@ def success_response(data, status_code=status.HTTP_200_OK):
     )
 
 
+def not_modified_response(etag):
+    """
+    조건부 GET 응답 (304 Not Modified, 본문 없음)
+    클라이언트가 가진 success_response 본문이 그대로 유효함을 알림
+    """
+    return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
 def error_response(message, errors=None, status_code=status.HTTP_400_BAD_REQUEST):
     """
     에러 응답 포맷
@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+from corsheaders.defaults import default_headers
 
 load_dotenv()
 
@@ -158,11 +159,60 @@ CORS_ALLOWED_ORIGINS = os.environ.get(
 ).split(',')
 
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'content-range', 'if-none-match')  # 분할 업로드 PUT, 대시보드 조건부 GET
+CORS_EXPOSE_HEADERS = ['etag']
 
 # 파일 업로드 설정
-FILE_UPLOAD_MAX_MEMORY_SIZE = 104857600  # 100MB
+# 2.5MB 를 넘는 업로드 파일은 메모리 대신 디스크 임시 파일로 스풀링
+FILE_UPLOAD_MAX_MEMORY_SIZE = 2621440  # 2.5MB
+FILE_UPLOAD_TEMP_DIR = os.environ.get('FILE_UPLOAD_TEMP_DIR') or None
 DATA_UPLOAD_MAX_MEMORY_SIZE = 104857600  # 100MB
 
+# CSV 업로드 처리 설정
+CSV_UPLOAD_CHUNK_ROWS = int(os.environ.get('CSV_UPLOAD_CHUNK_ROWS', 10000))  # 청크당 행 수
+CSV_PARSER_ENGINE = os.environ.get('CSV_PARSER_ENGINE', 'pandas')  # pandas, pyarrow (다중 스레드, pyarrow 설치 필요)
+CSV_VALIDATION_WORKERS = int(os.environ.get('CSV_VALIDATION_WORKERS', 0))  # 병렬 검증 프로세스 수 (0: 사용 안 함)
+CSV_PARALLEL_MIN_ROWS = int(os.environ.get('CSV_PARALLEL_MIN_ROWS', 50000))  # 이 행 수 이후 청크부터 병렬 검증
+CSV_UPLOAD_USE_COPY = os.environ.get('CSV_UPLOAD_USE_COPY', 'True') == 'True'  # PostgreSQL COPY 적재 경로 사용
+CSV_UPLOAD_COMMIT_MODE = os.environ.get('CSV_UPLOAD_COMMIT_MODE', 'atomic')  # atomic: 전체 한 트랜잭션, batch: 배치별 커밋 (선택)
+CSV_UPLOAD_COMMIT_ROWS = int(os.environ.get('CSV_UPLOAD_COMMIT_ROWS', 5000))  # batch 모드의 커밋 단위 행 수
+CSV_DUPLICATE_KEY_POLICY = os.environ.get('CSV_DUPLICATE_KEY_POLICY', 'last')  # 파일 안 중복 키: last, first, reject
+UPLOAD_ERROR_SAMPLE_SIZE = int(os.environ.get('UPLOAD_ERROR_SAMPLE_SIZE', 100))  # 메모리·업로드 로그에 남길 오류 수
+UPLOAD_ERROR_REPORT_DIR = os.environ.get('UPLOAD_ERROR_REPORT_DIR', str(MEDIA_ROOT / 'upload_errors'))
+UPLOAD_PREVIEW_HEAD_ROWS = int(os.environ.get('UPLOAD_PREVIEW_HEAD_ROWS', 200))  # dry_run=preview 앞부분 검증 행 수
+UPLOAD_PREVIEW_SAMPLE_ROWS = int(os.environ.get('UPLOAD_PREVIEW_SAMPLE_ROWS', 1000))  # dry_run=preview 임의 표본 행 수
+
+# 비동기 업로드 작업 설정 (워커: python manage.py run_upload_worker)
+UPLOAD_JOBS_ASYNC = os.environ.get('UPLOAD_JOBS_ASYNC', 'True') == 'True'  # False 면 요청 안에서 바로 처리
+UPLOAD_JOB_DIR = os.environ.get('UPLOAD_JOB_DIR', str(MEDIA_ROOT / 'upload_jobs'))
+UPLOAD_WORKER_THREADS = int(os.environ.get('UPLOAD_WORKER_THREADS', 4))
+UPLOAD_WORKER_POLL_INTERVAL = float(os.environ.get('UPLOAD_WORKER_POLL_INTERVAL', 1.0))
+UPLOAD_JOB_HEARTBEAT_INTERVAL = float(os.environ.get('UPLOAD_JOB_HEARTBEAT_INTERVAL', 30))  # 처리 중 작업의 하트비트 기록 간격 (초)
+UPLOAD_JOB_STALE_TIMEOUT = float(os.environ.get('UPLOAD_JOB_STALE_TIMEOUT', 600))  # 하트비트가 이만큼 끊긴 running 작업은 중단된 것으로 처리 (초)
+UPLOAD_JOB_MAX_ATTEMPTS = int(os.environ.get('UPLOAD_JOB_MAX_ATTEMPTS', 3))  # 중단된 작업을 다시 대기열에 넣는 최대 시도 횟수
+
+# 일괄 업로드 (CSV 여러 개 또는 ZIP)
+UPLOAD_BATCH_MAX_FILES = int(os.environ.get('UPLOAD_BATCH_MAX_FILES', 20))
+UPLOAD_BATCH_MAX_SIZE = int(os.environ.get('UPLOAD_BATCH_MAX_SIZE', 1024 ** 3))  # 압축 해제 후 합계 1GB
+
+# 재개 가능한 분할 업로드 세션
+UPLOAD_SESSION_DIR = os.environ.get('UPLOAD_SESSION_DIR', str(MEDIA_ROOT / 'upload_sessions'))
+UPLOAD_SESSION_MAX_SIZE = int(os.environ.get('UPLOAD_SESSION_MAX_SIZE', 10 * 1024 ** 3))  # 10GB
+UPLOAD_SESSION_MAX_CHUNK = int(os.environ.get('UPLOAD_SESSION_MAX_CHUNK', 64 * 1024 ** 2))  # PUT 1회 최대 64MB
+
+# 캐시 (대시보드 응답)
+# 무효화용 데이터 버전은 DB(DataVersion)에 있으므로 로컬 메모리 캐시도 프로세스마다 올바르게 무효화된다.
+# 프로세스 사이에 응답 자체를 공유하려면 파일 캐시 등을 사용:
+#   CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache CACHE_LOCATION=/var/tmp/vmc_cache
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'vmc-backend'),
+    }
+}
+DASHBOARD_CACHE_ENABLED = os.environ.get('DASHBOARD_CACHE_ENABLED', 'True') == 'True'
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', 3600))  # 초 (업로드 외 변경·기간 필터 기준일 보정)
+
 # 로깅 설정
 LOGGING = {
     'version': 1,
@@ -198,3 +248,5 @@ if 'test' in sys.argv or 'pytest' in sys.modules:
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
     }
+    # 업로드 API 통합 테스트는 요청 안에서 동기 처리 (비동기 작업은 별도 테스트)
+    UPLOAD_JOBS_ASYNC = False
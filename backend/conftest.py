@@ -1,5 +1,6 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 User = get_user_model()
@@ -25,3 +26,15 @@ def authenticated_client(api_client, user):
     return api_client
 
 
+@pytest.fixture(autouse=True)
+def upload_error_report_dir(settings, tmp_path):
+    """업로드 오류 보고서는 테스트마다 임시 디렉터리에 기록"""
+    settings.UPLOAD_ERROR_REPORT_DIR = str(tmp_path / 'upload_errors')
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """대시보드 응답 캐시가 테스트 사이에 남지 않도록 비움"""
+    cache.clear()
+    yield
+    cache.clear()
@@ -192,6 +192,8 @@ export default function UploadPage({ params }: UploadPageProps) {
                 </div>
                 <p className="text-sm text-green-600">
                   {uploadMutation.data.success_rows}개 행이 성공적으로 처리되었습니다.
+                  (추가 {uploadMutation.data.inserted_rows}, 수정 {uploadMutation.data.updated_rows}, 변경 없음{" "}
+                  {uploadMutation.data.unchanged_rows})
                 </p>
                 {uploadMutation.data.failed_rows > 0 && (
                   <p className="text-sm text-amber-600">
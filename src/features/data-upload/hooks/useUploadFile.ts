@@ -12,18 +12,107 @@ export type UploadResponse = {
   total_rows: number;
   success_rows: number;
   failed_rows: number;
+  inserted_rows: number;
+  updated_rows: number;
+  unchanged_rows: number;
   errors: Array<{
     row: number;
     reason: string;
   }>;
 };
 
+type UploadJobResponse = {
+  job_id: string;
+  status: "queued" | "running" | "done" | "failed";
+  progress: number;
+  error: string | null;
+  result: UploadResponse | null;
+};
+
 type UploadParams = {
   file: File;
   data_type: DataType;
   onProgress?: (progress: number) => void;
 };
 
+type UploadSessionResponse = {
+  session_id: string;
+  received_bytes: number;
+  total_size: number;
+  max_chunk_size: number;
+};
+
+const JOB_POLL_INTERVAL_MS = 1000;
+// 이 크기를 넘는 파일은 재개 가능한 분할 업로드 세션으로 전송
+const SESSION_UPLOAD_THRESHOLD = 100 * 1024 * 1024;
+const SESSION_CHUNK_SIZE = 8 * 1024 * 1024;
+const SESSION_CHUNK_RETRIES = 5;
+
+const waitForUploadJob = async (jobId: string): Promise<UploadResponse> => {
+  for (;;) {
+    const { data: job } = await apiClient.get<UploadJobResponse>(`/api/data/upload-jobs/${jobId}/`);
+
+    if (job.status === "done" && job.result) {
+      return job.result;
+    }
+    if (job.status === "failed") {
+      throw new Error(job.error ?? "파일 처리 중 오류가 발생했습니다.");
+    }
+
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+  }
+};
+
+/**
+ * 분할 업로드: 세션 생성 → 바이트 범위 PUT → finalize.
+ * 전송이 실패하면 세션 상태(received_bytes)를 조회해 그 위치부터 이어서 보낸다.
+ */
+const uploadInSession = async (
+  file: File,
+  data_type: DataType,
+  onProgress?: (progress: number) => void
+) => {
+  const { data: session } = await apiClient.post<UploadSessionResponse>("/api/data/upload-sessions/", {
+    file_name: file.name,
+    data_type,
+    total_size: file.size,
+  });
+  const chunkSize = Math.min(SESSION_CHUNK_SIZE, session.max_chunk_size);
+  let offset = 0;
+  let retries = 0;
+
+  while (offset < file.size) {
+    const end = Math.min(offset + chunkSize, file.size);
+    try {
+      const { data } = await apiClient.put<UploadSessionResponse>(
+        `/api/data/upload-sessions/${session.session_id}/`,
+        file.slice(offset, end),
+        {
+          headers: {
+            "Content-Type": "application/octet-stream",
+            "Content-Range": `bytes ${offset}-${end - 1}/${file.size}`,
+          },
+        }
+      );
+      offset = data.received_bytes;
+      retries = 0;
+    } catch (error) {
+      if (++retries > SESSION_CHUNK_RETRIES) {
+        throw error;
+      }
+      const { data } = await apiClient.get<UploadSessionResponse>(
+        `/api/data/upload-sessions/${session.session_id}/`
+      );
+      offset = data.received_bytes;
+    }
+    onProgress?.(Math.round((offset * 100) / file.size));
+  }
+
+  return apiClient.post<UploadResponse | UploadJobResponse>(
+    `/api/data/upload-sessions/${session.session_id}/finalize/`
+  );
+};
+
 export const useUploadFile = () => {
   const queryClient = useQueryClient();
 
@@ -34,21 +123,29 @@ export const useUploadFile = () => {
       formData.append("data_type", data_type);
 
       try {
-        const response = await apiClient.post<UploadResponse>("/api/data/upload/", formData, {
-          headers: {
-            "Content-Type": "multipart/form-data",
-          },
-          onUploadProgress: (progressEvent) => {
-            if (progressEvent.total !== undefined && onProgress) {
-              const percentCompleted = Math.round(
-                (progressEvent.loaded * 100) / progressEvent.total
-              );
-              onProgress(percentCompleted);
-            }
-          },
-        });
+        const response =
+          file.size > SESSION_UPLOAD_THRESHOLD
+            ? await uploadInSession(file, data_type, onProgress)
+            : await apiClient.post<UploadResponse | UploadJobResponse>("/api/data/upload/", formData, {
+                headers: {
+                  "Content-Type": "multipart/form-data",
+                },
+                onUploadProgress: (progressEvent) => {
+                  if (progressEvent.total !== undefined && onProgress) {
+                    const percentCompleted = Math.round(
+                      (progressEvent.loaded * 100) / progressEvent.total
+                    );
+                    onProgress(percentCompleted);
+                  }
+                },
+              });
+
+        // 202: 비동기 업로드 작업으로 등록됨 → 작업이 끝날 때까지 상태 조회
+        if (response.status === 202) {
+          return await waitForUploadJob((response.data as UploadJobResponse).job_id);
+        }
 
-        return response.data;
+        return response.data as UploadResponse;
       } catch (error) {
         const message = extractApiErrorMessage(error, "파일 업로드에 실패했습니다.");
         throw new Error(message);